@@ -0,0 +1,3 @@
+"""
+Benchmarks for woo_py. Run them from the repository root, e.g. python -m benchmarks.bench_json
+"""
@@ -0,0 +1,233 @@
+"""
+Measures the overhead of the client against a local stand-in store, without a real WooCommerce.
+
+Covers the first page of get_all, get_all following all pages (sequentially and concurrently),
+a single get, a put with change detection, and parsing a page of orders without any request.
+Following all pages is also measured against a store taking --latency milliseconds per request,
+as a real store does, which is where fetching pages concurrently pays off. Without latency,
+the pages only compete for the interpreter.
+Every scenario runs a fixed number of operations on generated data after a warm-up, and
+reports throughput and latency percentiles. Run from the repository root:
+
+    python -m benchmarks.bench_client            # in-process, using httpx.MockTransport
+    python -m benchmarks.bench_client --server   # over a local HTTP server
+    python -m benchmarks.bench_client --latency 200
+    python -m benchmarks.bench_client --json results.json
+
+The JSON output can be kept to compare runs and spot regressions.
+"""
+
+import argparse
+import json
+import statistics
+import sys
+import time
+import typing as t
+
+import httpx
+from loguru import logger
+
+from benchmarks.stub_store import StubServer, StubStore
+from woo_py.api import API
+from woo_py.models.order import Order
+from woo_py.models.product import Product
+from woo_py.retry import RetryPolicy
+
+ORDERS = 1000
+PRODUCTS = 200
+PER_PAGE = 100
+
+
+def _measure(
+    name: str, operation: t.Callable[[], int], repeat: int, warmup: int = 3
+) -> dict[str, t.Any]:
+    """
+    Run an operation repeatedly and collect its latencies.
+
+    :param name: Name of the scenario.
+    :param operation: The operation. Returns the number of items it handled.
+    :param repeat: Number of measured runs.
+    :param warmup: Number of runs before measuring.
+    :return: The results of the scenario.
+    """
+    for _ in range(warmup):
+        operation()
+
+    latencies = []
+    items = 0
+    for _ in range(repeat):
+        started = time.perf_counter()
+        items += operation()
+        latencies.append(time.perf_counter() - started)
+
+    latencies.sort()
+    total = sum(latencies)
+    return {
+        "name": name,
+        "runs": repeat,
+        "runs_per_second": repeat / total,
+        "items_per_second": items / total,
+        "p50_ms": statistics.median(latencies) * 1000,
+        "p95_ms": latencies[min(int(repeat * 0.95), repeat - 1)] * 1000,
+    }
+
+
+def run(server: bool, repeat: int, latency: float) -> list[dict[str, t.Any]]:
+    """
+    Run all scenarios.
+
+    :param server: Whenever to use a local HTTP server instead of httpx.MockTransport.
+    :param repeat: Number of measured runs per scenario.
+    :param latency: Seconds the slow store takes per request.
+    :return: The results of the scenarios.
+    """
+    stub_servers: list[StubServer] = []
+
+    def connect(store: StubStore) -> API:
+        if server:
+            stub_server = store.serve()
+            stub_servers.append(stub_server)
+            url = stub_server.url
+            transport = None
+        else:
+            url = "https://stub"
+            transport = httpx.MockTransport(store.handler)
+
+        return API(
+            url,
+            "ck_bench",
+            "cs_bench",
+            transport=transport,
+            retry_policy=RetryPolicy(max_retries={}),
+            request_logger=None,
+        )
+
+    store = StubStore(orders=ORDERS, products=PRODUCTS)
+    api = connect(store)
+    slow_api = connect(StubStore(orders=ORDERS, products=0, latency=latency))
+    page_content = json.dumps(
+        list(store.resources["orders"].values())[:PER_PAGE]
+    ).encode()
+
+    def first_page() -> int:
+        return len(api.get_all("orders", Order, per_page=PER_PAGE))
+
+    def all_pages(page_concurrency: int, client: API = api) -> t.Callable[[], int]:
+        def operation() -> int:
+            return len(
+                client.get_all(
+                    "orders",
+                    Order,
+                    follow_pages=True,
+                    page_concurrency=page_concurrency,
+                    per_page=PER_PAGE,
+                )
+            )
+
+        return operation
+
+    def all_products() -> int:
+        return len(
+            api.get_all("products", Product, follow_pages=True, per_page=PER_PAGE)
+        )
+
+    def get_order() -> int:
+        return 1 if api.get("orders/42", Order) is not None else 0
+
+    def put_order() -> int:
+        order = api.get("orders/42", Order)
+        assert order is not None
+        order.customer_note = "Leave at the door"
+        api.put("orders/42", order)
+        return 1
+
+    def parse_page() -> int:
+        return len(
+            [Order.model_validate(item) for item in api.json_codec.loads(page_content)]
+        )
+
+    try:
+        return [
+            _measure(f"get_all, first page of {PER_PAGE} orders", first_page, repeat),
+            _measure(
+                f"get_all follow_pages, {ORDERS} orders",
+                all_pages(1),
+                max(repeat // 10, 1),
+            ),
+            _measure(
+                f"get_all follow_pages, {ORDERS} orders, 4 concurrent",
+                all_pages(4),
+                max(repeat // 10, 1),
+            ),
+            _measure(
+                f"get_all follow_pages, {ORDERS} orders, {latency * 1000:.0f} ms/request",
+                all_pages(1, slow_api),
+                max(repeat // 25, 1),
+                warmup=1,
+            ),
+            _measure(
+                "  same, 4 concurrent",
+                all_pages(4, slow_api),
+                max(repeat // 25, 1),
+                warmup=1,
+            ),
+            _measure(
+                f"get_all follow_pages, {PRODUCTS} products",
+                all_products,
+                max(repeat // 10, 1),
+            ),
+            _measure("get, single order", get_order, repeat * 5),
+            _measure("put with change detection (get + put)", put_order, repeat * 5),
+            _measure(
+                f"parse a page of {PER_PAGE} orders, no request", parse_page, repeat
+            ),
+        ]
+    finally:
+        for stub_server in stub_servers:
+            stub_server.shutdown()
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("--server", action="store_true", help="use a local HTTP server")
+    parser.add_argument(
+        "--repeat", type=int, default=50, help="measured runs per scenario"
+    )
+    parser.add_argument(
+        "--latency",
+        type=float,
+        default=50,
+        help="milliseconds per request of the slow store",
+    )
+    parser.add_argument("--json", help="also write the results to this file")
+    args = parser.parse_args()
+
+    # Logging to the console would dominate the measurements
+    logger.remove()
+    logger.add(sys.stderr, level="WARNING")
+
+    results = run(args.server, args.repeat, args.latency / 1000)
+
+    print(f"{'scenario':<52} {'runs/s':>9} {'items/s':>10} {'p50 ms':>8} {'p95 ms':>8}")
+    for result in results:
+        print(
+            f"{result['name']:<52} {result['runs_per_second']:9.1f} "
+            f"{result['items_per_second']:10.0f} {result['p50_ms']:8.3f} {result['p95_ms']:8.3f}"
+        )
+
+    if args.json:
+        with open(args.json, "w") as f:
+            json.dump(
+                {
+                    "transport": "server" if args.server else "mock",
+                    "latency_ms": args.latency,
+                    "python": sys.version.split()[0],
+                    "results": results,
+                },
+                f,
+                indent=2,
+            )
+
+
+if __name__ == "__main__":
+    main()
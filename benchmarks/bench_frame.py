@@ -0,0 +1,73 @@
+"""
+Compares aggregating orders with OrderFrame to walking the models in pure Python:
+revenue per SKU and tax per billing country. Run from the repository root:
+
+    python -m benchmarks.bench_frame
+    python -m benchmarks.bench_frame --orders 200000
+"""
+
+import argparse
+import time
+import typing as t
+from collections import defaultdict
+from decimal import Decimal
+
+from benchmarks.stub_store import StubStore
+from woo_py.frame import OrderFrame
+from woo_py.models.order import Order
+
+
+def _timed(operation: t.Callable[[], t.Any]) -> tuple[t.Any, float]:
+    started = time.perf_counter()
+    result = operation()
+    return result, time.perf_counter() - started
+
+
+def python_totals(orders: list[Order]) -> tuple[dict, dict]:
+    revenue: dict[str | None, Decimal] = defaultdict(Decimal)
+    tax: dict[str | None, Decimal] = defaultdict(Decimal)
+    for order in orders:
+        for item in order.line_items:
+            revenue[item.sku or None] += Decimal(item.total or 0)
+        country = order.billing.country if order.billing else None
+        tax[country or None] += Decimal(order.total_tax or 0)
+    return revenue, tax
+
+
+def frame_totals(frame: OrderFrame) -> tuple[dict, dict]:
+    return (
+        frame.line_items.group_sum("sku", "total"),
+        frame.orders.group_sum("billing_country", "total_tax"),
+    )
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("--orders", type=int, default=50000, help="number of orders")
+    args = parser.parse_args()
+
+    store = StubStore(orders=1000, products=0)
+    countries = ["US", "NO", "DE", "SE", "GB"]
+    skus = [f"SKU-{index:03d}" for index in range(50)]
+    templates = []
+    for index, data in enumerate(store.resources["orders"].values()):
+        data["billing"]["country"] = countries[index % len(countries)]
+        for position, item in enumerate(data["line_items"]):
+            item["sku"] = skus[(index + position) % len(skus)]
+        templates.append(Order.model_validate(data))
+    orders = [templates[index % len(templates)] for index in range(args.orders)]
+
+    frame, build_seconds = _timed(lambda: OrderFrame.from_orders(orders))
+    (frame_revenue, frame_tax), frame_seconds = _timed(lambda: frame_totals(frame))
+    (python_revenue, python_tax), python_seconds = _timed(lambda: python_totals(orders))
+    assert frame_revenue == {sku: total for sku, total in python_revenue.items() if sku}
+    assert frame_tax == {key: total for key, total in python_tax.items() if key}
+
+    print(f"{len(orders)} orders, {len(frame.line_items)} line items")
+    print(f"{'build OrderFrame (once)':<40} {build_seconds * 1000:10.1f} ms")
+    print(f"{'group sums, OrderFrame':<40} {frame_seconds * 1000:10.1f} ms")
+    print(f"{'group sums, pure Python':<40} {python_seconds * 1000:10.1f} ms")
+
+
+if __name__ == "__main__":
+    main()
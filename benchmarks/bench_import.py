@@ -0,0 +1,89 @@
+"""
+Measures the cold-start cost of the package: importing it in a fresh interpreter,
+and importing it and validating a first order, as a short-lived job would.
+Each is compared to importing eagerly, as before models and optional subsystems were loaded on first use.
+Every measurement runs in a new process, with bytecode already cached. Run from the repository root:
+
+    python -m benchmarks.bench_import
+"""
+
+import statistics
+import subprocess
+import sys
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parent.parent
+REPEAT = 20
+
+VALIDATE_ORDER = (
+    "from woo_py.models import Order\n"
+    "Order.model_validate_json(open('test/sample_data/order.json', 'rb').read())"
+)
+
+EAGER_IMPORTS = "\n".join(
+    f"import woo_py.models.{path.stem}"
+    for path in sorted((ROOT / "woo_py" / "models").glob("*.py"))
+    if path.stem != "__init__"
+) + ("\nimport woo_py.cache, woo_py.json_codec, woo_py.limiter, woo_py.metrics")
+"""Imports of every model module and optional subsystem, as the package did before loading them lazily."""
+
+SCENARIOS = {
+    "import pydantic and httpx (baseline)": "import pydantic, httpx",
+    "import woo_py.models": "import woo_py.models",
+    "import woo_py.api": "import woo_py.api",
+    "import woo_py.woo": "import woo_py.woo",
+    "import woo_py.woo, validate an order": f"import woo_py.woo\n{VALIDATE_ORDER}",
+}
+
+EAGER_SCENARIOS = {
+    "import woo_py.woo": f"{EAGER_IMPORTS}\nimport woo_py.woo",
+    "import woo_py.woo, validate an order": (
+        f"{EAGER_IMPORTS}\nimport woo_py.woo\n{VALIDATE_ORDER}"
+    ),
+}
+"""The same scenarios with everything imported up front, keyed by the lazy scenario they compare to."""
+
+
+def _run(code: str) -> float:
+    timed = (
+        "import time\n"
+        "started = time.perf_counter()\n"
+        f"{code}\n"
+        "print(time.perf_counter() - started)"
+    )
+    output = subprocess.run(
+        [sys.executable, "-c", timed],
+        cwd=ROOT,
+        check=True,
+        capture_output=True,
+        text=True,
+    ).stdout
+    return float(output.strip().splitlines()[-1])
+
+
+def _measure(code: str) -> float:
+    """
+    :return: The median import time of the code in milliseconds.
+    """
+    return statistics.median(_run(code) for _ in range(REPEAT)) * 1000
+
+
+def main() -> None:
+    for code in [*SCENARIOS.values(), *EAGER_SCENARIOS.values()]:
+        # Write the bytecode caches before measuring
+        _run(code)
+
+    print(f"{REPEAT} fresh interpreters per scenario, median")
+    print(f"{'scenario':<40} {'lazy ms':>8} {'eager ms':>9} {'saved ms':>9}")
+    for name, code in SCENARIOS.items():
+        lazy = _measure(code)
+        if name not in EAGER_SCENARIOS:
+            print(f"{name:<40} {lazy:8.1f}")
+            continue
+
+        eager = _measure(EAGER_SCENARIOS[name])
+        print(f"{name:<40} {lazy:8.1f} {eager:9.1f} {eager - lazy:9.1f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,79 @@
+"""
+Compares decoding and encoding of a 100-order page with the available JSON codecs.
+
+The "legacy" rows reproduce how requests used to be handled: bodies were dumped with
+model_dump_json, parsed again with json.loads and re-encoded by httpx, and responses
+were decoded with response.json(). Run from the repository root:
+
+    python -m benchmarks.bench_json
+"""
+
+import json
+import timeit
+from pathlib import Path
+
+import httpx
+
+from woo_py.json_codec import JSONCodec, MsgspecCodec, OrjsonCodec
+from woo_py.models.order import Order
+
+ROOT = Path(__file__).resolve().parent.parent
+PAGE_SIZE = 100
+REPEAT = 200
+
+
+def _codecs() -> list[JSONCodec]:
+    codecs = [JSONCodec()]
+    for codec_class in (OrjsonCodec, MsgspecCodec):
+        try:
+            codecs.append(codec_class())
+        except ImportError:
+            print(f"{codec_class.name} is not installed, skipping")
+    return codecs
+
+
+def _report(name: str, seconds: float) -> None:
+    print(f"{name:<32} {seconds / REPEAT * 1000:8.3f} ms/page")
+
+
+def main() -> None:
+    order = json.loads((ROOT / "test" / "sample_data" / "order.json").read_text())
+    page = [{**order, "id": order_id} for order_id in range(PAGE_SIZE)]
+    response = httpx.Response(200, json=page)
+    models = [Order.model_validate(item) for item in page]
+    codecs = _codecs()
+
+    print(f"Decoding a page of {PAGE_SIZE} orders ({len(response.content)} bytes)")
+    _report("legacy response.json()", timeit.timeit(response.json, number=REPEAT))
+    for codec in codecs:
+        _report(
+            codec.name,
+            timeit.timeit(lambda: codec.loads(response.content), number=REPEAT),
+        )
+
+    print(f"Encoding {PAGE_SIZE} orders")
+
+    def legacy_encode() -> None:
+        for model in models:
+            httpx.Request(
+                "POST",
+                "https://example.com",
+                json=json.loads(model.model_dump_json(exclude_unset=True)),
+            )
+
+    def encode() -> None:
+        for model in models:
+            httpx.Request(
+                "POST",
+                "https://example.com",
+                content=model.model_dump_json(exclude_unset=True).encode(),
+            )
+
+    _report(
+        "legacy dump, loads, re-encode", timeit.timeit(legacy_encode, number=REPEAT)
+    )
+    _report("model_dump_json bytes", timeit.timeit(encode, number=REPEAT))
+
+
+if __name__ == "__main__":
+    main()
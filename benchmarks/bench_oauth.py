@@ -0,0 +1,80 @@
+"""
+Measures the cost of signing a request with OAuth 1.0a, as used for stores without HTTPS.
+
+The "legacy" row reproduces how requests used to be signed: a new signer per request,
+the consumer secret keyed into a new HMAC, every parameter encoded again and the nonce
+drawn with random.choices. Run from the repository root:
+
+    python -m benchmarks.bench_oauth
+"""
+
+import base64
+import hashlib
+import hmac
+import random
+import string
+import time
+import timeit
+from concurrent.futures import ThreadPoolExecutor
+from urllib.parse import quote, urlencode
+
+from oauth import OAuth
+
+REPEAT = 20000
+URL = "http://example.com/wp-json/wc/v3/orders"
+PARAMS = {"per_page": "100", "page": "3", "status": "processing", "order": "asc"}
+
+
+def _legacy_sign(consumer_key: str, consumer_secret: str) -> dict[str, str]:
+    params = {
+        "oauth_consumer_key": consumer_key,
+        "oauth_signature_method": "HMAC-SHA1",
+        "oauth_timestamp": str(int(time.time())),
+        "oauth_nonce": "".join(
+            random.choices(string.ascii_letters + string.digits, k=32)
+        ),
+        **PARAMS,
+    }
+    encoded = {quote(k, safe="/"): quote(v, safe="/") for k, v in params.items()}
+    param_string = urlencode(dict(sorted(encoded.items())), safe="/")
+    base_string = "&".join(["GET", quote(URL, safe="/"), quote(param_string, safe="/")])
+    signing_key = f"{quote(consumer_secret, safe='/')}&"
+    hashed = hmac.new(signing_key.encode(), base_string.encode(), hashlib.sha1)
+    params["oauth_signature"] = base64.b64encode(hashed.digest()).decode()
+    return params
+
+
+def _report(name: str, seconds: float) -> None:
+    print(f"{name:<32} {seconds / REPEAT * 1_000_000:8.2f} us/request")
+
+
+def main() -> None:
+    consumer_key, consumer_secret = "ck_" + "a" * 40, "cs_" + "b" * 40
+    signer = OAuth(consumer_key, consumer_secret)
+
+    print(f"Signing a GET request with {len(PARAMS)} query parameters")
+    _report(
+        "legacy signer per request",
+        timeit.timeit(
+            lambda: _legacy_sign(consumer_key, consumer_secret), number=REPEAT
+        ),
+    )
+    _report(
+        "reused signer",
+        timeit.timeit(
+            lambda: signer.get_auth_params("get", URL, PARAMS), number=REPEAT
+        ),
+    )
+
+    with ThreadPoolExecutor(max_workers=8) as executor:
+        started = time.perf_counter()
+        list(
+            executor.map(
+                lambda _: signer.get_auth_params("get", URL, PARAMS), range(REPEAT)
+            )
+        )
+        _report("reused signer, 8 threads", time.perf_counter() - started)
+
+
+if __name__ == "__main__":
+    main()
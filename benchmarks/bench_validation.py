@@ -0,0 +1,68 @@
+"""
+Compares validating a page of 100 orders item by item from decoded JSON, as the clients do,
+with validating the whole page from the response bytes using a TypeAdapter,
+and with a LazyList where only one in ten orders is validated after filtering.
+The TypeAdapter is slower on these pages, so the clients decode with their codec first.
+Run from the repository root:
+
+    python -m benchmarks.bench_validation
+"""
+
+import json
+import timeit
+from pathlib import Path
+
+from pydantic import TypeAdapter
+
+from woo_py.json_codec import get_default_codec
+from woo_py.lazy import LazyList
+from woo_py.models.order import Order
+
+ROOT = Path(__file__).resolve().parent.parent
+PAGE_SIZE = 100
+REPEAT = 100
+
+
+def main() -> None:
+    order = json.loads((ROOT / "test" / "sample_data" / "order.json").read_text())
+    content = json.dumps(
+        [
+            {
+                **order,
+                "id": order_id,
+                "status": "completed" if order_id % 10 else "processing",
+            }
+            for order_id in range(PAGE_SIZE)
+        ]
+    ).encode()
+    codec = get_default_codec()
+    adapter = TypeAdapter(list[Order])
+
+    def per_item() -> list[Order]:
+        return [Order.model_validate(item) for item in json.loads(content)]
+
+    def per_item_codec() -> list[Order]:
+        return [Order.model_validate(item) for item in codec.loads(content)]
+
+    def page() -> list[Order]:
+        return adapter.validate_json(content)
+
+    def lazy_filtered() -> list[Order]:
+        orders = LazyList(Order, codec.loads(content))
+        return list(orders.filter(lambda raw: raw["status"] == "processing"))
+
+    assert per_item() == page()
+
+    print(f"Validating a page of {PAGE_SIZE} orders ({len(content)} bytes)")
+    for name, function in (
+        ("json.loads + model_validate", per_item),
+        (f"{codec.name}.loads + model_validate", per_item_codec),
+        ("TypeAdapter.validate_json", page),
+        ("LazyList, 10% validated", lazy_filtered),
+    ):
+        seconds = timeit.timeit(function, number=REPEAT)
+        print(f"{name:<36} {seconds / REPEAT * 1000:8.3f} ms/page")
+
+
+if __name__ == "__main__":
+    main()
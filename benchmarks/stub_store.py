@@ -0,0 +1,223 @@
+"""
+A stand-in for a WooCommerce store, serving generated orders and products.
+
+The same store can be used in-process through httpx.MockTransport, or over the loopback
+interface with a small HTTP server, to include the cost of the network stack.
+List endpoints are paginated like WooCommerce: per_page and page query parameters,
+X-WP-Total, X-WP-TotalPages and Link headers.
+"""
+
+import copy
+import json
+import threading
+import time
+import typing as t
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+from urllib.parse import parse_qsl, urlsplit
+
+import httpx
+
+ROOT = Path(__file__).resolve().parent.parent
+SAMPLE_DATA = ROOT / "test" / "sample_data"
+API_PREFIX = "/wp-json/wc/v3/"
+
+Response = tuple[int, dict[str, str], bytes]
+
+
+class StubStore:
+    """
+    Generated orders and products, answering WooCommerce REST requests.
+    The data only depends on the number of objects, so results are reproducible.
+    """
+
+    base_url: str
+    """URL used in Link headers."""
+
+    latency: float
+    """Seconds every request takes to answer."""
+
+    def __init__(
+        self,
+        orders: int = 1000,
+        products: int = 200,
+        base_url: str = "http://stub",
+        latency: float = 0.0,
+    ) -> None:
+        """
+        Initialize the store.
+
+        :param orders: Number of generated orders.
+        :param products: Number of generated products.
+        :param base_url: URL used in Link headers.
+        :param latency: Seconds every request takes to answer, like the time a real store spends
+            on a page of orders. Concurrent requests wait at the same time.
+        """
+        self.base_url = base_url
+        self.latency = latency
+
+        order = json.loads((SAMPLE_DATA / "order.json").read_text())
+        product = json.loads((SAMPLE_DATA / "product.json").read_text())
+
+        statuses = ["processing", "completed", "on-hold", "pending"]
+        self.resources: dict[str, dict[int, dict[str, t.Any]]] = {
+            "orders": {
+                order_id: {
+                    **copy.deepcopy(order),
+                    "id": order_id,
+                    "number": str(order_id),
+                    "status": statuses[order_id % len(statuses)],
+                }
+                for order_id in range(1, orders + 1)
+            },
+            "products": {
+                product_id: {
+                    **copy.deepcopy(product),
+                    "id": product_id,
+                    "sku": f"SKU-{product_id:05d}",
+                    "slug": f"product-{product_id}",
+                }
+                for product_id in range(1, products + 1)
+            },
+        }
+
+    def respond(
+        self, method: str, path: str, params: dict[str, str], body: bytes
+    ) -> Response:
+        """
+        Answer a request.
+
+        :param method: The HTTP method.
+        :param path: The URL path.
+        :param params: The query parameters.
+        :param body: The request body.
+        :return: Status code, headers and body of the response.
+        """
+        if self.latency:
+            time.sleep(self.latency)
+
+        parts = path.removeprefix(API_PREFIX).strip("/").split("/")
+        resource = self.resources.get(parts[0])
+        if resource is None or len(parts) > 2:
+            return _json(404, {"code": "rest_no_route", "message": "No route"})
+
+        if len(parts) == 1:
+            if method != "GET":
+                return _json(405, {"code": "rest_no_route", "message": "No route"})
+            return self._list(parts[0], resource, params)
+
+        item = resource.get(int(parts[1])) if parts[1].isdigit() else None
+        if item is None:
+            return _json(404, {"code": "not_found", "message": "Invalid ID."})
+
+        if method == "PUT":
+            item.update(json.loads(body))
+        elif method != "GET":
+            return _json(405, {"code": "rest_no_route", "message": "No route"})
+        return _json(200, item)
+
+    def _list(
+        self, name: str, resource: dict[int, dict[str, t.Any]], params: dict[str, str]
+    ) -> Response:
+        per_page = int(params.get("per_page", 10))
+        page = int(params.get("page", 1))
+
+        items = list(resource.values())
+        total_pages = max(1, -(-len(items) // per_page))
+
+        links = []
+        if page < total_pages:
+            links.append(
+                f'<{self.base_url}{API_PREFIX}{name}?page={page + 1}>; rel="next"'
+            )
+        if page > 1:
+            links.append(
+                f'<{self.base_url}{API_PREFIX}{name}?page={page - 1}>; rel="prev"'
+            )
+
+        status, headers, body = _json(
+            200, items[(page - 1) * per_page : page * per_page]
+        )
+        headers["X-WP-Total"] = str(len(items))
+        headers["X-WP-TotalPages"] = str(total_pages)
+        if links:
+            headers["Link"] = ", ".join(links)
+        return status, headers, body
+
+    def handler(self, request: httpx.Request) -> httpx.Response:
+        """
+        Answer a request of httpx.MockTransport.
+
+        :param request: The request.
+        :return: The response.
+        """
+        status, headers, body = self.respond(
+            request.method,
+            request.url.path,
+            dict(request.url.params),
+            request.read(),
+        )
+        return httpx.Response(status, headers=headers, content=body)
+
+    def serve(self) -> "StubServer":
+        """
+        Serve the store over HTTP on a free port of the loopback interface.
+
+        :return: The running server. Stop it with shutdown().
+        """
+        return StubServer(self)
+
+
+class StubServer:
+    """
+    An HTTP server for a StubStore, running in a background thread.
+    """
+
+    url: str
+    """URL of the server."""
+
+    def __init__(self, store: StubStore) -> None:
+        class Handler(BaseHTTPRequestHandler):
+            protocol_version = "HTTP/1.1"
+            # Headers and body are written separately, Nagle's algorithm would delay the body
+            disable_nagle_algorithm = True
+
+            def _handle(self) -> None:
+                url = urlsplit(self.path)
+                length = int(self.headers.get("Content-Length", 0))
+                status, headers, body = store.respond(
+                    self.command,
+                    url.path,
+                    dict(parse_qsl(url.query)),
+                    self.rfile.read(length),
+                )
+                self.send_response(status)
+                for key, value in headers.items():
+                    self.send_header(key, value)
+                self.send_header("Content-Length", str(len(body)))
+                self.end_headers()
+                self.wfile.write(body)
+
+            do_GET = do_PUT = _handle
+
+            def log_message(self, format: str, *args: t.Any) -> None:
+                pass
+
+        self._server = ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+        self._server.daemon_threads = True
+        self.url = f"http://127.0.0.1:{self._server.server_address[1]}"
+        store.base_url = self.url
+
+        self._thread = threading.Thread(target=self._server.serve_forever, daemon=True)
+        self._thread.start()
+
+    def shutdown(self) -> None:
+        """
+        Stop the server.
+        """
+        self._server.shutdown()
+        self._server.server_close()
+
+
+def _json(status: int, data: t.Any) -> Response:
+    return status, {"Content-Type": "application/json"}, json.dumps(data).encode()
@@ -6,15 +6,57 @@ import time
 import hashlib
 import hmac
 import base64
-from typing import Literal
-from urllib.parse import quote, urlencode, urljoin
-import random
-import string
+import secrets
+from functools import lru_cache
+from typing import Any, Literal
+from urllib.parse import quote, quote_plus
+
+
+@lru_cache(maxsize=4096)
+def _percent_encode(value: str) -> str:
+    """Percent-encode a string as per OAuth 1.0a specifications."""
+    return quote(value, safe="/")
+
+
+def _encode_pair(key: str, value: str) -> tuple[str, str]:
+    """
+    Encode a parameter for the parameter string of the signature.
+
+    :return: The encoded key, used for sorting, and the encoded key=value pair.
+    """
+    encoded_key = quote(key, safe="/")
+    return encoded_key, (
+        quote_plus(encoded_key, safe="/")
+        + "="
+        + quote_plus(quote(value, safe="/"), safe="/")
+    )
+
+
+_encode_static_pair = lru_cache(maxsize=4096)(_encode_pair)
+"""
+_encode_pair for the parameters repeating between requests, like the consumer key,
+the signature method and the query parameters. Their encoding is cached.
+"""
+
+_PER_REQUEST_PARAMS = frozenset({"oauth_nonce", "oauth_timestamp"})
+"""Parameters that change with every request. Encoded directly, so they do not evict the cached ones."""
+
+
+def _param_to_str(value: Any) -> str:
+    """Convert a query parameter to the string sent by HTTPX."""
+    if value is True:
+        return "true"
+    if value is False:
+        return "false"
+    return str(value)
 
 
 class OAuth:
     """
     Class to handle one-legged OAuth 1.0a authentication.
+
+    The signing key is set up once, so one object can be reused for all requests.
+    It keeps no state between requests and can be used from several threads and tasks at the same time.
     """
 
     def __init__(self, consumer_key: str, consumer_secret: str):
@@ -27,17 +69,25 @@ class OAuth:
         self.consumer_key = consumer_key
         self.consumer_secret = consumer_secret
 
+        signing_key = f"{_percent_encode(consumer_secret)}&"
+        # Keyed once, copied for every signature
+        self._hmac = hmac.new(signing_key.encode(), digestmod=hashlib.sha1)
+        self._static_params = {
+            "oauth_consumer_key": consumer_key,
+            "oauth_signature_method": "HMAC-SHA1",
+        }
+
     @staticmethod
     def _percent_encode(value: str) -> str:
         """Percent-encode a string as per OAuth 1.0a specifications."""
-        return quote(value, safe="/")
+        return _percent_encode(value)
 
     def _generate_nonce(self, length: int = 32) -> str:
         """Generate a random nonce for the request."""
-        return ''.join(random.choices(string.ascii_letters + string.digits, k=length))
+        return secrets.token_hex(length // 2)
 
     def _generate_signature(
-        self, method: Literal["get", "post", "delete", "put"], url: str, params: dict[str, str]
+        self, method: Literal["get", "post", "delete", "put"], url: str, params: dict[str, Any]
     ) -> str:
         """
         Generate the OAuth signature.
@@ -47,33 +97,30 @@ class OAuth:
         :param params: The parameters to include in the signature.
         :return: The generated signature.
         """
-        # 1. Percent encode all keys and values
-        encoded_params = {self._percent_encode(k): self._percent_encode(v) for k, v in params.items()}
-        # 2. Sort the parameters by key
-        sorted_params = dict(sorted(encoded_params.items()))
-        # 3. Create the parameter string
-        param_string = urlencode(sorted_params, safe="/")
-
-        # 4. Create the signature base string
+        # 1. Percent encode all keys and values, and sort the parameters by key
+        pairs = sorted(
+            (_encode_pair if k in _PER_REQUEST_PARAMS else _encode_static_pair)(
+                k, _param_to_str(v)
+            )
+            for k, v in params.items()
+        )
+        # 2. Create the parameter string
+        param_string = "&".join(pair for _, pair in pairs)
+
+        # 3. Create the signature base string
         base_string = "&".join([
             method.upper(),
-            self._percent_encode(url),
-            self._percent_encode(param_string)
+            _percent_encode(url),
+            quote(param_string, safe="/")
         ])
 
-        # 5. Create the signing key
-        signing_key = f"{self._percent_encode(self.consumer_secret)}&"
-
-        # 6. Generate the HMAC-SHA1 hash
-        hashed = hmac.new(
-            signing_key.encode(),
-            base_string.encode(),
-            hashlib.sha1
-        )
-        # 7. Return the base64 encoded signature
+        # 4. Generate the HMAC-SHA1 hash with the pre-keyed HMAC
+        hashed = self._hmac.copy()
+        hashed.update(base_string.encode())
+        # 5. Return the base64 encoded signature
         return base64.b64encode(hashed.digest()).decode()
 
-    def get_auth_params(self, method: str, url: str, additional_params: dict[str, str] = None) -> dict[str, str]:
+    def get_auth_params(self, method: str, url: str, additional_params: dict[str, Any] = None) -> dict[str, str]:
         """
         Get OAuth parameters including the generated signature.
 
@@ -82,15 +129,11 @@ class OAuth:
         :param additional_params: Any additional parameters to include in the request.
         :return: The complete set of OAuth parameters.
         """
-        timestamp = str(int(time.time()))
-        nonce = self._generate_nonce()
-
         # Base OAuth parameters
         params = {
-            "oauth_consumer_key": self.consumer_key,
-            "oauth_signature_method": "HMAC-SHA1",
-            "oauth_timestamp": timestamp,
-            "oauth_nonce": nonce,
+            **self._static_params,
+            "oauth_timestamp": str(int(time.time())),
+            "oauth_nonce": self._generate_nonce(),
         }
 
         if additional_params:
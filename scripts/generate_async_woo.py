@@ -0,0 +1,66 @@
+"""
+Generates woo_py/async_woo.py from woo_py/woo.py.
+
+The async facade exposes exactly the same methods as Woo, so instead of keeping
+two copies of every resource method in sync by hand, the async version is derived
+from the sync source. Run this after changing woo_py/woo.py:
+
+    python scripts/generate_async_woo.py
+"""
+
+import re
+from pathlib import Path
+
+import black
+
+ROOT = Path(__file__).resolve().parent.parent
+SOURCE = ROOT / "woo_py" / "woo.py"
+TARGET = ROOT / "woo_py" / "async_woo.py"
+
+HEADER = (
+    "# This file is generated from woo_py/woo.py by scripts/generate_async_woo.py.\n"
+    "# Do not edit it directly.\n"
+)
+
+REPLACEMENTS: list[tuple[str, str]] = [
+    (r"from woo_py\.api import API,", "from woo_py.api import AsyncAPI,"),
+    (r"^class Woo:", "class AsyncWoo:"),
+    (
+        r"Represents the main interface for accessing the API\.",
+        "Represents the asynchronous interface for accessing the API.\n"
+        "    All resource methods of Woo are available as coroutines.",
+    ),
+    (r"api_object: API\b", "api_object: AsyncAPI"),
+    # Methods become coroutines, except for __init__, the private helpers and the iter_
+    # methods, which return the async iterator of AsyncAPI.iter_all directly.
+    (r"^(\s+)def (?!_|iter_)(\w+)\(", r"\1async def \2("),
+    (r"\bt\.Iterator\[", "t.AsyncIterator["),
+    # Streamed API results are iterated asynchronously.
+    (
+        r"^(\s+)for (.+) in self\.api_object\.iter_all\(",
+        r"\1async for \2 in self.api_object.iter_all(",
+    ),
+    # API calls are awaited.
+    (r"(?<!await )self\.api_object\.(?!iter_)(\w+)\(", r"await self.api_object.\1("),
+]
+
+
+def generate(source: str) -> str:
+    """
+    Convert the source of the sync facade into the async facade.
+
+    :param source: Source of woo_py/woo.py.
+    :return: Source of woo_py/async_woo.py.
+    """
+    for pattern, replacement in REPLACEMENTS:
+        source = re.sub(pattern, replacement, source, flags=re.MULTILINE)
+
+    return black.format_str(HEADER + source, mode=black.Mode())
+
+
+def main() -> None:
+    TARGET.write_text(generate(SOURCE.read_text()))
+
+
+if __name__ == "__main__":
+    main()
@@ -1,6 +1,8 @@
 import os
 import random
+import typing as t
 
+import httpx
 import pytest
 from dotenv import load_dotenv
 
@@ -37,4 +39,27 @@ def woo() -> Woo:
 
 @pytest.fixture(scope="session")
 def random_str() -> str:
-    return "".join([random.choice("ABCDEFGHIJKLMNOPQRSTUVWXYZ") for _ in range(4)])
\ No newline at end of file
+    return "".join([random.choice("ABCDEFGHIJKLMNOPQRSTUVWXYZ") for _ in range(4)])
+
+
+@pytest.fixture
+def mock_api() -> t.Callable[..., t.Any]:
+    """
+    Build API clients answering requests with a handler instead of a WooCommerce store.
+    Call with the handler, optionally api_class=AsyncAPI and further client options.
+    """
+
+    def make(
+        handler: t.Callable[[httpx.Request], httpx.Response],
+        api_class: type = API,
+        **kwargs: t.Any,
+    ) -> t.Any:
+        return api_class(
+            "https://example.com",
+            "ck_test",
+            "cs_test",
+            transport=httpx.MockTransport(handler),
+            **kwargs,
+        )
+
+    return make
@@ -0,0 +1,196 @@
+import gc
+import sys
+import typing as t
+
+import httpx
+import pytest
+
+from woo_py.api import API
+from woo_py.json_codec import JSONCodec, get_default_codec
+from woo_py.models.order import Order
+from woo_py.retry import RetryPolicy
+
+
+def test_client_options():
+    api = API(
+        "https://example.com",
+        "ck_test",
+        "cs_test",
+        timeout=30.0,
+        connect_timeout=2.0,
+        pool_timeout=1.0,
+        max_connections=50,
+        max_keepalive_connections=50,
+        keepalive_expiry=60.0,
+    )
+
+    assert api._client.timeout == httpx.Timeout(30.0, connect=2.0, pool=1.0)
+    assert api.limits == httpx.Limits(
+        max_connections=50, max_keepalive_connections=50, keepalive_expiry=60.0
+    )
+
+
+def test_timeout_object():
+    timeout = httpx.Timeout(30.0, connect=2.0)
+    api = API("https://example.com", "ck_test", "cs_test", timeout=timeout)
+    assert api._client.timeout == timeout
+
+    with pytest.raises(ValueError, match="connect_timeout"):
+        API(
+            "https://example.com",
+            "ck_test",
+            "cs_test",
+            timeout=timeout,
+            read_timeout=5.0,
+        )
+
+
+def test_invalid_options_are_collected_quietly(monkeypatch):
+    unraisable = []
+    monkeypatch.setattr(sys, "unraisablehook", unraisable.append)
+
+    with pytest.raises(ValueError):
+        API(
+            "https://example.com",
+            "ck_test",
+            "cs_test",
+            timeout=httpx.Timeout(30.0),
+            read_timeout=5.0,
+        )
+    gc.collect()
+
+    assert unraisable == []
+
+
+def test_shared_transport():
+    transport = httpx.MockTransport(lambda request: httpx.Response(200, json=[]))
+
+    first = API("https://example.com", "ck_test", "cs_test", transport=transport)
+    second = API("https://example.com", "ck_test", "cs_test", transport=transport)
+
+    assert first._client._transport is second._client._transport
+
+    del first
+    assert second.get_json("orders") == []
+
+
+def test_retry_resumes_current_page(mock_api):
+    calls: list[tuple[str, int]] = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        page = int(request.url.params.get("page", 1))
+        calls.append((request.method, page))
+
+        if page == 2 and calls.count(("GET", 2)) == 1:
+            return httpx.Response(429, headers={"Retry-After": "0"}, json={})
+        if page == 2 and calls.count(("GET", 2)) == 2:
+            raise httpx.ReadTimeout("Timed out", request=request)
+
+        headers = {"X-WP-TotalPages": "3"}
+        if page < 3:
+            headers["Link"] = (
+                f'<https://example.com/orders?page={page + 1}>; rel="next"'
+            )
+        return httpx.Response(200, json=[{"id": page}], headers=headers)
+
+    api = mock_api(handler, retry_policy=RetryPolicy(backoff_factor=0))
+
+    assert api.get_all("orders", Order, follow_pages=True) == [
+        Order(id=1),
+        Order(id=2),
+        Order(id=3),
+    ]
+    assert calls == [("GET", 1), ("GET", 2), ("GET", 2), ("GET", 2), ("GET", 3)]
+
+
+def test_retry_budget(mock_api):
+    calls = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        calls.append(request.method)
+        return httpx.Response(503, json={"code": "unavailable"})
+
+    api = mock_api(
+        handler, retry_policy=RetryPolicy(max_retries={"get": 2}, backoff_factor=0)
+    )
+
+    with pytest.raises(httpx.HTTPStatusError):
+        api.get_json("orders")
+    assert calls == ["GET"] * 3
+
+    calls.clear()
+    with pytest.raises(httpx.HTTPStatusError):
+        api.post("orders", Order())
+    assert calls == ["POST"]
+
+
+def test_default_retry_policy(mock_api):
+    calls = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        calls.append(request.method)
+        return httpx.Response(503, headers={"Retry-After": "0"}, json={})
+
+    api = mock_api(handler)
+    assert api.retry_policy is not mock_api(handler).retry_policy
+
+    # Only reads are retried unless configured otherwise
+    with pytest.raises(httpx.HTTPStatusError):
+        api.get_json("orders")
+    assert calls == ["GET"] * 4
+
+    calls.clear()
+    with pytest.raises(httpx.HTTPStatusError):
+        api.put("orders/1", Order(id=1))
+    assert calls == ["PUT"]
+
+
+def test_retry_after_header():
+    policy = RetryPolicy(max_retry_after=10)
+    request = httpx.Request("GET", "https://example.com")
+
+    response = httpx.Response(429, headers={"Retry-After": "3"}, request=request)
+    assert policy.get_delay("get", 0, response) == 3
+
+    response = httpx.Response(429, headers={"Retry-After": "60"}, request=request)
+    assert policy.get_delay("get", 0, response) is None
+
+    response = httpx.Response(400, request=request)
+    assert policy.get_delay("get", 0, response) is None
+
+
+def test_json_codec(mock_api):
+    class CountingCodec(JSONCodec):
+        decoded = 0
+
+        def loads(self, content: bytes | str) -> t.Any:
+            CountingCodec.decoded += 1
+            return super().loads(content)
+
+    sent: list[httpx.Request] = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        sent.append(request)
+        if request.method == "POST":
+            return httpx.Response(201, content=request.content)
+        return httpx.Response(200, json=[{"id": 1}, {"id": 2}])
+
+    api = mock_api(handler, json_codec=CountingCodec())
+
+    assert api.post("orders", Order(customer_note="Hei")) == Order(customer_note="Hei")
+    assert sent[0].headers["Content-Type"] == "application/json"
+    assert sent[0].content == b'{"customer_note":"Hei"}'
+
+    assert api.get_all("orders", Order) == [Order(id=1), Order(id=2)]
+    assert "Content-Type" not in sent[1].headers
+    assert CountingCodec.decoded == 2
+
+
+def test_default_json_codec():
+    codec = get_default_codec()
+
+    assert codec.loads(codec.dumps({"name": "Bøtte", "ids": [1, 2]})) == {
+        "name": "Bøtte",
+        "ids": [1, 2],
+    }
+    assert JSONCodec().dumps({"a": 1}) == b'{"a":1}'
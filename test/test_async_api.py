@@ -0,0 +1,55 @@
+import asyncio
+import json
+
+import httpx
+
+from woo_py.api import AsyncAPI
+from woo_py.async_woo import AsyncWoo
+from woo_py.models.order import Order
+
+with open("test/sample_data/order.json") as f:
+    SAMPLE_ORDER = json.load(f)
+
+
+def _handler(request: httpx.Request) -> httpx.Response:
+    if request.url.path.endswith("/orders"):
+        page = int(request.url.params.get("page", 1))
+        headers = {"X-WP-Total": "3", "X-WP-TotalPages": "2"}
+        if page == 1:
+            headers["Link"] = '<https://example.com/orders?page=2>; rel="next"'
+            return httpx.Response(
+                200, json=[SAMPLE_ORDER, SAMPLE_ORDER], headers=headers
+            )
+        return httpx.Response(200, json=[SAMPLE_ORDER], headers=headers)
+
+    if request.url.path.endswith("/orders/727"):
+        return httpx.Response(200, json=SAMPLE_ORDER)
+
+    return httpx.Response(404, json={"code": "not_found", "message": "Not found"})
+
+
+def test_async_woo_methods(mock_api):
+    async def run() -> None:
+        woo = AsyncWoo(mock_api(_handler, AsyncAPI))
+
+        order = await woo.get_order(727)
+        assert isinstance(order, Order)
+        assert order.id == SAMPLE_ORDER["id"]
+
+        assert await woo.get_order(1) is None
+
+        first_page = await woo.list_orders()
+        assert len(first_page) == 2
+
+        all_orders = await woo.list_orders(follow_pages=True)
+        assert len(all_orders) == 3
+
+        metadata = await woo.list_orders(return_metadata=True)
+        assert metadata.total == 3
+        assert metadata.total_pages == 2
+
+        await woo.delete_order(727, force=True)
+
+        await woo.api_object.aclose()
+
+    asyncio.run(run())
@@ -0,0 +1,94 @@
+import asyncio
+import json
+
+import httpx
+import pytest
+
+from woo_py.api import AsyncAPI
+from woo_py.async_woo import AsyncWoo
+from woo_py.models.product_tag import ProductTag
+from woo_py.woo import Woo
+
+FAILING_ID = 42
+
+
+def _handler(request: httpx.Request) -> httpx.Response:
+    assert request.url.path.endswith("/products/tags/batch")
+    body = json.loads(request.content)
+    assert sum(len(items) for items in body.values()) <= 100
+
+    response: dict[str, list[dict]] = {}
+    for item in body.get("create", []):
+        response.setdefault("create", []).append({"id": 1, **item})
+    for item in body.get("update", []):
+        if item["id"] == FAILING_ID:
+            response.setdefault("update", []).append(
+                {
+                    "id": FAILING_ID,
+                    "error": {
+                        "code": "woocommerce_rest_term_invalid",
+                        "message": "Resource does not exist.",
+                        "data": {"status": 404},
+                    },
+                }
+            )
+        else:
+            response.setdefault("update", []).append(
+                {"name": "Tag", "slug": "tag", **item}
+            )
+    for tag_id in body.get("delete", []):
+        response.setdefault("delete", []).append(
+            {"id": tag_id, "name": "Tag", "slug": "tag"}
+        )
+
+    return httpx.Response(200, json=response)
+
+
+def _tags(count: int, start: int = 1000) -> list[ProductTag]:
+    return [
+        ProductTag(id=start + i, name=f"Tag {i}", slug=f"tag-{i}") for i in range(count)
+    ]
+
+
+def test_batch_chunking(mock_api):
+    woo = Woo(mock_api(_handler))
+
+    update = _tags(150)
+    update[120] = ProductTag(id=FAILING_ID, name="Missing", slug="missing")
+
+    result = woo.batch_product_tags(
+        create=_tags(30), update=update, delete=list(range(40)), concurrency=3
+    )
+
+    assert len(result.create) == 30
+    assert len(result.update) == 149
+    assert [tag.id for tag in result.delete] == list(range(40))
+
+    assert len(result.errors) == 1
+    error = result.errors[0]
+    assert error.operation == "update"
+    assert error.index == 120
+    assert error.id == FAILING_ID
+    assert error.status == 404
+
+
+def test_batch_requires_id_for_update(mock_api):
+    woo = Woo(mock_api(_handler))
+
+    with pytest.raises(ValueError):
+        woo.batch_product_tags(update=[ProductTag(id=None, name="a", slug="a")])
+
+
+def test_batch_async(mock_api):
+    async def run() -> None:
+        api = mock_api(_handler, AsyncAPI)
+
+        result = await AsyncWoo(api).batch_product_tags(
+            update=_tags(250), concurrency=2
+        )
+        assert [tag.id for tag in result.update] == [1000 + i for i in range(250)]
+        assert result.errors == []
+
+        await api.aclose()
+
+    asyncio.run(run())
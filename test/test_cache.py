@@ -0,0 +1,179 @@
+import asyncio
+
+import httpx
+
+from woo_py.api import AsyncAPI
+from woo_py.async_woo import AsyncWoo
+from woo_py.cache import HTTPCache, MemoCache
+from woo_py.models.order import Order
+from woo_py.models.setting import SettingOption
+from woo_py.woo import Woo
+
+
+def _etag_handler(requests: list[httpx.Request]):
+    def handler(request: httpx.Request) -> httpx.Response:
+        requests.append(request)
+        if request.headers.get("If-None-Match") == '"v1"':
+            return httpx.Response(304, headers={"ETag": '"v1"'})
+        return httpx.Response(
+            200,
+            json=[{"id": 1}, {"id": 2}],
+            headers={"ETag": '"v1"', "X-WP-Total": "2", "X-WP-TotalPages": "1"},
+        )
+
+    return handler
+
+
+def test_not_modified_is_served_from_cache(mock_api):
+    requests: list[httpx.Request] = []
+    api = mock_api(_etag_handler(requests), http_cache=HTTPCache())
+
+    first = api.get_all("orders", Order, include_metadata=True)
+    first.items[0].status = "completed"
+
+    second = api.get_all("orders", Order, include_metadata=True)
+
+    assert "If-None-Match" not in requests[0].headers
+    assert requests[1].headers["If-None-Match"] == '"v1"'
+    assert second.items == [Order(id=1), Order(id=2)]
+    assert second.total == 2
+    assert second.total_pages == 1
+
+
+def test_last_modified_revalidation(mock_api):
+    last_modified = "Wed, 21 Oct 2015 07:28:00 GMT"
+    requests: list[httpx.Request] = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        requests.append(request)
+        if request.headers.get("If-Modified-Since") == last_modified:
+            return httpx.Response(304)
+        return httpx.Response(
+            200, json={"id": 5}, headers={"Last-Modified": last_modified}
+        )
+
+    api = mock_api(handler, http_cache=HTTPCache())
+
+    assert api.get("orders/5", Order) == Order(id=5)
+    assert api.get("orders/5", Order) == Order(id=5)
+    assert requests[1].headers["If-Modified-Since"] == last_modified
+
+
+def test_without_validators_nothing_is_cached(mock_api):
+    requests: list[httpx.Request] = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        requests.append(request)
+        return httpx.Response(200, json={"id": len(requests)})
+
+    cache = HTTPCache()
+    api = mock_api(handler, http_cache=cache)
+
+    assert api.get("orders/1", Order) == Order(id=1)
+    assert api.get("orders/1", Order) == Order(id=2)
+    assert "If-None-Match" not in requests[1].headers
+    assert len(cache) == 0
+
+
+def test_conditional_headers_are_not_query_parameters(mock_api):
+    requests: list[httpx.Request] = []
+    api = mock_api(_etag_handler(requests), http_cache=HTTPCache())
+
+    api.get_all("orders", Order, headers="yes")
+    api.get_all("orders", Order, headers="yes")
+
+    assert requests[1].url.params["headers"] == "yes"
+    assert requests[1].headers["If-None-Match"] == '"v1"'
+
+
+def test_cache_evicts_least_recently_used():
+    cache = HTTPCache(max_entries=2)
+    request = httpx.Request("GET", "https://example.com")
+    response = httpx.Response(200, headers={"ETag": '"v1"'}, request=request)
+
+    for order_id in range(3):
+        cache.store(("orders", order_id), response, Order(id=order_id))
+
+    assert len(cache) == 2
+    assert cache.get(("orders", 0)) is None
+    assert cache.get(("orders", 2)).value == Order(id=2)
+
+
+def test_not_modified_async(mock_api):
+    requests: list[httpx.Request] = []
+
+    async def run() -> list[Order]:
+        async with mock_api(
+            _etag_handler(requests), AsyncAPI, http_cache=HTTPCache()
+        ) as api:
+            await api.get_all("orders", Order, follow_pages=True)
+            return await api.get_all("orders", Order, follow_pages=True)
+
+    assert asyncio.run(run()) == [Order(id=1), Order(id=2)]
+    assert requests[1].headers["If-None-Match"] == '"v1"'
+
+
+_SETTING = {"id": "woocommerce_currency", "label": "Currency", "value": "USD"}
+
+
+def _counting_handler(requests: list[httpx.Request]):
+    def handler(request: httpx.Request) -> httpx.Response:
+        requests.append(request)
+        if request.method == "PUT":
+            return httpx.Response(200, json=_SETTING)
+        return httpx.Response(200, json=[_SETTING])
+
+    return handler
+
+
+def test_memo_cache_serves_reference_data(mock_api):
+    requests: list[httpx.Request] = []
+    woo = Woo(mock_api(_counting_handler(requests)), cache=MemoCache())
+
+    first = woo.get_settings("general")
+    first[0].value = "NOK"
+
+    assert woo.get_settings("general") == [SettingOption(**_SETTING)]
+    assert len(requests) == 1
+
+    woo.get_settings("products")
+    assert len(requests) == 2
+
+    woo.update_setting("general", "woocommerce_currency", SettingOption(**_SETTING))
+    woo.get_settings("general")
+    assert len(requests) == 4
+
+
+def test_memo_cache_ttl_and_lru():
+    now = 0.0
+    cache = MemoCache(max_entries=2, ttls={"settings": 10}, clock=lambda: now)
+
+    cache.set("settings", "general", [1])
+    assert cache.get("settings", "general") == [1]
+
+    now = 10.0
+    assert cache.get("settings", "general") is None
+
+    cache.set("data", "countries", [1])
+    cache.set("data", "currencies", [2])
+    cache.get("data", "countries")
+    cache.set("taxes", "rates", [3])
+
+    assert cache.get("data", "currencies") is None
+    assert cache.get("data", "countries") == [1]
+
+    cache.invalidate("data")
+    assert len(cache) == 1
+
+
+def test_memo_cache_async(mock_api):
+    requests: list[httpx.Request] = []
+
+    async def run() -> None:
+        async with mock_api(_counting_handler(requests), AsyncAPI) as api:
+            woo = AsyncWoo(api, cache=MemoCache())
+            await woo.list_payment_gateways()
+            await woo.list_payment_gateways()
+
+    asyncio.run(run())
+    assert len(requests) == 1
@@ -0,0 +1,185 @@
+import csv
+import json
+
+import httpx
+import pytest
+
+from woo_py.cache import HTTPCache
+from woo_py.export import (
+    CSVWriter,
+    Exporter,
+    ExportWriter,
+    NDJSONWriter,
+    ParquetWriter,
+    flatten_item,
+)
+from woo_py.models.order import Order
+from woo_py.retry import RetryPolicy
+
+
+class Store:
+    """Paginated orders, with or without the X-WP-TotalPages header."""
+
+    def __init__(self, orders: int, total_pages_header: bool = True) -> None:
+        self.orders = [
+            {
+                "id": order_id,
+                "status": "completed",
+                "total": f"{order_id}.50",
+                "billing": {"country": "NO", "email": f"{order_id}@example.com"},
+                "line_items": [
+                    {"sku": "SHIRT", "quantity": 1},
+                    {"sku": "HOODIE", "quantity": order_id},
+                ][: order_id % 3],
+                "meta_data": [{"id": 1, "key": "gift", "value": "yes"}],
+                "_links": {"self": [{"href": f"https://shop/orders/{order_id}"}]},
+            }
+            for order_id in range(1, orders + 1)
+        ]
+        self.total_pages_header = total_pages_header
+        self.pages: list[int] = []
+
+    def handler(self, request: httpx.Request) -> httpx.Response:
+        params = request.url.params
+        page = int(params["page"])
+        per_page = int(params["per_page"])
+        self.pages.append(page)
+
+        items = self.orders[(page - 1) * per_page : page * per_page]
+        fields = params.get("_fields")
+        if fields is not None:
+            items = [{key: item[key] for key in fields.split(",")} for item in items]
+
+        total_pages = -(-len(self.orders) // per_page)
+        headers = {"X-WP-Total": str(len(self.orders))}
+        if self.total_pages_header:
+            headers["X-WP-TotalPages"] = str(total_pages)
+        if page < total_pages:
+            headers["Link"] = f'<https://shop/orders?page={page + 1}>; rel="next"'
+        return httpx.Response(200, json=items, headers=headers)
+
+
+@pytest.fixture
+def exporter(mock_api):
+    def make(store: Store, **kwargs) -> Exporter:
+        return Exporter(
+            mock_api(store.handler, retry_policy=RetryPolicy(max_retries={})),
+            per_page=10,
+            **kwargs,
+        )
+
+    return make
+
+
+def test_export_writer_is_abstract():
+    with pytest.raises(TypeError):
+        ExportWriter()
+
+
+def test_flatten_item():
+    item = {
+        "id": 1,
+        "billing": {"country": "NO"},
+        "line_items": [{"sku": "A"}, {"sku": "B"}],
+    }
+
+    assert flatten_item(item) == [
+        {"id": 1, "billing.country": "NO", "line_items": [{"sku": "A"}, {"sku": "B"}]}
+    ]
+    assert flatten_item(item, flatten=(), explode="line_items", separator="_") == [
+        {"id": 1, "billing": {"country": "NO"}, "line_items_sku": "A"},
+        {"id": 1, "billing": {"country": "NO"}, "line_items_sku": "B"},
+    ]
+    assert flatten_item({"id": 2, "line_items": []}, explode="line_items") == [
+        {"id": 2}
+    ]
+
+
+@pytest.mark.parametrize("total_pages_header", [True, False])
+def test_export_ndjson(exporter, tmp_path, total_pages_header):
+    store = Store(95, total_pages_header)
+    path = tmp_path / "orders.ndjson"
+
+    with NDJSONWriter(path) as writer:
+        exported = exporter(store, page_concurrency=3).export(
+            "orders", Order, writer, status="completed"
+        )
+
+    lines = path.read_text().splitlines()
+    assert exported == 95
+    assert [json.loads(line)["id"] for line in lines] == list(range(1, 96))
+    assert "_links" not in json.loads(lines[0])
+    assert sorted(store.pages) == list(range(1, 11))
+
+
+def test_export_fields(exporter, tmp_path):
+    store = Store(5)
+    path = tmp_path / "orders.ndjson"
+
+    with NDJSONWriter(path) as writer:
+        exporter(store).export("orders", Order, writer, fields=["id", "total"])
+
+    assert json.loads(path.read_text().splitlines()[0]) == {"id": 1, "total": "1.50"}
+
+
+def test_export_keeps_cached_pages(mock_api, tmp_path):
+    store = Store(5)
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        if request.headers.get("If-None-Match") == '"v1"':
+            return httpx.Response(304, headers={"ETag": '"v1"'})
+        response = store.handler(request)
+        response.headers["ETag"] = '"v1"'
+        return response
+
+    api = mock_api(handler, http_cache=HTTPCache())
+    paths = [tmp_path / "first.ndjson", tmp_path / "second.ndjson"]
+    for path in paths:
+        with NDJSONWriter(path) as writer:
+            Exporter(api, per_page=10).export("orders", Order, writer)
+
+    # The second export is served from the cache, which still has the _links
+    assert paths[0].read_text() == paths[1].read_text()
+    cached = api.get_all("orders", Order, lazy=True, page=1, per_page=10)
+    assert "_links" in cached.raw(0)
+
+
+def test_export_csv(exporter, tmp_path):
+    store = Store(25)
+    path = tmp_path / "line_items.csv"
+
+    with CSVWriter(path, explode="line_items") as writer:
+        exporter(store).export("orders", Order, writer)
+
+    with open(path, newline="") as f:
+        rows = list(csv.DictReader(f))
+
+    assert len(rows) == writer.rows
+    assert rows[0]["billing.country"] == "NO"
+    assert rows[0]["line_items.sku"] == "SHIRT"
+    assert json.loads(rows[0]["meta_data"]) == [
+        {"id": 1, "key": "gift", "value": "yes"}
+    ]
+    # Orders without line items get one row
+    assert [row["id"] for row in rows[:4]] == ["1", "2", "2", "3"]
+    assert rows[3]["line_items.sku"] == ""
+
+
+def test_export_parquet(exporter, tmp_path):
+    parquet = pytest.importorskip("pyarrow.parquet")
+    store = Store(45)
+    path = tmp_path / "orders.parquet"
+
+    with ParquetWriter(path, row_group_size=20) as writer:
+        exporter(store).export("orders", Order, writer)
+
+    file = parquet.ParquetFile(path)
+    assert file.metadata.num_rows == 45
+    assert file.metadata.num_row_groups == 3
+    table = file.read()
+    assert table.column("id").to_pylist() == list(range(1, 46))
+    assert table.column("billing.email").to_pylist()[0] == "1@example.com"
+    assert json.loads(table.column("line_items").to_pylist()[1]) == [
+        {"sku": "SHIRT", "quantity": 1},
+        {"sku": "HOODIE", "quantity": 2},
+    ]
@@ -0,0 +1,63 @@
+import asyncio
+
+import httpx
+import pytest
+
+from woo_py.api import AsyncAPI
+from woo_py.async_woo import AsyncWoo
+from woo_py.models.customer import Customer
+from woo_py.models.tax_rate import TaxRate
+from woo_py.partial import fields_param, partial_model
+from woo_py.woo import Woo
+
+
+def _handler(requests: list[httpx.Request]):
+    def handler(request: httpx.Request) -> httpx.Response:
+        requests.append(request)
+        fields = request.url.params["_fields"].split(",")
+        customer = {"id": 1, "email": "ola@example.com", "first_name": "Ola"}
+        partial = {field: customer[field] for field in fields if field in customer}
+
+        if request.url.path.endswith("/customers"):
+            return httpx.Response(200, json=[partial])
+        return httpx.Response(200, json=partial)
+
+    return handler
+
+
+def test_partial_models(mock_api):
+    requests: list[httpx.Request] = []
+    woo = Woo(mock_api(_handler(requests)))
+
+    customers = woo.list_customers(fields=["id", "first_name", "_links"])
+    assert requests[0].url.params["_fields"] == "id,first_name"
+
+    # Customer.email is required, but was not requested
+    assert isinstance(customers[0], Customer)
+    assert customers[0].first_name == "Ola"
+    assert customers[0].email is None
+
+    customer = woo.get_customer(1, fields=["email"])
+    assert customer.email == "ola@example.com"
+    assert customer.id is None
+
+    assert [customer.id for customer in woo.iter_customers(fields=["id"])] == [1]
+
+
+def test_fields_param():
+    assert fields_param(TaxRate, ["id", "class_", "class"]) == ["id", "class"]
+    assert partial_model(TaxRate).model_validate({"class": "zero"}).class_ == "zero"
+    assert partial_model(TaxRate) is partial_model(TaxRate)
+
+    with pytest.raises(ValueError):
+        fields_param(TaxRate, ["_links"])
+
+
+def test_partial_models_async(mock_api):
+    requests: list[httpx.Request] = []
+
+    async def run() -> list[Customer]:
+        async with mock_api(_handler(requests), AsyncAPI) as api:
+            return await AsyncWoo(api).list_customers(follow_pages=True, fields=["id"])
+
+    assert [customer.id for customer in asyncio.run(run())] == [1]
@@ -0,0 +1,125 @@
+import copy
+import datetime
+import json
+from decimal import Decimal
+
+import pytest
+
+np = pytest.importorskip("numpy")
+
+from woo_py.frame import Categorical, OrderFrame, parse_money
+from woo_py.models import Order
+
+
+def _orders() -> list[Order]:
+    with open("test/sample_data/order.json") as f:
+        sample = json.load(f)
+
+    orders = []
+    for order_id, (status, country, refunds) in enumerate(
+        [
+            ("processing", "US", []),
+            ("completed", "NO", [{"id": 1, "total": "-2.10"}]),
+            ("completed", "", [{"id": 2, "total": "-1"}, {"id": 3, "total": "-0.05"}]),
+        ],
+        start=1,
+    ):
+        data = copy.deepcopy(sample)
+        data["id"] = order_id
+        data["status"] = status
+        data["billing"]["country"] = country
+        data["refunds"] = refunds
+        data["date_created_gmt"] = f"2024-01-0{order_id}T23:30:00"
+        orders.append(Order.model_validate(data))
+    return orders
+
+
+def test_parse_money():
+    amounts = parse_money(["29.35", "0.1", "", None, "-5", 1.35, "8.264463"])
+    assert amounts.tolist() == [29350000, 100000, 0, 0, -5000000, 1350000, 8264463]
+    assert parse_money(["0.1"] * 10, decimals=2).sum() == 100
+
+
+def test_parse_money_is_exact():
+    # Beyond the 15 significant digits a float holds
+    assert parse_money(["12345678901.123456"]).tolist() == [12345678901123456]
+    assert parse_money(["0.0000015", "0.0000025", "1e-3"]).tolist() == [2, 2, 1000]
+    assert parse_money([".5", "-.25"], decimals=2).tolist() == [50, -25]
+
+
+def test_categorical():
+    column = Categorical.from_values(["NO", None, "US", "NO"])
+    assert column.categories.tolist() == ["NO", "US"]
+    assert column.codes.tolist() == [0, -1, 1, 0]
+    assert column.isin("NO", "SE").tolist() == [True, False, False, True]
+    assert column.to_list() == ["NO", None, "US", "NO"]
+
+
+def test_typed_columns():
+    frame = OrderFrame.from_orders(_orders())
+
+    assert frame.orders.array("id").tolist() == [1, 2, 3]
+    assert frame.orders.categorical("currency").to_list() == ["USD"] * 3
+    with pytest.raises(TypeError):
+        frame.orders.array("currency")
+    with pytest.raises(TypeError):
+        frame.orders.categorical("id")
+
+
+def test_order_columns():
+    frame = OrderFrame.from_orders(_orders())
+
+    assert len(frame) == 3
+    assert frame.orders["id"].tolist() == [1, 2, 3]
+    assert frame.orders["status"].to_list() == ["processing", "completed", "completed"]
+    assert frame.orders["billing_country"].to_list() == ["US", "NO", None]
+    assert frame.orders["date_created"][0] == np.datetime64("2024-01-01T23:30:00")
+    assert np.isnat(frame.orders["date_completed"]).all()
+    assert frame.orders["item_count"].tolist() == [3, 3, 3]
+    assert frame.orders.sum("total") == Decimal("88.05")
+    assert frame.orders.sum("refund_total") == Decimal("3.15")
+
+
+def test_group_sum():
+    frame = OrderFrame.from_orders(_orders())
+
+    assert frame.orders.group_sum("status", "total") == {
+        "completed": Decimal("58.70"),
+        "processing": Decimal("29.35"),
+    }
+    # Orders without a country are left out
+    assert frame.orders.group_sum(("status", "billing_country"), "total") == {
+        ("completed", "NO"): Decimal("29.35"),
+        ("processing", "US"): Decimal("29.35"),
+    }
+    assert frame.line_items.group_sum("product_id", "quantity") == {22: 3, 93: 6}
+    assert frame.tax_lines.group_sum("rate_code", "tax_total") == {
+        "US-CA-STATE TAX": Decimal("4.05")
+    }
+
+    days = frame.orders.with_columns(
+        day=frame.orders["date_created"].astype("datetime64[D]")
+    )
+    assert list(days.group_sum("day", "total")) == [
+        datetime.date(2024, 1, 1),
+        datetime.date(2024, 1, 2),
+        datetime.date(2024, 1, 3),
+    ]
+
+
+def test_join_orders():
+    frame = OrderFrame.from_orders(_orders())
+
+    items = frame.join_orders(frame.line_items, "status", "total")
+    assert "order_total" in items.money
+    completed = items.filter(items["status"].isin("completed"))
+    assert len(completed) == 4
+    assert completed.group_sum("sku", "total") == {"Bar3": Decimal("24.00")}
+
+
+def test_empty():
+    frame = OrderFrame.from_orders([])
+
+    assert len(frame.line_items) == 0
+    assert frame.orders.sum("total") == 0
+    assert frame.orders.group_sum("status", "total") == {}
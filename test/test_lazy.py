@@ -0,0 +1,78 @@
+import asyncio
+
+import httpx
+
+from woo_py.api import AsyncAPI
+from woo_py.async_woo import AsyncWoo
+from woo_py.lazy import LazyList
+from woo_py.models.order import Order
+from woo_py.woo import Woo
+
+STATUSES = ["processing", "completed", "processing"]
+
+
+def _handler(request: httpx.Request) -> httpx.Response:
+    page = int(request.url.params.get("page", 1))
+    headers = {"X-WP-Total": "6", "X-WP-TotalPages": "2"}
+    if page == 1:
+        headers["Link"] = '<https://example.com/orders?page=2>; rel="next"'
+    if page > 2:
+        return httpx.Response(200, json=[])
+
+    orders = [
+        {"id": page * 10 + i, "status": status, "line_items": [{"id": i}]}
+        for i, status in enumerate(STATUSES)
+    ]
+    return httpx.Response(200, json=orders, headers=headers)
+
+
+def test_items_are_validated_on_access(mock_api):
+    orders = mock_api(_handler).get_all("orders", Order, lazy=True)
+
+    assert isinstance(orders, LazyList)
+    assert len(orders) == 3
+    assert orders.values("status") == STATUSES
+    assert orders.raw(0)["id"] == 10
+    assert "0 validated" in repr(orders)
+
+    assert orders[1].line_items[0].id == 1
+    assert orders[1] is orders[1]
+    assert "1 validated" in repr(orders)
+
+    processing = orders.filter(lambda raw: raw["status"] == "processing")
+    assert [order.id for order in processing] == [10, 12]
+    assert orders[:2].validate_all() == [orders[0], orders[1]]
+
+
+def test_lazy_follow_pages(mock_api):
+    first_page = mock_api(_handler).get_all("orders", Order)
+
+    for page_concurrency in (1, 4):
+        orders = mock_api(_handler, page_concurrency=page_concurrency).get_all(
+            "orders", Order, follow_pages=True, lazy=True
+        )
+
+        assert isinstance(orders, LazyList)
+        assert orders.values("id") == [10, 11, 12, 20, 21, 22]
+        assert list(orders[:3]) == first_page
+
+
+def test_lazy_facade(mock_api):
+    woo = Woo(mock_api(_handler))
+
+    orders = woo.list_orders(follow_pages=True, lazy=True)
+    assert len(orders) == 6
+
+    page = woo.list_orders(return_metadata=True, lazy=True)
+    assert isinstance(page.items, LazyList)
+    assert page.total == 6
+
+
+def test_lazy_async(mock_api):
+    async def run() -> LazyList[Order]:
+        async with mock_api(_handler, AsyncAPI, page_concurrency=2) as api:
+            return await AsyncWoo(api).list_orders(follow_pages=True, lazy=True)
+
+    orders = asyncio.run(run())
+    assert orders.values("id") == [10, 11, 12, 20, 21, 22]
+    assert orders[5].id == 22
@@ -0,0 +1,144 @@
+import asyncio
+import threading
+import time
+
+import httpx
+
+from woo_py.limiter import AdaptiveLimiter
+from woo_py.retry import RetryPolicy
+
+
+def _run_saturated(limiter: AdaptiveLimiter, latency: float, rounds: int) -> None:
+    for _ in range(rounds):
+        epochs = [limiter.acquire() for _ in range(limiter.limit)]
+        for epoch in epochs:
+            limiter.release(latency=latency, epoch=epoch)
+
+
+def test_additive_increase_and_multiplicative_decrease():
+    limiter = AdaptiveLimiter(initial_limit=4, max_limit=10)
+
+    _run_saturated(limiter, latency=0.1, rounds=20)
+    assert limiter.limit == 10
+
+    limiter.release(overloaded=True, epoch=limiter.acquire())
+    assert limiter.limit == 5
+
+    _run_saturated(limiter, latency=1.0, rounds=5)
+    assert limiter.limit < 5
+    assert limiter.in_flight == 0
+
+
+def test_limit_is_cut_once_per_window():
+    limiter = AdaptiveLimiter(initial_limit=8, max_limit=8)
+
+    # Overloads of requests that were in flight together are a single signal
+    epochs = [limiter.acquire() for _ in range(8)]
+    for epoch in epochs:
+        limiter.release(overloaded=True, epoch=epoch)
+    assert limiter.limit == 4
+
+    # Latency samples of the same window do not cut it either
+    limiter.release(latency=0.1, epoch=limiter.acquire())
+    epochs = [limiter.acquire() for _ in range(4)]
+    for epoch in epochs:
+        limiter.release(latency=1.0, epoch=epoch)
+    assert limiter.limit == 3
+
+    # A request started after the last cut cuts it again
+    limiter.release(overloaded=True, epoch=limiter.acquire())
+    assert limiter.limit == 1
+    assert limiter.in_flight == 0
+
+
+def test_limit_is_not_exceeded():
+    limiter = AdaptiveLimiter(initial_limit=3, min_limit=3, max_limit=3)
+    in_flight = 0
+    max_in_flight = 0
+    lock = threading.Lock()
+
+    def worker() -> None:
+        nonlocal in_flight, max_in_flight
+        limiter.acquire()
+        with lock:
+            in_flight += 1
+            max_in_flight = max(max_in_flight, in_flight)
+        time.sleep(0.01)
+        with lock:
+            in_flight -= 1
+        limiter.release(latency=0.01)
+
+    threads = [threading.Thread(target=worker) for _ in range(12)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert max_in_flight == 3
+
+
+def test_limit_is_not_exceeded_async():
+    limiter = AdaptiveLimiter(initial_limit=3, min_limit=3, max_limit=3)
+    in_flight = 0
+    max_in_flight = 0
+
+    async def worker() -> None:
+        nonlocal in_flight, max_in_flight
+        await limiter.acquire_async()
+        in_flight += 1
+        max_in_flight = max(max_in_flight, in_flight)
+        await asyncio.sleep(0.01)
+        in_flight -= 1
+        limiter.release(latency=0.01)
+
+    async def run() -> None:
+        await asyncio.gather(*(worker() for _ in range(12)))
+
+    asyncio.run(run())
+
+    assert max_in_flight == 3
+    assert limiter.in_flight == 0
+
+
+def test_api_reports_overload(mock_api):
+    limiter = AdaptiveLimiter(initial_limit=8, max_limit=8)
+    api = mock_api(
+        lambda request: httpx.Response(503, json={}),
+        retry_policy=RetryPolicy(max_retries={}),
+        limiter=limiter,
+    )
+
+    try:
+        api.get_json("orders")
+    except httpx.HTTPStatusError:
+        pass
+
+    assert limiter.limit == 4
+    assert limiter.in_flight == 0
+
+
+def test_api_cuts_once_for_concurrent_overloads(mock_api):
+    limiter = AdaptiveLimiter(initial_limit=8, max_limit=8)
+    barrier = threading.Barrier(4)
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        # Answer once all requests are in flight
+        barrier.wait(timeout=5)
+        return httpx.Response(503, json={})
+
+    api = mock_api(handler, retry_policy=RetryPolicy(max_retries={}), limiter=limiter)
+
+    def worker() -> None:
+        try:
+            api.get_json("orders")
+        except httpx.HTTPStatusError:
+            pass
+
+    threads = [threading.Thread(target=worker) for _ in range(4)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert limiter.limit == 4
+    assert limiter.in_flight == 0
@@ -0,0 +1,72 @@
+import httpx
+
+from woo_py.metrics import Histogram, MetricsRegistry, endpoint_label
+from woo_py.models.order import Order
+from woo_py.retry import RetryPolicy
+
+
+def test_api_records_metrics(mock_api):
+    attempts = {"orders/5": 0}
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        path = request.url.path.removeprefix("/wp-json/wc/v3/")
+        if path == "orders/5":
+            attempts[path] += 1
+            if attempts[path] == 1:
+                return httpx.Response(503, headers={"Retry-After": "0"})
+            return httpx.Response(200, json={"id": 5})
+        return httpx.Response(
+            200,
+            json=[{"id": 1}, {"id": 2}],
+            headers={"X-WP-Total": "2", "X-WP-TotalPages": "1"},
+        )
+
+    metrics = MetricsRegistry()
+    api = mock_api(handler, retry_policy=RetryPolicy(backoff_factor=0), metrics=metrics)
+
+    api.get_all("orders", Order)
+    api.get("orders/5", Order)
+
+    snapshots = {
+        (snapshot.endpoint, snapshot.method): snapshot
+        for snapshot in metrics.snapshot()
+    }
+    orders = snapshots[("orders", "GET")]
+    assert orders.requests == 1
+    assert orders.items_parsed == 2
+    assert orders.status_codes == {200: 1}
+    assert orders.response_bytes == len(b'[{"id":1},{"id":2}]')
+
+    order = snapshots[("orders/{id}", "GET")]
+    assert order.requests == 2
+    assert order.retries == 1
+    assert order.status_codes == {503: 1, 200: 1}
+    assert order.items_parsed == 1
+    assert order.validation_seconds > 0
+
+    text = metrics.render_prometheus()
+    assert (
+        'woo_py_requests_total{endpoint="orders/{id}",method="GET",status="503"} 1'
+        in text
+    )
+    assert (
+        'woo_py_request_duration_seconds_bucket{endpoint="orders",method="GET",le="+Inf"} 1'
+        in text
+    )
+    assert 'woo_py_request_retries_total{endpoint="orders/{id}",method="GET"} 1' in text
+
+
+def test_histogram_quantiles():
+    histogram = Histogram(buckets=(0.1, 0.2, 0.4))
+    for value in [0.05] * 50 + [0.15] * 45 + [0.3] * 4 + [1.0]:
+        histogram.observe(value)
+
+    assert 0 < histogram.quantile(0.5) <= 0.1
+    assert 0.1 < histogram.quantile(0.95) <= 0.2
+    assert 0.2 < histogram.quantile(0.99) <= 0.4
+    assert histogram.quantile(1.0) == 1.0
+
+
+def test_endpoint_label():
+    assert endpoint_label("orders/123/notes/4") == "orders/{id}/notes/{id}"
+    assert endpoint_label("/products/categories") == "products/categories"
@@ -0,0 +1,142 @@
+import httpx
+
+from woo_py.mirror import CatalogMirror
+
+
+class Store:
+    """In-memory catalog, filtering on modified_after and status like the REST API."""
+
+    def __init__(self) -> None:
+        self.products: dict[int, dict] = {}
+        self.variations: dict[int, dict[int, dict]] = {}
+        self.categories = [
+            {"id": 1, "name": "Clothing", "slug": "clothing", "parent": 0},
+            {"id": 2, "name": "Shirts", "slug": "shirts", "parent": 1},
+        ]
+        self.tags = [{"id": 5, "name": "Sale", "slug": "sale"}]
+        self.requests: list[httpx.Request] = []
+
+    def handler(self, request: httpx.Request) -> httpx.Response:
+        self.requests.append(request)
+        path = request.url.path.removeprefix("/wp-json/wc/v3/")
+        params = request.url.params
+
+        if path == "products/categories":
+            items = self.categories
+        elif path == "products/tags":
+            items = self.tags
+        elif path == "products":
+            status = params.get("status")
+            items = [
+                product
+                for product in self.products.values()
+                if (product["status"] == "trash") == (status == "trash")
+            ]
+        else:
+            items = list(self.variations[int(path.split("/")[1])].values())
+
+        modified_after = params.get("modified_after")
+        if modified_after is not None:
+            items = [
+                item for item in items if item["date_modified_gmt"] > modified_after
+            ]
+
+        fields = params.get("_fields")
+        if fields is not None:
+            items = [
+                {key: item[key] for key in fields.split(",") if key in item}
+                for item in items
+            ]
+
+        return httpx.Response(
+            200,
+            json=items,
+            headers={"X-WP-Total": str(len(items)), "X-WP-TotalPages": "1"},
+        )
+
+
+def _product(product_id: int, modified: str, **kwargs) -> dict:
+    return {
+        "id": product_id,
+        "name": f"Product {product_id}",
+        "slug": f"product-{product_id}",
+        "sku": f"P{product_id}",
+        "status": "publish",
+        "date_modified_gmt": modified,
+        **kwargs,
+    }
+
+
+def test_mirror(mock_api, tmp_path):
+    store = Store()
+    store.products = {
+        1: _product(
+            1,
+            "2024-05-01T10:00:00",
+            categories=[{"id": 2, "name": "Shirts", "slug": "shirts"}],
+            tags=[{"id": 5, "name": "Sale", "slug": "sale"}],
+        ),
+        2: _product(2, "2024-05-01T11:00:00", type="variable"),
+        4: _product(4, "2024-05-01T09:00:00", type="variable"),
+    }
+    store.variations = {
+        2: {
+            21: {"id": 21, "sku": "P2-S", "date_modified_gmt": "2024-05-01T11:00:00"},
+            22: {"id": 22, "sku": "P2-M", "date_modified_gmt": "2024-05-01T11:00:00"},
+        },
+        4: {41: {"id": 41, "sku": "P4-S", "date_modified_gmt": "2024-05-01T09:00:00"}},
+    }
+    mirror = CatalogMirror(
+        tmp_path / "catalog.db", mock_api(store.handler), page_concurrency=2
+    )
+    mirror.refresh()
+
+    assert mirror.get_product(1).name == "Product 1"
+    assert mirror.get_product_by_sku("P2").id == 2
+    assert mirror.get_product_by_slug("product-1").id == 1
+    assert mirror.get_product(3) is None
+    assert [product.id for product in mirror.list_products(category=2)] == [1]
+    assert [product.id for product in mirror.list_products(tag=5)] == [1]
+    assert [product.id for product in mirror.list_products(type="variable")] == [2, 4]
+    assert [variation.id for variation in mirror.list_product_variations(2)] == [
+        21,
+        22,
+    ]
+    assert mirror.get_product_variation_by_sku("P2-M").id == 22
+    assert mirror.get_product_category_by_slug("shirts").parent == 1
+    assert [category.id for category in mirror.list_product_categories(parent=0)] == [1]
+    assert mirror.get_product_tag(5).slug == "sale"
+
+    # Only the changes are requested, trashed products are removed
+    store.products[1]["status"] = "trash"
+    store.products[1]["date_modified_gmt"] = "2024-05-02T10:00:00"
+    store.products[2]["date_modified_gmt"] = "2024-05-02T10:00:00"
+    store.variations[2][22]["sku"] = "P2-L"
+    store.variations[2][22]["date_modified_gmt"] = "2024-05-02T10:00:00"
+    store.requests.clear()
+    mirror.refresh()
+
+    assert mirror.get_product(1) is None
+    assert mirror.list_products(category=2) == []
+    assert mirror.get_product_variation_by_sku("P2-M") is None
+    assert mirror.get_product_variation(22).sku == "P2-L"
+    assert mirror.get_product_variation(21).sku == "P2-S"
+    assert all(
+        request.url.params.get("modified_after") == "2024-05-01T10:59:59"
+        for request in store.requests
+        if request.url.path.endswith("/products")
+    )
+    # Variations are only requested for the changed variable product
+    assert [
+        request.url.path
+        for request in store.requests
+        if "variations" in request.url.path
+    ] == ["/wp-json/wc/v3/products/2/variations"]
+    assert mirror.get_product_variation(41).sku == "P4-S"
+
+    mirror.close()
+
+    # The mirror answers lookups without an API client
+    mirror = CatalogMirror(tmp_path / "catalog.db")
+    assert mirror.get_product_by_sku("P2").type.value == "variable"
+    mirror.close()
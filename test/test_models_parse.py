@@ -1,8 +1,11 @@
 import json
+import subprocess
+import sys
 
 import pytest
 from pydantic import BaseModel
 
+import woo_py.models
 from woo_py.models.coupon import Coupon
 from woo_py.models.customer import Customer
 from woo_py.models.order import Order
@@ -21,6 +24,7 @@ def _class_to_snake_case(obj):
         ["_" + i.lower() if i.isupper() else i for i in obj.__name__]
     ).lstrip("_")
 
+
 @pytest.mark.parametrize(
     "object",
     [
@@ -42,4 +46,39 @@ def test_parse_sample_data(object: BaseModel):
 
     as_dict = json.loads(data)
 
-    item = object.model_validate(as_dict)
\ No newline at end of file
+    item = object.model_validate(as_dict)
+
+
+def test_models_imported_lazily():
+    code = (
+        "import sys\n"
+        "import woo_py.models as models\n"
+        "assert 'woo_py.models.order' not in sys.modules\n"
+        "assert not models.MetaData.__pydantic_complete__\n"
+        "assert models.Order is sys.modules['woo_py.models.order'].Order\n"
+        "assert models.ProductCategoryRef.__module__ == 'woo_py.models.product'\n"
+        "assert 'Webhook' in dir(models)\n"
+    )
+    subprocess.run([sys.executable, "-c", code], check=True)
+
+
+def test_woo_imports_lazily():
+    code = (
+        "import sys\n"
+        "import woo_py.woo, woo_py.async_woo\n"
+        "assert 'woo_py.sync' not in sys.modules\n"
+        "assert 'sqlite3' not in sys.modules\n"
+        "assert not [name for name in sys.modules if name.startswith('woo_py.models.')]\n"
+        "assert not {'woo_py.cache', 'woo_py.limiter', 'woo_py.metrics'} & set(sys.modules)\n"
+    )
+    subprocess.run([sys.executable, "-c", code], check=True)
+
+
+def test_lazy_models_are_exported():
+    assert set(woo_py.models._LAZY_MODELS) <= set(woo_py.models.__all__)
+    assert all(hasattr(woo_py.models, name) for name in woo_py.models.__all__)
+
+
+def test_unknown_model():
+    with pytest.raises(AttributeError):
+        woo_py.models.NotAModel
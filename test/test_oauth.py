@@ -0,0 +1,94 @@
+import base64
+import hashlib
+import hmac
+from concurrent.futures import ThreadPoolExecutor
+from urllib.parse import quote, urlencode
+
+import httpx
+
+import oauth
+from oauth import OAuth
+from woo_py.api import API
+
+URL = "http://example.com/wp-json/wc/v3/products"
+
+
+def _reference_signature(method: str, params: dict[str, str], secret: str) -> str:
+    """The signature as computed by the original, unoptimised implementation."""
+    encoded = {quote(k, safe="/"): quote(v, safe="/") for k, v in params.items()}
+    param_string = urlencode(dict(sorted(encoded.items())), safe="/")
+    base_string = "&".join(
+        [method.upper(), quote(URL, safe="/"), quote(param_string, safe="/")]
+    )
+    signing_key = f"{quote(secret, safe='/')}&"
+    hashed = hmac.new(signing_key.encode(), base_string.encode(), hashlib.sha1)
+    return base64.b64encode(hashed.digest()).decode()
+
+
+def test_signature_matches_reference():
+    signer = OAuth("ck_test", "cs_te/st&")
+    params = {
+        "oauth_consumer_key": "ck_test",
+        "oauth_signature_method": "HMAC-SHA1",
+        "oauth_timestamp": "1700000000",
+        "oauth_nonce": "abc",
+        "search": "blue shirt/xl",
+        "per_page": "100",
+    }
+
+    for _ in range(2):
+        assert signer._generate_signature("get", URL, params) == _reference_signature(
+            "get", params, "cs_te/st&"
+        )
+
+
+def test_signer_is_reusable_across_threads():
+    signer = OAuth("ck_test", "cs_test")
+
+    def sign(page: int) -> dict[str, str]:
+        return signer.get_auth_params("get", URL, {"page": str(page)})
+
+    with ThreadPoolExecutor(max_workers=8) as executor:
+        results = list(executor.map(sign, range(200)))
+
+    assert len({params["oauth_nonce"] for params in results}) == 200
+    for params in results:
+        signature = params.pop("oauth_signature")
+        assert signature == _reference_signature("get", params, "cs_test")
+
+
+def test_per_request_params_are_not_cached():
+    signer = OAuth("ck_test", "cs_test")
+    oauth._encode_static_pair.cache_clear()
+
+    for _ in range(50):
+        signer.get_auth_params("get", URL, {"per_page": "100"})
+
+    # The consumer key, signature method and per_page
+    assert oauth._encode_static_pair.cache_info().currsize == 3
+
+
+def test_api_signs_plain_http_requests():
+    requests: list[httpx.Request] = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        requests.append(request)
+        return httpx.Response(200, json=[])
+
+    api = API(
+        "http://example.com",
+        "ck_test",
+        "cs_test",
+        transport=httpx.MockTransport(handler),
+    )
+    signer = api._oauth
+
+    api.get_json("products", per_page=10, featured=True)
+    api.get_json("products", per_page=10, featured=True)
+
+    assert api._oauth is signer
+    assert requests[0].url.params["featured"] == "true"
+    assert "oauth_signature" in requests[0].url.params
+    assert (
+        requests[0].url.params["oauth_nonce"] != requests[1].url.params["oauth_nonce"]
+    )
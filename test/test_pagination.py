@@ -0,0 +1,106 @@
+import asyncio
+import threading
+
+import httpx
+
+from woo_py.api import AsyncAPI
+from woo_py.async_woo import AsyncWoo
+from woo_py.models.product_tag import ProductTag
+from woo_py.woo import Woo
+
+TOTAL_PAGES = 5
+PER_PAGE = 3
+
+
+def _handler(request: httpx.Request) -> httpx.Response:
+    page = int(request.url.params.get("page", 1))
+    items = [
+        {"id": page * 100 + i, "name": f"Tag {page}-{i}", "slug": f"tag-{page}-{i}"}
+        for i in range(PER_PAGE)
+    ]
+    headers = {
+        "X-WP-Total": str(TOTAL_PAGES * PER_PAGE),
+        "X-WP-TotalPages": str(TOTAL_PAGES),
+    }
+    if page < TOTAL_PAGES:
+        headers["Link"] = (
+            f'<https://example.com/products/tags?page={page + 1}>; rel="next"'
+        )
+    return httpx.Response(200, json=items, headers=headers)
+
+
+EXPECTED_IDS = [
+    page * 100 + i for page in range(1, TOTAL_PAGES + 1) for i in range(PER_PAGE)
+]
+
+
+def test_follow_pages_sequential(mock_api):
+    api = mock_api(_handler)
+
+    tags = api.get_all("products/tags", ProductTag, follow_pages=True)
+
+    assert [tag.id for tag in tags] == EXPECTED_IDS
+
+
+def test_follow_pages_concurrent(mock_api):
+    api = mock_api(_handler, page_concurrency=4)
+
+    tags = api.get_all("products/tags", ProductTag, follow_pages=True)
+    assert [tag.id for tag in tags] == EXPECTED_IDS
+
+    tags = api.get_all(
+        "products/tags", ProductTag, follow_pages=True, page_concurrency=2, page=3
+    )
+    assert [tag.id for tag in tags] == EXPECTED_IDS[2 * PER_PAGE :]
+
+
+def test_single_remaining_page_is_fetched_directly(mock_api):
+    threads: set[threading.Thread] = set()
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        threads.add(threading.current_thread())
+        return _handler(request)
+
+    api = mock_api(handler, page_concurrency=4)
+
+    tags = api.get_all("products/tags", ProductTag, follow_pages=True, page=4)
+    assert [tag.id for tag in tags] == EXPECTED_IDS[3 * PER_PAGE :]
+    assert threads == {threading.current_thread()}
+
+
+def test_follow_pages_concurrent_async(mock_api):
+    async def run() -> None:
+        api = mock_api(_handler, AsyncAPI)
+
+        tags = await api.get_all(
+            "products/tags", ProductTag, follow_pages=True, page_concurrency=3
+        )
+        assert [tag.id for tag in tags] == EXPECTED_IDS
+
+        await api.aclose()
+
+    asyncio.run(run())
+
+
+def test_iter_all(mock_api):
+    api = mock_api(_handler)
+
+    tags = api.iter_all("products/tags", ProductTag)
+    assert isinstance(next(tags), ProductTag)
+    assert [tag.id for tag in tags] == EXPECTED_IDS[1:]
+
+    woo = Woo(api)
+    assert [tag.id for tag in woo.iter_product_tags(page=5)] == EXPECTED_IDS[-PER_PAGE:]
+
+
+def test_iter_all_async(mock_api):
+    async def run() -> None:
+        api = mock_api(_handler, AsyncAPI)
+
+        woo = AsyncWoo(api)
+        ids = [tag.id async for tag in woo.iter_product_tags()]
+        assert ids == EXPECTED_IDS
+
+        await api.aclose()
+
+    asyncio.run(run())
@@ -1,3 +1,7 @@
+import datetime
+
+import pytest
+
 from woo_py.models.report import SalesReport, TopSellersReport
 from woo_py.woo import Woo
 
@@ -13,4 +17,37 @@ def test_reports_methods(woo: Woo):
     # We can verify we get a list, but it may be empty if no sales
     assert isinstance(top_sellers, list)
     for seller in top_sellers:
-        assert isinstance(seller, TopSellersReport)
\ No newline at end of file
+        assert isinstance(seller, TopSellersReport)
+
+
+def test_local_sales_report_parity(woo: Woo):
+    pytest.importorskip("numpy")
+    from woo_py.sales_report import SalesReportEngine
+
+    date_max = datetime.date.today()
+    date_min = date_max - datetime.timedelta(days=30)
+
+    after = f"{date_min.isoformat()}T00:00:00"
+    # Refunding an order modifies it, so this includes orders created before the range
+    # that were refunded in it, whose refunds count on the day they were made
+    orders = list(woo.iter_orders(per_page=100, modified_after=after))
+    refunds = {
+        order.id: woo.list_order_refunds(order.id, after=after, follow_pages=True)
+        for order in orders
+        if order.refunds
+    }
+    engine = SalesReportEngine.from_orders(orders, refunds)
+
+    local = engine.report(date_min, date_max)
+    remote = woo.get_sales_report(
+        date_min=date_min.isoformat(), date_max=date_max.isoformat()
+    )
+    assert remote is not None
+    assert local.total_orders == remote.total_orders
+    assert local.total_items == remote.total_items
+    for field in ("total_sales", "net_sales", "total_tax", "total_shipping"):
+        assert float(getattr(local, field)) == pytest.approx(
+            float(getattr(remote, field))
+        )
+    assert float(local.total_refunds) == pytest.approx(float(remote.total_refunds))
+    assert float(local.total_discount) == pytest.approx(float(remote.total_discount))
@@ -0,0 +1,84 @@
+import sys
+
+import httpx
+import pytest
+from loguru import logger
+
+from woo_py.request_log import RequestLogger
+
+
+class CountingLogger(RequestLogger):
+    def __init__(self, **kwargs) -> None:
+        super().__init__(**kwargs)
+        self.formatted = 0
+
+    def format_response(self, response: httpx.Response, elapsed: float) -> str:
+        self.formatted += 1
+        return super().format_response(response, elapsed)
+
+
+@pytest.fixture(autouse=True)
+def no_default_handler():
+    """Remove loguru's default DEBUG handler, so the tests control which levels are enabled."""
+    logger.remove()
+    yield
+    logger.add(sys.stderr)
+
+
+def _ok(request: httpx.Request) -> httpx.Response:
+    return httpx.Response(200, json=[])
+
+
+def test_messages_are_only_formatted_when_level_is_enabled(mock_api):
+    request_logger = CountingLogger()
+    api = mock_api(_ok, request_logger=request_logger)
+
+    messages: list[str] = []
+    handler_id = logger.add(messages.append, level="INFO", format="{message}")
+    try:
+        api.get_json("orders")
+    finally:
+        logger.remove(handler_id)
+    assert request_logger.formatted == 0
+
+    handler_id = logger.add(messages.append, level="DEBUG", format="{message}")
+    try:
+        api.get_json("orders")
+    finally:
+        logger.remove(handler_id)
+    assert request_logger.formatted == 1
+    assert any(message.startswith("GET https://example.com") for message in messages)
+
+
+def test_secrets_are_redacted_and_payload_is_sampled(mock_api):
+    api = mock_api(
+        _ok,
+        request_logger=RequestLogger(payload_sample_rate=0.0),
+        query_string_auth=True,
+    )
+
+    messages: list[str] = []
+    handler_id = logger.add(messages.append, level="DEBUG", format="{message}")
+    try:
+        api.get_json("orders")
+    finally:
+        logger.remove(handler_id)
+
+    (message,) = [message for message in messages if message.startswith("GET")]
+    assert "cs_test" not in message
+    assert "consumer_secret=%5Bsecure%5D" in message
+    assert "headers" not in message
+    assert "-> 200 in" in message
+
+
+def test_request_logging_can_be_disabled(mock_api):
+    api = mock_api(_ok, request_logger=None)
+
+    messages: list[str] = []
+    handler_id = logger.add(messages.append, level="DEBUG", format="{message}")
+    try:
+        api.get_json("orders")
+    finally:
+        logger.remove(handler_id)
+
+    assert not any(message.startswith("GET") for message in messages)
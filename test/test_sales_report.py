@@ -0,0 +1,140 @@
+import copy
+import datetime
+import json
+
+import pytest
+
+pytest.importorskip("numpy")
+
+from woo_py.models import Order, OrderRefund
+from woo_py.sales_report import SalesReportEngine
+
+
+def _orders() -> list[Order]:
+    with open("test/sample_data/order.json") as f:
+        sample = json.load(f)
+
+    orders = []
+    for order_id, (status, created, refunds, coupons) in enumerate(
+        [
+            ("processing", "2024-03-04T22:00:00", [], []),
+            (
+                "completed",
+                "2024-03-05T09:00:00",
+                [{"id": 9, "total": "-12.00"}],
+                [{"id": 1, "code": "spring", "discount": "5.00", "discount_tax": "0"}],
+            ),
+            ("pending", "2024-03-11T10:00:00", [], []),
+            ("cancelled", "2024-03-12T10:00:00", [], []),
+        ],
+        start=1,
+    ):
+        data = copy.deepcopy(sample)
+        data.update(
+            id=order_id,
+            status=status,
+            date_created=created,
+            # A day later in GMT, reports use the site's timezone
+            date_created_gmt=created.replace("T22", "T23").replace("-04T", "-05T"),
+            refunds=refunds,
+            coupon_lines=coupons,
+        )
+        orders.append(Order.model_validate(data))
+    return orders
+
+
+def _refunds() -> dict[int, list[OrderRefund]]:
+    return {
+        2: [
+            OrderRefund.model_validate(
+                {
+                    "id": 9,
+                    "date_created": "2024-03-11T08:00:00",
+                    "amount": "12.00",
+                    "line_items": [
+                        {
+                            "id": 1,
+                            "product_id": 22,
+                            "quantity": -1,
+                            "total": "-11.10",
+                            "total_tax": "-0.90",
+                        }
+                    ],
+                }
+            )
+        ],
+        # Refunds of orders that are not included are left out
+        3: [
+            OrderRefund.model_validate(
+                {"id": 10, "date_created": "2024-03-11T08:00:00", "amount": "1.00"}
+            )
+        ],
+    }
+
+
+def test_report():
+    engine = SalesReportEngine.from_orders(_orders(), _refunds())
+
+    report = engine.report(datetime.date(2024, 3, 4), datetime.date(2024, 3, 10))
+    assert report.total_sales == "58.70"
+    assert report.net_sales == "36.00"
+    assert report.average_sales == "5.14"
+    assert report.total_orders == 2
+    assert report.total_items == 6
+    assert report.total_tax == "2.70"
+    assert report.total_shipping == "20.00"
+    assert report.total_refunds == "0.00"
+    assert report.total_discount == "5.00"
+
+    report = engine.report(datetime.date(2024, 3, 4), datetime.date(2024, 3, 17))
+    assert report.total_sales == "46.70"
+    assert report.net_sales == "24.90"
+    assert report.total_items == 5
+    assert report.total_tax == "1.80"
+    assert report.total_refunds == "12.00"
+
+    report = engine.report(datetime.date(2023, 1, 1), datetime.date(2023, 12, 31))
+    assert report.total_orders == 0
+    assert report.total_sales == "0.00"
+
+
+def test_report_without_refunds():
+    engine = SalesReportEngine.from_orders(_orders())
+
+    # The refund listed in the order is counted on the day of the order
+    report = engine.report(datetime.date(2024, 3, 4), datetime.date(2024, 3, 10))
+    assert report.total_sales == "46.70"
+    assert report.total_refunds == "12.00"
+    assert report.total_items == 6
+
+
+def test_buckets():
+    engine = SalesReportEngine.from_orders(_orders(), _refunds())
+
+    daily = engine.buckets(datetime.date(2024, 3, 4), datetime.date(2024, 3, 6))
+    assert list(daily) == [
+        datetime.date(2024, 3, 4),
+        datetime.date(2024, 3, 5),
+        datetime.date(2024, 3, 6),
+    ]
+    assert [report.total_orders for report in daily.values()] == [1, 1, 0]
+    assert daily[datetime.date(2024, 3, 4)].average_sales == "18.00"
+
+    weekly = engine.buckets(
+        datetime.date(2024, 3, 6), datetime.date(2024, 3, 17), interval="week"
+    )
+    assert list(weekly) == [datetime.date(2024, 3, 6), datetime.date(2024, 3, 11)]
+    assert weekly[datetime.date(2024, 3, 6)].total_orders == 0
+    assert weekly[datetime.date(2024, 3, 11)].total_sales == "-12.00"
+    assert weekly[datetime.date(2024, 3, 11)].total_items == -1
+
+    with pytest.raises(ValueError):
+        engine.buckets(datetime.date(2024, 3, 6), datetime.date(2024, 3, 17), "month")
+
+
+def test_empty():
+    engine = SalesReportEngine.from_orders([], {})
+
+    report = engine.report(datetime.date(2024, 3, 4), datetime.date(2024, 3, 10))
+    assert report.total_orders == 0
+    assert report.net_sales == "0.00"
@@ -0,0 +1,155 @@
+import asyncio
+import threading
+
+import httpx
+
+from woo_py.api import AsyncAPI
+from woo_py.async_woo import AsyncWoo
+from woo_py.sku_index import SkuIndex, SkuLocation
+from woo_py.woo import Woo
+
+
+class Store:
+    """In-memory catalog. Like the REST API, searching by SKU also returns variations."""
+
+    def __init__(self) -> None:
+        self.products = {
+            1: {
+                "id": 1,
+                "sku": "SHIRT",
+                "type": "simple",
+                "date_modified_gmt": "2024-05-01T10:00:00",
+            },
+            2: {
+                "id": 2,
+                "sku": "HOODIE",
+                "type": "variable",
+                "date_modified_gmt": "2024-05-01T11:00:00",
+            },
+        }
+        self.variations = {
+            2: {
+                21: {"id": 21, "sku": "HOODIE-S", "parent_id": 2},
+                22: {"id": 22, "sku": "HOODIE-M", "parent_id": 2},
+            }
+        }
+        self.requests: list[httpx.Request] = []
+
+    def handler(self, request: httpx.Request) -> httpx.Response:
+        self.requests.append(request)
+        path = request.url.path.removeprefix("/wp-json/wc/v3/")
+        params = request.url.params
+
+        if path == "products":
+            items = list(self.products.values())
+            if "sku" in params:
+                skus = params["sku"].split(",")
+                items = [
+                    item
+                    for item in items
+                    + [v for vs in self.variations.values() for v in vs.values()]
+                    if item["sku"] in skus
+                ]
+            if "modified_after" in params:
+                items = [
+                    item
+                    for item in items
+                    if item["date_modified_gmt"] > params["modified_after"]
+                ]
+        else:
+            items = list(self.variations[int(path.split("/")[1])].values())
+
+        return httpx.Response(
+            200,
+            json=items,
+            headers={"X-WP-Total": str(len(items)), "X-WP-TotalPages": "1"},
+        )
+
+
+def test_update_and_resolve(mock_api):
+    store = Store()
+    woo = Woo(mock_api(store.handler))
+
+    assert woo.update_sku_index() == 2
+    assert len(woo.sku_index) == 4
+    assert len(store.requests) == 2
+
+    store.requests.clear()
+    assert woo.resolve_skus(["HOODIE-M", "SHIRT", "UNKNOWN"]) == {
+        "HOODIE-M": SkuLocation(2, 22),
+        "SHIRT": SkuLocation(1),
+    }
+    # The misses are looked up in one request
+    assert len(store.requests) == 1
+    assert store.requests[0].url.params["sku"] == "UNKNOWN"
+
+    # Only the modified products are requested, the variations of modified variable products are replaced
+    store.products[2]["date_modified_gmt"] = "2024-05-02T10:00:00"
+    store.variations[2] = {23: {"id": 23, "sku": "HOODIE-L", "parent_id": 2}}
+    store.requests.clear()
+    assert woo.update_sku_index() == 1
+    assert store.requests[0].url.params["modified_after"] == "2024-05-01T10:59:59"
+    assert woo.sku_index.get("HOODIE-M") is None
+    assert woo.sku_index.get("HOODIE-L") == SkuLocation(2, 23)
+
+
+def test_variations_are_requested_concurrently(mock_api):
+    store = Store()
+    store.products[3] = {
+        "id": 3,
+        "sku": "CAP",
+        "type": "variable",
+        "date_modified_gmt": "2024-05-01T12:00:00",
+    }
+    store.variations[3] = {31: {"id": 31, "sku": "CAP-RED", "parent_id": 3}}
+    barrier = threading.Barrier(2)
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        if request.url.path.endswith("/variations"):
+            # Answer once the variations of both products are requested
+            barrier.wait(timeout=5)
+        return store.handler(request)
+
+    woo = Woo(mock_api(handler, page_concurrency=2))
+
+    assert woo.update_sku_index() == 3
+    assert woo.sku_index.get("CAP-RED") == SkuLocation(3, 31)
+    assert woo.sku_index.get("HOODIE-S") == SkuLocation(2, 21)
+
+
+def test_resolve_misses_in_batches(mock_api):
+    store = Store()
+    woo = Woo(mock_api(store.handler))
+
+    skus = ["HOODIE-S", "SHIRT"] + [f"MISSING-{i}" for i in range(150)]
+    assert woo.resolve_skus(skus) == {
+        "HOODIE-S": SkuLocation(2, 21),
+        "SHIRT": SkuLocation(1),
+    }
+    assert len(store.requests) == 2
+
+    # Resolved SKUs are kept in the index
+    store.requests.clear()
+    assert woo.resolve_skus(["SHIRT"]) == {"SHIRT": SkuLocation(1)}
+    assert store.requests == []
+
+
+def test_sku_change_replaces_old_sku():
+    index = SkuIndex()
+    index.set("OLD", SkuLocation(1))
+    index.set("NEW", SkuLocation(1))
+
+    assert index.get("OLD") is None
+    assert index.get("NEW") == SkuLocation(1)
+    assert len(index) == 1
+
+
+def test_async_resolve(mock_api):
+    store = Store()
+    woo = AsyncWoo(mock_api(store.handler, AsyncAPI))
+
+    async def run():
+        await woo.update_sku_index()
+        return await woo.resolve_skus(["HOODIE-S"])
+
+    assert asyncio.run(run()) == {"HOODIE-S": SkuLocation(2, 21)}
@@ -0,0 +1,184 @@
+import datetime
+
+import httpx
+import pytest
+
+from woo_py.api import API
+from woo_py.sync import (
+    Checkpoint,
+    CheckpointStore,
+    FileCheckpointStore,
+    IncrementalSync,
+    SQLiteCheckpointStore,
+)
+
+
+class Store:
+    """In-memory WooCommerce store, filtering on modified_after and ordering by
+    modification date like the REST API."""
+
+    def __init__(self) -> None:
+        self.orders: dict[int, str] = {}
+        self.variations: dict[int, dict[int, str]] = {}
+        self.requests: list[httpx.Request] = []
+
+    def handler(self, request: httpx.Request) -> httpx.Response:
+        self.requests.append(request)
+        path = request.url.path.removeprefix("/wp-json/wc/v3/")
+
+        if path == "orders":
+            items = [
+                {"id": order_id, "date_modified_gmt": modified}
+                for order_id, modified in self.orders.items()
+            ]
+        elif path == "products":
+            items = [{"id": product_id} for product_id in self.variations]
+        else:
+            product_id = int(path.split("/")[1])
+            items = [
+                {"id": variation_id, "date_modified_gmt": modified}
+                for variation_id, modified in self.variations[product_id].items()
+            ]
+
+        modified_after = request.url.params.get("modified_after")
+        if modified_after is not None:
+            items = [
+                item for item in items if item["date_modified_gmt"] > modified_after
+            ]
+        if request.url.params.get("orderby") == "modified":
+            items.sort(key=lambda item: item["date_modified_gmt"])
+
+        per_page = int(request.url.params.get("per_page", 10))
+        page = int(request.url.params.get("page", 1))
+        total_pages = max(1, -(-len(items) // per_page))
+        headers = {"X-WP-Total": str(len(items)), "X-WP-TotalPages": str(total_pages)}
+        if page < total_pages:
+            headers["Link"] = (
+                f'<https://example.com/{path}?page={page + 1}>; rel="next"'
+            )
+
+        return httpx.Response(
+            200, json=items[(page - 1) * per_page : page * per_page], headers=headers
+        )
+
+
+def _sync(api: API, checkpoints) -> IncrementalSync:
+    return IncrementalSync(api, checkpoints, page_concurrency=2, per_page=2)
+
+
+@pytest.mark.parametrize("backend", ["file", "sqlite"])
+def test_incremental_sync(mock_api, tmp_path, backend):
+    if backend == "file":
+        checkpoints = FileCheckpointStore(tmp_path / "checkpoints.json")
+    else:
+        checkpoints = SQLiteCheckpointStore(tmp_path / "checkpoints.db")
+
+    store = Store()
+    store.orders = {
+        1: "2024-05-01T10:00:00",
+        2: "2024-05-01T12:00:00",
+        3: "2024-05-01T11:00:00",
+        4: "2024-05-01T12:00:00",
+        5: "2024-05-01T09:00:00",
+    }
+    sync = _sync(mock_api(store.handler), checkpoints)
+
+    assert [order.id for order in sync.changes("orders")] == [5, 1, 3, 2, 4]
+    assert checkpoints.load("orders") == Checkpoint(
+        datetime.datetime(2024, 5, 1, 12), [2, 4]
+    )
+
+    # Nothing changed, but the checkpoint's second is requested again
+    assert sync.run("orders", lambda order: None) == 0
+    assert store.requests[-1].url.params["modified_after"] == "2024-05-01T11:59:59"
+
+    # An order modified in the same second as the checkpoint is still picked up
+    store.orders[6] = "2024-05-01T12:00:00"
+    store.orders[1] = "2024-05-02T08:00:00"
+    received = []
+    assert sync.run("orders", received.append) == 2
+    assert [order.id for order in received] == [6, 1]
+
+    assert list(sync.changes("orders")) == []
+
+
+def test_pages_follow_the_last_object(mock_api, tmp_path):
+    checkpoints = FileCheckpointStore(tmp_path / "checkpoints.json")
+    store = Store()
+    store.orders = {
+        order_id: f"2024-05-01T1{order_id}:00:00" for order_id in range(1, 6)
+    }
+    sync = _sync(mock_api(store.handler), checkpoints)
+
+    changes = sync.changes("orders")
+    assert [next(changes).id for _ in range(3)] == [1, 2, 3]
+    # The first page of two orders was consumed, the third order is not done yet
+    assert checkpoints.load("orders") == Checkpoint(
+        datetime.datetime(2024, 5, 1, 12), [2]
+    )
+
+    # Modified while the run goes on, so it is passed on again at the end.
+    # Every page starts in the second of the last object, which is skipped by its ID
+    store.orders[1] = "2024-05-02T08:00:00"
+    assert [order.id for order in changes] == [4, 5, 1]
+    assert checkpoints.load("orders") == Checkpoint(
+        datetime.datetime(2024, 5, 2, 8), [1]
+    )
+    assert [request.url.params.get("modified_after") for request in store.requests] == [
+        None,
+        "2024-05-01T11:59:59",
+        "2024-05-01T12:59:59",
+        "2024-05-01T13:59:59",
+        "2024-05-01T14:59:59",
+        "2024-05-02T07:59:59",
+    ]
+    assert all(request.url.params["page"] == "1" for request in store.requests)
+
+
+def test_more_objects_in_one_second_than_a_page(mock_api, tmp_path):
+    checkpoints = FileCheckpointStore(tmp_path / "checkpoints.json")
+    store = Store()
+    store.orders = {order_id: "2024-05-01T10:00:00" for order_id in range(1, 6)}
+    store.orders[6] = "2024-05-01T11:00:00"
+    sync = _sync(mock_api(store.handler), checkpoints)
+    sync.initial_modified_after = datetime.datetime(2024, 5, 1)
+
+    assert [order.id for order in sync.changes("orders")] == [1, 2, 3, 4, 5, 6]
+    assert checkpoints.load("orders") == Checkpoint(
+        datetime.datetime(2024, 5, 1, 11), [6]
+    )
+
+
+def test_failed_run_keeps_checkpoint(mock_api, tmp_path):
+    checkpoints = FileCheckpointStore(tmp_path / "checkpoints.json")
+    store = Store()
+    store.orders = {1: "2024-05-01T10:00:00"}
+    sync = _sync(mock_api(store.handler), checkpoints)
+
+    def fail(order) -> None:
+        raise RuntimeError("Could not process order")
+
+    with pytest.raises(RuntimeError):
+        sync.run("orders", fail)
+    assert checkpoints.load("orders") is None
+
+    assert sync.run("orders", lambda order: None) == 1
+
+
+def test_variations(mock_api, tmp_path):
+    store = Store()
+    store.variations = {
+        10: {11: "2024-05-01T10:00:00", 12: "2024-05-03T10:00:00"},
+        20: {21: "2024-05-02T10:00:00"},
+    }
+    sync = _sync(
+        mock_api(store.handler), FileCheckpointStore(tmp_path / "checkpoints.json")
+    )
+    sync.initial_modified_after = datetime.datetime(2024, 5, 1, 12)
+
+    assert [variation.id for variation in sync.changes("variations")] == [21, 12]
+
+
+def test_checkpoint_store_is_abstract():
+    with pytest.raises(TypeError):
+        CheckpointStore()
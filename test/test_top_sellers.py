@@ -0,0 +1,99 @@
+import datetime
+
+from woo_py.models import Order, Product
+from woo_py.top_sellers import TopSellersIndex
+
+
+def _order(
+    order_id: int, created: str, status: str = "completed", **quantities
+) -> Order:
+    return Order(
+        id=order_id,
+        status=status,
+        date_created=created,
+        line_items=[
+            {
+                "product_id": int(name[1:]),
+                "name": f"Product {name}",
+                "quantity": quantity,
+            }
+            for name, quantity in quantities.items()
+        ],
+    )
+
+
+def _index() -> TopSellersIndex:
+    index = TopSellersIndex()
+    index.add_orders(
+        [
+            _order(1, "2024-03-04T10:00:00", p1=2, p2=1),
+            _order(2, "2024-03-05T23:30:00", p2=3),
+            _order(3, "2024-03-10T08:00:00", p3=5, p1=1),
+            _order(4, "2024-03-10T09:00:00", status="pending", p3=100),
+        ]
+    )
+    index.add_products(
+        [
+            Product(
+                id=1,
+                name="Shirt",
+                categories=[{"id": 7, "name": "Clothing", "slug": "clothing"}],
+            ),
+            Product(
+                id=2,
+                name="Hoodie",
+                categories=[{"id": 7, "name": "Clothing", "slug": "clothing"}],
+                tags=[{"id": 9, "name": "Sale", "slug": "sale"}],
+            ),
+        ]
+    )
+    return index
+
+
+def _ranking(reports) -> list[tuple[int, int]]:
+    return [(report.product_id, report.quantity) for report in reports]
+
+
+def test_top_sellers():
+    index = _index()
+    march = datetime.date(2024, 3, 1), datetime.date(2024, 3, 31)
+
+    assert len(index) == 3
+    assert _ranking(index.top_sellers(*march)) == [(3, 5), (2, 4), (1, 3)]
+    assert _ranking(index.top_sellers(*march, limit=2)) == [(3, 5), (2, 4)]
+    assert _ranking(
+        index.top_sellers(datetime.date(2024, 3, 4), datetime.date(2024, 3, 5))
+    ) == [(2, 4), (1, 2)]
+    assert (
+        index.top_sellers(datetime.date(2023, 1, 1), datetime.date(2023, 12, 31)) == []
+    )
+
+    reports = index.top_sellers(*march)
+    # Named after the product if known, otherwise after the line item
+    assert [report.name for report in reports] == ["Product p3", "Hoodie", "Shirt"]
+
+
+def test_top_sellers_category_and_tag():
+    index = _index()
+    march = datetime.date(2024, 3, 1), datetime.date(2024, 3, 31)
+
+    assert _ranking(index.top_sellers(*march, category=7)) == [(2, 4), (1, 3)]
+    assert _ranking(index.top_sellers(*march, tag=9)) == [(2, 4)]
+    assert index.top_sellers(*march, category=8) == []
+
+
+def test_orders_updated_and_removed():
+    index = _index()
+    march = datetime.date(2024, 3, 1), datetime.date(2024, 3, 31)
+
+    # Changed line items replace what was counted before
+    index.add_orders([_order(3, "2024-03-10T08:00:00", p3=1)])
+    assert _ranking(index.top_sellers(*march)) == [(2, 4), (1, 2), (3, 1)]
+
+    # Orders with a status that is not counted are removed
+    index.add_orders([_order(2, "2024-03-05T23:30:00", status="cancelled", p2=3)])
+    assert _ranking(index.top_sellers(*march)) == [(1, 2), (2, 1), (3, 1)]
+
+    index.remove_orders([1, 3])
+    assert len(index) == 0
+    assert index.top_sellers(*march) == []
@@ -2,9 +2,13 @@
 Package for handling requests to the WOO API.
 """
 
+from __future__ import annotations
+
+import abc
 import json
 import re
-from dataclasses import dataclass
+import time
+from dataclasses import dataclass, field
 from urllib.parse import urljoin, urlparse
 
 import httpx
@@ -16,6 +20,20 @@ from pydantic import BaseModel
 from pydantic_changedetect import ChangeDetectionMixin
 
 from oauth import OAuth
+from woo_py.lazy import LazyList
+from woo_py.partial import fields_param, partial_model
+from woo_py.request_log import RequestLogger
+from woo_py.retry import RequestMethod, RetryPolicy
+
+if t.TYPE_CHECKING:
+    # Optional subsystems, imported where first used
+    from woo_py.cache import CachedResponse, HTTPCache
+    from woo_py.json_codec import JSONCodec
+    from woo_py.limiter import AdaptiveLimiter
+    from woo_py.metrics import MetricsRegistry
+
+DEFAULT_REQUEST_LOGGER = RequestLogger()
+"""Request logger used by the API clients unless another one is given."""
 
 
 def _is_ssl(url: str) -> bool:
@@ -71,8 +89,8 @@ class PaginatedResponse(t.Generic[T]):
     A response from the WooCommerce API that includes pagination metadata.
     """
 
-    items: list[T]
-    """Actual items returned by the API."""
+    items: list[T] | LazyList[T]
+    """Actual items returned by the API. A LazyList for lazily validated responses."""
 
     total: int | None = None
     """Total number of items (NOT PAGES)."""
@@ -97,7 +115,10 @@ class PaginatedResponse(t.Generic[T]):
 
     @classmethod
     def from_response(
-        cls, data: list[T], headers: dict[str, str], current_page: int | None = None
+        cls,
+        data: list[T] | LazyList[T],
+        headers: t.Mapping[str, str],
+        current_page: int | None = None,
     ) -> "PaginatedResponse[T]":
         total = int(headers.get("X-WP-Total", 0))
         total_pages = int(headers.get("X-WP-TotalPages", 0))
@@ -116,6 +137,142 @@ class PaginatedResponse(t.Generic[T]):
         )
 
 
+MIN_CONCURRENT_PAGES = 2
+"""Fewest remaining pages fetched concurrently. A single remaining page is fetched directly."""
+
+BATCH_SIZE = 100
+"""Maximum number of operations the WooCommerce batch endpoints accept per request."""
+
+GMT_FORMAT = "%Y-%m-%dT%H:%M:%S"
+"""Format of GMT dates in query parameters like modified_after, used with dates_are_gmt."""
+
+BatchOperation = t.Literal["create", "update", "delete"]
+
+
+@dataclass
+class BatchError:
+    """
+    An error for a single item of a batch request.
+    """
+
+    operation: BatchOperation
+    """The operation that failed."""
+
+    index: int
+    """Position of the item in the list passed for the operation."""
+
+    id: int | None = None
+    """ID of the object, if known."""
+
+    code: str | None = None
+    """WooCommerce error code."""
+
+    message: str | None = None
+    """WooCommerce error message."""
+
+    status: int | None = None
+    """HTTP status of the individual operation."""
+
+
+@dataclass
+class BatchChunk:
+    """
+    A single request to a batch endpoint, holding at most BATCH_SIZE operations.
+    """
+
+    payload: dict[str, list[t.Any]]
+    """The request body, by operation."""
+
+    offsets: dict[BatchOperation, int]
+    """Index of the first item of each operation in the lists passed by the caller."""
+
+    @classmethod
+    def split(
+        cls,
+        create: list[dict[str, t.Any]],
+        update: list[dict[str, t.Any]],
+        delete: list[int],
+        batch_size: int = BATCH_SIZE,
+    ) -> list["BatchChunk"]:
+        """
+        Split the operations into chunks of at most batch_size operations.
+
+        :param create: Serialized objects to create.
+        :param update: Serialized objects to update.
+        :param delete: IDs of the objects to delete.
+        :param batch_size: Maximum number of operations per chunk.
+        :return: The chunks, in order.
+        """
+        operations: list[tuple[BatchOperation, int, t.Any]] = [
+            *(("create", index, item) for index, item in enumerate(create)),
+            *(("update", index, item) for index, item in enumerate(update)),
+            *(("delete", index, item) for index, item in enumerate(delete)),
+        ]
+
+        chunks = []
+        for start in range(0, len(operations), batch_size):
+            chunk = cls(payload={}, offsets={})
+            for operation, index, item in operations[start : start + batch_size]:
+                chunk.offsets.setdefault(operation, index)
+                chunk.payload.setdefault(operation, []).append(item)
+            chunks.append(chunk)
+
+        return chunks
+
+
+@dataclass
+class BatchResponse(t.Generic[T]):
+    """
+    The combined result of one or more requests to a batch endpoint.
+    """
+
+    create: list[T] = field(default_factory=list)
+    """Objects that were created."""
+
+    update: list[T] = field(default_factory=list)
+    """Objects that were updated."""
+
+    delete: list[T] = field(default_factory=list)
+    """Objects that were deleted."""
+
+    errors: list[BatchError] = field(default_factory=list)
+    """Errors of the individual items that failed."""
+
+    def add_chunk(
+        self,
+        chunk: BatchChunk,
+        response_json: dict[str, list[dict[str, t.Any]]],
+        expected_model: t.Type[T],
+    ) -> None:
+        """
+        Add the response of a single batch request.
+
+        :param chunk: The chunk that was sent.
+        :param response_json: The JSON returned by the batch endpoint.
+        :param expected_model: The model to expect.
+        """
+        operation: BatchOperation
+        for operation in ("create", "update", "delete"):
+            results = getattr(self, operation)
+
+            for position, item in enumerate(response_json.get(operation, [])):
+                error = item.get("error")
+                if error is None:
+                    results.append(expected_model.model_validate(item))
+                    continue
+
+                self.errors.append(
+                    BatchError(
+                        operation=operation,
+                        index=chunk.offsets[operation] + position,
+                        id=item.get("id") or None,
+                        code=error.get("code"),
+                        message=error.get("message"),
+                        status=error.get("data", {}).get("status"),
+                    )
+                )
+
+
 def _parse_woo_error_json(response: httpx.Response) -> str:
     """
     Parse the error JSON from a WooCommerce response.
@@ -150,14 +307,11 @@ def _parse_woo_error_json(response: httpx.Response) -> str:
     return msg
 
 
-class API:
+class _BaseAPI(abc.ABC):
     """
-    Class for doing requests to the WooCommerce API.
+    Shared configuration and request preparation for the sync and async API clients.
     """
 
-    _client: httpx.Client
-    """The HTTPX client to use for requests."""
-
     _url: str
     """The URL of the WooCommerce API."""
 
@@ -176,7 +330,38 @@ class API:
     _query_string_auth: bool
     """Whenever to authenticate using url params (include consumer key and secret in URL). Requires HTTPS."""
 
-    timeout: float = 10.0
+    timeout: httpx.Timeout
+    """Timeouts for requests."""
+
+    limits: httpx.Limits
+    """Connection pool limits of the HTTPX client."""
+
+    http2: bool = False
+    """Whenever HTTP/2 is enabled."""
+
+    _transport: httpx.BaseTransport | httpx.AsyncBaseTransport | None = None
+    """Transport passed by the user, possibly shared with other clients."""
+
+    page_concurrency: int = 1
+    """Default number of pages fetched concurrently when following pagination."""
+
+    retry_policy: RetryPolicy
+    """Policy for retrying failed requests."""
+
+    limiter: AdaptiveLimiter | None
+    """Limiter for the number of requests in flight. None for no limit."""
+
+    http_cache: HTTPCache | None
+    """Cache for revalidating GET requests. None disables it."""
+
+    json_codec: JSONCodec
+    """Codec for encoding request bodies and decoding responses."""
+
+    request_logger: RequestLogger | None
+    """Logger for finished requests. None disables per-request logging."""
+
+    metrics: MetricsRegistry | None
+    """Registry the request metrics are recorded in. None disables metrics."""
 
     def __init__(
         self,
@@ -185,7 +370,23 @@ class API:
         consumer_secret: str,
         query_string_auth: bool = False,
         verify_ssl: bool = True,
-        timeout: float = 10.0,
+        timeout: float | httpx.Timeout = 10.0,
+        page_concurrency: int = 1,
+        connect_timeout: float | None = None,
+        read_timeout: float | None = None,
+        write_timeout: float | None = None,
+        pool_timeout: float | None = None,
+        http2: bool = False,
+        max_connections: int | None = 100,
+        max_keepalive_connections: int | None = 20,
+        keepalive_expiry: float | None = 5.0,
+        transport: httpx.BaseTransport | httpx.AsyncBaseTransport | None = None,
+        retry_policy: RetryPolicy | None = None,
+        limiter: AdaptiveLimiter | None = None,
+        http_cache: HTTPCache | None = None,
+        json_codec: JSONCodec | None = None,
+        request_logger: RequestLogger | None = DEFAULT_REQUEST_LOGGER,
+        metrics: MetricsRegistry | None = None,
     ) -> None:
         """
         Initialize the API client.
@@ -195,27 +396,89 @@ class API:
         :param consumer_secret: The consumer secret.
         :param verify_ssl: Whenever to verify SSL certificate. Need to be set to False for self-signed certificates.
         :param query_string_auth: Whenever to authenticate using url params (include consumer key and secret in URL).
-        :param timeout: The timeout for requests.
         Requires HTTPS.
+        :param timeout: The timeout for requests. Used for every phase not given a timeout of its own.
+        An httpx.Timeout is used as is, and can not be combined with the timeouts of single phases.
+        :param page_concurrency: Default number of pages fetched concurrently when following pagination.
+        With 1, pages are fetched one after another.
+        :param connect_timeout: The timeout for establishing a connection.
+        :param read_timeout: The timeout for receiving a chunk of the response.
+        :param write_timeout: The timeout for sending a chunk of the request.
+        :param pool_timeout: The timeout for acquiring a connection from the pool.
+        :param http2: Whenever to use HTTP/2 if the server supports it. Requires the 'http2' extra.
+        :param max_connections: Maximum number of connections in the pool. None for no limit.
+        :param max_keepalive_connections: Maximum number of idle connections kept alive. None for no limit.
+        :param keepalive_expiry: Seconds an idle connection is kept alive. None to keep them forever.
+        :param transport: A pre-built HTTPX transport, e.g. to share a connection pool between several clients.
+        Must be a sync transport for API and an async transport for AsyncAPI. When set, http2 and the pool
+        limits are taken from the transport, and the transport is not closed together with the client.
+        :param retry_policy: Policy for retrying failed requests, e.g. on 429 and 503 responses or timeouts.
+        Defaults to a RetryPolicy of this client, retrying GET requests up to 3 times.
+        Pass RetryPolicy(max_retries={}) to disable retries.
+        :param limiter: Adaptive limiter for the number of requests in flight. Shared by all requests of
+        this client, including concurrently fetched pages and batches, and can be shared with other clients.
+        :param http_cache: Cache for revalidating GET requests using ETag and Last-Modified. When the server
+        answers 304 Not Modified, the already validated models are returned. Disabled by default.
+        :param json_codec: Codec for encoding request bodies and decoding responses.
+        Defaults to the fastest installed of orjson, msgspec and the standard library.
+        :param request_logger: Logs every finished request, at DEBUG level by default. Messages are only
+        formatted if the level is enabled, and the payload is only logged for a sample of the requests.
+        None disables per-request logging. Errors are logged regardless.
+        :param metrics: Registry for recording latency, response sizes, status codes, retries and validation
+        time per endpoint. Can be shared with other clients. Disabled by default.
         """
 
         self._url = url
         self._query_string_auth = query_string_auth
-
-        self._client = httpx.Client(
-            headers={
-                "User-Agent": "WooPy/0.0.2",
-                "Accept": "application/json",
-            },
-            base_url=urljoin(self._url, "/wp-json/wc/v3/"),
-            verify=verify_ssl,
-            timeout=timeout,
+        self._verify_ssl = verify_ssl
+        phase_timeouts = {
+            phase: phase_timeout
+            for phase, phase_timeout in {
+                "connect": connect_timeout,
+                "read": read_timeout,
+                "write": write_timeout,
+                "pool": pool_timeout,
+            }.items()
+            if phase_timeout is not None
+        }
+        if isinstance(timeout, httpx.Timeout):
+            if phase_timeouts:
+                raise ValueError(
+                    "Cannot combine an httpx.Timeout with connect_timeout, read_timeout, "
+                    "write_timeout or pool_timeout. Set the phases on the httpx.Timeout instead"
+                )
+            self.timeout = timeout
+        else:
+            self.timeout = httpx.Timeout(timeout, **phase_timeouts)
+        self.limits = httpx.Limits(
+            max_connections=max_connections,
+            max_keepalive_connections=max_keepalive_connections,
+            keepalive_expiry=keepalive_expiry,
         )
+        self.http2 = http2
+        self._transport = transport
+        self.page_concurrency = page_concurrency
+        self.retry_policy = retry_policy if retry_policy is not None else RetryPolicy()
+        self.limiter = limiter
+        self.http_cache = http_cache
+        if json_codec is None:
+            from woo_py.json_codec import get_default_codec
+
+            json_codec = get_default_codec()
+        self.json_codec = json_codec
+        self.request_logger = request_logger
+        self.metrics = metrics
 
         self._consumer_key = consumer_key
         self._consumer_secret = consumer_secret
 
         self._is_ssl = _is_ssl(self._url)
+        # Reused for every request, the signing key is set up once
+        self._oauth = (
+            None if self._is_ssl else OAuth(self._consumer_key, self._consumer_secret)
+        )
+
+        self._create_client()
 
         censored_secret = self._consumer_secret[-4:]
         logger.debug(
@@ -230,27 +493,49 @@ class API:
                 "SSL certificate verification is disabled. This is not recommended."
             )
 
-    def __del__(self) -> None:
-        self._client.close()
+    @abc.abstractmethod
+    def _create_client(self) -> None:
+        """
+        Create the underlying HTTPX client. Implemented by the sync and async clients.
+        """
 
-    def _request(
+    def _client_options(self) -> dict[str, t.Any]:
+        """
+        Options shared by the sync and async HTTPX clients.
+
+        :return: Keyword arguments for the HTTPX client constructor.
+        """
+        return {
+            "headers": {
+                "User-Agent": "WooPy/0.0.2",
+                "Accept": "application/json",
+            },
+            "base_url": urljoin(self._url, "/wp-json/wc/v3/"),
+            "verify": self._verify_ssl,
+            "timeout": self.timeout,
+            "limits": self.limits,
+            "http2": self.http2,
+            "transport": self._transport,
+        }
+
+    def _prepare_request(
         self,
         endpoint: str,
         method: t.Literal["post", "get", "put", "delete"],
-        data: dict[str, t.Any] | BaseModel | ChangeDetectionMixin | None = None,
-        **kwargs: URLParams,
-    ) -> httpx.Response:
+        data: dict[str, t.Any] | BaseModel | ChangeDetectionMixin | None,
+        kwargs: dict[str, URLParams],
+    ) -> tuple[dict[str, URLParams], BasicAuth | None, bytes | None]:
         """
-        Do requests.
+        Build the query parameters, authentication and body for a request.
         For HTTPS, either basic or query string auth is used.
         For HTTP, 'one-legged' OAuth is used.
         For reference: https://woocommerce.github.io/woocommerce-rest-api-docs/#authentication
 
-        :param method: The HTTP method to use.
         :param endpoint: The endpoint to request.
+        :param method: The HTTP method to use.
         :param data: The data to send.
-        :param kwargs: Additional keyword arguments.
-        :return: The response.
+        :param kwargs: The query parameters.
+        :return: The query parameters, the auth to use and the encoded JSON body.
         """
 
         kwargs = kwargs or {}
@@ -278,207 +563,1489 @@ class API:
                 auth = BasicAuth(self._consumer_key, self._consumer_secret)
         else:
             """Without SSL, only OAUTH url is supported"""
+            assert self._oauth is not None
             full_url = urljoin(self._url, endpoint)
-            oauth = OAuth(self._consumer_key, self._consumer_secret)
-            oauth_params = oauth.get_auth_params(method, full_url, kwargs)
+            oauth_params = self._oauth.get_auth_params(method, full_url, kwargs)
             kwargs.update(oauth_params)
 
-        sent_data: str | dict[str, t.Any] | None = None
+        content: bytes | None = None
 
+        # Models are encoded by pydantic directly, without a round trip through a dict
         if issubclass(data.__class__, ChangeDetectionMixin) and method == "put":
-            json_dumped = data.model_dump_json(exclude_unchanged=True, exclude_unset=True)  # type: ignore
-            print(f"excluding unchanged")
-            sent_data = json.loads(
-                json_dumped
-            )  # Stupid workaround as we can't send text directly,
-            # but also sending the whole object gives 'datetime' is not JSON serializable
+            content = data.model_dump_json(exclude_unchanged=True, exclude_unset=True).encode()  # type: ignore
         elif issubclass(data.__class__, BaseModel):
-            json_dumped = data.model_dump_json(exclude_unset=True)
-            sent_data = json.loads(json_dumped)
-        else:
-            sent_data = data
-
-        response = self._client.request(
-            method,
-            endpoint,
-            json=sent_data,
-            auth=auth,
-            params=kwargs,
-        )
+            content = data.model_dump_json(exclude_unset=True).encode()  # type: ignore
+        elif data is not None:
+            content = self.json_codec.dumps(data)
 
-        logger.debug(f"Request: {response.request.__dict__}")
+        return kwargs, auth, content
 
-        try:
-            response.raise_for_status()
-        except httpx.HTTPStatusError as e:
-            logger.error(f"Failed to make request: {e}")
-            logger.error(f"Parsed error: {_parse_woo_error_json(response)}")
-            raise
+    @staticmethod
+    def _dump_model(
+        data: BaseModel, exclude_unchanged: bool = False
+    ) -> dict[str, t.Any]:
+        """
+        Dump a model to a JSON compatible dict.
 
-        except httpx.HTTPError as e:
-            logger.error(f"Failed to make request: {e}")
-            raise
+        :param data: The model.
+        :param exclude_unchanged: Only include fields changed since the model was created.
+        Requires the model to use ChangeDetectionMixin.
+        :return: The dumped model.
+        """
+        if exclude_unchanged:
+            return data.model_dump(mode="json", exclude_unchanged=True, exclude_unset=True)  # type: ignore
 
-        return response
+        return data.model_dump(mode="json", exclude_unset=True)
 
-    def get_json(self, endpoint: str, **kwargs: URLParams) -> dict[str, t.Any]:
+    def _validate_page(
+        self,
+        endpoint: str,
+        expected_model: t.Type[T],
+        response: httpx.Response,
+        lazy: bool = False,
+    ) -> list[T] | LazyList[T]:
         """
-        Get JSON from the API.
-
-        :param endpoint: The endpoint to request.
-        :param kwargs: Additional keyword arguments.
-        :return: The JSON response.
+        Validate the items of a page, recording the validation time.
+
+        :param endpoint: The endpoint that was requested.
+        :param expected_model: The model of the items.
+        :param response: The response.
+        :param lazy: Whenever to keep the items as decoded JSON until they are accessed.
+        Only the decoding is then recorded, without any parsed items.
+        :return: The items.
         """
+        started = time.perf_counter()
 
-        response = self._request(endpoint, "get", None, **kwargs)
-
-        return response.json()
+        items: list[T] | LazyList[T]
+        if lazy:
+            items = LazyList(expected_model, self._decode(response))
+        else:
+            items = [
+                expected_model.model_validate(item) for item in self._decode(response)
+            ]
+
+        if self.metrics is not None:
+            self.metrics.record_validation(
+                endpoint,
+                "get",
+                0 if lazy else len(items),
+                time.perf_counter() - started,
+            )
+        return items
 
-    def get(
-        self, endpoint: str, expected_model: t.Type[T], **kwargs: URLParams
-    ) -> T | None:
+    def _validate_model(
+        self,
+        endpoint: str,
+        method: RequestMethod,
+        expected_model: t.Type[T],
+        response: httpx.Response,
+    ) -> T:
         """
-        Get a model from the API.
+        Validate a single model, recording the validation time.
 
-        :param endpoint: The endpoint to request.
-        :param expected_model: The model to expect.
-        :param kwargs: Additional keyword arguments.
+        :param endpoint: The endpoint that was requested.
+        :param method: The HTTP method.
+        :param expected_model: The model.
+        :param response: The response.
         :return: The model.
         """
-        try:
-            response = self.get_json(endpoint, **kwargs)
-        except httpx.HTTPStatusError as e:
-            if e.response.status_code == 404:
-                return None
-            raise
+        started = time.perf_counter()
+        model = expected_model.model_validate(self._decode(response))
 
-        return expected_model.model_validate(response)
+        if self.metrics is not None:
+            self.metrics.record_validation(
+                endpoint, method, 1, time.perf_counter() - started
+            )
+        return model
 
-    @t.overload
-    def get_all(
+    def _decode(self, response: httpx.Response) -> t.Any:
+        """
+        Decode the JSON body of a response.
+
+        :param response: The response.
+        :return: The decoded body.
+        """
+        return self.json_codec.loads(response.content)
+
+    def _batch_chunks(
         self,
-        endpoint: str,
-        expected_model: t.Type[T],
-        *,
-        follow_pages: t.Literal[True],
-        include_metadata: t.Literal[False] = False,
-        **kwargs: URLParams,
-    ) -> list[T]: ...
+        create: list[T] | None,
+        update: list[T] | None,
+        delete: list[int] | None,
+        batch_size: int,
+    ) -> list[BatchChunk]:
+        """
+        Serialize the objects of a batch request and split them into chunks.
+        Updated objects using ChangeDetectionMixin only send their changed fields and their ID.
+
+        :param create: Objects to create.
+        :param update: Objects to update. Must have their ID set.
+        :param delete: IDs of the objects to delete.
+        :param batch_size: Maximum number of operations per request.
+        :return: The chunks to send.
+        """
+        if not 0 < batch_size <= BATCH_SIZE:
+            raise ValueError(f"batch_size must be between 1 and {BATCH_SIZE}")
 
-    @t.overload
-    def get_all(
+        update_dumped = []
+        for item in update or []:
+            item_id = getattr(item, "id", None)
+            if item_id is None:
+                raise ValueError("Objects to update must have their id set")
+
+            dumped = self._dump_model(
+                item, exclude_unchanged=isinstance(item, ChangeDetectionMixin)
+            )
+            dumped["id"] = item_id
+            update_dumped.append(dumped)
+
+        return BatchChunk.split(
+            [self._dump_model(item) for item in create or []],
+            update_dumped,
+            delete or [],
+            batch_size,
+        )
+
+    def _finish_attempt(
         self,
         endpoint: str,
-        expected_model: t.Type[T],
-        *,
-        follow_pages: t.Literal[False] = False,
-        include_metadata: t.Literal[False],
-        **kwargs: URLParams,
-    ) -> list[T]: ...
+        method: RequestMethod,
+        started: float,
+        epoch: int | None,
+        response: httpx.Response | None = None,
+        error: Exception | None = None,
+    ) -> None:
+        """
+        Release the limiter slot of a finished attempt and record its metrics.
+
+        :param endpoint: The endpoint that was requested.
+        :param method: The HTTP method.
+        :param started: performance counter value when the attempt started.
+        :param epoch: The limiter epoch the slot was acquired in.
+        :param response: The response, if one was received.
+        :param error: The transport error, if no response was received.
+        Neither is given for attempts that were cancelled.
+        """
+        latency = time.perf_counter() - started
+
+        if self.metrics is not None:
+            if response is not None:
+                self.metrics.record_response(
+                    endpoint,
+                    method,
+                    response.status_code,
+                    latency,
+                    len(response.content),
+                )
+            elif error is not None:
+                self.metrics.record_error(endpoint, method)
 
-    @t.overload
-    def get_all(
+        if self.limiter is None:
+            return
+
+        if response is None:
+            self.limiter.release(
+                overloaded=isinstance(error, httpx.TimeoutException), epoch=epoch
+            )
+        elif response.status_code in self.limiter.overload_statuses:
+            self.limiter.release(overloaded=True, epoch=epoch)
+        else:
+            self.limiter.release(latency=latency, epoch=epoch)
+
+    def _retry_delay(
         self,
         endpoint: str,
-        expected_model: t.Type[T],
-        *,
-        follow_pages: t.Literal[False] = False,
-        include_metadata: t.Literal[True],
-        **kwargs: URLParams,
-    ) -> PaginatedResponse[T]: ...
+        method: RequestMethod,
+        attempt: int,
+        response: httpx.Response | None = None,
+        error: Exception | None = None,
+    ) -> float | None:
+        """
+        Ask the retry policy whenever a failed attempt is retried.
+
+        :param endpoint: The endpoint that was requested.
+        :param method: The HTTP method.
+        :param attempt: Number of the failed attempt, starting at 0.
+        :param response: The response, if one was received.
+        :param error: The transport error, if no response was received.
+        :return: Seconds to wait before retrying, or None if the request is not retried.
+        """
+        delay = self.retry_policy.get_delay(method, attempt, response, error)
+        if delay is not None:
+            if self.metrics is not None:
+                self.metrics.record_retry(endpoint, method)
+            reason = error if error is not None else f"status {response.status_code}"  # type: ignore
+            logger.warning(
+                f"Retrying {method.upper()} {endpoint} in {delay:.2f}s "
+                f"(attempt {attempt + 1}, {reason})"
+            )
 
-    def get_all(
+        return delay
+
+    def _get_cached(
         self,
         endpoint: str,
-        expected_model: t.Type[T],
-        *,
-        follow_pages: bool = False,
-        include_metadata: bool = False,
-        **kwargs: URLParams,
-    ) -> list[T] | PaginatedResponse[T]:
+        expected_model: t.Type[BaseModel],
+        kwargs: dict[str, URLParams],
+        lazy: bool = False,
+    ) -> CachedResponse | None:
         """
-        Get all models from the API.
+        Look up a request in the HTTP cache.
 
         :param endpoint: The endpoint to request.
         :param expected_model: The model to expect.
-        :param follow_pages: Whether to automatically follow pagination and get all pages.
-        :param include_metadata: If True, returns PaginatedResponse instead of plain list.
-        :param kwargs: Additional query parameters like page, per_page, etc.
+        :param kwargs: Query parameters for the request.
+        :param lazy: Whenever the items are validated lazily.
+        :return: The cached response, or None if there is none or no HTTP cache is used.
         """
-        if follow_pages and include_metadata:
-            raise ValueError("Cannot use follow_pages=True with include_metadata=True")
+        if self.http_cache is None:
+            return None
 
-        if not follow_pages:
-            page = int(kwargs.get("page", 1))
-            response = self._request(endpoint, "get", None, **kwargs)
-            items = [expected_model.model_validate(item) for item in response.json()]
+        return self.http_cache.get(
+            self.http_cache.make_key(endpoint, kwargs, expected_model, lazy)
+        )
 
-            if include_metadata:
-                return PaginatedResponse.from_response(
-                    items, response.headers, current_page=page
-                )
-            return items
+    @staticmethod
+    def _conditional_headers(cached: CachedResponse | None) -> dict[str, str] | None:
+        """
+        Get the headers for revalidating a cached response.
 
-        # Follow pagination
-        all_items = []
-        current_page = int(kwargs.get("page", 1))
-        page_kwargs = dict(kwargs)
+        :param cached: The cached response, if any.
+        :return: The conditional request headers, or None if nothing is cached.
+        """
+        if cached is None:
+            return None
 
-        while True:
-            page_kwargs["page"] = current_page
-            response = self._request(endpoint, "get", None, **page_kwargs)
-            page_items = response.json()
+        return cached.conditional_headers()
 
-            if not page_items:
-                break
+    def _store_cached(
+        self,
+        endpoint: str,
+        expected_model: t.Type[BaseModel],
+        kwargs: dict[str, URLParams],
+        response: httpx.Response,
+        value: t.Any,
+        lazy: bool = False,
+    ) -> None:
+        """
+        Store a validated response in the HTTP cache, if one is used.
+
+        :param endpoint: The endpoint requested.
+        :param expected_model: The model the response was validated into.
+        :param kwargs: Query parameters of the request.
+        :param response: The response.
+        :param value: The validated model, or the models of a page.
+        :param lazy: Whenever the items are validated lazily.
+        """
+        if self.http_cache is None:
+            return
 
-            all_items.extend(page_items)
+        self.http_cache.store(
+            self.http_cache.make_key(endpoint, kwargs, expected_model, lazy),
+            response,
+            value,
+        )
 
-            # Stop if no next page in Link header
-            link_header = response.headers.get("Link", "")
-            if 'rel="next"' not in link_header:
-                break
+    def _check_response(self, response: httpx.Response, elapsed: float) -> None:
+        """
+        Log the request and raise if the response has an error status.
 
-            current_page += 1
-            logger.debug(f"Following pagination to page {current_page}")
+        :param response: The response.
+        :param elapsed: Seconds the request took.
+        """
 
-        return [expected_model.model_validate(item) for item in all_items]
+        if self.request_logger is not None:
+            self.request_logger.log_response(response, elapsed)
 
-    def post(self, endpoint: str, data: T, **kwargs: URLParams) -> T:
-        """
-        Post a model to the API.
+        # Answer to a revalidation, served from the HTTP cache
+        if response.status_code == httpx.codes.NOT_MODIFIED:
+            return
 
-        :param endpoint: The endpoint to request.
-        :param data: The data to send.
-        :param kwargs: Additional keyword arguments.
-        :return: The response.
+        try:
+            response.raise_for_status()
+        except httpx.HTTPStatusError as e:
+            logger.error("Failed to make request: {}", e)
+            logger.error("Parsed error: {}", _parse_woo_error_json(response))
+            raise
+
+        except httpx.HTTPError as e:
+            logger.error("Failed to make request: {}", e)
+            raise
+
+    @staticmethod
+    def _apply_fields(
+        expected_model: t.Type[T],
+        fields: list[str] | None,
+        kwargs: dict[str, URLParams],
+    ) -> t.Type[T]:
         """
+        Limit a request to some fields with the _fields query parameter.
 
-        response = self._request(endpoint, "post", data, **kwargs)
+        :param expected_model: The model to expect.
+        :param fields: The fields to request. None requests all fields.
+        :param kwargs: Query parameters of the request, updated in place.
+        :return: The model to validate the response into, a partial model if fields are given.
+        """
+        if fields is None:
+            return expected_model
 
-        return data.__class__.model_validate(response.json())
+        kwargs["_fields"] = fields_param(expected_model, fields)
+        return partial_model(expected_model)
 
-    def put(self, endpoint: str, data: T, **kwargs: URLParams) -> T:
+    @staticmethod
+    def _join_pages(
+        expected_model: t.Type[T], pages: list[list[T] | LazyList[T]], lazy: bool
+    ) -> list[T] | LazyList[T]:
         """
-        Put a model to the API.
+        Join the items of several pages.
 
-        :param endpoint: The endpoint to request.
-        :param data: The data to send.
-        :param kwargs: Additional keyword arguments.
-        :return: The response.
+        :param expected_model: The model of the items.
+        :param pages: The items of each page, in page order.
+        :param lazy: Whenever the items are validated lazily.
+        :return: All items, as a LazyList if lazy is set.
         """
+        if lazy:
+            return LazyList.concat(expected_model, pages)  # type: ignore[arg-type]
 
-        response = self._request(endpoint, "put", data, **kwargs)
+        return [item for items in pages for item in items]
 
-        return data.__class__.model_validate(response.json())
+    @staticmethod
+    def _remaining_pages(headers: t.Mapping[str, str], current_page: int) -> range:
+        """
+        Get the pages after the current one, based on the X-WP-TotalPages header.
 
-    def delete(self, endpoint: str, **kwargs: URLParams) -> None:
+        :param headers: The response headers for the current page.
+        :param current_page: The current page.
+        :return: The remaining page numbers. Empty if the header is missing.
         """
-        Delete a model from the API.
+        total_pages = int(headers.get("X-WP-TotalPages", 0))
+        return range(current_page + 1, total_pages + 1)
 
-        :param endpoint: The endpoint to request.
-        :param kwargs: Additional keyword arguments.
-        :return: The response.
+    @staticmethod
+    def _has_next_page(headers: t.Mapping[str, str]) -> bool:
         """
+        Check the Link header of a response for a next page.
 
-        response = self._request(endpoint, "delete", None, **kwargs)
+        :param headers: The response headers.
+        :return: Whenever there is a next page.
+        """
+        link_header = headers.get("Link", "")
+        return 'rel="next"' in link_header
+
+
+class API(_BaseAPI):
+    """
+    Class for doing requests to the WooCommerce API.
+    """
+
+    _client: httpx.Client
+    """The HTTPX client to use for requests."""
+
+    def _create_client(self) -> None:
+        self._client = httpx.Client(**self._client_options())
+
+    def __del__(self) -> None:
+        # Invalid options raise before the client is created
+        client = getattr(self, "_client", None)
+        # Shared transports are closed by their owner
+        if client is not None and self._transport is None:
+            client.close()
+
+    def _request(
+        self,
+        endpoint: str,
+        method: t.Literal["post", "get", "put", "delete"],
+        data: dict[str, t.Any] | BaseModel | ChangeDetectionMixin | None = None,
+        **kwargs: URLParams,
+    ) -> httpx.Response:
+        """
+        Do requests.
+        For HTTPS, either basic or query string auth is used.
+        For HTTP, 'one-legged' OAuth is used.
+        For reference: https://woocommerce.github.io/woocommerce-rest-api-docs/#authentication
+
+        :param method: The HTTP method to use.
+        :param endpoint: The endpoint to request.
+        :param data: The data to send.
+        :param kwargs: Additional keyword arguments.
+        :return: The response.
+        """
+        return self._send(endpoint, method, data, kwargs)
+
+    def _send(
+        self,
+        endpoint: str,
+        method: t.Literal["post", "get", "put", "delete"],
+        data: dict[str, t.Any] | BaseModel | ChangeDetectionMixin | None,
+        kwargs: dict[str, URLParams],
+        headers: dict[str, str] | None = None,
+    ) -> httpx.Response:
+        """
+        Send a request, retrying it according to the retry policy. See _request.
+
+        :param endpoint: The endpoint to request.
+        :param method: The HTTP method to use.
+        :param data: The data to send.
+        :param kwargs: The query parameters.
+        :param headers: Additional request headers.
+        :return: The response.
+        """
+
+        if data is not None:
+            headers = {"Content-Type": "application/json", **(headers or {})}
+
+        attempt = 0
+        while True:
+            # Prepared on every attempt, as OAuth nonces can not be reused
+            params, auth, content = self._prepare_request(
+                endpoint, method, data, kwargs
+            )
+
+            epoch = self._acquire_slot()
+            started = time.perf_counter()
+            try:
+                response = self._client.request(
+                    method,
+                    endpoint,
+                    content=content,
+                    auth=auth,
+                    params=params,
+                    headers=headers,
+                )
+            except httpx.HTTPError as e:
+                self._finish_attempt(endpoint, method, started, epoch, error=e)
+                delay = self._retry_delay(endpoint, method, attempt, error=e)
+                if delay is None:
+                    raise
+            except BaseException:
+                self._finish_attempt(endpoint, method, started, epoch)
+                raise
+            else:
+                self._finish_attempt(
+                    endpoint, method, started, epoch, response=response
+                )
+                delay = self._retry_delay(endpoint, method, attempt, response=response)
+                if delay is None:
+                    break
+
+            time.sleep(delay)
+            attempt += 1
+
+        self._check_response(response, time.perf_counter() - started)
+
+        return response
+
+    def _acquire_slot(self) -> int | None:
+        """
+        Wait for a slot of the limiter, if one is used.
+
+        :return: The limiter epoch the slot was acquired in, or None without a limiter.
+        """
+        if self.limiter is None:
+            return None
+        return self.limiter.acquire()
+
+    def _fetch_pages(
+        self,
+        endpoint: str,
+        expected_model: t.Type[T],
+        pages: range,
+        page_concurrency: int,
+        kwargs: dict[str, URLParams],
+        lazy: bool = False,
+    ) -> list[list[T] | LazyList[T]]:
+        """
+        Fetch several pages of a list endpoint concurrently.
+
+        :param endpoint: The endpoint to request.
+        :param expected_model: The model to expect.
+        :param pages: The pages to fetch.
+        :param page_concurrency: Maximum number of pages fetched at the same time.
+        :param kwargs: Query parameters for the request.
+        :param lazy: Whenever to validate the items lazily.
+        :return: The items of each page, in page order.
+        """
+
+        def fetch_page(page: int) -> list[T] | LazyList[T]:
+            items, _ = self._get_page(
+                endpoint, expected_model, {**kwargs, "page": page}, lazy
+            )
+            return items
+
+        logger.debug("Fetching pages {}-{} concurrently", pages.start, pages.stop - 1)
+
+        from concurrent.futures import ThreadPoolExecutor
+
+        with ThreadPoolExecutor(
+            max_workers=min(page_concurrency, len(pages))
+        ) as executor:
+            return list(executor.map(fetch_page, pages))
+
+    def _get_page(
+        self,
+        endpoint: str,
+        expected_model: t.Type[T],
+        kwargs: dict[str, URLParams],
+        lazy: bool = False,
+    ) -> tuple[list[T] | LazyList[T], t.Mapping[str, str]]:
+        """
+        Get a single page of a list endpoint.
+        If an HTTP cache is used, the page is revalidated and served from the cache when unchanged.
+
+        :param endpoint: The endpoint to request.
+        :param expected_model: The model to expect.
+        :param kwargs: Query parameters for the request.
+        :param lazy: Whenever to keep the items as decoded JSON until they are accessed.
+        :return: The items of the page and the response headers.
+        """
+        cached = self._get_cached(endpoint, expected_model, kwargs, lazy)
+
+        response = self._send(
+            endpoint, "get", None, kwargs, self._conditional_headers(cached)
+        )
+
+        if cached is not None and response.status_code == httpx.codes.NOT_MODIFIED:
+            return cached.copy_value(), cached.headers
+
+        items = self._validate_page(endpoint, expected_model, response, lazy)
+        self._store_cached(endpoint, expected_model, kwargs, response, items, lazy)
+
+        return items, response.headers
+
+    def get_json(self, endpoint: str, **kwargs: URLParams) -> dict[str, t.Any]:
+        """
+        Get JSON from the API.
+
+        :param endpoint: The endpoint to request.
+        :param kwargs: Additional keyword arguments.
+        :return: The JSON response.
+        """
+
+        response = self._request(endpoint, "get", None, **kwargs)
+
+        return self._decode(response)
+
+    def get(
+        self,
+        endpoint: str,
+        expected_model: t.Type[T],
+        fields: list[str] | None = None,
+        **kwargs: URLParams,
+    ) -> T | None:
+        """
+        Get a model from the API.
+        If an HTTP cache is used, the model is revalidated and served from the cache when unchanged.
+
+        :param endpoint: The endpoint to request.
+        :param expected_model: The model to expect.
+        :param fields: Only request these fields, using _fields. The model is then validated
+        as a partial model, where fields that were not requested are None.
+        It is typed as the full model, so type checkers do not flag those fields as optional.
+        :param kwargs: Additional keyword arguments.
+        :return: The model.
+        """
+        expected_model = self._apply_fields(expected_model, fields, kwargs)
+        cached = self._get_cached(endpoint, expected_model, kwargs)
+
+        try:
+            response = self._send(
+                endpoint, "get", None, kwargs, self._conditional_headers(cached)
+            )
+        except httpx.HTTPStatusError as e:
+            if e.response.status_code == 404:
+                return None
+            raise
+
+        if cached is not None and response.status_code == httpx.codes.NOT_MODIFIED:
+            return cached.copy_value()
+
+        model = self._validate_model(endpoint, "get", expected_model, response)
+        self._store_cached(endpoint, expected_model, kwargs, response, model)
+
+        return model
+
+    @t.overload
+    def get_all(
+        self,
+        endpoint: str,
+        expected_model: t.Type[T],
+        *,
+        follow_pages: t.Literal[True],
+        include_metadata: t.Literal[False] = False,
+        page_concurrency: int | None = None,
+        lazy: t.Literal[False] = False,
+        fields: list[str] | None = None,
+        **kwargs: URLParams,
+    ) -> list[T]: ...
+
+    @t.overload
+    def get_all(
+        self,
+        endpoint: str,
+        expected_model: t.Type[T],
+        *,
+        follow_pages: t.Literal[False] = False,
+        include_metadata: t.Literal[False],
+        page_concurrency: int | None = None,
+        lazy: t.Literal[False] = False,
+        fields: list[str] | None = None,
+        **kwargs: URLParams,
+    ) -> list[T]: ...
+
+    @t.overload
+    def get_all(
+        self,
+        endpoint: str,
+        expected_model: t.Type[T],
+        *,
+        follow_pages: t.Literal[False] = False,
+        include_metadata: t.Literal[True],
+        page_concurrency: int | None = None,
+        lazy: t.Literal[False] = False,
+        fields: list[str] | None = None,
+        **kwargs: URLParams,
+    ) -> PaginatedResponse[T]: ...
+
+    @t.overload
+    def get_all(
+        self,
+        endpoint: str,
+        expected_model: t.Type[T],
+        *,
+        follow_pages: bool = False,
+        include_metadata: t.Literal[False] = False,
+        page_concurrency: int | None = None,
+        lazy: t.Literal[True],
+        fields: list[str] | None = None,
+        **kwargs: URLParams,
+    ) -> LazyList[T]: ...
+
+    @t.overload
+    def get_all(
+        self,
+        endpoint: str,
+        expected_model: t.Type[T],
+        *,
+        follow_pages: t.Literal[False] = False,
+        include_metadata: t.Literal[True],
+        page_concurrency: int | None = None,
+        lazy: t.Literal[True],
+        fields: list[str] | None = None,
+        **kwargs: URLParams,
+    ) -> PaginatedResponse[T]: ...
+
+    def get_all(
+        self,
+        endpoint: str,
+        expected_model: t.Type[T],
+        *,
+        follow_pages: bool = False,
+        include_metadata: bool = False,
+        page_concurrency: int | None = None,
+        lazy: bool = False,
+        fields: list[str] | None = None,
+        **kwargs: URLParams,
+    ) -> list[T] | LazyList[T] | PaginatedResponse[T]:
+        """
+        Get all models from the API.
+
+        :param endpoint: The endpoint to request.
+        :param expected_model: The model to expect.
+        :param follow_pages: Whether to automatically follow pagination and get all pages.
+        :param include_metadata: If True, returns PaginatedResponse instead of plain list.
+        :param page_concurrency: Number of pages fetched concurrently when following pagination.
+        After the first page, the remaining pages are known from the X-WP-TotalPages header
+        and are fetched in parallel, but returned in page order. Only pays off when requests spend
+        their time waiting for the store, and a single remaining page is fetched directly.
+        Defaults to the value set on the client.
+        :param lazy: If True, returns a LazyList that keeps the items as decoded JSON
+        and validates each item only when it is accessed.
+        :param fields: Only request these fields, using _fields. _links is always left out.
+        The items are validated as partial models, where fields that were not requested are None.
+        They are typed as the full model, so type checkers do not flag those fields as optional.
+        :param kwargs: Additional query parameters like page, per_page, etc.
+        """
+        if follow_pages and include_metadata:
+            raise ValueError("Cannot use follow_pages=True with include_metadata=True")
+
+        expected_model = self._apply_fields(expected_model, fields, kwargs)
+
+        if not follow_pages:
+            page = int(kwargs.get("page", 1))
+            items, headers = self._get_page(endpoint, expected_model, kwargs, lazy)
+
+            if include_metadata:
+                return PaginatedResponse.from_response(
+                    items, headers, current_page=page
+                )
+            return items
+
+        # Follow pagination
+        if page_concurrency is None:
+            page_concurrency = self.page_concurrency
+
+        pages: list[list[T] | LazyList[T]] = []
+        current_page = int(kwargs.get("page", 1))
+        page_kwargs = dict(kwargs)
+
+        while True:
+            page_kwargs["page"] = current_page
+            page_items, headers = self._get_page(
+                endpoint, expected_model, page_kwargs, lazy
+            )
+
+            if not page_items:
+                break
+
+            pages.append(page_items)
+
+            remaining_pages = self._remaining_pages(headers, current_page)
+            if page_concurrency > 1 and len(remaining_pages) >= MIN_CONCURRENT_PAGES:
+                pages.extend(
+                    self._fetch_pages(
+                        endpoint,
+                        expected_model,
+                        remaining_pages,
+                        page_concurrency,
+                        page_kwargs,
+                        lazy,
+                    )
+                )
+                break
+
+            # Stop if no next page in Link header
+            if not self._has_next_page(headers):
+                break
+
+            current_page += 1
+            logger.debug("Following pagination to page {}", current_page)
+
+        return self._join_pages(expected_model, pages, lazy)
+
+    def iter_all(
+        self,
+        endpoint: str,
+        expected_model: t.Type[T],
+        fields: list[str] | None = None,
+        **kwargs: URLParams,
+    ) -> t.Iterator[T]:
+        """
+        Iterate over all models from the API, following pagination.
+        Pages are fetched and validated one at a time, so only the current page is held in memory.
+
+        :param endpoint: The endpoint to request.
+        :param expected_model: The model to expect.
+        :param fields: Only request these fields, using _fields. See get_all.
+        :param kwargs: Additional query parameters like page, per_page, etc.
+        :return: An iterator of models.
+        """
+        expected_model = self._apply_fields(expected_model, fields, kwargs)
+        current_page = int(kwargs.get("page", 1))
+        page_kwargs = dict(kwargs)
+
+        while True:
+            page_kwargs["page"] = current_page
+            page_items, headers = self._get_page(endpoint, expected_model, page_kwargs)
+
+            if not page_items:
+                break
+
+            for item in page_items:
+                yield item
+
+            # Stop if no next page in Link header
+            if not self._has_next_page(headers):
+                break
+
+            current_page += 1
+            logger.debug("Following pagination to page {}", current_page)
+
+    def get_each(
+        self,
+        endpoints: t.Sequence[str],
+        expected_model: t.Type[T],
+        concurrency: int | None = None,
+        fields: list[str] | None = None,
+        **kwargs: URLParams,
+    ) -> list[list[T]]:
+        """
+        Get all models of several list endpoints, e.g. the variations of several products.
+        The pages of each endpoint are followed one after another, while up to concurrency
+        endpoints are requested at the same time.
+
+        :param endpoints: The endpoints to request.
+        :param expected_model: The model to expect.
+        :param concurrency: Maximum number of endpoints requested at the same time.
+        Defaults to the page_concurrency of the client.
+        :param fields: Only request these fields, using _fields. See get_all.
+        :param kwargs: Additional query parameters for every endpoint, like per_page.
+        :return: The models of each endpoint, in the order of endpoints.
+        """
+        if concurrency is None:
+            concurrency = self.page_concurrency
+        # Passed next to the typed keywords of get_all
+        params: dict[str, t.Any] = kwargs
+
+        def fetch(endpoint: str) -> list[T]:
+            return self.get_all(
+                endpoint,
+                expected_model,
+                follow_pages=True,
+                page_concurrency=1,
+                fields=fields,
+                **params,
+            )
+
+        if concurrency <= 1 or len(endpoints) <= 1:
+            return [fetch(endpoint) for endpoint in endpoints]
+
+        from concurrent.futures import ThreadPoolExecutor
+
+        with ThreadPoolExecutor(
+            max_workers=min(concurrency, len(endpoints))
+        ) as executor:
+            return list(executor.map(fetch, endpoints))
+
+    def post(self, endpoint: str, data: T, **kwargs: URLParams) -> T:
+        """
+        Post a model to the API.
+
+        :param endpoint: The endpoint to request.
+        :param data: The data to send.
+        :param kwargs: Additional keyword arguments.
+        :return: The response.
+        """
+
+        response = self._request(endpoint, "post", data, **kwargs)
+
+        return self._validate_model(endpoint, "post", data.__class__, response)
+
+    def put(self, endpoint: str, data: T, **kwargs: URLParams) -> T:
+        """
+        Put a model to the API.
+
+        :param endpoint: The endpoint to request.
+        :param data: The data to send.
+        :param kwargs: Additional keyword arguments.
+        :return: The response.
+        """
+
+        response = self._request(endpoint, "put", data, **kwargs)
+
+        return self._validate_model(endpoint, "put", data.__class__, response)
+
+    def batch(
+        self,
+        endpoint: str,
+        expected_model: t.Type[T],
+        create: list[T] | None = None,
+        update: list[T] | None = None,
+        delete: list[int] | None = None,
+        batch_size: int = BATCH_SIZE,
+        concurrency: int = 1,
+    ) -> BatchResponse[T]:
+        """
+        Create, update and delete models using a batch endpoint.
+        The operations are split into requests of at most batch_size operations.
+
+        :param endpoint: The batch endpoint to request, e.g. 'products/batch'.
+        :param expected_model: The model to expect.
+        :param create: Models to create.
+        :param update: Models to update. Must have their ID set.
+        :param delete: IDs of the models to delete.
+        :param batch_size: Maximum number of operations per request.
+        :param concurrency: Number of requests sent at the same time.
+        :return: The created, updated and deleted models, and the errors of failed items.
+        """
+        chunks = self._batch_chunks(create, update, delete, batch_size)
+
+        def send_chunk(chunk: BatchChunk) -> dict[str, t.Any]:
+            return self._decode(self._request(endpoint, "post", chunk.payload))
+
+        if concurrency > 1 and len(chunks) > 1:
+            from concurrent.futures import ThreadPoolExecutor
+
+            with ThreadPoolExecutor(
+                max_workers=min(concurrency, len(chunks))
+            ) as executor:
+                results = list(executor.map(send_chunk, chunks))
+        else:
+            results = [send_chunk(chunk) for chunk in chunks]
+
+        batch_response: BatchResponse[T] = BatchResponse()
+        for chunk, result in zip(chunks, results):
+            batch_response.add_chunk(chunk, result, expected_model)
+
+        return batch_response
+
+    def delete(self, endpoint: str, **kwargs: URLParams) -> None:
+        """
+        Delete a model from the API.
+
+        :param endpoint: The endpoint to request.
+        :param kwargs: Additional keyword arguments.
+        :return: The response.
+        """
+
+        response = self._request(endpoint, "delete", None, **kwargs)
+
+
+class AsyncAPI(_BaseAPI):
+    """
+    Class for doing asynchronous requests to the WooCommerce API.
+    Has the same interface as API, but all request methods are coroutines.
+    """
+
+    _client: httpx.AsyncClient
+    """The HTTPX client to use for requests."""
+
+    def _create_client(self) -> None:
+        self._client = httpx.AsyncClient(**self._client_options())
+
+    async def aclose(self) -> None:
+        """
+        Close the underlying HTTPX client.
+        """
+        # Shared transports are closed by their owner
+        if self._transport is None:
+            await self._client.aclose()
+
+    async def __aenter__(self) -> "AsyncAPI":
+        return self
+
+    async def __aexit__(self, *args: t.Any) -> None:
+        await self.aclose()
+
+    async def _request(
+        self,
+        endpoint: str,
+        method: t.Literal["post", "get", "put", "delete"],
+        data: dict[str, t.Any] | BaseModel | ChangeDetectionMixin | None = None,
+        **kwargs: URLParams,
+    ) -> httpx.Response:
+        """
+        Do requests.
+        See API._request for details on authentication.
+
+        :param method: The HTTP method to use.
+        :param endpoint: The endpoint to request.
+        :param data: The data to send.
+        :param kwargs: Additional keyword arguments.
+        :return: The response.
+        """
+        return await self._send(endpoint, method, data, kwargs)
+
+    async def _send(
+        self,
+        endpoint: str,
+        method: t.Literal["post", "get", "put", "delete"],
+        data: dict[str, t.Any] | BaseModel | ChangeDetectionMixin | None,
+        kwargs: dict[str, URLParams],
+        headers: dict[str, str] | None = None,
+    ) -> httpx.Response:
+        """
+        Send a request, retrying it according to the retry policy. See API._request.
+
+        :param endpoint: The endpoint to request.
+        :param method: The HTTP method to use.
+        :param data: The data to send.
+        :param kwargs: The query parameters.
+        :param headers: Additional request headers.
+        :return: The response.
+        """
+
+        if data is not None:
+            headers = {"Content-Type": "application/json", **(headers or {})}
+
+        import asyncio
+
+        attempt = 0
+        while True:
+            # Prepared on every attempt, as OAuth nonces can not be reused
+            params, auth, content = self._prepare_request(
+                endpoint, method, data, kwargs
+            )
+
+            epoch = await self._acquire_slot()
+            started = time.perf_counter()
+            try:
+                response = await self._client.request(
+                    method,
+                    endpoint,
+                    content=content,
+                    auth=auth,
+                    params=params,
+                    headers=headers,
+                )
+            except httpx.HTTPError as e:
+                self._finish_attempt(endpoint, method, started, epoch, error=e)
+                delay = self._retry_delay(endpoint, method, attempt, error=e)
+                if delay is None:
+                    raise
+            except BaseException:
+                self._finish_attempt(endpoint, method, started, epoch)
+                raise
+            else:
+                self._finish_attempt(
+                    endpoint, method, started, epoch, response=response
+                )
+                delay = self._retry_delay(endpoint, method, attempt, response=response)
+                if delay is None:
+                    break
+
+            await asyncio.sleep(delay)
+            attempt += 1
+
+        self._check_response(response, time.perf_counter() - started)
+
+        return response
+
+    async def _acquire_slot(self) -> int | None:
+        """
+        Wait for a slot of the limiter, if one is used.
+
+        :return: The limiter epoch the slot was acquired in, or None without a limiter.
+        """
+        if self.limiter is None:
+            return None
+        return await self.limiter.acquire_async()
+
+    async def _fetch_pages(
+        self,
+        endpoint: str,
+        expected_model: t.Type[T],
+        pages: range,
+        page_concurrency: int,
+        kwargs: dict[str, URLParams],
+        lazy: bool = False,
+    ) -> list[list[T] | LazyList[T]]:
+        """
+        Fetch several pages of a list endpoint concurrently.
+
+        :param endpoint: The endpoint to request.
+        :param expected_model: The model to expect.
+        :param pages: The pages to fetch.
+        :param page_concurrency: Maximum number of pages fetched at the same time.
+        :param kwargs: Query parameters for the request.
+        :param lazy: Whenever to validate the items lazily.
+        :return: The items of each page, in page order.
+        """
+        import asyncio
+
+        semaphore = asyncio.Semaphore(page_concurrency)
+
+        async def fetch_page(page: int) -> list[T] | LazyList[T]:
+            async with semaphore:
+                items, _ = await self._get_page(
+                    endpoint, expected_model, {**kwargs, "page": page}, lazy
+                )
+            return items
+
+        logger.debug("Fetching pages {}-{} concurrently", pages.start, pages.stop - 1)
+
+        return list(await asyncio.gather(*(fetch_page(page) for page in pages)))
+
+    async def _get_page(
+        self,
+        endpoint: str,
+        expected_model: t.Type[T],
+        kwargs: dict[str, URLParams],
+        lazy: bool = False,
+    ) -> tuple[list[T] | LazyList[T], t.Mapping[str, str]]:
+        """
+        Get a single page of a list endpoint.
+        If an HTTP cache is used, the page is revalidated and served from the cache when unchanged.
+
+        :param endpoint: The endpoint to request.
+        :param expected_model: The model to expect.
+        :param kwargs: Query parameters for the request.
+        :param lazy: Whenever to keep the items as decoded JSON until they are accessed.
+        :return: The items of the page and the response headers.
+        """
+        cached = self._get_cached(endpoint, expected_model, kwargs, lazy)
+
+        response = await self._send(
+            endpoint, "get", None, kwargs, self._conditional_headers(cached)
+        )
+
+        if cached is not None and response.status_code == httpx.codes.NOT_MODIFIED:
+            return cached.copy_value(), cached.headers
+
+        items = self._validate_page(endpoint, expected_model, response, lazy)
+        self._store_cached(endpoint, expected_model, kwargs, response, items, lazy)
+
+        return items, response.headers
+
+    async def get_json(self, endpoint: str, **kwargs: URLParams) -> dict[str, t.Any]:
+        """
+        Get JSON from the API.
+
+        :param endpoint: The endpoint to request.
+        :param kwargs: Additional keyword arguments.
+        :return: The JSON response.
+        """
+
+        response = await self._request(endpoint, "get", None, **kwargs)
+
+        return self._decode(response)
+
+    async def get(
+        self,
+        endpoint: str,
+        expected_model: t.Type[T],
+        fields: list[str] | None = None,
+        **kwargs: URLParams,
+    ) -> T | None:
+        """
+        Get a model from the API.
+        If an HTTP cache is used, the model is revalidated and served from the cache when unchanged.
+
+        :param endpoint: The endpoint to request.
+        :param expected_model: The model to expect.
+        :param fields: Only request these fields, using _fields. The model is then validated
+        as a partial model, where fields that were not requested are None.
+        It is typed as the full model, so type checkers do not flag those fields as optional.
+        :param kwargs: Additional keyword arguments.
+        :return: The model.
+        """
+        expected_model = self._apply_fields(expected_model, fields, kwargs)
+        cached = self._get_cached(endpoint, expected_model, kwargs)
+
+        try:
+            response = await self._send(
+                endpoint, "get", None, kwargs, self._conditional_headers(cached)
+            )
+        except httpx.HTTPStatusError as e:
+            if e.response.status_code == 404:
+                return None
+            raise
+
+        if cached is not None and response.status_code == httpx.codes.NOT_MODIFIED:
+            return cached.copy_value()
+
+        model = self._validate_model(endpoint, "get", expected_model, response)
+        self._store_cached(endpoint, expected_model, kwargs, response, model)
+
+        return model
+
+    @t.overload
+    async def get_all(
+        self,
+        endpoint: str,
+        expected_model: t.Type[T],
+        *,
+        follow_pages: t.Literal[True],
+        include_metadata: t.Literal[False] = False,
+        page_concurrency: int | None = None,
+        lazy: t.Literal[False] = False,
+        fields: list[str] | None = None,
+        **kwargs: URLParams,
+    ) -> list[T]: ...
+
+    @t.overload
+    async def get_all(
+        self,
+        endpoint: str,
+        expected_model: t.Type[T],
+        *,
+        follow_pages: t.Literal[False] = False,
+        include_metadata: t.Literal[False],
+        page_concurrency: int | None = None,
+        lazy: t.Literal[False] = False,
+        fields: list[str] | None = None,
+        **kwargs: URLParams,
+    ) -> list[T]: ...
+
+    @t.overload
+    async def get_all(
+        self,
+        endpoint: str,
+        expected_model: t.Type[T],
+        *,
+        follow_pages: t.Literal[False] = False,
+        include_metadata: t.Literal[True],
+        page_concurrency: int | None = None,
+        lazy: t.Literal[False] = False,
+        fields: list[str] | None = None,
+        **kwargs: URLParams,
+    ) -> PaginatedResponse[T]: ...
+
+    @t.overload
+    async def get_all(
+        self,
+        endpoint: str,
+        expected_model: t.Type[T],
+        *,
+        follow_pages: bool = False,
+        include_metadata: t.Literal[False] = False,
+        page_concurrency: int | None = None,
+        lazy: t.Literal[True],
+        fields: list[str] | None = None,
+        **kwargs: URLParams,
+    ) -> LazyList[T]: ...
+
+    @t.overload
+    async def get_all(
+        self,
+        endpoint: str,
+        expected_model: t.Type[T],
+        *,
+        follow_pages: t.Literal[False] = False,
+        include_metadata: t.Literal[True],
+        page_concurrency: int | None = None,
+        lazy: t.Literal[True],
+        fields: list[str] | None = None,
+        **kwargs: URLParams,
+    ) -> PaginatedResponse[T]: ...
+
+    async def get_all(
+        self,
+        endpoint: str,
+        expected_model: t.Type[T],
+        *,
+        follow_pages: bool = False,
+        include_metadata: bool = False,
+        page_concurrency: int | None = None,
+        lazy: bool = False,
+        fields: list[str] | None = None,
+        **kwargs: URLParams,
+    ) -> list[T] | LazyList[T] | PaginatedResponse[T]:
+        """
+        Get all models from the API.
+
+        :param endpoint: The endpoint to request.
+        :param expected_model: The model to expect.
+        :param follow_pages: Whether to automatically follow pagination and get all pages.
+        :param include_metadata: If True, returns PaginatedResponse instead of plain list.
+        :param page_concurrency: Number of pages fetched concurrently when following pagination.
+        After the first page, the remaining pages are known from the X-WP-TotalPages header
+        and are fetched in parallel, but returned in page order. Only pays off when requests spend
+        their time waiting for the store, and a single remaining page is fetched directly.
+        Defaults to the value set on the client.
+        :param lazy: If True, returns a LazyList that keeps the items as decoded JSON
+        and validates each item only when it is accessed.
+        :param fields: Only request these fields, using _fields. _links is always left out.
+        The items are validated as partial models, where fields that were not requested are None.
+        They are typed as the full model, so type checkers do not flag those fields as optional.
+        :param kwargs: Additional query parameters like page, per_page, etc.
+        """
+        if follow_pages and include_metadata:
+            raise ValueError("Cannot use follow_pages=True with include_metadata=True")
+
+        expected_model = self._apply_fields(expected_model, fields, kwargs)
+
+        if not follow_pages:
+            page = int(kwargs.get("page", 1))
+            items, headers = await self._get_page(
+                endpoint, expected_model, kwargs, lazy
+            )
+
+            if include_metadata:
+                return PaginatedResponse.from_response(
+                    items, headers, current_page=page
+                )
+            return items
+
+        # Follow pagination
+        if page_concurrency is None:
+            page_concurrency = self.page_concurrency
+
+        pages: list[list[T] | LazyList[T]] = []
+        current_page = int(kwargs.get("page", 1))
+        page_kwargs = dict(kwargs)
+
+        while True:
+            page_kwargs["page"] = current_page
+            page_items, headers = await self._get_page(
+                endpoint, expected_model, page_kwargs, lazy
+            )
+
+            if not page_items:
+                break
+
+            pages.append(page_items)
+
+            remaining_pages = self._remaining_pages(headers, current_page)
+            if page_concurrency > 1 and len(remaining_pages) >= MIN_CONCURRENT_PAGES:
+                pages.extend(
+                    await self._fetch_pages(
+                        endpoint,
+                        expected_model,
+                        remaining_pages,
+                        page_concurrency,
+                        page_kwargs,
+                        lazy,
+                    )
+                )
+                break
+
+            # Stop if no next page in Link header
+            if not self._has_next_page(headers):
+                break
+
+            current_page += 1
+            logger.debug("Following pagination to page {}", current_page)
+
+        return self._join_pages(expected_model, pages, lazy)
+
+    async def iter_all(
+        self,
+        endpoint: str,
+        expected_model: t.Type[T],
+        fields: list[str] | None = None,
+        **kwargs: URLParams,
+    ) -> t.AsyncIterator[T]:
+        """
+        Iterate over all models from the API, following pagination.
+        Pages are fetched and validated one at a time, so only the current page is held in memory.
+
+        :param endpoint: The endpoint to request.
+        :param expected_model: The model to expect.
+        :param fields: Only request these fields, using _fields. See get_all.
+        :param kwargs: Additional query parameters like page, per_page, etc.
+        :return: An iterator of models.
+        """
+        expected_model = self._apply_fields(expected_model, fields, kwargs)
+        current_page = int(kwargs.get("page", 1))
+        page_kwargs = dict(kwargs)
+
+        while True:
+            page_kwargs["page"] = current_page
+            page_items, headers = await self._get_page(
+                endpoint, expected_model, page_kwargs
+            )
+
+            if not page_items:
+                break
+
+            for item in page_items:
+                yield item
+
+            # Stop if no next page in Link header
+            if not self._has_next_page(headers):
+                break
+
+            current_page += 1
+            logger.debug("Following pagination to page {}", current_page)
+
+    async def get_each(
+        self,
+        endpoints: t.Sequence[str],
+        expected_model: t.Type[T],
+        concurrency: int | None = None,
+        fields: list[str] | None = None,
+        **kwargs: URLParams,
+    ) -> list[list[T]]:
+        """
+        Get all models of several list endpoints, e.g. the variations of several products.
+        The pages of each endpoint are followed one after another, while up to concurrency
+        endpoints are requested at the same time.
+
+        :param endpoints: The endpoints to request.
+        :param expected_model: The model to expect.
+        :param concurrency: Maximum number of endpoints requested at the same time.
+        Defaults to the page_concurrency of the client.
+        :param fields: Only request these fields, using _fields. See get_all.
+        :param kwargs: Additional query parameters for every endpoint, like per_page.
+        :return: The models of each endpoint, in the order of endpoints.
+        """
+        import asyncio
+
+        if concurrency is None:
+            concurrency = self.page_concurrency
+        # Passed next to the typed keywords of get_all
+        params: dict[str, t.Any] = kwargs
+        semaphore = asyncio.Semaphore(max(concurrency, 1))
+
+        async def fetch(endpoint: str) -> list[T]:
+            async with semaphore:
+                return await self.get_all(
+                    endpoint,
+                    expected_model,
+                    follow_pages=True,
+                    page_concurrency=1,
+                    fields=fields,
+                    **params,
+                )
+
+        return list(await asyncio.gather(*(fetch(endpoint) for endpoint in endpoints)))
+
+    async def post(self, endpoint: str, data: T, **kwargs: URLParams) -> T:
+        """
+        Post a model to the API.
+
+        :param endpoint: The endpoint to request.
+        :param data: The data to send.
+        :param kwargs: Additional keyword arguments.
+        :return: The response.
+        """
+
+        response = await self._request(endpoint, "post", data, **kwargs)
+
+        return self._validate_model(endpoint, "post", data.__class__, response)
+
+    async def put(self, endpoint: str, data: T, **kwargs: URLParams) -> T:
+        """
+        Put a model to the API.
+
+        :param endpoint: The endpoint to request.
+        :param data: The data to send.
+        :param kwargs: Additional keyword arguments.
+        :return: The response.
+        """
+
+        response = await self._request(endpoint, "put", data, **kwargs)
+
+        return self._validate_model(endpoint, "put", data.__class__, response)
+
+    async def batch(
+        self,
+        endpoint: str,
+        expected_model: t.Type[T],
+        create: list[T] | None = None,
+        update: list[T] | None = None,
+        delete: list[int] | None = None,
+        batch_size: int = BATCH_SIZE,
+        concurrency: int = 1,
+    ) -> BatchResponse[T]:
+        """
+        Create, update and delete models using a batch endpoint.
+        The operations are split into requests of at most batch_size operations.
+
+        :param endpoint: The batch endpoint to request, e.g. 'products/batch'.
+        :param expected_model: The model to expect.
+        :param create: Models to create.
+        :param update: Models to update. Must have their ID set.
+        :param delete: IDs of the models to delete.
+        :param batch_size: Maximum number of operations per request.
+        :param concurrency: Number of requests sent at the same time.
+        :return: The created, updated and deleted models, and the errors of failed items.
+        """
+        import asyncio
+
+        chunks = self._batch_chunks(create, update, delete, batch_size)
+        semaphore = asyncio.Semaphore(concurrency)
+
+        async def send_chunk(chunk: BatchChunk) -> dict[str, t.Any]:
+            async with semaphore:
+                response = await self._request(endpoint, "post", chunk.payload)
+            return self._decode(response)
+
+        results = await asyncio.gather(*(send_chunk(chunk) for chunk in chunks))
+
+        batch_response: BatchResponse[T] = BatchResponse()
+        for chunk, result in zip(chunks, results):
+            batch_response.add_chunk(chunk, result, expected_model)
+
+        return batch_response
+
+    async def delete(self, endpoint: str, **kwargs: URLParams) -> None:
+        """
+        Delete a model from the API.
+
+        :param endpoint: The endpoint to request.
+        :param kwargs: Additional keyword arguments.
+        :return: The response.
+        """
+
+        response = await self._request(endpoint, "delete", None, **kwargs)
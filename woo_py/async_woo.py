@@ -0,0 +1,3889 @@
+# This file is generated from woo_py/woo.py by scripts/generate_async_woo.py.
+# Do not edit it directly.
+from __future__ import annotations
+
+import datetime
+import typing as t
+from pydantic import BaseModel
+
+# Models are only imported when a method first needs them, see woo_py.models
+from woo_py import models
+
+from woo_py.api import AsyncAPI, GMT_FORMAT, BatchResponse, PaginatedResponse
+from woo_py.lazy import LazyList
+from woo_py.sku_index import SKU_FIELDS, SkuIndex, SkuLocation
+
+if t.TYPE_CHECKING:
+    from woo_py.cache import MemoCache
+    from woo_py.models import Order
+    from woo_py.models.coupon import Coupon
+    from woo_py.models.customer import Customer
+    from woo_py.models.product import Product, ProductType
+    from woo_py.models.product_variation import ProductVariation
+    from woo_py.models.product_category import ProductCategory
+    from woo_py.models.product_tag import ProductTag
+    from woo_py.models.product_attribute import ProductAttribute
+    from woo_py.models.product_review import ProductReview
+    from woo_py.models.payment_gateway import PaymentGateway
+    from woo_py.models.report import SalesReport, TopSellersReport
+    from woo_py.models.setting import SettingOption
+    from woo_py.models.data import Country, Currency
+    from woo_py.models.tax_class import TaxClass
+    from woo_py.models.tax_rate import TaxRate
+    from woo_py.models.webhook import Webhook
+    from woo_py.models.order_refund import OrderRefund
+
+ContextType = t.Literal["view", "edit"]
+OrderType = t.Literal["asc", "desc"]
+
+
+class AsyncWoo:
+    """
+    Represents the asynchronous interface for accessing the API.
+    All resource methods of Woo are available as coroutines.
+    """
+
+    api_object: AsyncAPI
+
+    cache: MemoCache | None
+    """Cache for reference data, e.g. countries, settings and tax rates. None disables it."""
+
+    sku_index: SkuIndex
+    """Index of SKUs used by resolve_skus."""
+
+    def __init__(
+        self,
+        api_object: AsyncAPI,
+        cache: MemoCache | None = None,
+        sku_index: SkuIndex | None = None,
+    ) -> None:
+        self.api_object = api_object
+        self.cache = cache
+        self.sku_index = sku_index if sku_index is not None else SkuIndex()
+
+    def _get_cached(self, endpoint: str, key: t.Hashable) -> t.Any | None:
+        """
+        Get a result from the cache, if one is used.
+
+        :param endpoint: The endpoint the result belongs to.
+        :param key: The arguments the result was requested with.
+        :return: The cached result, or None if it is not cached.
+        """
+        if self.cache is None:
+            return None
+
+        return self.cache.get(endpoint, key)
+
+    def _set_cached(self, endpoint: str, key: t.Hashable, value: t.Any) -> None:
+        """
+        Store a result in the cache, if one is used.
+
+        :param endpoint: The endpoint the result belongs to.
+        :param key: The arguments the result was requested with.
+        :param value: The result.
+        """
+        if self.cache is not None:
+            self.cache.set(endpoint, key, value)
+
+    def _invalidate_cached(self, endpoint: str) -> None:
+        """
+        Remove the cached results of an endpoint after it was changed.
+
+        :param endpoint: The endpoint.
+        """
+        if self.cache is not None:
+            self.cache.invalidate(endpoint)
+
+    # Coupons
+    async def create_coupon(self, coupon: Coupon) -> Coupon:
+        """
+        Creates a coupon.
+        :param coupon: Coupon object
+        :return: the created coupon
+        """
+        return await self.api_object.post("coupons", coupon)
+
+    async def get_coupon(
+        self, coupon_id: int, fields: list[str] | None = None
+    ) -> Coupon | None:
+        """
+        Gets a coupon by its ID.
+        :param coupon_id: id of the coupon
+        :param fields: Only return these fields, e.g. ["id", "code", "amount"]. Other fields of the returned objects are None.
+        The objects are still typed as the full model, so type checkers do not flag those fields as optional.
+        :return:
+        """
+        return await self.api_object.get(
+            f"coupons/{coupon_id}", models.Coupon, fields=fields
+        )
+
+    @t.overload
+    async def list_coupons(
+        self,
+        context: ContextType = None,
+        page: int = None,
+        per_page: int = None,
+        search: str | None = None,
+        after: str | None = None,
+        before: str | None = None,
+        exclude: list[int] | None = None,
+        include: list[int] | None = None,
+        offset: int = None,
+        order: OrderType = None,
+        orderby: t.Literal["date", "modified", "id", "include", "title", "slug"] = None,
+        code: str | None = None,
+        *,
+        follow_pages: t.Literal[False] = False,
+        return_metadata: t.Literal[True],
+        lazy: t.Literal[False] = False,
+        fields: list[str] | None = None,
+    ) -> PaginatedResponse[Coupon]: ...
+
+    @t.overload
+    async def list_coupons(
+        self,
+        context: ContextType = None,
+        page: int = None,
+        per_page: int = None,
+        search: str | None = None,
+        after: str | None = None,
+        before: str | None = None,
+        exclude: list[int] | None = None,
+        include: list[int] | None = None,
+        offset: int = None,
+        order: OrderType = None,
+        orderby: t.Literal["date", "modified", "id", "include", "title", "slug"] = None,
+        code: str | None = None,
+        *,
+        follow_pages: t.Literal[False] = False,
+        return_metadata: t.Literal[False] = False,
+        lazy: t.Literal[False] = False,
+        fields: list[str] | None = None,
+    ) -> list[Coupon]: ...
+
+    @t.overload
+    async def list_coupons(
+        self,
+        context: ContextType = None,
+        page: int = None,
+        per_page: int = None,
+        search: str | None = None,
+        after: str | None = None,
+        before: str | None = None,
+        exclude: list[int] | None = None,
+        include: list[int] | None = None,
+        offset: int = None,
+        order: OrderType = None,
+        orderby: t.Literal["date", "modified", "id", "include", "title", "slug"] = None,
+        code: str | None = None,
+        *,
+        follow_pages: t.Literal[True],
+        return_metadata: t.Literal[False] = False,
+        lazy: t.Literal[False] = False,
+        fields: list[str] | None = None,
+    ) -> list[Coupon]: ...
+
+    @t.overload
+    async def list_coupons(
+        self,
+        context: ContextType = None,
+        page: int = None,
+        per_page: int = None,
+        search: str | None = None,
+        after: str | None = None,
+        before: str | None = None,
+        exclude: list[int] | None = None,
+        include: list[int] | None = None,
+        offset: int = None,
+        order: OrderType = None,
+        orderby: t.Literal["date", "modified", "id", "include", "title", "slug"] = None,
+        code: str | None = None,
+        *,
+        follow_pages: bool = False,
+        return_metadata: t.Literal[False] = False,
+        lazy: t.Literal[True],
+        fields: list[str] | None = None,
+    ) -> LazyList[Coupon]: ...
+
+    async def list_coupons(
+        self,
+        context: ContextType = None,
+        page: int = None,
+        per_page: int = None,
+        search: str | None = None,
+        after: str | None = None,
+        before: str | None = None,
+        exclude: list[int] | None = None,
+        include: list[int] | None = None,
+        offset: int = None,
+        order: OrderType = None,
+        orderby: t.Literal["date", "modified", "id", "include", "title", "slug"] = None,
+        code: str | None = None,
+        follow_pages: bool = False,
+        return_metadata: bool = False,
+        lazy: bool = False,
+        fields: list[str] | None = None,
+    ) -> list[Coupon] | LazyList[Coupon] | PaginatedResponse[Coupon]:
+        """
+        Lists all coupons.
+
+        :param follow_pages: Whether to automatically follow pagination and get all pages. Defaults to False.
+        :param return_metadata: If True, returns a PaginatedResponse with metadata instead of just a list. Cannot be used with follow_pages=True.
+        :param lazy: If True, returns a LazyList that validates each item only when it is accessed.
+        :param fields: Only return these fields, e.g. ["id", "code", "amount"]. Other fields of the returned objects are None.
+        The objects are still typed as the full model, so type checkers do not flag those fields as optional.
+        :return: A list of Coupon objects or a PaginatedResponse containing the list and pagination metadata.
+        """
+        if follow_pages and return_metadata:
+            raise ValueError("Cannot use follow_pages=True with return_metadata=True")
+
+        params = {
+            "context": context,
+            "page": page,
+            "per_page": per_page,
+            "search": search,
+            "after": after,
+            "before": before,
+            "exclude": exclude,
+            "include": include,
+            "offset": offset,
+            "order": order,
+            "orderby": orderby,
+            "code": code,
+        }
+        # Remove None values
+        params = {k: v for k, v in params.items() if v is not None}
+
+        return await self.api_object.get_all(
+            "coupons",
+            models.Coupon,
+            follow_pages=follow_pages,
+            include_metadata=return_metadata,
+            lazy=lazy,
+            fields=fields,
+            **params,
+        )
+
+    def iter_coupons(
+        self,
+        context: ContextType = None,
+        page: int = None,
+        per_page: int = None,
+        search: str | None = None,
+        after: str | None = None,
+        before: str | None = None,
+        exclude: list[int] | None = None,
+        include: list[int] | None = None,
+        offset: int = None,
+        order: OrderType = None,
+        orderby: t.Literal["date", "modified", "id", "include", "title", "slug"] = None,
+        code: str | None = None,
+        fields: list[str] | None = None,
+    ) -> t.AsyncIterator[Coupon]:
+        """
+        Iterates over all coupons, fetching one page at a time.
+        Accepts the same filters as list_coupons.
+
+        :param fields: Only return these fields, e.g. ["id", "code", "amount"]. Other fields of the returned objects are None.
+        The objects are still typed as the full model, so type checkers do not flag those fields as optional.
+        :return: An iterator of Coupon objects.
+        """
+        params = {
+            "context": context,
+            "page": page,
+            "per_page": per_page,
+            "search": search,
+            "after": after,
+            "before": before,
+            "exclude": exclude,
+            "include": include,
+            "offset": offset,
+            "order": order,
+            "orderby": orderby,
+            "code": code,
+        }
+        # Remove None values
+        params = {k: v for k, v in params.items() if v is not None}
+
+        return self.api_object.iter_all(
+            "coupons", models.Coupon, fields=fields, **params
+        )
+
+    async def update_coupon(self, coupon_id: int, coupon: Coupon) -> Coupon:
+        """
+        Updates a coupon by its ID.
+        :param coupon_id: id of the coupon
+        :param coupon: Coupon object
+        :return:
+        """
+        return await self.api_object.put(f"coupons/{coupon_id}", coupon)
+
+    async def delete_coupon(self, coupon_id: int) -> None:
+        """
+        Deletes a coupon by its ID.
+        :param coupon_id: id of the coupon
+        :return: None
+        """
+        await self.api_object.delete(f"coupons/{coupon_id}")
+
+    async def batch_coupons(
+        self,
+        create: list[Coupon] | None = None,
+        update: list[Coupon] | None = None,
+        delete: list[int] | None = None,
+        concurrency: int = 1,
+    ) -> BatchResponse[Coupon]:
+        """
+        Creates, updates and deletes coupons using the batch endpoint.
+        Large inputs are split into requests of up to 100 operations.
+        :param create: Coupon objects to create
+        :param update: Coupon objects to update, must have their id set
+        :param delete: ids of the coupons to delete
+        :param concurrency: number of batch requests sent at the same time
+        :return: BatchResponse with the resulting objects and the errors of failed items
+        """
+        return await self.api_object.batch(
+            "coupons/batch",
+            models.Coupon,
+            create=create,
+            update=update,
+            delete=delete,
+            concurrency=concurrency,
+        )
+
+    # Webhooks
+
+    async def create_webhook(self, webhook: Webhook) -> Webhook:
+        """
+        Creates a webhook.
+        :param webhook: Webhook object
+        :return: the created webhook
+        """
+        return await self.api_object.post("webhooks", webhook)
+
+    async def get_webhook(
+        self, webhook_id: int, fields: list[str] | None = None
+    ) -> Webhook | None:
+        """
+        Gets a webhook by its ID.
+        :param webhook_id: id of the webhook
+        :param fields: Only return these fields, e.g. ["id", "name", "status"]. Other fields of the returned objects are None.
+        The objects are still typed as the full model, so type checkers do not flag those fields as optional.
+        :return:
+        """
+        return await self.api_object.get(
+            f"webhooks/{webhook_id}", models.Webhook, fields=fields
+        )
+
+    async def delete_webhook(self, webhook_id: int, force: bool = False) -> None:
+        """
+        Deletes a webhook by its ID.
+        :param webhook_id: id of the webhook
+        :param force: when True, the webhook will be permanently deleted
+        :return: None
+        """
+        return await self.api_object.delete(f"webhooks/{webhook_id}", force=force)
+
+    @t.overload
+    async def list_webhooks(
+        self,
+        context: ContextType = None,
+        page: int = None,
+        per_page: int = None,
+        search: str | None = None,
+        after: str | None = None,
+        before: str | None = None,
+        exclude: list[int] | None = None,
+        include: list[int] | None = None,
+        offset: int | None = None,
+        order: OrderType = None,
+        orderby: t.Literal["date", "id", "title"] = None,
+        status: t.Literal["all", "active", "paused", "disabled", "all"] = None,
+        *,
+        follow_pages: t.Literal[False] = False,
+        return_metadata: t.Literal[True],
+        lazy: t.Literal[False] = False,
+        fields: list[str] | None = None,
+    ) -> PaginatedResponse[Webhook]: ...
+
+    @t.overload
+    async def list_webhooks(
+        self,
+        context: ContextType = None,
+        page: int = None,
+        per_page: int = None,
+        search: str | None = None,
+        after: str | None = None,
+        before: str | None = None,
+        exclude: list[int] | None = None,
+        include: list[int] | None = None,
+        offset: int | None = None,
+        order: OrderType = None,
+        orderby: t.Literal["date", "id", "title"] = None,
+        status: t.Literal["all", "active", "paused", "disabled", "all"] = None,
+        *,
+        follow_pages: t.Literal[False] = False,
+        return_metadata: t.Literal[False] = False,
+        lazy: t.Literal[False] = False,
+        fields: list[str] | None = None,
+    ) -> list[Webhook]: ...
+
+    @t.overload
+    async def list_webhooks(
+        self,
+        context: ContextType = None,
+        page: int = None,
+        per_page: int = None,
+        search: str | None = None,
+        after: str | None = None,
+        before: str | None = None,
+        exclude: list[int] | None = None,
+        include: list[int] | None = None,
+        offset: int | None = None,
+        order: OrderType = None,
+        orderby: t.Literal["date", "id", "title"] = None,
+        status: t.Literal["all", "active", "paused", "disabled", "all"] = None,
+        *,
+        follow_pages: t.Literal[True],
+        return_metadata: t.Literal[False] = False,
+        lazy: t.Literal[False] = False,
+        fields: list[str] | None = None,
+    ) -> list[Webhook]: ...
+
+    @t.overload
+    async def list_webhooks(
+        self,
+        context: ContextType = None,
+        page: int = None,
+        per_page: int = None,
+        search: str | None = None,
+        after: str | None = None,
+        before: str | None = None,
+        exclude: list[int] | None = None,
+        include: list[int] | None = None,
+        offset: int | None = None,
+        order: OrderType = None,
+        orderby: t.Literal["date", "id", "title"] = None,
+        status: t.Literal["all", "active", "paused", "disabled", "all"] = None,
+        *,
+        follow_pages: bool = False,
+        return_metadata: t.Literal[False] = False,
+        lazy: t.Literal[True],
+        fields: list[str] | None = None,
+    ) -> LazyList[Webhook]: ...
+
+    async def list_webhooks(
+        self,
+        context: ContextType = None,
+        page: int = None,
+        per_page: int = None,
+        search: str | None = None,
+        after: str | None = None,
+        before: str | None = None,
+        exclude: list[int] | None = None,
+        include: list[int] | None = None,
+        offset: int | None = None,
+        order: OrderType = None,
+        orderby: t.Literal["date", "id", "title"] = None,
+        status: t.Literal["all", "active", "paused", "disabled", "all"] = None,
+        follow_pages: bool = False,
+        return_metadata: bool = False,
+        lazy: bool = False,
+        fields: list[str] | None = None,
+    ) -> list[Webhook] | LazyList[Webhook] | PaginatedResponse[Webhook]:
+        """
+        Lists all webhooks.
+
+        :param follow_pages: Whether to automatically follow pagination and get all pages. Defaults to False.
+        :param return_metadata: If True, returns a PaginatedResponse with metadata instead of just a list. Cannot be used with follow_pages=True.
+        :param lazy: If True, returns a LazyList that validates each item only when it is accessed.
+        :param fields: Only return these fields, e.g. ["id", "name", "status"]. Other fields of the returned objects are None.
+        The objects are still typed as the full model, so type checkers do not flag those fields as optional.
+        :return: A list of Webhook objects or a PaginatedResponse containing the list and pagination metadata.
+        """
+        if follow_pages and return_metadata:
+            raise ValueError("Cannot use follow_pages=True with return_metadata=True")
+
+        params = {
+            "context": context,
+            "page": page,
+            "per_page": per_page,
+            "search": search,
+            "after": after,
+            "before": before,
+            "exclude": exclude,
+            "include": include,
+            "offset": offset,
+            "order": order,
+            "orderby": orderby,
+            "status": status,
+        }
+        # Remove None values
+        params = {k: v for k, v in params.items() if v is not None}
+
+        return await self.api_object.get_all(
+            "webhooks/",
+            models.Webhook,
+            follow_pages=follow_pages,
+            include_metadata=return_metadata,
+            lazy=lazy,
+            fields=fields,
+            **params,
+        )
+
+    def iter_webhooks(
+        self,
+        context: ContextType = None,
+        page: int = None,
+        per_page: int = None,
+        search: str | None = None,
+        after: str | None = None,
+        before: str | None = None,
+        exclude: list[int] | None = None,
+        include: list[int] | None = None,
+        offset: int | None = None,
+        order: OrderType = None,
+        orderby: t.Literal["date", "id", "title"] = None,
+        status: t.Literal["all", "active", "paused", "disabled", "all"] = None,
+        fields: list[str] | None = None,
+    ) -> t.AsyncIterator[Webhook]:
+        """
+        Iterates over all webhooks, fetching one page at a time.
+        Accepts the same filters as list_webhooks.
+
+        :param fields: Only return these fields, e.g. ["id", "name", "status"]. Other fields of the returned objects are None.
+        The objects are still typed as the full model, so type checkers do not flag those fields as optional.
+        :return: An iterator of Webhook objects.
+        """
+        params = {
+            "context": context,
+            "page": page,
+            "per_page": per_page,
+            "search": search,
+            "after": after,
+            "before": before,
+            "exclude": exclude,
+            "include": include,
+            "offset": offset,
+            "order": order,
+            "orderby": orderby,
+            "status": status,
+        }
+        # Remove None values
+        params = {k: v for k, v in params.items() if v is not None}
+
+        return self.api_object.iter_all(
+            "webhooks/", models.Webhook, fields=fields, **params
+        )
+
+    async def update_webhook(self, webhook_id: int, webhook: Webhook) -> Webhook:
+        """
+        Updates a webhook by its ID.
+        :param webhook_id: id of the webhook
+        :param webhook_edit: edit object
+        :return:
+        """
+        return await self.api_object.put(f"webhooks/{webhook_id}", webhook)
+
+    async def batch_webhooks(
+        self,
+        create: list[Webhook] | None = None,
+        update: list[Webhook] | None = None,
+        delete: list[int] | None = None,
+        concurrency: int = 1,
+    ) -> BatchResponse[Webhook]:
+        """
+        Creates, updates and deletes webhooks using the batch endpoint.
+        Large inputs are split into requests of up to 100 operations.
+        :param create: Webhook objects to create
+        :param update: Webhook objects to update, must have their id set
+        :param delete: ids of the webhooks to delete
+        :param concurrency: number of batch requests sent at the same time
+        :return: BatchResponse with the resulting objects and the errors of failed items
+        """
+        return await self.api_object.batch(
+            "webhooks/batch",
+            models.Webhook,
+            create=create,
+            update=update,
+            delete=delete,
+            concurrency=concurrency,
+        )
+
+    # Customers
+
+    async def create_customer(self, customer: Customer) -> BaseModel:
+        """
+        Creates a customer.
+        :param customer: Customer object
+        :return: the created customer
+        """
+        return await self.api_object.post("customers", customer)
+
+    async def get_customer(
+        self, customer_id: int, fields: list[str] | None = None
+    ) -> BaseModel | None:
+        """
+        Gets a customer by its ID.
+        :param customer_id: id of the customer
+        :param fields: Only return these fields, e.g. ["id", "email"]. Other fields of the returned objects are None.
+        The objects are still typed as the full model, so type checkers do not flag those fields as optional.
+        :return:
+        """
+        return await self.api_object.get(
+            f"customers/{customer_id}", models.Customer, fields=fields
+        )
+
+    @t.overload
+    async def list_customers(
+        self,
+        context: ContextType = None,
+        page: int = None,
+        per_page: int = None,
+        search: str | None = None,
+        exclude: list[int] | None = None,
+        include: list[int] | None = None,
+        offset: int | None = None,
+        order: OrderType = None,
+        orderby: t.Literal["id", "include", "name", "registered_date"] = None,
+        email: str | None = None,
+        role: t.Literal[
+            "all",
+            "administrator",
+            "editor",
+            "author",
+            "contributor",
+            "subscriber",
+            "customer",
+            "shop_manager",
+        ] = None,
+        *,
+        follow_pages: t.Literal[False] = False,
+        return_metadata: t.Literal[True],
+        lazy: t.Literal[False] = False,
+        fields: list[str] | None = None,
+    ) -> PaginatedResponse[Customer]: ...
+
+    @t.overload
+    async def list_customers(
+        self,
+        context: ContextType = None,
+        page: int = None,
+        per_page: int = None,
+        search: str | None = None,
+        exclude: list[int] | None = None,
+        include: list[int] | None = None,
+        offset: int | None = None,
+        order: OrderType = None,
+        orderby: t.Literal["id", "include", "name", "registered_date"] = None,
+        email: str | None = None,
+        role: t.Literal[
+            "all",
+            "administrator",
+            "editor",
+            "author",
+            "contributor",
+            "subscriber",
+            "customer",
+            "shop_manager",
+        ] = None,
+        *,
+        follow_pages: t.Literal[False] = False,
+        return_metadata: t.Literal[False] = False,
+        lazy: t.Literal[False] = False,
+        fields: list[str] | None = None,
+    ) -> list[Customer]: ...
+
+    @t.overload
+    async def list_customers(
+        self,
+        context: ContextType = None,
+        page: int = None,
+        per_page: int = None,
+        search: str | None = None,
+        exclude: list[int] | None = None,
+        include: list[int] | None = None,
+        offset: int | None = None,
+        order: OrderType = None,
+        orderby: t.Literal["id", "include", "name", "registered_date"] = None,
+        email: str | None = None,
+        role: t.Literal[
+            "all",
+            "administrator",
+            "editor",
+            "author",
+            "contributor",
+            "subscriber",
+            "customer",
+            "shop_manager",
+        ] = None,
+        *,
+        follow_pages: t.Literal[True],
+        return_metadata: t.Literal[False] = False,
+        lazy: t.Literal[False] = False,
+        fields: list[str] | None = None,
+    ) -> list[Customer]: ...
+
+    @t.overload
+    async def list_customers(
+        self,
+        context: ContextType = None,
+        page: int = None,
+        per_page: int = None,
+        search: str | None = None,
+        exclude: list[int] | None = None,
+        include: list[int] | None = None,
+        offset: int | None = None,
+        order: OrderType = None,
+        orderby: t.Literal["id", "include", "name", "registered_date"] = None,
+        email: str | None = None,
+        role: t.Literal[
+            "all",
+            "administrator",
+            "editor",
+            "author",
+            "contributor",
+            "subscriber",
+            "customer",
+            "shop_manager",
+        ] = None,
+        *,
+        follow_pages: bool = False,
+        return_metadata: t.Literal[False] = False,
+        lazy: t.Literal[True],
+        fields: list[str] | None = None,
+    ) -> LazyList[Customer]: ...
+
+    async def list_customers(
+        self,
+        context: ContextType = None,
+        page: int = None,
+        per_page: int = None,
+        search: str | None = None,
+        exclude: list[int] | None = None,
+        include: list[int] | None = None,
+        offset: int | None = None,
+        order: OrderType = None,
+        orderby: t.Literal["id", "include", "name", "registered_date"] = None,
+        email: str | None = None,
+        role: t.Literal[
+            "all",
+            "administrator",
+            "editor",
+            "author",
+            "contributor",
+            "subscriber",
+            "customer",
+            "shop_manager",
+        ] = None,
+        follow_pages: bool = False,
+        return_metadata: bool = False,
+        lazy: bool = False,
+        fields: list[str] | None = None,
+    ) -> list[Customer] | LazyList[Customer] | PaginatedResponse[Customer]:
+        """
+        Lists all customers
+
+        :param follow_pages: Whether to automatically follow pagination and get all pages. Defaults to False.
+        :param return_metadata: If True, returns a PaginatedResponse with metadata instead of just a list. Cannot be used with follow_pages=True.
+        :param lazy: If True, returns a LazyList that validates each item only when it is accessed.
+        :param fields: Only return these fields, e.g. ["id", "email"]. Other fields of the returned objects are None.
+        The objects are still typed as the full model, so type checkers do not flag those fields as optional.
+        :return: A list of Customer objects or a PaginatedResponse containing the list and pagination metadata.
+        """
+        if follow_pages and return_metadata:
+            raise ValueError("Cannot use follow_pages=True with return_metadata=True")
+
+        params = {
+            "context": context,
+            "page": page,
+            "per_page": per_page,
+            "search": search,
+            "exclude": exclude,
+            "include": include,
+            "offset": offset,
+            "order": order,
+            "orderby": orderby,
+            "email": email,
+            "role": role,
+        }
+        # Remove None values
+        params = {k: v for k, v in params.items() if v is not None}
+
+        return await self.api_object.get_all(
+            "customers",
+            models.Customer,
+            follow_pages=follow_pages,
+            include_metadata=return_metadata,
+            lazy=lazy,
+            fields=fields,
+            **params,
+        )
+
+    def iter_customers(
+        self,
+        context: ContextType = None,
+        page: int = None,
+        per_page: int = None,
+        search: str | None = None,
+        exclude: list[int] | None = None,
+        include: list[int] | None = None,
+        offset: int | None = None,
+        order: OrderType = None,
+        orderby: t.Literal["id", "include", "name", "registered_date"] = None,
+        email: str | None = None,
+        role: t.Literal[
+            "all",
+            "administrator",
+            "editor",
+            "author",
+            "contributor",
+            "subscriber",
+            "customer",
+            "shop_manager",
+        ] = None,
+        fields: list[str] | None = None,
+    ) -> t.AsyncIterator[Customer]:
+        """
+        Iterates over all customers, fetching one page at a time.
+        Accepts the same filters as list_customers.
+
+        :param fields: Only return these fields, e.g. ["id", "email"]. Other fields of the returned objects are None.
+        The objects are still typed as the full model, so type checkers do not flag those fields as optional.
+        :return: An iterator of Customer objects.
+        """
+        params = {
+            "context": context,
+            "page": page,
+            "per_page": per_page,
+            "search": search,
+            "exclude": exclude,
+            "include": include,
+            "offset": offset,
+            "order": order,
+            "orderby": orderby,
+            "email": email,
+            "role": role,
+        }
+        # Remove None values
+        params = {k: v for k, v in params.items() if v is not None}
+
+        return self.api_object.iter_all(
+            "customers", models.Customer, fields=fields, **params
+        )
+
+    async def update_customer(self, customer_id: int, customer: Customer) -> BaseModel:
+        """
+        Updates a customer by its ID.
+        :param customer_id: id of the customer
+        :param customer: Customer object
+        :return:
+        """
+        return await self.api_object.put(f"customers/{customer_id}", customer)
+
+    async def delete_customer(
+        self, customer_id: int, force: bool, reassign: int | None = None
+    ) -> None:
+        """
+        Deletes a customer by its ID.
+        :param customer_id: id of the customer
+        :param force: required to be True, as customer does not support trashing
+        :param reassign: id of the customer to reassign the customer's posts to
+        :return: None
+        """
+
+        await self.api_object.delete(
+            f"customers/{customer_id}", force=force, reassign=reassign
+        )
+
+    async def batch_customers(
+        self,
+        create: list[Customer] | None = None,
+        update: list[Customer] | None = None,
+        delete: list[int] | None = None,
+        concurrency: int = 1,
+    ) -> BatchResponse[Customer]:
+        """
+        Creates, updates and deletes customers using the batch endpoint.
+        Large inputs are split into requests of up to 100 operations.
+        :param create: Customer objects to create
+        :param update: Customer objects to update, must have their id set
+        :param delete: ids of the customers to delete
+        :param concurrency: number of batch requests sent at the same time
+        :return: BatchResponse with the resulting objects and the errors of failed items
+        """
+        return await self.api_object.batch(
+            "customers/batch",
+            models.Customer,
+            create=create,
+            update=update,
+            delete=delete,
+            concurrency=concurrency,
+        )
+
+    # Tax classes
+    async def create_tax_class(self, tax_class: TaxClass) -> BaseModel:
+        """
+        Creates a tax class.
+        :param tax_class: Tax class object
+        :return: the created tax class
+        """
+        result = await self.api_object.post("taxes/classes", tax_class)
+        self._invalidate_cached("taxes")
+        return result
+
+    @t.overload
+    async def list_tax_classes(
+        self,
+        *,
+        follow_pages: t.Literal[False] = False,
+        return_metadata: t.Literal[True],
+        lazy: t.Literal[False] = False,
+        fields: list[str] | None = None,
+    ) -> PaginatedResponse[TaxClass]: ...
+
+    @t.overload
+    async def list_tax_classes(
+        self,
+        *,
+        follow_pages: t.Literal[False] = False,
+        return_metadata: t.Literal[False] = False,
+        lazy: t.Literal[False] = False,
+        fields: list[str] | None = None,
+    ) -> list[TaxClass]: ...
+
+    @t.overload
+    async def list_tax_classes(
+        self,
+        *,
+        follow_pages: t.Literal[True],
+        return_metadata: t.Literal[False] = False,
+        lazy: t.Literal[False] = False,
+        fields: list[str] | None = None,
+    ) -> list[TaxClass]: ...
+
+    @t.overload
+    async def list_tax_classes(
+        self,
+        *,
+        follow_pages: bool = False,
+        return_metadata: t.Literal[False] = False,
+        lazy: t.Literal[True],
+        fields: list[str] | None = None,
+    ) -> LazyList[TaxClass]: ...
+
+    async def list_tax_classes(
+        self,
+        follow_pages: bool = False,
+        return_metadata: bool = False,
+        lazy: bool = False,
+        fields: list[str] | None = None,
+    ) -> list[TaxClass] | LazyList[TaxClass] | PaginatedResponse[TaxClass]:
+        """
+        Lists all tax classes.
+
+        :param follow_pages: Whether to automatically follow pagination and get all pages. Defaults to False.
+        :param return_metadata: If True, returns a PaginatedResponse with metadata instead of just a list. Cannot be used with follow_pages=True.
+        :param lazy: If True, returns a LazyList that validates each item only when it is accessed.
+        :param fields: Only return these fields, e.g. ["slug", "name"]. Other fields of the returned objects are None.
+        The objects are still typed as the full model, so type checkers do not flag those fields as optional.
+        :return: A list of TaxClass objects or a PaginatedResponse containing the list and pagination metadata.
+        """
+        if follow_pages and return_metadata:
+            raise ValueError("Cannot use follow_pages=True with return_metadata=True")
+
+        key = ("classes", follow_pages, return_metadata, lazy, tuple(fields or ()))
+        cached = self._get_cached("taxes", key)
+        if cached is not None:
+            return cached
+
+        result = await self.api_object.get_all(
+            "taxes/classes",
+            models.TaxClass,
+            follow_pages=follow_pages,
+            include_metadata=return_metadata,
+            lazy=lazy,
+            fields=fields,
+        )
+        self._set_cached("taxes", key, result)
+        return result
+
+    def iter_tax_classes(
+        self, fields: list[str] | None = None
+    ) -> t.AsyncIterator[TaxClass]:
+        """
+        Iterates over all tax classes, fetching one page at a time.
+
+        :param fields: Only return these fields, e.g. ["slug", "name"]. Other fields of the returned objects are None.
+        The objects are still typed as the full model, so type checkers do not flag those fields as optional.
+        :return: An iterator of TaxClass objects.
+        """
+        return self.api_object.iter_all("taxes/classes", models.TaxClass, fields=fields)
+
+    async def delete_tax_class(self, slug: str, force: bool) -> None:
+        """
+        Deletes a tax class by its ID.
+        :param tax_class_id: id of the tax class
+        :param force: required to be True, as tax class does not support trashing
+        :return: None
+        """
+        await self.api_object.delete(f"taxes/classes/{slug}", force=force)
+        self._invalidate_cached("taxes")
+
+    # Tax rates
+    async def create_tax_rate(self, tax_rate: TaxRate) -> TaxRate:
+        """
+        Creates a tax rate.
+        :param tax_rate: TaxRate object
+        :return: the created tax rate
+        """
+        result = await self.api_object.post("taxes", tax_rate)
+        self._invalidate_cached("taxes")
+        return result
+
+    async def get_tax_rate(
+        self, tax_rate_id: int, fields: list[str] | None = None
+    ) -> TaxRate | None:
+        """
+        Gets a tax rate by its ID.
+        :param tax_rate_id: id of the tax rate
+        :param fields: Only return these fields, e.g. ["id", "country", "rate"]. Other fields of the returned objects are None.
+        The objects are still typed as the full model, so type checkers do not flag those fields as optional.
+        :return: TaxRate object or None if not found
+        """
+        return await self.api_object.get(
+            f"taxes/{tax_rate_id}", models.TaxRate, fields=fields
+        )
+
+    @t.overload
+    async def list_tax_rates(
+        self,
+        context: ContextType = None,
+        page: int = None,
+        per_page: int = None,
+        offset: int | None = None,
+        order: OrderType = None,
+        orderby: t.Literal["id", "order", "priority"] = None,
+        class_: str | None = None,
+        *,
+        follow_pages: t.Literal[False] = False,
+        return_metadata: t.Literal[True],
+        lazy: t.Literal[False] = False,
+        fields: list[str] | None = None,
+    ) -> PaginatedResponse[TaxRate]: ...
+
+    @t.overload
+    async def list_tax_rates(
+        self,
+        context: ContextType = None,
+        page: int = None,
+        per_page: int = None,
+        offset: int | None = None,
+        order: OrderType = None,
+        orderby: t.Literal["id", "order", "priority"] = None,
+        class_: str | None = None,
+        *,
+        follow_pages: t.Literal[False] = False,
+        return_metadata: t.Literal[False] = False,
+        lazy: t.Literal[False] = False,
+        fields: list[str] | None = None,
+    ) -> list[TaxRate]: ...
+
+    @t.overload
+    async def list_tax_rates(
+        self,
+        context: ContextType = None,
+        page: int = None,
+        per_page: int = None,
+        offset: int | None = None,
+        order: OrderType = None,
+        orderby: t.Literal["id", "order", "priority"] = None,
+        class_: str | None = None,
+        *,
+        follow_pages: t.Literal[True],
+        return_metadata: t.Literal[False] = False,
+        lazy: t.Literal[False] = False,
+        fields: list[str] | None = None,
+    ) -> list[TaxRate]: ...
+
+    @t.overload
+    async def list_tax_rates(
+        self,
+        context: ContextType = None,
+        page: int = None,
+        per_page: int = None,
+        offset: int | None = None,
+        order: OrderType = None,
+        orderby: t.Literal["id", "order", "priority"] = None,
+        class_: str | None = None,
+        *,
+        follow_pages: bool = False,
+        return_metadata: t.Literal[False] = False,
+        lazy: t.Literal[True],
+        fields: list[str] | None = None,
+    ) -> LazyList[TaxRate]: ...
+
+    async def list_tax_rates(
+        self,
+        context: ContextType = None,
+        page: int = None,
+        per_page: int = None,
+        offset: int | None = None,
+        order: OrderType = None,
+        orderby: t.Literal["id", "order", "priority"] = None,
+        class_: str | None = None,
+        follow_pages: bool = False,
+        return_metadata: bool = False,
+        lazy: bool = False,
+        fields: list[str] | None = None,
+    ) -> list[TaxRate] | LazyList[TaxRate] | PaginatedResponse[TaxRate]:
+        """
+        Lists all tax rates.
+
+        :param context: Scope under which the request is made; determines fields present in response.
+        :param page: Current page of the collection.
+        :param per_page: Maximum number of items to be returned in result set.
+        :param offset: Offset the result set by a specific number of items.
+        :param order: Order sort attribute ascending or descending.
+        :param orderby: Sort collection by object attribute.
+        :param class_: Retrieve only tax rates of this tax class.
+        :param follow_pages: Whether to automatically follow pagination and get all pages. Defaults to False.
+        :param return_metadata: If True, returns a PaginatedResponse with metadata instead of just a list. Cannot be used with follow_pages=True.
+        :param lazy: If True, returns a LazyList that validates each item only when it is accessed.
+        :param fields: Only return these fields, e.g. ["id", "country", "rate"]. Other fields of the returned objects are None.
+        The objects are still typed as the full model, so type checkers do not flag those fields as optional.
+        :return: A list of TaxRate objects or a PaginatedResponse containing the list and pagination metadata.
+        """
+        if follow_pages and return_metadata:
+            raise ValueError("Cannot use follow_pages=True with return_metadata=True")
+
+        params = {
+            "context": context,
+            "page": page,
+            "per_page": per_page,
+            "offset": offset,
+            "order": order,
+            "orderby": orderby,
+            "class": class_,
+        }
+
+        # Remove None values
+        params = {k: v for k, v in params.items() if v is not None}
+
+        key = (
+            "rates",
+            follow_pages,
+            return_metadata,
+            lazy,
+            tuple(fields or ()),
+            tuple(sorted(params.items())),
+        )
+        cached = self._get_cached("taxes", key)
+        if cached is not None:
+            return cached
+
+        result = await self.api_object.get_all(
+            "taxes",
+            models.TaxRate,
+            follow_pages=follow_pages,
+            include_metadata=return_metadata,
+            lazy=lazy,
+            fields=fields,
+            **params,
+        )
+        self._set_cached("taxes", key, result)
+        return result
+
+    def iter_tax_rates(
+        self,
+        context: ContextType = None,
+        page: int = None,
+        per_page: int = None,
+        offset: int | None = None,
+        order: OrderType = None,
+        orderby: t.Literal["id", "order", "priority"] = None,
+        class_: str | None = None,
+        fields: list[str] | None = None,
+    ) -> t.AsyncIterator[TaxRate]:
+        """
+        Iterates over all tax rates, fetching one page at a time.
+        Accepts the same filters as list_tax_rates.
+
+        :param fields: Only return these fields, e.g. ["id", "country", "rate"]. Other fields of the returned objects are None.
+        The objects are still typed as the full model, so type checkers do not flag those fields as optional.
+        :return: An iterator of TaxRate objects.
+        """
+        params = {
+            "context": context,
+            "page": page,
+            "per_page": per_page,
+            "offset": offset,
+            "order": order,
+            "orderby": orderby,
+            "class": class_,
+        }
+
+        # Remove None values
+        params = {k: v for k, v in params.items() if v is not None}
+
+        return self.api_object.iter_all(
+            "taxes", models.TaxRate, fields=fields, **params
+        )
+
+    async def update_tax_rate(self, tax_rate_id: int, tax_rate: TaxRate) -> TaxRate:
+        """
+        Updates a tax rate by its ID.
+        :param tax_rate_id: id of the tax rate
+        :param tax_rate: TaxRate object with updates
+        :return: updated TaxRate object
+        """
+        result = await self.api_object.put(f"taxes/{tax_rate_id}", tax_rate)
+        self._invalidate_cached("taxes")
+        return result
+
+    async def delete_tax_rate(self, tax_rate_id: int, force: bool = False) -> None:
+        """
+        Deletes a tax rate by its ID.
+        :param tax_rate_id: id of the tax rate
+        :param force: when True, the tax rate will be permanently deleted
+        :return: None
+        """
+        await self.api_object.delete(f"taxes/{tax_rate_id}", force=force)
+        self._invalidate_cached("taxes")
+
+    async def batch_tax_rates(
+        self,
+        create: list[TaxRate] | None = None,
+        update: list[TaxRate] | None = None,
+        delete: list[int] | None = None,
+        concurrency: int = 1,
+    ) -> BatchResponse[TaxRate]:
+        """
+        Creates, updates and deletes tax rates using the batch endpoint.
+        Large inputs are split into requests of up to 100 operations.
+        :param create: TaxRate objects to create
+        :param update: TaxRate objects to update, must have their id set
+        :param delete: ids of the tax rates to delete
+        :param concurrency: number of batch requests sent at the same time
+        :return: BatchResponse with the resulting objects and the errors of failed items
+        """
+        result = await self.api_object.batch(
+            "taxes/batch",
+            models.TaxRate,
+            create=create,
+            update=update,
+            delete=delete,
+            concurrency=concurrency,
+        )
+        self._invalidate_cached("taxes")
+        return result
+
+    # Products
+    async def create_product(self, product: Product) -> Product:
+        """
+        Creates a product.
+        :param product: Product object
+        :return: the created product
+        """
+        return await self.api_object.post("products", product)
+
+    async def get_product(
+        self, product_id: int, fields: list[str] | None = None
+    ) -> Product | None:
+        """
+        Gets a product by its ID.
+        :param product_id: id of the product
+        :param fields: Only return these fields, e.g. ["id", "sku", "stock_quantity"]. Other fields of the returned objects are None.
+        The objects are still typed as the full model, so type checkers do not flag those fields as optional.
+        :return: Product object or None if not found
+        """
+        return await self.api_object.get(
+            f"products/{product_id}", models.Product, fields=fields
+        )
+
+    @t.overload
+    async def list_products(
+        self,
+        context: ContextType = None,
+        page: int = None,
+        per_page: int = None,
+        search: str | None = None,
+        after: str | None = None,
+        before: str | None = None,
+        exclude: list[int] | None = None,
+        include: list[int] | None = None,
+        offset: int | None = None,
+        order: OrderType = None,
+        orderby: t.Literal[
+            "date", "id", "include", "title", "slug", "price", "popularity", "rating"
+        ] = None,
+        category: str | None = None,
+        tag: str | None = None,
+        status: t.Literal["any", "draft", "pending", "private", "publish"] = None,
+        type: t.Literal["simple", "grouped", "external", "variable"] = None,
+        featured: bool | None = None,
+        sku: str | None = None,
+        *,
+        follow_pages: t.Literal[False] = False,
+        return_metadata: t.Literal[True],
+        lazy: t.Literal[False] = False,
+        fields: list[str] | None = None,
+    ) -> PaginatedResponse[Product]: ...
+
+    @t.overload
+    async def list_products(
+        self,
+        context: ContextType = None,
+        page: int = None,
+        per_page: int = None,
+        search: str | None = None,
+        after: str | None = None,
+        before: str | None = None,
+        exclude: list[int] | None = None,
+        include: list[int] | None = None,
+        offset: int | None = None,
+        order: OrderType = None,
+        orderby: t.Literal[
+            "date", "id", "include", "title", "slug", "price", "popularity", "rating"
+        ] = None,
+        category: str | None = None,
+        tag: str | None = None,
+        status: t.Literal["any", "draft", "pending", "private", "publish"] = None,
+        type: t.Literal["simple", "grouped", "external", "variable"] = None,
+        featured: bool | None = None,
+        sku: str | None = None,
+        *,
+        follow_pages: t.Literal[False] = False,
+        return_metadata: t.Literal[False] = False,
+        lazy: t.Literal[False] = False,
+        fields: list[str] | None = None,
+    ) -> list[Product]: ...
+
+    @t.overload
+    async def list_products(
+        self,
+        context: ContextType = None,
+        page: int = None,
+        per_page: int = None,
+        search: str | None = None,
+        after: str | None = None,
+        before: str | None = None,
+        exclude: list[int] | None = None,
+        include: list[int] | None = None,
+        offset: int | None = None,
+        order: OrderType = None,
+        orderby: t.Literal[
+            "date", "id", "include", "title", "slug", "price", "popularity", "rating"
+        ] = None,
+        category: str | None = None,
+        tag: str | None = None,
+        status: t.Literal["any", "draft", "pending", "private", "publish"] = None,
+        type: t.Literal["simple", "grouped", "external", "variable"] = None,
+        featured: bool | None = None,
+        sku: str | None = None,
+        *,
+        follow_pages: t.Literal[True],
+        return_metadata: t.Literal[False] = False,
+        lazy: t.Literal[False] = False,
+        fields: list[str] | None = None,
+    ) -> list[Product]: ...
+
+    @t.overload
+    async def list_products(
+        self,
+        context: ContextType = None,
+        page: int = None,
+        per_page: int = None,
+        search: str | None = None,
+        after: str | None = None,
+        before: str | None = None,
+        exclude: list[int] | None = None,
+        include: list[int] | None = None,
+        offset: int | None = None,
+        order: OrderType = None,
+        orderby: t.Literal[
+            "date", "id", "include", "title", "slug", "price", "popularity", "rating"
+        ] = None,
+        category: str | None = None,
+        tag: str | None = None,
+        status: t.Literal["any", "draft", "pending", "private", "publish"] = None,
+        type: t.Literal["simple", "grouped", "external", "variable"] = None,
+        featured: bool | None = None,
+        sku: str | None = None,
+        *,
+        follow_pages: bool = False,
+        return_metadata: t.Literal[False] = False,
+        lazy: t.Literal[True],
+        fields: list[str] | None = None,
+    ) -> LazyList[Product]: ...
+
+    async def list_products(
+        self,
+        context: ContextType = None,
+        page: int = None,
+        per_page: int = None,
+        search: str | None = None,
+        after: str | None = None,
+        before: str | None = None,
+        exclude: list[int] | None = None,
+        include: list[int] | None = None,
+        offset: int | None = None,
+        order: OrderType = None,
+        orderby: t.Literal[
+            "date", "id", "include", "title", "slug", "price", "popularity", "rating"
+        ] = None,
+        category: str | None = None,
+        tag: str | None = None,
+        status: t.Literal["any", "draft", "pending", "private", "publish"] = None,
+        type: t.Literal["simple", "grouped", "external", "variable"] = None,
+        featured: bool | None = None,
+        sku: str | None = None,
+        follow_pages: bool = False,
+        return_metadata: bool = False,
+        lazy: bool = False,
+        fields: list[str] | None = None,
+    ) -> list[Product] | LazyList[Product] | PaginatedResponse[Product]:
+        """
+        Lists all products.
+
+        :param follow_pages: Whether to automatically follow pagination and get all pages. Defaults to False.
+        :param return_metadata: If True, returns a PaginatedResponse with metadata instead of just a list. Cannot be used with follow_pages=True.
+        :param lazy: If True, returns a LazyList that validates each item only when it is accessed.
+        :param fields: Only return these fields, e.g. ["id", "sku", "stock_quantity"]. Other fields of the returned objects are None.
+        The objects are still typed as the full model, so type checkers do not flag those fields as optional.
+        :return: A list of Product objects or a PaginatedResponse containing the list and pagination metadata.
+        """
+        if follow_pages and return_metadata:
+            raise ValueError("Cannot use follow_pages=True with return_metadata=True")
+
+        params = {
+            "context": context,
+            "page": page,
+            "per_page": per_page,
+            "search": search,
+            "after": after,
+            "before": before,
+            "exclude": exclude,
+            "include": include,
+            "offset": offset,
+            "order": order,
+            "orderby": orderby,
+            "category": category,
+            "tag": tag,
+            "status": status,
+            "type": type,
+            "featured": featured,
+            "sku": sku,
+        }
+        # Remove None values
+        params = {k: v for k, v in params.items() if v is not None}
+
+        return await self.api_object.get_all(
+            "products",
+            models.Product,
+            follow_pages=follow_pages,
+            include_metadata=return_metadata,
+            lazy=lazy,
+            fields=fields,
+            **params,
+        )
+
+    def iter_products(
+        self,
+        context: ContextType = None,
+        page: int = None,
+        per_page: int = None,
+        search: str | None = None,
+        after: str | None = None,
+        before: str | None = None,
+        exclude: list[int] | None = None,
+        include: list[int] | None = None,
+        offset: int | None = None,
+        order: OrderType = None,
+        orderby: t.Literal[
+            "date", "id", "include", "title", "slug", "price", "popularity", "rating"
+        ] = None,
+        category: str | None = None,
+        tag: str | None = None,
+        status: t.Literal["any", "draft", "pending", "private", "publish"] = None,
+        type: t.Literal["simple", "grouped", "external", "variable"] = None,
+        featured: bool | None = None,
+        sku: str | None = None,
+        fields: list[str] | None = None,
+    ) -> t.AsyncIterator[Product]:
+        """
+        Iterates over all products, fetching one page at a time.
+        Accepts the same filters as list_products.
+
+        :param fields: Only return these fields, e.g. ["id", "sku", "stock_quantity"]. Other fields of the returned objects are None.
+        The objects are still typed as the full model, so type checkers do not flag those fields as optional.
+        :return: An iterator of Product objects.
+        """
+        params = {
+            "context": context,
+            "page": page,
+            "per_page": per_page,
+            "search": search,
+            "after": after,
+            "before": before,
+            "exclude": exclude,
+            "include": include,
+            "offset": offset,
+            "order": order,
+            "orderby": orderby,
+            "category": category,
+            "tag": tag,
+            "status": status,
+            "type": type,
+            "featured": featured,
+            "sku": sku,
+        }
+        # Remove None values
+        params = {k: v for k, v in params.items() if v is not None}
+
+        return self.api_object.iter_all(
+            "products", models.Product, fields=fields, **params
+        )
+
+    async def update_product(self, product_id: int, product: Product) -> Product:
+        """
+        Updates a product by its ID.
+        :param product_id: id of the product
+        :param product: Product object with updates
+        :return: updated Product object
+        """
+        return await self.api_object.put(f"products/{product_id}", product)
+
+    async def delete_product(self, product_id: int, force: bool = False) -> None:
+        """
+        Deletes a product by its ID.
+        :param product_id: id of the product
+        :param force: when True, the product will be permanently deleted
+        :return: None
+        """
+        await self.api_object.delete(f"products/{product_id}", force=force)
+
+    async def batch_products(
+        self,
+        create: list[Product] | None = None,
+        update: list[Product] | None = None,
+        delete: list[int] | None = None,
+        concurrency: int = 1,
+    ) -> BatchResponse[Product]:
+        """
+        Creates, updates and deletes products using the batch endpoint.
+        Large inputs are split into requests of up to 100 operations.
+        :param create: Product objects to create
+        :param update: Product objects to update, must have their id set
+        :param delete: ids of the products to delete
+        :param concurrency: number of batch requests sent at the same time
+        :return: BatchResponse with the resulting objects and the errors of failed items
+        """
+        return await self.api_object.batch(
+            "products/batch",
+            models.Product,
+            create=create,
+            update=update,
+            delete=delete,
+            concurrency=concurrency,
+        )
+
+    # Product Variations
+    async def create_product_variation(
+        self, product_id: int, variation: ProductVariation
+    ) -> ProductVariation:
+        """
+        Creates a product variation.
+        :param product_id: id of the parent product
+        :param variation: ProductVariation object
+        :return: the created variation
+        """
+        return await self.api_object.post(
+            f"products/{product_id}/variations", variation
+        )
+
+    async def get_product_variation(
+        self, product_id: int, variation_id: int, fields: list[str] | None = None
+    ) -> ProductVariation | None:
+        """
+        Gets a product variation by its ID.
+        :param product_id: id of the parent product
+        :param variation_id: id of the variation
+        :param fields: Only return these fields, e.g. ["id", "sku", "price"]. Other fields of the returned objects are None.
+        The objects are still typed as the full model, so type checkers do not flag those fields as optional.
+        :return: ProductVariation object or None if not found
+        """
+        return await self.api_object.get(
+            f"products/{product_id}/variations/{variation_id}",
+            models.ProductVariation,
+            fields=fields,
+        )
+
+    @t.overload
+    async def list_product_variations(
+        self,
+        product_id: int,
+        context: ContextType = None,
+        page: int = None,
+        per_page: int = None,
+        search: str | None = None,
+        after: str | None = None,
+        before: str | None = None,
+        exclude: list[int] | None = None,
+        include: list[int] | None = None,
+        offset: int | None = None,
+        order: OrderType = None,
+        orderby: t.Literal["date", "id", "include", "title", "slug"] = None,
+        *,
+        follow_pages: t.Literal[False] = False,
+        return_metadata: t.Literal[True],
+        lazy: t.Literal[False] = False,
+        fields: list[str] | None = None,
+    ) -> PaginatedResponse[ProductVariation]: ...
+
+    @t.overload
+    async def list_product_variations(
+        self,
+        product_id: int,
+        context: ContextType = None,
+        page: int = None,
+        per_page: int = None,
+        search: str | None = None,
+        after: str | None = None,
+        before: str | None = None,
+        exclude: list[int] | None = None,
+        include: list[int] | None = None,
+        offset: int | None = None,
+        order: OrderType = None,
+        orderby: t.Literal["date", "id", "include", "title", "slug"] = None,
+        *,
+        follow_pages: t.Literal[False] = False,
+        return_metadata: t.Literal[False] = False,
+        lazy: t.Literal[False] = False,
+        fields: list[str] | None = None,
+    ) -> list[ProductVariation]: ...
+
+    @t.overload
+    async def list_product_variations(
+        self,
+        product_id: int,
+        context: ContextType = None,
+        page: int = None,
+        per_page: int = None,
+        search: str | None = None,
+        after: str | None = None,
+        before: str | None = None,
+        exclude: list[int] | None = None,
+        include: list[int] | None = None,
+        offset: int | None = None,
+        order: OrderType = None,
+        orderby: t.Literal["date", "id", "include", "title", "slug"] = None,
+        *,
+        follow_pages: t.Literal[True],
+        return_metadata: t.Literal[False] = False,
+        lazy: t.Literal[False] = False,
+        fields: list[str] | None = None,
+    ) -> list[ProductVariation]: ...
+
+    @t.overload
+    async def list_product_variations(
+        self,
+        product_id: int,
+        context: ContextType = None,
+        page: int = None,
+        per_page: int = None,
+        search: str | None = None,
+        after: str | None = None,
+        before: str | None = None,
+        exclude: list[int] | None = None,
+        include: list[int] | None = None,
+        offset: int | None = None,
+        order: OrderType = None,
+        orderby: t.Literal["date", "id", "include", "title", "slug"] = None,
+        *,
+        follow_pages: bool = False,
+        return_metadata: t.Literal[False] = False,
+        lazy: t.Literal[True],
+        fields: list[str] | None = None,
+    ) -> LazyList[ProductVariation]: ...
+
+    async def list_product_variations(
+        self,
+        product_id: int,
+        context: ContextType = None,
+        page: int = None,
+        per_page: int = None,
+        search: str | None = None,
+        after: str | None = None,
+        before: str | None = None,
+        exclude: list[int] | None = None,
+        include: list[int] | None = None,
+        offset: int | None = None,
+        order: OrderType = None,
+        orderby: t.Literal["date", "id", "include", "title", "slug"] = None,
+        follow_pages: bool = False,
+        return_metadata: bool = False,
+        lazy: bool = False,
+        fields: list[str] | None = None,
+    ) -> (
+        list[ProductVariation]
+        | LazyList[ProductVariation]
+        | PaginatedResponse[ProductVariation]
+    ):
+        """
+        Lists all variations for a product.
+
+        :param product_id: id of the parent product
+        :param follow_pages: Whether to automatically follow pagination and get all pages. Defaults to False.
+        :param return_metadata: If True, returns a PaginatedResponse with metadata instead of just a list. Cannot be used with follow_pages=True.
+        :param lazy: If True, returns a LazyList that validates each item only when it is accessed.
+        :param fields: Only return these fields, e.g. ["id", "sku", "price"]. Other fields of the returned objects are None.
+        The objects are still typed as the full model, so type checkers do not flag those fields as optional.
+        :return: A list of ProductVariation objects or a PaginatedResponse containing the list and pagination metadata.
+        """
+        if follow_pages and return_metadata:
+            raise ValueError("Cannot use follow_pages=True with return_metadata=True")
+
+        params = {
+            "context": context,
+            "page": page,
+            "per_page": per_page,
+            "search": search,
+            "after": after,
+            "before": before,
+            "exclude": exclude,
+            "include": include,
+            "offset": offset,
+            "order": order,
+            "orderby": orderby,
+        }
+        # Remove None values
+        params = {k: v for k, v in params.items() if v is not None}
+
+        return await self.api_object.get_all(
+            f"products/{product_id}/variations",
+            models.ProductVariation,
+            follow_pages=follow_pages,
+            include_metadata=return_metadata,
+            lazy=lazy,
+            fields=fields,
+            **params,
+        )
+
+    def iter_product_variations(
+        self,
+        product_id: int,
+        context: ContextType = None,
+        page: int = None,
+        per_page: int = None,
+        search: str | None = None,
+        after: str | None = None,
+        before: str | None = None,
+        exclude: list[int] | None = None,
+        include: list[int] | None = None,
+        offset: int | None = None,
+        order: OrderType = None,
+        orderby: t.Literal["date", "id", "include", "title", "slug"] = None,
+        fields: list[str] | None = None,
+    ) -> t.AsyncIterator[ProductVariation]:
+        """
+        Iterates over all product variations, fetching one page at a time.
+        Accepts the same filters as list_product_variations.
+
+        :param product_id: id of the parent product
+        :param fields: Only return these fields, e.g. ["id", "sku", "price"]. Other fields of the returned objects are None.
+        The objects are still typed as the full model, so type checkers do not flag those fields as optional.
+        :return: An iterator of ProductVariation objects.
+        """
+        params = {
+            "context": context,
+            "page": page,
+            "per_page": per_page,
+            "search": search,
+            "after": after,
+            "before": before,
+            "exclude": exclude,
+            "include": include,
+            "offset": offset,
+            "order": order,
+            "orderby": orderby,
+        }
+        # Remove None values
+        params = {k: v for k, v in params.items() if v is not None}
+
+        return self.api_object.iter_all(
+            f"products/{product_id}/variations",
+            models.ProductVariation,
+            fields=fields,
+            **params,
+        )
+
+    async def update_product_variation(
+        self, product_id: int, variation_id: int, variation: ProductVariation
+    ) -> ProductVariation:
+        """
+        Updates a product variation by its ID.
+        :param product_id: id of the parent product
+        :param variation_id: id of the variation
+        :param variation: ProductVariation object with updates
+        :return: updated ProductVariation object
+        """
+        return await self.api_object.put(
+            f"products/{product_id}/variations/{variation_id}", variation
+        )
+
+    async def delete_product_variation(
+        self, product_id: int, variation_id: int, force: bool = False
+    ) -> None:
+        """
+        Deletes a product variation by its ID.
+        :param product_id: id of the parent product
+        :param variation_id: id of the variation
+        :param force: when True, the variation will be permanently deleted
+        :return: None
+        """
+        await self.api_object.delete(
+            f"products/{product_id}/variations/{variation_id}", force=force
+        )
+
+    async def batch_product_variations(
+        self,
+        product_id: int,
+        create: list[ProductVariation] | None = None,
+        update: list[ProductVariation] | None = None,
+        delete: list[int] | None = None,
+        concurrency: int = 1,
+    ) -> BatchResponse[ProductVariation]:
+        """
+        Creates, updates and deletes variations of a product using the batch endpoint.
+        Large inputs are split into requests of up to 100 operations.
+        :param product_id: id of the parent product
+        :param create: ProductVariation objects to create
+        :param update: ProductVariation objects to update, must have their id set
+        :param delete: ids of the variations to delete
+        :param concurrency: number of batch requests sent at the same time
+        :return: BatchResponse with the resulting objects and the errors of failed items
+        """
+        return await self.api_object.batch(
+            f"products/{product_id}/variations/batch",
+            models.ProductVariation,
+            create=create,
+            update=update,
+            delete=delete,
+            concurrency=concurrency,
+        )
+
+    # SKU resolution
+    async def update_sku_index(self, full: bool = False) -> int:
+        """
+        Updates the SKU index with the products modified since it was last updated.
+        The variations of the modified variable products are indexed again, requesting
+        the variations of up to page_concurrency products at a time.
+        Only IDs and SKUs are requested.
+        :param full: Whenever to rebuild the index from a scan of the whole catalog.
+        The index is always built in full the first time.
+        :return: number of scanned products
+        """
+        params: dict[str, t.Any] = {"per_page": 100}
+        if full:
+            self.sku_index.clear()
+        elif self.sku_index.updated_gmt is not None:
+            # modified_after is exclusive and precise to the second, so include the last second
+            modified_after = self.sku_index.updated_gmt - datetime.timedelta(seconds=1)
+            params["modified_after"] = modified_after.strftime(GMT_FORMAT)
+            params["dates_are_gmt"] = True
+
+        # Products are streamed a page at a time, only the IDs of variable products are kept
+        scanned = 0
+        variable_ids: list[int] = []
+        async for product in self.api_object.iter_all(
+            "products", models.Product, fields=SKU_FIELDS, **params
+        ):
+            self.sku_index.add_products([product])
+            scanned += 1
+            if product.id is not None and product.type == models.ProductType.VARIABLE:
+                variable_ids.append(product.id)
+
+        # The variations of several products are requested concurrently
+        variations = await self.api_object.get_each(
+            [f"products/{product_id}/variations" for product_id in variable_ids],
+            models.ProductVariation,
+            per_page=100,
+            fields=["id", "sku"],
+        )
+        for product_id, product_variations in zip(variable_ids, variations):
+            self.sku_index.add_variations(product_id, product_variations)
+
+        return scanned
+
+    async def resolve_skus(self, skus: t.Iterable[str]) -> dict[str, SkuLocation]:
+        """
+        Resolves SKUs to products and variations.
+        SKUs are looked up in the SKU index first. The missing ones are searched for
+        100 at a time, which finds variations as well, and added to the index.
+        :param skus: SKUs to resolve
+        :return: dict of SKU to SkuLocation. SKUs that do not exist in the store are left out.
+        """
+        unique = [sku for sku in dict.fromkeys(skus) if sku]
+        missing = [sku for sku in unique if sku not in self.sku_index]
+
+        for start in range(0, len(missing), 100):
+            self.sku_index.add_products(
+                await self.api_object.get_all(
+                    "products",
+                    models.Product,
+                    follow_pages=True,
+                    per_page=100,
+                    sku=",".join(missing[start : start + 100]),
+                    fields=["id", "sku", "parent_id"],
+                )
+            )
+
+        resolved = {sku: self.sku_index.get(sku) for sku in unique}
+        return {sku: location for sku, location in resolved.items() if location}
+
+    # Product Categories
+    async def create_product_category(
+        self, category: ProductCategory
+    ) -> ProductCategory:
+        """
+        Creates a product category.
+        :param category: ProductCategory object
+        :return: the created category
+        """
+        return await self.api_object.post("products/categories", category)
+
+    async def get_product_category(
+        self, category_id: int, fields: list[str] | None = None
+    ) -> ProductCategory | None:
+        """
+        Gets a product category by its ID.
+        :param category_id: id of the category
+        :param fields: Only return these fields, e.g. ["id", "name", "parent"]. Other fields of the returned objects are None.
+        The objects are still typed as the full model, so type checkers do not flag those fields as optional.
+        :return: ProductCategory object or None if not found
+        """
+        return await self.api_object.get(
+            f"products/categories/{category_id}", models.ProductCategory, fields=fields
+        )
+
+    @t.overload
+    async def list_product_categories(
+        self,
+        context: ContextType = None,
+        page: int = None,
+        per_page: int = None,
+        search: str | None = None,
+        exclude: list[int] | None = None,
+        include: list[int] | None = None,
+        order: OrderType = None,
+        orderby: t.Literal[
+            "id", "include", "name", "slug", "term_group", "description", "count"
+        ] = None,
+        hide_empty: bool = None,
+        parent: int | None = None,
+        product: int | None = None,
+        slug: str | None = None,
+        *,
+        follow_pages: t.Literal[False] = False,
+        return_metadata: t.Literal[True],
+        lazy: t.Literal[False] = False,
+        fields: list[str] | None = None,
+    ) -> PaginatedResponse[ProductCategory]: ...
+
+    @t.overload
+    async def list_product_categories(
+        self,
+        context: ContextType = None,
+        page: int = None,
+        per_page: int = None,
+        search: str | None = None,
+        exclude: list[int] | None = None,
+        include: list[int] | None = None,
+        order: OrderType = None,
+        orderby: t.Literal[
+            "id", "include", "name", "slug", "term_group", "description", "count"
+        ] = None,
+        hide_empty: bool = None,
+        parent: int | None = None,
+        product: int | None = None,
+        slug: str | None = None,
+        *,
+        follow_pages: t.Literal[False] = False,
+        return_metadata: t.Literal[False] = False,
+        lazy: t.Literal[False] = False,
+        fields: list[str] | None = None,
+    ) -> list[ProductCategory]: ...
+
+    @t.overload
+    async def list_product_categories(
+        self,
+        context: ContextType = None,
+        page: int = None,
+        per_page: int = None,
+        search: str | None = None,
+        exclude: list[int] | None = None,
+        include: list[int] | None = None,
+        order: OrderType = None,
+        orderby: t.Literal[
+            "id", "include", "name", "slug", "term_group", "description", "count"
+        ] = None,
+        hide_empty: bool = None,
+        parent: int | None = None,
+        product: int | None = None,
+        slug: str | None = None,
+        *,
+        follow_pages: t.Literal[True],
+        return_metadata: t.Literal[False] = False,
+        lazy: t.Literal[False] = False,
+        fields: list[str] | None = None,
+    ) -> list[ProductCategory]: ...
+
+    @t.overload
+    async def list_product_categories(
+        self,
+        context: ContextType = None,
+        page: int = None,
+        per_page: int = None,
+        search: str | None = None,
+        exclude: list[int] | None = None,
+        include: list[int] | None = None,
+        order: OrderType = None,
+        orderby: t.Literal[
+            "id", "include", "name", "slug", "term_group", "description", "count"
+        ] = None,
+        hide_empty: bool = None,
+        parent: int | None = None,
+        product: int | None = None,
+        slug: str | None = None,
+        *,
+        follow_pages: bool = False,
+        return_metadata: t.Literal[False] = False,
+        lazy: t.Literal[True],
+        fields: list[str] | None = None,
+    ) -> LazyList[ProductCategory]: ...
+
+    async def list_product_categories(
+        self,
+        context: ContextType = None,
+        page: int = None,
+        per_page: int = None,
+        search: str | None = None,
+        exclude: list[int] | None = None,
+        include: list[int] | None = None,
+        order: OrderType = None,
+        orderby: t.Literal[
+            "id", "include", "name", "slug", "term_group", "description", "count"
+        ] = None,
+        hide_empty: bool = None,
+        parent: int | None = None,
+        product: int | None = None,
+        slug: str | None = None,
+        follow_pages: bool = False,
+        return_metadata: bool = False,
+        lazy: bool = False,
+        fields: list[str] | None = None,
+    ) -> (
+        list[ProductCategory]
+        | LazyList[ProductCategory]
+        | PaginatedResponse[ProductCategory]
+    ):
+        """
+        Lists all product categories.
+
+        :param follow_pages: Whether to automatically follow pagination and get all pages. Defaults to False.
+        :param return_metadata: If True, returns a PaginatedResponse with metadata instead of just a list. Cannot be used with follow_pages=True.
+        :param lazy: If True, returns a LazyList that validates each item only when it is accessed.
+        :param fields: Only return these fields, e.g. ["id", "name", "parent"]. Other fields of the returned objects are None.
+        The objects are still typed as the full model, so type checkers do not flag those fields as optional.
+        :return: A list of ProductCategory objects or a PaginatedResponse containing the list and pagination metadata.
+        """
+        if follow_pages and return_metadata:
+            raise ValueError("Cannot use follow_pages=True with return_metadata=True")
+
+        params = {
+            "context": context,
+            "page": page,
+            "per_page": per_page,
+            "search": search,
+            "exclude": exclude,
+            "include": include,
+            "order": order,
+            "orderby": orderby,
+            "hide_empty": hide_empty,
+            "parent": parent,
+            "product": product,
+            "slug": slug,
+        }
+        # Remove None values
+        params = {k: v for k, v in params.items() if v is not None}
+
+        return await self.api_object.get_all(
+            "products/categories",
+            models.ProductCategory,
+            follow_pages=follow_pages,
+            include_metadata=return_metadata,
+            lazy=lazy,
+            fields=fields,
+            **params,
+        )
+
+    def iter_product_categories(
+        self,
+        context: ContextType = None,
+        page: int = None,
+        per_page: int = None,
+        search: str | None = None,
+        exclude: list[int] | None = None,
+        include: list[int] | None = None,
+        order: OrderType = None,
+        orderby: t.Literal[
+            "id", "include", "name", "slug", "term_group", "description", "count"
+        ] = None,
+        hide_empty: bool = None,
+        parent: int | None = None,
+        product: int | None = None,
+        slug: str | None = None,
+        fields: list[str] | None = None,
+    ) -> t.AsyncIterator[ProductCategory]:
+        """
+        Iterates over all product categories, fetching one page at a time.
+        Accepts the same filters as list_product_categories.
+
+        :param fields: Only return these fields, e.g. ["id", "name", "parent"]. Other fields of the returned objects are None.
+        The objects are still typed as the full model, so type checkers do not flag those fields as optional.
+        :return: An iterator of ProductCategory objects.
+        """
+        params = {
+            "context": context,
+            "page": page,
+            "per_page": per_page,
+            "search": search,
+            "exclude": exclude,
+            "include": include,
+            "order": order,
+            "orderby": orderby,
+            "hide_empty": hide_empty,
+            "parent": parent,
+            "product": product,
+            "slug": slug,
+        }
+        # Remove None values
+        params = {k: v for k, v in params.items() if v is not None}
+
+        return self.api_object.iter_all(
+            "products/categories", models.ProductCategory, fields=fields, **params
+        )
+
+    async def update_product_category(
+        self, category_id: int, category: ProductCategory
+    ) -> ProductCategory:
+        """
+        Updates a product category by its ID.
+        :param category_id: id of the category
+        :param category: ProductCategory object with updates
+        :return: updated ProductCategory object
+        """
+        return await self.api_object.put(f"products/categories/{category_id}", category)
+
+    async def delete_product_category(
+        self, category_id: int, force: bool = False
+    ) -> None:
+        """
+        Deletes a product category by its ID.
+        :param category_id: id of the category
+        :param force: when True, the category will be permanently deleted
+        :return: None
+        """
+        await self.api_object.delete(f"products/categories/{category_id}", force=force)
+
+    async def batch_product_categories(
+        self,
+        create: list[ProductCategory] | None = None,
+        update: list[ProductCategory] | None = None,
+        delete: list[int] | None = None,
+        concurrency: int = 1,
+    ) -> BatchResponse[ProductCategory]:
+        """
+        Creates, updates and deletes product categories using the batch endpoint.
+        Large inputs are split into requests of up to 100 operations.
+        :param create: ProductCategory objects to create
+        :param update: ProductCategory objects to update, must have their id set
+        :param delete: ids of the product categories to delete
+        :param concurrency: number of batch requests sent at the same time
+        :return: BatchResponse with the resulting objects and the errors of failed items
+        """
+        return await self.api_object.batch(
+            "products/categories/batch",
+            models.ProductCategory,
+            create=create,
+            update=update,
+            delete=delete,
+            concurrency=concurrency,
+        )
+
+    # Product Tags
+    async def create_product_tag(self, tag: ProductTag) -> ProductTag:
+        """
+        Creates a product tag.
+        :param tag: ProductTag object
+        :return: the created tag
+        """
+        return await self.api_object.post("products/tags", tag)
+
+    async def get_product_tag(
+        self, tag_id: int, fields: list[str] | None = None
+    ) -> ProductTag | None:
+        """
+        Gets a product tag by its ID.
+        :param tag_id: id of the tag
+        :param fields: Only return these fields, e.g. ["id", "name", "count"]. Other fields of the returned objects are None.
+        The objects are still typed as the full model, so type checkers do not flag those fields as optional.
+        :return: ProductTag object or None if not found
+        """
+        return await self.api_object.get(
+            f"products/tags/{tag_id}", models.ProductTag, fields=fields
+        )
+
+    @t.overload
+    async def list_product_tags(
+        self,
+        context: ContextType = None,
+        page: int = None,
+        per_page: int = None,
+        search: str | None = None,
+        exclude: list[int] | None = None,
+        include: list[int] | None = None,
+        offset: int | None = None,
+        order: OrderType = None,
+        orderby: t.Literal[
+            "id", "include", "name", "slug", "term_group", "description", "count"
+        ] = None,
+        hide_empty: bool = None,
+        product: int | None = None,
+        slug: str | None = None,
+        *,
+        follow_pages: t.Literal[False] = False,
+        return_metadata: t.Literal[True],
+        lazy: t.Literal[False] = False,
+        fields: list[str] | None = None,
+    ) -> PaginatedResponse[ProductTag]: ...
+
+    @t.overload
+    async def list_product_tags(
+        self,
+        context: ContextType = None,
+        page: int = None,
+        per_page: int = None,
+        search: str | None = None,
+        exclude: list[int] | None = None,
+        include: list[int] | None = None,
+        offset: int | None = None,
+        order: OrderType = None,
+        orderby: t.Literal[
+            "id", "include", "name", "slug", "term_group", "description", "count"
+        ] = None,
+        hide_empty: bool = None,
+        product: int | None = None,
+        slug: str | None = None,
+        *,
+        follow_pages: t.Literal[False] = False,
+        return_metadata: t.Literal[False] = False,
+        lazy: t.Literal[False] = False,
+        fields: list[str] | None = None,
+    ) -> list[ProductTag]: ...
+
+    @t.overload
+    async def list_product_tags(
+        self,
+        context: ContextType = None,
+        page: int = None,
+        per_page: int = None,
+        search: str | None = None,
+        exclude: list[int] | None = None,
+        include: list[int] | None = None,
+        offset: int | None = None,
+        order: OrderType = None,
+        orderby: t.Literal[
+            "id", "include", "name", "slug", "term_group", "description", "count"
+        ] = None,
+        hide_empty: bool = None,
+        product: int | None = None,
+        slug: str | None = None,
+        *,
+        follow_pages: t.Literal[True],
+        return_metadata: t.Literal[False] = False,
+        lazy: t.Literal[False] = False,
+        fields: list[str] | None = None,
+    ) -> list[ProductTag]: ...
+
+    @t.overload
+    async def list_product_tags(
+        self,
+        context: ContextType = None,
+        page: int = None,
+        per_page: int = None,
+        search: str | None = None,
+        exclude: list[int] | None = None,
+        include: list[int] | None = None,
+        offset: int | None = None,
+        order: OrderType = None,
+        orderby: t.Literal[
+            "id", "include", "name", "slug", "term_group", "description", "count"
+        ] = None,
+        hide_empty: bool = None,
+        product: int | None = None,
+        slug: str | None = None,
+        *,
+        follow_pages: bool = False,
+        return_metadata: t.Literal[False] = False,
+        lazy: t.Literal[True],
+        fields: list[str] | None = None,
+    ) -> LazyList[ProductTag]: ...
+
+    async def list_product_tags(
+        self,
+        context: ContextType = None,
+        page: int = None,
+        per_page: int = None,
+        search: str | None = None,
+        exclude: list[int] | None = None,
+        include: list[int] | None = None,
+        offset: int | None = None,
+        order: OrderType = None,
+        orderby: t.Literal[
+            "id", "include", "name", "slug", "term_group", "description", "count"
+        ] = None,
+        hide_empty: bool = None,
+        product: int | None = None,
+        slug: str | None = None,
+        follow_pages: bool = False,
+        return_metadata: bool = False,
+        lazy: bool = False,
+        fields: list[str] | None = None,
+    ) -> list[ProductTag] | LazyList[ProductTag] | PaginatedResponse[ProductTag]:
+        """
+        Lists all product tags.
+
+        :param follow_pages: Whether to automatically follow pagination and get all pages. Defaults to False.
+        :param return_metadata: If True, returns a PaginatedResponse with metadata instead of just a list. Cannot be used with follow_pages=True.
+        :param lazy: If True, returns a LazyList that validates each item only when it is accessed.
+        :param fields: Only return these fields, e.g. ["id", "name", "count"]. Other fields of the returned objects are None.
+        The objects are still typed as the full model, so type checkers do not flag those fields as optional.
+        :return: A list of ProductTag objects or a PaginatedResponse containing the list and pagination metadata.
+        """
+        if follow_pages and return_metadata:
+            raise ValueError("Cannot use follow_pages=True with return_metadata=True")
+
+        params = {
+            "context": context,
+            "page": page,
+            "per_page": per_page,
+            "search": search,
+            "exclude": exclude,
+            "include": include,
+            "offset": offset,
+            "order": order,
+            "orderby": orderby,
+            "hide_empty": hide_empty,
+            "product": product,
+            "slug": slug,
+        }
+        # Remove None values
+        params = {k: v for k, v in params.items() if v is not None}
+
+        return await self.api_object.get_all(
+            "products/tags",
+            models.ProductTag,
+            follow_pages=follow_pages,
+            include_metadata=return_metadata,
+            lazy=lazy,
+            fields=fields,
+            **params,
+        )
+
+    def iter_product_tags(
+        self,
+        context: ContextType = None,
+        page: int = None,
+        per_page: int = None,
+        search: str | None = None,
+        exclude: list[int] | None = None,
+        include: list[int] | None = None,
+        offset: int | None = None,
+        order: OrderType = None,
+        orderby: t.Literal[
+            "id", "include", "name", "slug", "term_group", "description", "count"
+        ] = None,
+        hide_empty: bool = None,
+        product: int | None = None,
+        slug: str | None = None,
+        fields: list[str] | None = None,
+    ) -> t.AsyncIterator[ProductTag]:
+        """
+        Iterates over all product tags, fetching one page at a time.
+        Accepts the same filters as list_product_tags.
+
+        :param fields: Only return these fields, e.g. ["id", "name", "count"]. Other fields of the returned objects are None.
+        The objects are still typed as the full model, so type checkers do not flag those fields as optional.
+        :return: An iterator of ProductTag objects.
+        """
+        params = {
+            "context": context,
+            "page": page,
+            "per_page": per_page,
+            "search": search,
+            "exclude": exclude,
+            "include": include,
+            "offset": offset,
+            "order": order,
+            "orderby": orderby,
+            "hide_empty": hide_empty,
+            "product": product,
+            "slug": slug,
+        }
+        # Remove None values
+        params = {k: v for k, v in params.items() if v is not None}
+
+        return self.api_object.iter_all(
+            "products/tags", models.ProductTag, fields=fields, **params
+        )
+
+    async def update_product_tag(self, tag_id: int, tag: ProductTag) -> ProductTag:
+        """
+        Updates a product tag by its ID.
+        :param tag_id: id of the tag
+        :param tag: ProductTag object with updates
+        :return: updated ProductTag object
+        """
+        return await self.api_object.put(f"products/tags/{tag_id}", tag)
+
+    async def delete_product_tag(self, tag_id: int, force: bool = False) -> None:
+        """
+        Deletes a product tag by its ID.
+        :param tag_id: id of the tag
+        :param force: when True, the tag will be permanently deleted
+        :return: None
+        """
+        await self.api_object.delete(f"products/tags/{tag_id}", force=force)
+
+    async def batch_product_tags(
+        self,
+        create: list[ProductTag] | None = None,
+        update: list[ProductTag] | None = None,
+        delete: list[int] | None = None,
+        concurrency: int = 1,
+    ) -> BatchResponse[ProductTag]:
+        """
+        Creates, updates and deletes product tags using the batch endpoint.
+        Large inputs are split into requests of up to 100 operations.
+        :param create: ProductTag objects to create
+        :param update: ProductTag objects to update, must have their id set
+        :param delete: ids of the product tags to delete
+        :param concurrency: number of batch requests sent at the same time
+        :return: BatchResponse with the resulting objects and the errors of failed items
+        """
+        return await self.api_object.batch(
+            "products/tags/batch",
+            models.ProductTag,
+            create=create,
+            update=update,
+            delete=delete,
+            concurrency=concurrency,
+        )
+
+    # Product Attributes
+    async def create_product_attribute(
+        self, attribute: ProductAttribute
+    ) -> ProductAttribute:
+        """
+        Creates a product attribute.
+        :param attribute: ProductAttribute object
+        :return: the created attribute
+        """
+        return await self.api_object.post("products/attributes", attribute)
+
+    async def get_product_attribute(
+        self, attribute_id: int, fields: list[str] | None = None
+    ) -> ProductAttribute | None:
+        """
+        Gets a product attribute by its ID.
+        :param attribute_id: id of the attribute
+        :param fields: Only return these fields, e.g. ["id", "name", "slug"]. Other fields of the returned objects are None.
+        The objects are still typed as the full model, so type checkers do not flag those fields as optional.
+        :return: ProductAttribute object or None if not found
+        """
+        return await self.api_object.get(
+            f"products/attributes/{attribute_id}",
+            models.ProductAttribute,
+            fields=fields,
+        )
+
+    @t.overload
+    async def list_product_attributes(
+        self,
+        context: ContextType = None,
+        page: int = None,
+        per_page: int = None,
+        order: OrderType = None,
+        orderby: t.Literal["id", "name", "slug", "type", "order_by"] = None,
+        *,
+        follow_pages: t.Literal[False] = False,
+        return_metadata: t.Literal[True],
+        lazy: t.Literal[False] = False,
+        fields: list[str] | None = None,
+    ) -> PaginatedResponse[ProductAttribute]: ...
+
+    @t.overload
+    async def list_product_attributes(
+        self,
+        context: ContextType = None,
+        page: int = None,
+        per_page: int = None,
+        order: OrderType = None,
+        orderby: t.Literal["id", "name", "slug", "type", "order_by"] = None,
+        *,
+        follow_pages: t.Literal[False] = False,
+        return_metadata: t.Literal[False] = False,
+        lazy: t.Literal[False] = False,
+        fields: list[str] | None = None,
+    ) -> list[ProductAttribute]: ...
+
+    @t.overload
+    async def list_product_attributes(
+        self,
+        context: ContextType = None,
+        page: int = None,
+        per_page: int = None,
+        order: OrderType = None,
+        orderby: t.Literal["id", "name", "slug", "type", "order_by"] = None,
+        *,
+        follow_pages: t.Literal[True],
+        return_metadata: t.Literal[False] = False,
+        lazy: t.Literal[False] = False,
+        fields: list[str] | None = None,
+    ) -> list[ProductAttribute]: ...
+
+    @t.overload
+    async def list_product_attributes(
+        self,
+        context: ContextType = None,
+        page: int = None,
+        per_page: int = None,
+        order: OrderType = None,
+        orderby: t.Literal["id", "name", "slug", "type", "order_by"] = None,
+        *,
+        follow_pages: bool = False,
+        return_metadata: t.Literal[False] = False,
+        lazy: t.Literal[True],
+        fields: list[str] | None = None,
+    ) -> LazyList[ProductAttribute]: ...
+
+    async def list_product_attributes(
+        self,
+        context: ContextType = None,
+        page: int = None,
+        per_page: int = None,
+        order: OrderType = None,
+        orderby: t.Literal["id", "name", "slug", "type", "order_by"] = None,
+        follow_pages: bool = False,
+        return_metadata: bool = False,
+        lazy: bool = False,
+        fields: list[str] | None = None,
+    ) -> (
+        list[ProductAttribute]
+        | LazyList[ProductAttribute]
+        | PaginatedResponse[ProductAttribute]
+    ):
+        """
+        Lists all product attributes.
+
+        :param follow_pages: Whether to automatically follow pagination and get all pages. Defaults to False.
+        :param return_metadata: If True, returns a PaginatedResponse with metadata instead of just a list. Cannot be used with follow_pages=True.
+        :param lazy: If True, returns a LazyList that validates each item only when it is accessed.
+        :param fields: Only return these fields, e.g. ["id", "name", "slug"]. Other fields of the returned objects are None.
+        The objects are still typed as the full model, so type checkers do not flag those fields as optional.
+        :return: A list of ProductAttribute objects or a PaginatedResponse containing the list and pagination metadata.
+        """
+        if follow_pages and return_metadata:
+            raise ValueError("Cannot use follow_pages=True with return_metadata=True")
+
+        params = {
+            "context": context,
+            "page": page,
+            "per_page": per_page,
+            "order": order,
+            "orderby": orderby,
+        }
+        # Remove None values
+        params = {k: v for k, v in params.items() if v is not None}
+
+        return await self.api_object.get_all(
+            "products/attributes",
+            models.ProductAttribute,
+            follow_pages=follow_pages,
+            include_metadata=return_metadata,
+            lazy=lazy,
+            fields=fields,
+            **params,
+        )
+
+    def iter_product_attributes(
+        self,
+        context: ContextType = None,
+        page: int = None,
+        per_page: int = None,
+        order: OrderType = None,
+        orderby: t.Literal["id", "name", "slug", "type", "order_by"] = None,
+        fields: list[str] | None = None,
+    ) -> t.AsyncIterator[ProductAttribute]:
+        """
+        Iterates over all product attributes, fetching one page at a time.
+        Accepts the same filters as list_product_attributes.
+
+        :param fields: Only return these fields, e.g. ["id", "name", "slug"]. Other fields of the returned objects are None.
+        The objects are still typed as the full model, so type checkers do not flag those fields as optional.
+        :return: An iterator of ProductAttribute objects.
+        """
+        params = {
+            "context": context,
+            "page": page,
+            "per_page": per_page,
+            "order": order,
+            "orderby": orderby,
+        }
+        # Remove None values
+        params = {k: v for k, v in params.items() if v is not None}
+
+        return self.api_object.iter_all(
+            "products/attributes", models.ProductAttribute, fields=fields, **params
+        )
+
+    async def update_product_attribute(
+        self, attribute_id: int, attribute: ProductAttribute
+    ) -> ProductAttribute:
+        """
+        Updates a product attribute by its ID.
+        :param attribute_id: id of the attribute
+        :param attribute: ProductAttribute object with updates
+        :return: updated ProductAttribute object
+        """
+        return await self.api_object.put(
+            f"products/attributes/{attribute_id}", attribute
+        )
+
+    async def delete_product_attribute(
+        self, attribute_id: int, force: bool = True
+    ) -> None:
+        """
+        Deletes a product attribute by its ID.
+        :param attribute_id: id of the attribute
+        :param force: when True, the attribute will be permanently deleted
+        :return: None
+        """
+        await self.api_object.delete(f"products/attributes/{attribute_id}", force=force)
+
+    async def batch_product_attributes(
+        self,
+        create: list[ProductAttribute] | None = None,
+        update: list[ProductAttribute] | None = None,
+        delete: list[int] | None = None,
+        concurrency: int = 1,
+    ) -> BatchResponse[ProductAttribute]:
+        """
+        Creates, updates and deletes product attributes using the batch endpoint.
+        Large inputs are split into requests of up to 100 operations.
+        :param create: ProductAttribute objects to create
+        :param update: ProductAttribute objects to update, must have their id set
+        :param delete: ids of the product attributes to delete
+        :param concurrency: number of batch requests sent at the same time
+        :return: BatchResponse with the resulting objects and the errors of failed items
+        """
+        return await self.api_object.batch(
+            "products/attributes/batch",
+            models.ProductAttribute,
+            create=create,
+            update=update,
+            delete=delete,
+            concurrency=concurrency,
+        )
+
+    # Product Reviews
+    async def create_product_review(self, review: ProductReview) -> ProductReview:
+        """
+        Creates a product review.
+        :param review: ProductReview object
+        :return: the created review
+        """
+        return await self.api_object.post("products/reviews", review)
+
+    async def get_product_review(
+        self, review_id: int, fields: list[str] | None = None
+    ) -> ProductReview | None:
+        """
+        Gets a product review by its ID.
+        :param review_id: id of the review
+        :param fields: Only return these fields, e.g. ["id", "product_id", "rating"]. Other fields of the returned objects are None.
+        The objects are still typed as the full model, so type checkers do not flag those fields as optional.
+        :return: ProductReview object or None if not found
+        """
+        return await self.api_object.get(
+            f"products/reviews/{review_id}", models.ProductReview, fields=fields
+        )
+
+    @t.overload
+    async def list_product_reviews(
+        self,
+        context: ContextType = None,
+        page: int = None,
+        per_page: int = None,
+        search: str | None = None,
+        after: str | None = None,
+        before: str | None = None,
+        exclude: list[int] | None = None,
+        include: list[int] | None = None,
+        offset: int | None = None,
+        order: OrderType = None,
+        orderby: t.Literal[
+            "date", "date_gmt", "id", "include", "product", "rating"
+        ] = None,
+        reviewer: str | None = None,
+        reviewer_email: str | None = None,
+        product: int | None = None,
+        status: t.Literal[
+            "approved", "hold", "spam", "unspam", "trash", "untrash"
+        ] = None,
+        *,
+        follow_pages: t.Literal[False] = False,
+        return_metadata: t.Literal[True],
+        lazy: t.Literal[False] = False,
+        fields: list[str] | None = None,
+    ) -> PaginatedResponse[ProductReview]: ...
+
+    @t.overload
+    async def list_product_reviews(
+        self,
+        context: ContextType = None,
+        page: int = None,
+        per_page: int = None,
+        search: str | None = None,
+        after: str | None = None,
+        before: str | None = None,
+        exclude: list[int] | None = None,
+        include: list[int] | None = None,
+        offset: int | None = None,
+        order: OrderType = None,
+        orderby: t.Literal[
+            "date", "date_gmt", "id", "include", "product", "rating"
+        ] = None,
+        reviewer: str | None = None,
+        reviewer_email: str | None = None,
+        product: int | None = None,
+        status: t.Literal[
+            "approved", "hold", "spam", "unspam", "trash", "untrash"
+        ] = None,
+        *,
+        follow_pages: t.Literal[False] = False,
+        return_metadata: t.Literal[False] = False,
+        lazy: t.Literal[False] = False,
+        fields: list[str] | None = None,
+    ) -> list[ProductReview]: ...
+
+    @t.overload
+    async def list_product_reviews(
+        self,
+        context: ContextType = None,
+        page: int = None,
+        per_page: int = None,
+        search: str | None = None,
+        after: str | None = None,
+        before: str | None = None,
+        exclude: list[int] | None = None,
+        include: list[int] | None = None,
+        offset: int | None = None,
+        order: OrderType = None,
+        orderby: t.Literal[
+            "date", "date_gmt", "id", "include", "product", "rating"
+        ] = None,
+        reviewer: str | None = None,
+        reviewer_email: str | None = None,
+        product: int | None = None,
+        status: t.Literal[
+            "approved", "hold", "spam", "unspam", "trash", "untrash"
+        ] = None,
+        *,
+        follow_pages: t.Literal[True],
+        return_metadata: t.Literal[False] = False,
+        lazy: t.Literal[False] = False,
+        fields: list[str] | None = None,
+    ) -> list[ProductReview]: ...
+
+    @t.overload
+    async def list_product_reviews(
+        self,
+        context: ContextType = None,
+        page: int = None,
+        per_page: int = None,
+        search: str | None = None,
+        after: str | None = None,
+        before: str | None = None,
+        exclude: list[int] | None = None,
+        include: list[int] | None = None,
+        offset: int | None = None,
+        order: OrderType = None,
+        orderby: t.Literal[
+            "date", "date_gmt", "id", "include", "product", "rating"
+        ] = None,
+        reviewer: str | None = None,
+        reviewer_email: str | None = None,
+        product: int | None = None,
+        status: t.Literal[
+            "approved", "hold", "spam", "unspam", "trash", "untrash"
+        ] = None,
+        *,
+        follow_pages: bool = False,
+        return_metadata: t.Literal[False] = False,
+        lazy: t.Literal[True],
+        fields: list[str] | None = None,
+    ) -> LazyList[ProductReview]: ...
+
+    async def list_product_reviews(
+        self,
+        context: ContextType = None,
+        page: int = None,
+        per_page: int = None,
+        search: str | None = None,
+        after: str | None = None,
+        before: str | None = None,
+        exclude: list[int] | None = None,
+        include: list[int] | None = None,
+        offset: int | None = None,
+        order: OrderType = None,
+        orderby: t.Literal[
+            "date", "date_gmt", "id", "include", "product", "rating"
+        ] = None,
+        reviewer: str | None = None,
+        reviewer_email: str | None = None,
+        product: int | None = None,
+        status: t.Literal[
+            "approved", "hold", "spam", "unspam", "trash", "untrash"
+        ] = None,
+        follow_pages: bool = False,
+        return_metadata: bool = False,
+        lazy: bool = False,
+        fields: list[str] | None = None,
+    ) -> (
+        list[ProductReview] | LazyList[ProductReview] | PaginatedResponse[ProductReview]
+    ):
+        """
+        Lists all product reviews.
+
+        :param follow_pages: Whether to automatically follow pagination and get all pages. Defaults to False.
+        :param return_metadata: If True, returns a PaginatedResponse with metadata instead of just a list. Cannot be used with follow_pages=True.
+        :param lazy: If True, returns a LazyList that validates each item only when it is accessed.
+        :param fields: Only return these fields, e.g. ["id", "product_id", "rating"]. Other fields of the returned objects are None.
+        The objects are still typed as the full model, so type checkers do not flag those fields as optional.
+        :return: A list of ProductReview objects or a PaginatedResponse containing the list and pagination metadata.
+        """
+        if follow_pages and return_metadata:
+            raise ValueError("Cannot use follow_pages=True with return_metadata=True")
+
+        params = {
+            "context": context,
+            "page": page,
+            "per_page": per_page,
+            "search": search,
+            "after": after,
+            "before": before,
+            "exclude": exclude,
+            "include": include,
+            "offset": offset,
+            "order": order,
+            "orderby": orderby,
+            "reviewer": reviewer,
+            "reviewer_email": reviewer_email,
+            "product": product,
+            "status": status,
+        }
+        # Remove None values
+        params = {k: v for k, v in params.items() if v is not None}
+
+        return await self.api_object.get_all(
+            "products/reviews",
+            models.ProductReview,
+            follow_pages=follow_pages,
+            include_metadata=return_metadata,
+            lazy=lazy,
+            fields=fields,
+            **params,
+        )
+
+    def iter_product_reviews(
+        self,
+        context: ContextType = None,
+        page: int = None,
+        per_page: int = None,
+        search: str | None = None,
+        after: str | None = None,
+        before: str | None = None,
+        exclude: list[int] | None = None,
+        include: list[int] | None = None,
+        offset: int | None = None,
+        order: OrderType = None,
+        orderby: t.Literal[
+            "date", "date_gmt", "id", "include", "product", "rating"
+        ] = None,
+        reviewer: str | None = None,
+        reviewer_email: str | None = None,
+        product: int | None = None,
+        status: t.Literal[
+            "approved", "hold", "spam", "unspam", "trash", "untrash"
+        ] = None,
+        fields: list[str] | None = None,
+    ) -> t.AsyncIterator[ProductReview]:
+        """
+        Iterates over all product reviews, fetching one page at a time.
+        Accepts the same filters as list_product_reviews.
+
+        :param fields: Only return these fields, e.g. ["id", "product_id", "rating"]. Other fields of the returned objects are None.
+        The objects are still typed as the full model, so type checkers do not flag those fields as optional.
+        :return: An iterator of ProductReview objects.
+        """
+        params = {
+            "context": context,
+            "page": page,
+            "per_page": per_page,
+            "search": search,
+            "after": after,
+            "before": before,
+            "exclude": exclude,
+            "include": include,
+            "offset": offset,
+            "order": order,
+            "orderby": orderby,
+            "reviewer": reviewer,
+            "reviewer_email": reviewer_email,
+            "product": product,
+            "status": status,
+        }
+        # Remove None values
+        params = {k: v for k, v in params.items() if v is not None}
+
+        return self.api_object.iter_all(
+            "products/reviews", models.ProductReview, fields=fields, **params
+        )
+
+    async def update_product_review(
+        self, review_id: int, review: ProductReview
+    ) -> ProductReview:
+        """
+        Updates a product review by its ID.
+        :param review_id: id of the review
+        :param review: ProductReview object with updates
+        :return: updated ProductReview object
+        """
+        return await self.api_object.put(f"products/reviews/{review_id}", review)
+
+    async def delete_product_review(self, review_id: int, force: bool = False) -> None:
+        """
+        Deletes a product review by its ID.
+        :param review_id: id of the review
+        :param force: when True, the review will be permanently deleted
+        :return: None
+        """
+        await self.api_object.delete(f"products/reviews/{review_id}", force=force)
+
+    async def batch_product_reviews(
+        self,
+        create: list[ProductReview] | None = None,
+        update: list[ProductReview] | None = None,
+        delete: list[int] | None = None,
+        concurrency: int = 1,
+    ) -> BatchResponse[ProductReview]:
+        """
+        Creates, updates and deletes product reviews using the batch endpoint.
+        Large inputs are split into requests of up to 100 operations.
+        :param create: ProductReview objects to create
+        :param update: ProductReview objects to update, must have their id set
+        :param delete: ids of the product reviews to delete
+        :param concurrency: number of batch requests sent at the same time
+        :return: BatchResponse with the resulting objects and the errors of failed items
+        """
+        return await self.api_object.batch(
+            "products/reviews/batch",
+            models.ProductReview,
+            create=create,
+            update=update,
+            delete=delete,
+            concurrency=concurrency,
+        )
+
+    # Payment Gateways
+    @t.overload
+    async def list_payment_gateways(
+        self,
+        *,
+        follow_pages: t.Literal[False] = False,
+        return_metadata: t.Literal[True],
+        lazy: t.Literal[False] = False,
+        fields: list[str] | None = None,
+    ) -> PaginatedResponse[PaymentGateway]: ...
+
+    @t.overload
+    async def list_payment_gateways(
+        self,
+        *,
+        follow_pages: t.Literal[False] = False,
+        return_metadata: t.Literal[False] = False,
+        lazy: t.Literal[False] = False,
+        fields: list[str] | None = None,
+    ) -> list[PaymentGateway]: ...
+
+    @t.overload
+    async def list_payment_gateways(
+        self,
+        *,
+        follow_pages: t.Literal[True],
+        return_metadata: t.Literal[False] = False,
+        lazy: t.Literal[False] = False,
+        fields: list[str] | None = None,
+    ) -> list[PaymentGateway]: ...
+
+    @t.overload
+    async def list_payment_gateways(
+        self,
+        *,
+        follow_pages: bool = False,
+        return_metadata: t.Literal[False] = False,
+        lazy: t.Literal[True],
+        fields: list[str] | None = None,
+    ) -> LazyList[PaymentGateway]: ...
+
+    async def list_payment_gateways(
+        self,
+        follow_pages: bool = False,
+        return_metadata: bool = False,
+        lazy: bool = False,
+        fields: list[str] | None = None,
+    ) -> (
+        list[PaymentGateway]
+        | LazyList[PaymentGateway]
+        | PaginatedResponse[PaymentGateway]
+    ):
+        """
+        Lists all payment gateways.
+
+        :param follow_pages: Whether to automatically follow pagination and get all pages. Defaults to False.
+        :param return_metadata: If True, returns a PaginatedResponse with metadata instead of just a list. Cannot be used with follow_pages=True.
+        :param lazy: If True, returns a LazyList that validates each item only when it is accessed.
+        :param fields: Only return these fields, e.g. ["id", "enabled"]. Other fields of the returned objects are None.
+        The objects are still typed as the full model, so type checkers do not flag those fields as optional.
+        :return: A list of PaymentGateway objects or a PaginatedResponse containing the list and pagination metadata.
+        """
+        if follow_pages and return_metadata:
+            raise ValueError("Cannot use follow_pages=True with return_metadata=True")
+
+        key = (follow_pages, return_metadata, lazy, tuple(fields or ()))
+        cached = self._get_cached("payment_gateways", key)
+        if cached is not None:
+            return cached
+
+        result = await self.api_object.get_all(
+            "payment_gateways",
+            models.PaymentGateway,
+            follow_pages=follow_pages,
+            include_metadata=return_metadata,
+            lazy=lazy,
+            fields=fields,
+        )
+        self._set_cached("payment_gateways", key, result)
+        return result
+
+    def iter_payment_gateways(
+        self, fields: list[str] | None = None
+    ) -> t.AsyncIterator[PaymentGateway]:
+        """
+        Iterates over all payment gateways, fetching one page at a time.
+
+        :param fields: Only return these fields, e.g. ["id", "enabled"]. Other fields of the returned objects are None.
+        The objects are still typed as the full model, so type checkers do not flag those fields as optional.
+        :return: An iterator of PaymentGateway objects.
+        """
+        return self.api_object.iter_all(
+            "payment_gateways", models.PaymentGateway, fields=fields
+        )
+
+    async def get_payment_gateway(
+        self, gateway_id: str, fields: list[str] | None = None
+    ) -> PaymentGateway | None:
+        """
+        Gets a payment gateway by its ID.
+        :param gateway_id: id of the payment gateway
+        :param fields: Only return these fields, e.g. ["id", "enabled"]. Other fields of the returned objects are None.
+        The objects are still typed as the full model, so type checkers do not flag those fields as optional.
+        :return: PaymentGateway object or None if not found
+        """
+        return await self.api_object.get(
+            f"payment_gateways/{gateway_id}", models.PaymentGateway, fields=fields
+        )
+
+    async def update_payment_gateway(
+        self, gateway_id: str, gateway: PaymentGateway
+    ) -> PaymentGateway:
+        """
+        Updates a payment gateway by its ID.
+        :param gateway_id: id of the payment gateway
+        :param gateway: PaymentGateway object with updates
+        :return: updated PaymentGateway object
+        """
+        result = await self.api_object.put(f"payment_gateways/{gateway_id}", gateway)
+        self._invalidate_cached("payment_gateways")
+        return result
+
+    # Data endpoints
+    async def get_countries(self, follow_pages: bool = False) -> list[Country]:
+        """
+        Gets all countries.
+        :param follow_pages: Whether to automatically follow pagination and get all pages. Defaults to False.
+        :return: list of Country objects
+        """
+        key = ("countries", follow_pages)
+        cached = self._get_cached("data", key)
+        if cached is not None:
+            return cached
+
+        result = await self.api_object.get_all(
+            "data/countries", models.Country, follow_pages=follow_pages
+        )
+        self._set_cached("data", key, result)
+        return result
+
+    async def get_country(self, country_code: str) -> Country | None:
+        """
+        Gets a country by its code.
+        :param country_code: two-character country code
+        :return: Country object or None if not found
+        """
+        return await self.api_object.get(
+            f"data/countries/{country_code}", models.Country
+        )
+
+    async def get_currencies(self, follow_pages: bool = False) -> list[Currency]:
+        """
+        Gets all currencies.
+        :param follow_pages: Whether to automatically follow pagination and get all pages. Defaults to False.
+        :return: list of Currency objects
+        """
+        key = ("currencies", follow_pages)
+        cached = self._get_cached("data", key)
+        if cached is not None:
+            return cached
+
+        result = await self.api_object.get_all(
+            "data/currencies", models.Currency, follow_pages=follow_pages
+        )
+        self._set_cached("data", key, result)
+        return result
+
+    async def get_currency(self, currency_code: str) -> Currency | None:
+        """
+        Gets a currency by its code.
+        :param currency_code: three-character currency code
+        :return: Currency object or None if not found
+        """
+        return await self.api_object.get(
+            f"data/currencies/{currency_code}", models.Currency
+        )
+
+    # Reports
+    async def get_sales_report(
+        self,
+        period: t.Literal["week", "month", "last_month", "year"] = "week",
+        date_min: str | None = None,
+        date_max: str | None = None,
+    ) -> SalesReport | None:
+        """
+        Gets the sales report.
+        :param period: The period of sales to return
+        :param date_min: The start date for the report (ISO 8601 format)
+        :param date_max: The end date for the report (ISO 8601 format)
+        :return: SalesReport object or None if not found
+        """
+        params: dict[str, str] = {"period": period}
+        if date_min:
+            params["date_min"] = date_min
+        if date_max:
+            params["date_max"] = date_max
+
+        sales_report = await self.api_object.get_all(
+            "reports/sales", models.SalesReport, **params
+        )
+
+        if sales_report:
+            return sales_report[0]
+        return None
+
+    async def get_top_sellers_report(
+        self,
+        period: t.Literal["week", "month", "last_month", "year"] = "week",
+        date_min: str | None = None,
+        date_max: str | None = None,
+    ) -> list[TopSellersReport]:
+        """
+        Gets the top sellers report.
+        :param period: The period of sales to return
+        :param date_min: The start date for the report (ISO 8601 format)
+        :param date_max: The end date for the report (ISO 8601 format)
+        :return: list of TopSellersReport objects
+        """
+        params: dict[str, str] = {"period": period}
+        if date_min:
+            params["date_min"] = date_min
+        if date_max:
+            params["date_max"] = date_max
+
+        return await self.api_object.get_all(
+            "reports/top_sellers", models.TopSellersReport, **params
+        )
+
+    # Settings
+    async def get_settings(self, group: str | None = None) -> list[SettingOption]:
+        """
+        Gets all settings or settings for a specific group.
+        :param group: The settings group to get
+        :return: list of SettingOption objects
+        """
+        cached = self._get_cached("settings", group)
+        if cached is not None:
+            return cached
+
+        endpoint = "settings"
+        if group:
+            endpoint = f"settings/{group}"
+
+        result = await self.api_object.get_all(endpoint, models.SettingOption)
+        self._set_cached("settings", group, result)
+        return result
+
+    async def get_setting(self, group: str, id: str) -> SettingOption | None:
+        """
+        Gets a specific setting.
+        :param group: The settings group
+        :param id: The setting ID
+        :return: SettingOption object or None if not found
+        """
+        return await self.api_object.get(f"settings/{group}/{id}", models.SettingOption)
+
+    async def update_setting(
+        self, group: str, id: str, setting: SettingOption
+    ) -> SettingOption:
+        """
+        Updates a specific setting.
+        :param group: The settings group
+        :param id: The setting ID
+        :param setting: SettingOption object with updates
+        :return: updated SettingOption object
+        """
+        result = await self.api_object.put(f"settings/{group}/{id}", setting)
+        self._invalidate_cached("settings")
+        return result
+
+    # Order Refunds
+    async def create_order_refund(
+        self, order_id: int, refund: OrderRefund
+    ) -> OrderRefund:
+        """
+        Creates a refund for a given order.
+        :param order_id: id of the order
+        :param refund: OrderRefund object with refund data
+        :return: the created OrderRefund object
+        """
+        return await self.api_object.post(f"orders/{order_id}/refunds", refund)
+
+    async def get_order_refund(
+        self, order_id: int, refund_id: int, fields: list[str] | None = None
+    ) -> OrderRefund | None:
+        """
+        Retrieves a refund for a given order by its refund ID.
+        :param order_id: id of the order
+        :param refund_id: id of the refund
+        :param fields: Only return these fields, e.g. ["id", "amount", "date_created"]. Other fields of the returned objects are None.
+        The objects are still typed as the full model, so type checkers do not flag those fields as optional.
+        :return: OrderRefund object or None if not found
+        """
+        return await self.api_object.get(
+            f"orders/{order_id}/refunds/{refund_id}", models.OrderRefund, fields=fields
+        )
+
+    @t.overload
+    async def list_order_refunds(
+        self,
+        order_id: int,
+        context: str = None,
+        page: int = None,
+        per_page: int = None,
+        search: str = None,
+        after: str = None,
+        before: str = None,
+        exclude: list[int] = None,
+        include: list[int] = None,
+        offset: int = None,
+        order: str = None,
+        orderby: str = None,
+        dp: int = None,
+        *,
+        follow_pages: t.Literal[False] = False,
+        return_metadata: t.Literal[True],
+        lazy: t.Literal[False] = False,
+        fields: list[str] | None = None,
+    ) -> PaginatedResponse[OrderRefund]: ...
+
+    @t.overload
+    async def list_order_refunds(
+        self,
+        order_id: int,
+        context: str = None,
+        page: int = None,
+        per_page: int = None,
+        search: str = None,
+        after: str = None,
+        before: str = None,
+        exclude: list[int] = None,
+        include: list[int] = None,
+        offset: int = None,
+        order: str = None,
+        orderby: str = None,
+        dp: int = None,
+        *,
+        follow_pages: t.Literal[False] = False,
+        return_metadata: t.Literal[False] = False,
+        lazy: t.Literal[False] = False,
+        fields: list[str] | None = None,
+    ) -> list[OrderRefund]: ...
+
+    @t.overload
+    async def list_order_refunds(
+        self,
+        order_id: int,
+        context: str = None,
+        page: int = None,
+        per_page: int = None,
+        search: str = None,
+        after: str = None,
+        before: str = None,
+        exclude: list[int] = None,
+        include: list[int] = None,
+        offset: int = None,
+        order: str = None,
+        orderby: str = None,
+        dp: int = None,
+        *,
+        follow_pages: t.Literal[True],
+        return_metadata: t.Literal[False] = False,
+        lazy: t.Literal[False] = False,
+        fields: list[str] | None = None,
+    ) -> list[OrderRefund]: ...
+
+    @t.overload
+    async def list_order_refunds(
+        self,
+        order_id: int,
+        context: str = None,
+        page: int = None,
+        per_page: int = None,
+        search: str = None,
+        after: str = None,
+        before: str = None,
+        exclude: list[int] = None,
+        include: list[int] = None,
+        offset: int = None,
+        order: str = None,
+        orderby: str = None,
+        dp: int = None,
+        *,
+        follow_pages: bool = False,
+        return_metadata: t.Literal[False] = False,
+        lazy: t.Literal[True],
+        fields: list[str] | None = None,
+    ) -> LazyList[OrderRefund]: ...
+
+    async def list_order_refunds(
+        self,
+        order_id: int,
+        context: str = None,
+        page: int = None,
+        per_page: int = None,
+        search: str = None,
+        after: str = None,
+        before: str = None,
+        exclude: list[int] = None,
+        include: list[int] = None,
+        offset: int = None,
+        order: str = None,
+        orderby: str = None,
+        dp: int = None,
+        follow_pages: bool = False,
+        return_metadata: bool = False,
+        lazy: bool = False,
+        fields: list[str] | None = None,
+    ) -> list[OrderRefund] | LazyList[OrderRefund] | PaginatedResponse[OrderRefund]:
+        """
+        Lists all refunds for a given order.
+
+        :param order_id: id of the order
+        :param context: scope under which the request is made; determines fields present in the response
+        :param page: current page of the collection
+        :param per_page: maximum number of items returned per page
+        :param search: limit results to those matching a string
+        :param after: limit response to resources published after a given ISO8601-compliant date
+        :param before: limit response to resources published before a given ISO8601-compliant date
+        :param exclude: list of refund IDs to exclude from results
+        :param include: list of refund IDs to include in results
+        :param offset: offset the result set by a specific number of items
+        :param order: sort attribute order (asc or desc)
+        :param orderby: attribute by which to sort the collection
+        :param dp: number of decimal points to use for each resource
+        :param follow_pages: Whether to automatically follow pagination and get all pages. Defaults to False.
+        :param return_metadata: If True, returns a PaginatedResponse with metadata instead of just a list. Cannot be used with follow_pages=True.
+        :param lazy: If True, returns a LazyList that validates each item only when it is accessed.
+        :param fields: Only return these fields, e.g. ["id", "amount", "date_created"]. Other fields of the returned objects are None.
+        The objects are still typed as the full model, so type checkers do not flag those fields as optional.
+        :return: A list of OrderRefund objects or a PaginatedResponse containing the list and pagination metadata.
+        """
+        if follow_pages and return_metadata:
+            raise ValueError("Cannot use follow_pages=True with return_metadata=True")
+
+        params = {
+            "context": context,
+            "page": page,
+            "per_page": per_page,
+            "search": search,
+            "after": after,
+            "before": before,
+            "exclude": exclude,
+            "include": include,
+            "offset": offset,
+            "order": order,
+            "orderby": orderby,
+            "dp": dp,
+        }
+        # Remove None values
+        params = {k: v for k, v in params.items() if v is not None}
+
+        return await self.api_object.get_all(
+            f"orders/{order_id}/refunds",
+            models.OrderRefund,
+            follow_pages=follow_pages,
+            include_metadata=return_metadata,
+            lazy=lazy,
+            fields=fields,
+            **params,
+        )
+
+    def iter_order_refunds(
+        self,
+        order_id: int,
+        context: str = None,
+        page: int = None,
+        per_page: int = None,
+        search: str = None,
+        after: str = None,
+        before: str = None,
+        exclude: list[int] = None,
+        include: list[int] = None,
+        offset: int = None,
+        order: str = None,
+        orderby: str = None,
+        dp: int = None,
+        fields: list[str] | None = None,
+    ) -> t.AsyncIterator[OrderRefund]:
+        """
+        Iterates over all order refunds, fetching one page at a time.
+        Accepts the same filters as list_order_refunds.
+
+        :param order_id: id of the order
+        :param fields: Only return these fields, e.g. ["id", "amount", "date_created"]. Other fields of the returned objects are None.
+        The objects are still typed as the full model, so type checkers do not flag those fields as optional.
+        :return: An iterator of OrderRefund objects.
+        """
+        params: dict[str, t.Any] = {
+            "context": context,
+            "page": page,
+            "per_page": per_page,
+            "search": search,
+            "after": after,
+            "before": before,
+            "exclude": exclude,
+            "include": include,
+            "offset": offset,
+            "order": order,
+            "orderby": orderby,
+            "dp": dp,
+        }
+        # Remove None values
+        params = {k: v for k, v in params.items() if v is not None}
+
+        return self.api_object.iter_all(
+            f"orders/{order_id}/refunds", models.OrderRefund, fields=fields, **params
+        )
+
+    async def delete_order_refund(
+        self, order_id: int, refund_id: int, force: bool = None
+    ) -> None:
+        """
+        Deletes an order refund by its ID.
+        :param order_id: id of the order
+        :param refund_id: id of the refund
+        :param force: if True, the refund will be permanently deleted
+        :return: None
+        """
+        await self.api_object.delete(
+            f"orders/{order_id}/refunds/{refund_id}", force=force
+        )
+
+    async def create_order(self, order: Order) -> Order:
+        """
+        Creates an order.
+        :param order: Order object containing order details.
+        :return: The created Order object.
+        """
+        return await self.api_object.post("orders", order)
+
+    async def get_order(
+        self, order_id: int, fields: list[str] | None = None
+    ) -> Order | None:
+        """
+        Retrieves an order by its ID.
+        :param order_id: The ID of the order.
+        :param fields: Only return these fields, e.g. ["id", "status", "total"]. Other fields of the returned objects are None.
+        The objects are still typed as the full model, so type checkers do not flag those fields as optional.
+        :return: The Order object if found, otherwise None.
+        """
+        return await self.api_object.get(
+            f"orders/{order_id}", models.Order, fields=fields
+        )
+
+    @t.overload
+    async def list_orders(
+        self,
+        context: ContextType | None = None,
+        page: int | None = None,
+        per_page: int | None = None,
+        search: str | None = None,
+        after: str | None = None,
+        before: str | None = None,
+        modified_after: str | None = None,
+        modified_before: str | None = None,
+        dates_are_gmt: bool | None = None,
+        exclude: list[int] | None = None,
+        include: list[int] | None = None,
+        offset: int | None = None,
+        order: OrderType | None = None,
+        orderby: (
+            t.Literal["date", "modified", "id", "include", "title", "slug"] | None
+        ) = None,
+        parent: list[int] | None = None,
+        parent_exclude: list[int] | None = None,
+        status: list[str] | None = None,
+        customer: int | None = None,
+        product: int | None = None,
+        dp: int | None = None,
+        *,
+        follow_pages: t.Literal[False] = False,
+        return_metadata: t.Literal[True],
+        lazy: t.Literal[False] = False,
+        fields: list[str] | None = None,
+    ) -> PaginatedResponse[Order]: ...
+
+    @t.overload
+    async def list_orders(
+        self,
+        context: ContextType | None = None,
+        page: int | None = None,
+        per_page: int | None = None,
+        search: str | None = None,
+        after: str | None = None,
+        before: str | None = None,
+        modified_after: str | None = None,
+        modified_before: str | None = None,
+        dates_are_gmt: bool | None = None,
+        exclude: list[int] | None = None,
+        include: list[int] | None = None,
+        offset: int | None = None,
+        order: OrderType | None = None,
+        orderby: (
+            t.Literal["date", "modified", "id", "include", "title", "slug"] | None
+        ) = None,
+        parent: list[int] | None = None,
+        parent_exclude: list[int] | None = None,
+        status: list[str] | None = None,
+        customer: int | None = None,
+        product: int | None = None,
+        dp: int | None = None,
+        *,
+        follow_pages: t.Literal[False] = False,
+        return_metadata: t.Literal[False] = False,
+        lazy: t.Literal[False] = False,
+        fields: list[str] | None = None,
+    ) -> list[Order]: ...
+
+    @t.overload
+    async def list_orders(
+        self,
+        context: ContextType | None = None,
+        page: int | None = None,
+        per_page: int | None = None,
+        search: str | None = None,
+        after: str | None = None,
+        before: str | None = None,
+        modified_after: str | None = None,
+        modified_before: str | None = None,
+        dates_are_gmt: bool | None = None,
+        exclude: list[int] | None = None,
+        include: list[int] | None = None,
+        offset: int | None = None,
+        order: OrderType | None = None,
+        orderby: (
+            t.Literal["date", "modified", "id", "include", "title", "slug"] | None
+        ) = None,
+        parent: list[int] | None = None,
+        parent_exclude: list[int] | None = None,
+        status: list[str] | None = None,
+        customer: int | None = None,
+        product: int | None = None,
+        dp: int | None = None,
+        *,
+        follow_pages: t.Literal[True],
+        return_metadata: t.Literal[False] = False,
+        lazy: t.Literal[False] = False,
+        fields: list[str] | None = None,
+    ) -> list[Order]: ...
+
+    @t.overload
+    async def list_orders(
+        self,
+        context: ContextType | None = None,
+        page: int | None = None,
+        per_page: int | None = None,
+        search: str | None = None,
+        after: str | None = None,
+        before: str | None = None,
+        modified_after: str | None = None,
+        modified_before: str | None = None,
+        dates_are_gmt: bool | None = None,
+        exclude: list[int] | None = None,
+        include: list[int] | None = None,
+        offset: int | None = None,
+        order: OrderType | None = None,
+        orderby: (
+            t.Literal["date", "modified", "id", "include", "title", "slug"] | None
+        ) = None,
+        parent: list[int] | None = None,
+        parent_exclude: list[int] | None = None,
+        status: list[str] | None = None,
+        customer: int | None = None,
+        product: int | None = None,
+        dp: int | None = None,
+        *,
+        follow_pages: bool = False,
+        return_metadata: t.Literal[False] = False,
+        lazy: t.Literal[True],
+        fields: list[str] | None = None,
+    ) -> LazyList[Order]: ...
+
+    async def list_orders(
+        self,
+        context: ContextType | None = None,
+        page: int | None = None,
+        per_page: int | None = None,
+        search: str | None = None,
+        after: str | None = None,
+        before: str | None = None,
+        modified_after: str | None = None,
+        modified_before: str | None = None,
+        dates_are_gmt: bool | None = None,
+        exclude: list[int] | None = None,
+        include: list[int] | None = None,
+        offset: int | None = None,
+        order: OrderType | None = None,
+        orderby: (
+            t.Literal["date", "modified", "id", "include", "title", "slug"] | None
+        ) = None,
+        parent: list[int] | None = None,
+        parent_exclude: list[int] | None = None,
+        status: list[str] | None = None,
+        customer: int | None = None,
+        product: int | None = None,
+        dp: int | None = None,
+        follow_pages: bool = False,
+        return_metadata: bool = False,
+        lazy: bool = False,
+        fields: list[str] | None = None,
+    ) -> list[Order] | LazyList[Order] | PaginatedResponse[Order]:
+        """
+        Lists orders with optional filtering.
+        Available parameters include:
+          - context: Scope under which the request is made (e.g. "view" or "edit").
+          - page: Current page of the collection.
+          - per_page: Maximum number of orders per page.
+          - search: Limit results to those matching a string.
+          - after / before: Limit results to orders created within a date range.
+          - modified_after / modified_before: Filter orders by modification dates.
+          - dates_are_gmt: Whether the dates are in GMT.
+          - exclude / include: Lists of order IDs to exclude/include.
+          - offset: Offset for the result set.
+          - order: Sorting order ("asc" or "desc").
+          - orderby: Attribute by which to sort orders.
+          - parent / parent_exclude: Filter by parent order IDs.
+          - status: Filter by order statuses.
+          - customer: Filter orders for a specific customer ID.
+          - product: Filter orders that contain a specific product ID.
+          - dp: Number of decimal points to include.
+          - follow_pages: Whether to automatically follow pagination and get all pages. Defaults to False.
+          - return_metadata: If True, returns a PaginatedResponse with metadata instead of just a list. Cannot be used with follow_pages=True.
+          - lazy: If True, returns a LazyList that validates each item only when it is accessed.
+          - fields: Only return these fields, e.g. ["id", "status", "total"]. Other fields of the returned objects are None.
+            The objects are still typed as the full model, so type checkers do not flag those fields as optional.
+        :return: A list of Order objects or a PaginatedResponse containing the list and pagination metadata.
+        """
+        if follow_pages and return_metadata:
+            raise ValueError("Cannot use follow_pages=True with return_metadata=True")
+
+        params = {
+            "context": context,
+            "page": page,
+            "per_page": per_page,
+            "search": search,
+            "after": after,
+            "before": before,
+            "modified_after": modified_after,
+            "modified_before": modified_before,
+            "dates_are_gmt": dates_are_gmt,
+            "exclude": exclude,
+            "include": include,
+            "offset": offset,
+            "order": order,
+            "orderby": orderby,
+            "parent": parent,
+            "parent_exclude": parent_exclude,
+            "status": status,
+            "customer": customer,
+            "product": product,
+            "dp": dp,
+        }
+        # Remove any parameters that are None.
+        params = {k: v for k, v in params.items() if v is not None}
+
+        return await self.api_object.get_all(
+            "orders",
+            models.Order,
+            follow_pages=follow_pages,
+            include_metadata=return_metadata,
+            lazy=lazy,
+            fields=fields,
+            **params,
+        )
+
+    def iter_orders(
+        self,
+        context: ContextType | None = None,
+        page: int | None = None,
+        per_page: int | None = None,
+        search: str | None = None,
+        after: str | None = None,
+        before: str | None = None,
+        modified_after: str | None = None,
+        modified_before: str | None = None,
+        dates_are_gmt: bool | None = None,
+        exclude: list[int] | None = None,
+        include: list[int] | None = None,
+        offset: int | None = None,
+        order: OrderType | None = None,
+        orderby: (
+            t.Literal["date", "modified", "id", "include", "title", "slug"] | None
+        ) = None,
+        parent: list[int] | None = None,
+        parent_exclude: list[int] | None = None,
+        status: list[str] | None = None,
+        customer: int | None = None,
+        product: int | None = None,
+        dp: int | None = None,
+        fields: list[str] | None = None,
+    ) -> t.AsyncIterator[Order]:
+        """
+        Iterates over all orders, fetching one page at a time.
+        Accepts the same filters as list_orders.
+
+        :param fields: Only return these fields, e.g. ["id", "status", "total"]. Other fields of the returned objects are None.
+        The objects are still typed as the full model, so type checkers do not flag those fields as optional.
+        :return: An iterator of Order objects.
+        """
+        params = {
+            "context": context,
+            "page": page,
+            "per_page": per_page,
+            "search": search,
+            "after": after,
+            "before": before,
+            "modified_after": modified_after,
+            "modified_before": modified_before,
+            "dates_are_gmt": dates_are_gmt,
+            "exclude": exclude,
+            "include": include,
+            "offset": offset,
+            "order": order,
+            "orderby": orderby,
+            "parent": parent,
+            "parent_exclude": parent_exclude,
+            "status": status,
+            "customer": customer,
+            "product": product,
+            "dp": dp,
+        }
+        # Remove any parameters that are None.
+        params = {k: v for k, v in params.items() if v is not None}
+
+        return self.api_object.iter_all("orders", models.Order, fields=fields, **params)
+
+    async def update_order(self, order_id: int, order: Order) -> Order:
+        """
+        Updates an order by its ID.
+        :param order_id: The ID of the order to update.
+        :param order: Order object containing updated data.
+        :return: The updated Order object.
+        """
+        return await self.api_object.put(f"orders/{order_id}", order)
+
+    async def delete_order(self, order_id: int, force: bool = False) -> None:
+        """
+        Deletes an order by its ID.
+        :param order_id: The ID of the order.
+        :param force: If True, the order will be permanently deleted.
+        :return: None.
+        """
+        await self.api_object.delete(f"orders/{order_id}", force=force)
+
+    async def batch_orders(
+        self,
+        create: list[Order] | None = None,
+        update: list[Order] | None = None,
+        delete: list[int] | None = None,
+        concurrency: int = 1,
+    ) -> BatchResponse[Order]:
+        """
+        Creates, updates and deletes orders using the batch endpoint.
+        Large inputs are split into requests of up to 100 operations.
+        :param create: Order objects to create
+        :param update: Order objects to update, must have their id set
+        :param delete: ids of the orders to delete
+        :param concurrency: number of batch requests sent at the same time
+        :return: BatchResponse with the resulting objects and the errors of failed items
+        """
+        return await self.api_object.batch(
+            "orders/batch",
+            models.Order,
+            create=create,
+            update=update,
+            delete=delete,
+            concurrency=concurrency,
+        )
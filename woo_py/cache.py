@@ -0,0 +1,287 @@
+"""
+Caches for responses of the WooCommerce API.
+"""
+
+import copy
+import json
+import threading
+import time
+import typing as t
+from collections import OrderedDict
+from dataclasses import dataclass, field
+
+import httpx
+from pydantic import BaseModel
+
+from woo_py.lazy import LazyList
+
+CACHED_HEADERS = ("X-WP-Total", "X-WP-TotalPages", "Link")
+"""Response headers kept with cached pages, as 304 responses do not have to repeat them."""
+
+
+@dataclass
+class CachedResponse:
+    """
+    A validated response, together with the validators needed to revalidate it.
+    """
+
+    value: BaseModel | list[BaseModel] | LazyList[BaseModel]
+    """The validated model, or the models of a page."""
+
+    etag: str | None = None
+    """The ETag header of the response."""
+
+    last_modified: str | None = None
+    """The Last-Modified header of the response."""
+
+    headers: dict[str, str] = field(default_factory=dict)
+    """Pagination headers of the response."""
+
+    def conditional_headers(self) -> dict[str, str]:
+        """
+        Get the headers for revalidating the response.
+
+        :return: If-None-Match and/or If-Modified-Since headers.
+        """
+        headers = {}
+        if self.etag is not None:
+            headers["If-None-Match"] = self.etag
+        if self.last_modified is not None:
+            headers["If-Modified-Since"] = self.last_modified
+        return headers
+
+    def copy_value(self) -> t.Any:
+        """
+        Get a copy of the cached models, so changes by the caller do not end up in the cache.
+
+        :return: The copied model or list of models.
+        """
+        return _copy_value(self.value)
+
+
+def _copy_value(value: t.Any) -> t.Any:
+    if isinstance(value, LazyList):
+        return value.copy()
+    if isinstance(value, list):
+        return [item.model_copy(deep=True) for item in value]
+    return value.model_copy(deep=True)
+
+
+class HTTPCache:
+    """
+    Cache for revalidating GET requests with If-None-Match and If-Modified-Since.
+
+    Responses are stored with their ETag and Last-Modified validators, keyed by endpoint,
+    query parameters and model. When the server answers a revalidation with 304 Not Modified,
+    the already validated models are served from the cache instead of parsing the payload again.
+    Responses without validators are not stored. The least recently used entries are evicted
+    once max_entries is reached.
+    """
+
+    max_entries: int
+    """Maximum number of responses kept."""
+
+    def __init__(self, max_entries: int = 1024) -> None:
+        """
+        Initialize the cache.
+
+        :param max_entries: Maximum number of responses kept.
+        """
+        self.max_entries = max_entries
+        self._entries: OrderedDict[t.Hashable, CachedResponse] = OrderedDict()
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def make_key(
+        endpoint: str,
+        params: dict[str, t.Any],
+        expected_model: t.Type[BaseModel],
+        lazy: bool = False,
+    ) -> t.Hashable:
+        """
+        Build the cache key of a request.
+
+        :param endpoint: The endpoint requested.
+        :param params: The query parameters.
+        :param expected_model: The model the response is validated into.
+        :param lazy: Whenever the items are validated lazily.
+        :return: The key.
+        """
+        return (
+            endpoint.strip("/"),
+            json.dumps(params, sort_keys=True, default=str),
+            expected_model,
+            lazy,
+        )
+
+    def get(self, key: t.Hashable) -> CachedResponse | None:
+        """
+        Get a cached response.
+
+        :param key: The cache key.
+        :return: The cached response, or None if there is none.
+        """
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None:
+                self._entries.move_to_end(key)
+            return entry
+
+    def store(
+        self,
+        key: t.Hashable,
+        response: httpx.Response,
+        value: BaseModel | list[BaseModel] | LazyList[BaseModel],
+    ) -> None:
+        """
+        Store a response, if the server sent validators for it.
+
+        :param key: The cache key.
+        :param response: The response.
+        :param value: The validated model, or the models of a page.
+        """
+        etag = response.headers.get("ETag")
+        last_modified = response.headers.get("Last-Modified")
+
+        if etag is None and last_modified is None:
+            return
+
+        entry = CachedResponse(
+            value=_copy_value(value),
+            etag=etag,
+            last_modified=last_modified,
+            headers={
+                header: response.headers[header]
+                for header in CACHED_HEADERS
+                if header in response.headers
+            },
+        )
+
+        with self._lock:
+            self._entries[key] = entry
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+    def clear(self) -> None:
+        """
+        Remove all cached responses.
+        """
+        with self._lock:
+            self._entries.clear()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+
+DEFAULT_TTLS: dict[str, float] = {
+    "data": 24 * 60 * 60,
+    "settings": 5 * 60,
+    "taxes": 10 * 60,
+    "payment_gateways": 5 * 60,
+}
+"""Default time to live in seconds per endpoint, for MemoCache."""
+
+
+class MemoCache:
+    """
+    In-process cache for results of the Woo facade, used for reference data
+    such as countries, currencies, settings, tax classes, tax rates and payment gateways.
+
+    Entries are grouped by endpoint, expire after the time to live of their endpoint,
+    and the least recently used entries are evicted once max_entries is reached.
+    Woo invalidates the endpoint of an entry when it changes it, e.g. update_setting
+    invalidates "settings". Any object with the same get, set and invalidate methods can be used instead.
+    """
+
+    max_entries: int
+    """Maximum number of results kept."""
+
+    ttls: dict[str, float]
+    """Time to live in seconds per endpoint. Zero disables caching for the endpoint."""
+
+    default_ttl: float
+    """Time to live in seconds for endpoints missing in ttls."""
+
+    def __init__(
+        self,
+        max_entries: int = 256,
+        ttls: dict[str, float] | None = None,
+        default_ttl: float = 60.0,
+        clock: t.Callable[[], float] = time.monotonic,
+    ) -> None:
+        """
+        Initialize the cache.
+
+        :param max_entries: Maximum number of results kept.
+        :param ttls: Time to live in seconds per endpoint, merged with DEFAULT_TTLS.
+        :param default_ttl: Time to live in seconds for other endpoints.
+        :param clock: Function returning the current time in seconds.
+        """
+        self.max_entries = max_entries
+        self.ttls = {**DEFAULT_TTLS, **(ttls or {})}
+        self.default_ttl = default_ttl
+        self._clock = clock
+        self._entries: OrderedDict[tuple[str, t.Hashable], tuple[float, t.Any]] = (
+            OrderedDict()
+        )
+        self._lock = threading.Lock()
+
+    def get(self, endpoint: str, key: t.Hashable) -> t.Any | None:
+        """
+        Get a cached result.
+
+        :param endpoint: The endpoint the result belongs to.
+        :param key: The arguments the result was requested with.
+        :return: A copy of the result, or None if it is missing or expired.
+        """
+        with self._lock:
+            entry = self._entries.get((endpoint, key))
+            if entry is None:
+                return None
+
+            expires_at, value = entry
+            if expires_at <= self._clock():
+                del self._entries[(endpoint, key)]
+                return None
+
+            self._entries.move_to_end((endpoint, key))
+
+        return copy.deepcopy(value)
+
+    def set(self, endpoint: str, key: t.Hashable, value: t.Any) -> None:
+        """
+        Store a result.
+
+        :param endpoint: The endpoint the result belongs to.
+        :param key: The arguments the result was requested with.
+        :param value: The result.
+        """
+        ttl = self.ttls.get(endpoint, self.default_ttl)
+        if ttl <= 0:
+            return
+
+        entry = (self._clock() + ttl, copy.deepcopy(value))
+
+        with self._lock:
+            self._entries[(endpoint, key)] = entry
+            self._entries.move_to_end((endpoint, key))
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+    def invalidate(self, endpoint: str | None = None) -> None:
+        """
+        Remove cached results.
+
+        :param endpoint: The endpoint to remove the results of. None removes all results.
+        """
+        with self._lock:
+            if endpoint is None:
+                self._entries.clear()
+                return
+
+            for key in [key for key in self._entries if key[0] == endpoint]:
+                del self._entries[key]
+
+    def __len__(self) -> int:
+        return len(self._entries)
@@ -0,0 +1,409 @@
+"""
+Streaming export of list endpoints to NDJSON, CSV and Parquet files.
+"""
+
+import abc
+import csv
+import typing as t
+from collections import deque
+from concurrent.futures import Future, ThreadPoolExecutor
+from pathlib import Path
+
+from loguru import logger
+from pydantic import BaseModel
+
+from woo_py.api import API, PaginatedResponse
+from woo_py.json_codec import JSONCodec, get_default_codec
+from woo_py.lazy import LazyList
+
+Item = dict[str, t.Any]
+
+DEFAULT_FLATTEN = ("billing", "shipping")
+"""Nested objects flattened into columns by default, e.g. billing.country."""
+
+
+def flatten_item(
+    item: Item,
+    flatten: t.Iterable[str] = DEFAULT_FLATTEN,
+    explode: str | None = None,
+    separator: str = ".",
+) -> list[Item]:
+    """
+    Turn an item into flat rows, for tabular formats.
+
+    :param item: The item as decoded JSON.
+    :param flatten: Names of nested objects whose fields become columns, e.g. billing.country.
+    :param explode: Name of a list of objects, e.g. line_items, to write one row per element.
+        The element fields become columns, e.g. line_items.sku, and the other columns are repeated.
+        Items with an empty list still get one row.
+    :param separator: Separator between the object name and the field name.
+    :return: The rows. Nested values that are not flattened are left as they are.
+    """
+    row: Item = {}
+    for key, value in item.items():
+        if key == explode:
+            continue
+        if key in flatten and isinstance(value, dict):
+            for field, field_value in value.items():
+                row[f"{key}{separator}{field}"] = field_value
+        else:
+            row[key] = value
+
+    if explode is None:
+        return [row]
+
+    elements = item.get(explode) or []
+    if not elements:
+        return [row]
+    return [
+        {
+            **row,
+            **{
+                f"{explode}{separator}{field}": value
+                for field, value in element.items()
+            },
+        }
+        for element in elements
+    ]
+
+
+class ExportWriter(abc.ABC):
+    """
+    Writes pages of items to a file. Use as a context manager, or call close.
+    """
+
+    rows: int = 0
+    """Number of rows written."""
+
+    @abc.abstractmethod
+    def write_page(self, items: list[Item]) -> None:
+        """
+        Write the items of a page.
+
+        :param items: The items as decoded JSON.
+        """
+
+    @abc.abstractmethod
+    def close(self) -> None:
+        """
+        Flush and close the file.
+        """
+
+    def __enter__(self) -> "ExportWriter":
+        return self
+
+    def __exit__(self, *args: t.Any) -> None:
+        self.close()
+
+
+class NDJSONWriter(ExportWriter):
+    """
+    Writes one JSON document per line, with the items exactly as returned by the API.
+    """
+
+    def __init__(
+        self, file: str | Path | t.BinaryIO, json_codec: JSONCodec | None = None
+    ) -> None:
+        """
+        Initialize the writer.
+
+        :param file: Path of the file, or a file opened in binary mode. A given file is not closed.
+        :param json_codec: Codec for encoding the items. Defaults to the fastest installed one.
+        """
+        self._owns_file = isinstance(file, (str, Path))
+        self._file: t.BinaryIO = open(file, "wb") if self._owns_file else file  # type: ignore[arg-type, assignment]
+        self.json_codec = json_codec or get_default_codec()
+
+    def write_page(self, items: list[Item]) -> None:
+        dumps = self.json_codec.dumps
+        self._file.write(b"".join(dumps(item) + b"\n" for item in items))
+        self.rows += len(items)
+
+    def close(self) -> None:
+        if self._owns_file:
+            self._file.close()
+        else:
+            self._file.flush()
+
+
+class CSVWriter(ExportWriter):
+    """
+    Writes items as CSV rows, flattening nested objects into columns.
+
+    The columns are taken from the first page, unless given. Fields that only appear later are left out.
+    Nested values that are not flattened, e.g. meta_data, are written as JSON.
+    """
+
+    def __init__(
+        self,
+        file: str | Path | t.TextIO,
+        columns: list[str] | None = None,
+        flatten: t.Iterable[str] = DEFAULT_FLATTEN,
+        explode: str | None = None,
+        separator: str = ".",
+        json_codec: JSONCodec | None = None,
+    ) -> None:
+        """
+        Initialize the writer.
+
+        :param file: Path of the file, or a file opened in text mode with newline="". A given file is not closed.
+        :param columns: The columns to write, in order. Defaults to the fields of the first page.
+        :param flatten: Nested objects whose fields become columns, see flatten_item.
+        :param explode: A list of objects to write one row per element for, e.g. line_items. See flatten_item.
+        :param separator: Separator between the object name and the field name in column names.
+        :param json_codec: Codec for encoding nested values. Defaults to the fastest installed one.
+        """
+        self._owns_file = isinstance(file, (str, Path))
+        self._file: t.TextIO = (
+            open(file, "w", newline="", encoding="utf-8") if self._owns_file else file  # type: ignore[arg-type, assignment]
+        )
+        self.columns = columns
+        self.flatten = frozenset(flatten)
+        self.explode = explode
+        self.separator = separator
+        self.json_codec = json_codec or get_default_codec()
+        self._writer: csv.DictWriter | None = None
+
+    def write_page(self, items: list[Item]) -> None:
+        rows = [
+            row
+            for item in items
+            for row in flatten_item(item, self.flatten, self.explode, self.separator)
+        ]
+        if self._writer is None:
+            if self.columns is None:
+                self.columns = list(dict.fromkeys(key for row in rows for key in row))
+            self._writer = csv.DictWriter(
+                self._file, self.columns, extrasaction="ignore"
+            )
+            self._writer.writeheader()
+
+        self._writer.writerows(
+            {key: self._cell(value) for key, value in row.items()} for row in rows
+        )
+        self.rows += len(rows)
+
+    def _cell(self, value: t.Any) -> t.Any:
+        if isinstance(value, (dict, list)):
+            return self.json_codec.dumps(value).decode()
+        return value
+
+    def close(self) -> None:
+        if self._writer is None and self.columns is not None:
+            csv.DictWriter(self._file, self.columns).writeheader()
+        if self._owns_file:
+            self._file.close()
+        else:
+            self._file.flush()
+
+
+class ParquetWriter(ExportWriter):
+    """
+    Writes items to a Parquet file, a row group at a time. Requires pip install "woo_py[parquet]".
+
+    Rows are flattened like in CSVWriter, and nested values that are not flattened are stored as JSON strings.
+    The schema is inferred from the first row group unless given, with columns that are empty there
+    stored as strings. Values that do not fit the schema, e.g. a float in an integer column, raise
+    an error; pass a schema for such data.
+    """
+
+    def __init__(
+        self,
+        path: str | Path,
+        schema: t.Any = None,
+        flatten: t.Iterable[str] = DEFAULT_FLATTEN,
+        explode: str | None = None,
+        separator: str = ".",
+        row_group_size: int = 10000,
+        compression: str = "zstd",
+        json_codec: JSONCodec | None = None,
+    ) -> None:
+        """
+        Initialize the writer.
+
+        :param path: Path of the file.
+        :param schema: A pyarrow.Schema for the file. Defaults to the schema of the first row group.
+        :param flatten: Nested objects whose fields become columns, see flatten_item.
+        :param explode: A list of objects to write one row per element for, e.g. line_items. See flatten_item.
+        :param separator: Separator between the object name and the field name in column names.
+        :param row_group_size: Rows are buffered until a row group of this size is written.
+        :param compression: Compression codec of the column chunks.
+        :param json_codec: Codec for encoding nested values. Defaults to the fastest installed one.
+        """
+        import pyarrow
+        import pyarrow.parquet
+
+        self._pyarrow = pyarrow
+        self._parquet = pyarrow.parquet
+        self.path = path
+        self.schema = schema
+        self.flatten = frozenset(flatten)
+        self.explode = explode
+        self.separator = separator
+        self.row_group_size = row_group_size
+        self.compression = compression
+        self.json_codec = json_codec or get_default_codec()
+        self._buffer: list[Item] = []
+        self._writer: t.Any = None
+
+    def write_page(self, items: list[Item]) -> None:
+        for item in items:
+            for row in flatten_item(item, self.flatten, self.explode, self.separator):
+                self._buffer.append(
+                    {
+                        key: (
+                            self.json_codec.dumps(value).decode()
+                            if isinstance(value, (dict, list))
+                            else value
+                        )
+                        for key, value in row.items()
+                    }
+                )
+
+        if len(self._buffer) >= self.row_group_size:
+            self._write_row_group()
+
+    def _write_row_group(self) -> None:
+        pyarrow = self._pyarrow
+        if self.schema is None:
+            inferred = pyarrow.Table.from_pylist(self._buffer).schema
+            self.schema = pyarrow.schema(
+                [
+                    (
+                        field.with_type(pyarrow.string())
+                        if pyarrow.types.is_null(field.type)
+                        else field
+                    )
+                    for field in inferred
+                ]
+            )
+
+        table = pyarrow.Table.from_pylist(self._buffer, schema=self.schema)
+        if self._writer is None:
+            self._writer = self._parquet.ParquetWriter(
+                self.path, self.schema, compression=self.compression
+            )
+        self._writer.write_table(table, row_group_size=len(table))
+        self.rows += len(table)
+        self._buffer = []
+
+    def close(self) -> None:
+        if self._buffer or (self._writer is None and self.schema is not None):
+            self._write_row_group()
+        if self._writer is not None:
+            self._writer.close()
+
+
+class Exporter:
+    """
+    Streams all items of a list endpoint to an ExportWriter.
+
+    Pages are requested ahead while the current page is written, at most page_concurrency
+    at a time, so memory use is bounded by a few pages no matter how many items there are.
+    Items are written as returned by the API, without validating them, and without _links.
+    """
+
+    def __init__(
+        self, api_object: API, page_concurrency: int = 4, per_page: int = 100
+    ) -> None:
+        """
+        Initialize the exporter.
+
+        :param api_object: The API client.
+        :param page_concurrency: Maximum number of pages requested at the same time.
+        :param per_page: Number of items per page, at most 100.
+        """
+        self.api_object = api_object
+        self.page_concurrency = page_concurrency
+        self.per_page = per_page
+
+    def _get_page(
+        self,
+        endpoint: str,
+        model: t.Type[BaseModel],
+        fields: list[str] | None,
+        page: int,
+        params: dict[str, t.Any],
+    ) -> PaginatedResponse[BaseModel]:
+        return self.api_object.get_all(
+            endpoint,
+            model,
+            include_metadata=True,
+            lazy=True,
+            fields=fields,
+            **{**params, "page": page, "per_page": self.per_page},
+        )
+
+    def export(
+        self,
+        endpoint: str,
+        model: t.Type[BaseModel],
+        writer: ExportWriter,
+        fields: list[str] | None = None,
+        **params: t.Any,
+    ) -> int:
+        """
+        Export all items of a list endpoint. The writer is not closed.
+
+        :param endpoint: The list endpoint, e.g. 'orders'.
+        :param model: The model of the items, used for translating fields. Items are not validated.
+        :param writer: Where to write the items.
+        :param fields: Only request these fields, using _fields.
+        :param params: Additional query parameters, e.g. status or modified_after.
+        :return: Number of exported items.
+        """
+        first = self._get_page(endpoint, model, fields, 1, params)
+        exported = self._write(writer, first)
+
+        total_pages = first.total_pages or 0
+        if total_pages <= 1:
+            # Without X-WP-TotalPages, follow the Link header one page at a time
+            page = 1
+            response = first
+            while response.next_page_url and response.items:
+                page += 1
+                response = self._get_page(endpoint, model, fields, page, params)
+                exported += self._write(writer, response)
+            return exported
+
+        logger.debug(
+            "Exporting {} pages of {}, {} at a time",
+            total_pages,
+            endpoint,
+            self.page_concurrency,
+        )
+        pages = iter(range(2, total_pages + 1))
+        with ThreadPoolExecutor(max_workers=max(self.page_concurrency, 1)) as executor:
+            pending: deque[Future[PaginatedResponse[BaseModel]]] = deque()
+
+            def submit_next() -> None:
+                page = next(pages, None)
+                if page is not None:
+                    pending.append(
+                        executor.submit(
+                            self._get_page, endpoint, model, fields, page, params
+                        )
+                    )
+
+            for _ in range(max(self.page_concurrency, 1)):
+                submit_next()
+
+            # Pages are written in order, the next one is requested as soon as one is done
+            while pending:
+                response = pending.popleft().result()
+                submit_next()
+                exported += self._write(writer, response)
+
+        return exported
+
+    @staticmethod
+    def _write(writer: ExportWriter, response: PaginatedResponse[BaseModel]) -> int:
+        items = response.items
+        assert isinstance(items, LazyList)
+        # The raw items may be shared with the HTTP cache, so they are copied, not modified
+        raw = [
+            {key: value for key, value in items.raw(index).items() if key != "_links"}
+            for index in range(len(items))
+        ]
+        writer.write_page(raw)
+        return len(raw)
@@ -0,0 +1,646 @@
+"""
+Columnar tables of orders for fast aggregation. Requires pip install "woo_py[numpy]".
+"""
+
+import datetime
+import typing as t
+from dataclasses import dataclass
+from decimal import ROUND_HALF_EVEN, Decimal
+
+import numpy as np
+
+from woo_py.models import Order
+
+DEFAULT_DECIMALS = 6
+"""Decimal places kept in money columns. WooCommerce stores line totals with more places than prices."""
+
+Column = t.Union["Categorical", np.ndarray]
+
+
+@dataclass(frozen=True, eq=False)
+class Categorical:
+    """
+    A column of repeated strings, stored as an index into the distinct values.
+    Missing values have the code -1.
+    """
+
+    codes: np.ndarray
+    """Index of every row's value in categories, int32."""
+
+    categories: np.ndarray
+    """The distinct values, sorted."""
+
+    @classmethod
+    def from_values(cls, values: t.Sequence[str | None]) -> "Categorical":
+        """
+        Encode a sequence of strings.
+
+        :param values: The strings, None for missing values.
+        :return: The encoded column.
+        """
+        index: dict[str, int] = {}
+        codes = np.array(
+            [
+                index.setdefault(value, len(index)) if value is not None else -1
+                for value in values
+            ],
+            dtype=np.int32,
+        )
+        categories = sorted(index)
+        # Renumber the codes in category order, -1 stays -1
+        renumber = np.full(len(index) + 1, -1, dtype=np.int32)
+        renumber[[index[category] for category in categories]] = np.arange(
+            len(categories), dtype=np.int32
+        )
+        return cls(renumber[codes], np.array(categories, dtype=str))
+
+    def __len__(self) -> int:
+        return len(self.codes)
+
+    def __getitem__(self, index: t.Any) -> "Categorical":
+        return Categorical(self.codes[index], self.categories)
+
+    def code(self, value: str) -> int:
+        """
+        Get the code of a value.
+
+        :param value: The value.
+        :return: The code, -1 if no row has this value.
+        """
+        index = int(np.searchsorted(self.categories, value))
+        if index < len(self.categories) and self.categories[index] == value:
+            return index
+        return -1
+
+    def isin(self, *values: str) -> np.ndarray:
+        """
+        Get a mask of the rows having any of the values.
+
+        :param values: The values.
+        :return: Boolean array, one entry per row.
+        """
+        codes = [self.code(value) for value in values]
+        return np.isin(self.codes, [code for code in codes if code >= 0])
+
+    def to_list(self) -> list[str | None]:
+        """
+        Decode the column.
+
+        :return: The strings, None for missing values.
+        """
+        return [
+            str(self.categories[code]) if code >= 0 else None
+            for code in self.codes.tolist()
+        ]
+
+
+class Table:
+    """
+    Columns of equal length, by name.
+
+    Money columns hold integers scaled by 10 ** decimals, so sums are exact. group_sum converts them
+    back to Decimal, see also to_decimal.
+    """
+
+    decimals: int
+    """Decimal places of the money columns."""
+
+    money: frozenset[str]
+    """Names of the money columns."""
+
+    def __init__(
+        self,
+        columns: dict[str, Column],
+        money: t.Iterable[str] = (),
+        decimals: int = DEFAULT_DECIMALS,
+    ) -> None:
+        """
+        Initialize the table.
+
+        :param columns: The columns. NumPy arrays or Categorical, all of the same length.
+        :param money: Names of the columns holding scaled money amounts.
+        :param decimals: Decimal places of the money columns.
+        """
+        lengths = {len(column) for column in columns.values()}
+        if len(lengths) > 1:
+            raise ValueError(f"Columns have different lengths: {sorted(lengths)}")
+
+        self._columns = dict(columns)
+        self._length = lengths.pop() if lengths else 0
+        self.money = frozenset(money) & self._columns.keys()
+        self.decimals = decimals
+
+    def __len__(self) -> int:
+        return self._length
+
+    def __getitem__(self, name: str) -> Column:
+        return self._columns[name]
+
+    def array(self, name: str) -> np.ndarray:
+        """
+        Get a column stored as a NumPy array, e.g. a money, date or ID column.
+
+        :param name: Name of the column.
+        :return: The column.
+        :raises TypeError: If the column is Categorical.
+        """
+        column = self._columns[name]
+        if isinstance(column, Categorical):
+            raise TypeError(f"Column {name!r} is Categorical, use categorical()")
+        return column
+
+    def categorical(self, name: str) -> Categorical:
+        """
+        Get a Categorical column, e.g. a status, country or SKU column.
+
+        :param name: Name of the column.
+        :return: The column.
+        :raises TypeError: If the column is a NumPy array.
+        """
+        column = self._columns[name]
+        if not isinstance(column, Categorical):
+            raise TypeError(f"Column {name!r} is not Categorical, use array()")
+        return column
+
+    def __contains__(self, name: str) -> bool:
+        return name in self._columns
+
+    @property
+    def columns(self) -> list[str]:
+        """Names of the columns."""
+        return list(self._columns)
+
+    def filter(self, mask: np.ndarray) -> "Table":
+        """
+        Keep some rows.
+
+        :param mask: Boolean array, one entry per row, or row indices.
+        :return: A new table with the selected rows.
+        """
+        return Table(
+            {name: column[mask] for name, column in self._columns.items()},
+            self.money,
+            self.decimals,
+        )
+
+    def with_columns(self, money: t.Iterable[str] = (), **columns: Column) -> "Table":
+        """
+        Add or replace columns.
+
+        :param money: Names of the added columns that hold scaled money amounts.
+        :param columns: The columns, by name.
+        :return: A new table with the columns.
+        """
+        return Table(
+            {**self._columns, **columns},
+            (self.money - columns.keys()) | set(money),
+            self.decimals,
+        )
+
+    def to_decimal(self, values: np.ndarray) -> list[Decimal]:
+        """
+        Convert scaled money amounts to Decimal.
+
+        :param values: The scaled amounts.
+        :return: The amounts.
+        """
+        return [Decimal(value).scaleb(-self.decimals) for value in values.tolist()]
+
+    def sum(self, column: str) -> Decimal | int | float:
+        """
+        Sum a column.
+
+        :param column: Name of the column.
+        :return: The sum, Decimal for money columns.
+        """
+        total = self.array(column).sum()
+        if column in self.money:
+            return Decimal(int(total)).scaleb(-self.decimals)
+        return total.item()
+
+    def group_sum(
+        self, by: str | t.Sequence[str], column: str
+    ) -> dict[t.Any, Decimal | int | float]:
+        """
+        Sum a column per group, e.g. the revenue per SKU.
+
+        Rows with a missing key (None in a Categorical, NaT in a datetime column) are left out.
+
+        :param by: The column(s) to group by. With several columns, keys are tuples.
+        :param column: Name of the column to sum.
+        :return: The sums, by key, in key order.
+        """
+        names = [by] if isinstance(by, str) else list(by)
+        keys, inverse, present = self._group(names)
+
+        values = self.array(column)[present]
+        if len(values) == 0:
+            return {}
+        order = np.argsort(inverse, kind="stable")
+        starts = np.flatnonzero(np.diff(inverse[order], prepend=-1))
+        sums = np.add.reduceat(values[order], starts)
+
+        if column in self.money:
+            totals: list[t.Any] = self.to_decimal(sums)
+        else:
+            totals = sums.tolist()
+
+        if isinstance(by, str):
+            return dict(zip(keys[0], totals))
+        return dict(zip(zip(*keys), totals))
+
+    def _group(
+        self, names: list[str]
+    ) -> tuple[list[list[t.Any]], np.ndarray, np.ndarray]:
+        """
+        Number the distinct keys of the given columns.
+
+        :param names: The columns.
+        :return: Key values per column (one entry per group), the group of every present row,
+            and the mask of rows without missing keys.
+        """
+        present = np.ones(self._length, dtype=bool)
+        integers = []
+        for name in names:
+            column = self._columns[name]
+            if isinstance(column, Categorical):
+                present &= column.codes >= 0
+                integers.append(column.codes.astype(np.int64))
+            elif np.issubdtype(column.dtype, np.datetime64):
+                present &= ~np.isnat(column)
+                integers.append(column.view(np.int64))
+            else:
+                integers.append(column.astype(np.int64))
+
+        if len(integers) == 1:
+            unique, inverse = np.unique(integers[0][present], return_inverse=True)
+            groups = unique.reshape(1, -1)
+        else:
+            stacked = np.stack([values[present] for values in integers])
+            groups, inverse = np.unique(stacked, axis=1, return_inverse=True)
+
+        keys = []
+        for name, group_values in zip(names, groups):
+            column = self._columns[name]
+            if isinstance(column, Categorical):
+                keys.append(column.categories[group_values].tolist())
+            else:
+                keys.append(group_values.astype(column.dtype).tolist())
+
+        return keys, inverse.reshape(-1), present
+
+
+ORDER_MONEY = (
+    "total",
+    "total_tax",
+    "discount_total",
+    "discount_tax",
+    "shipping_total",
+    "shipping_tax",
+    "cart_tax",
+    "refund_total",
+)
+"""Money columns of OrderFrame.orders."""
+
+LINE_ITEM_MONEY = ("subtotal", "subtotal_tax", "total", "total_tax")
+"""Money columns of OrderFrame.line_items."""
+
+TAX_LINE_MONEY = ("tax_total", "shipping_tax_total")
+"""Money columns of OrderFrame.tax_lines."""
+
+COUPON_LINE_MONEY = ("discount", "discount_tax")
+"""Money columns of OrderFrame.coupon_lines."""
+
+_ORDER_COLUMNS = (
+    "id",
+    "number",
+    "status",
+    "currency",
+    "customer_id",
+    "billing_country",
+    "shipping_country",
+    "payment_method",
+    "date_created",
+    "date_created_site",
+    "date_paid",
+    "date_completed",
+    "item_count",
+    "total",
+    "total_tax",
+    "discount_total",
+    "discount_tax",
+    "shipping_total",
+    "shipping_tax",
+    "cart_tax",
+)
+_LINE_ITEM_COLUMNS = (
+    "order_index",
+    "order_id",
+    "id",
+    "product_id",
+    "variation_id",
+    "sku",
+    "quantity",
+    *LINE_ITEM_MONEY,
+)
+_TAX_LINE_COLUMNS = (
+    "order_index",
+    "order_id",
+    "rate_id",
+    "rate_code",
+    "label",
+    "compound",
+    *TAX_LINE_MONEY,
+)
+_COUPON_LINE_COLUMNS = ("order_index", "order_id", "code", *COUPON_LINE_MONEY)
+
+
+class OrderFrame:
+    """
+    Orders as columnar tables: one row per order, and one row per line item, tax line and coupon line.
+
+    Money amounts are exact: they are parsed into int64 scaled by 10 ** decimals, which holds
+    amounts up to about 9 trillion with the default 6 decimals. Statuses, currencies, countries, SKUs and codes
+    are Categorical, dates are datetime64[s] in GMT, NaT if missing. Only date_created_site is
+    in the site's timezone, as WooCommerce reports use it.
+
+    Rows of the child tables refer to their order with order_index, the row in orders,
+    see join_orders to bring order columns to them.
+    """
+
+    orders: Table
+    """id, number, status, currency, customer_id, billing_country, shipping_country, payment_method,
+    date_created, date_created_site, date_paid, date_completed, item_count and the money columns in ORDER_MONEY."""
+
+    line_items: Table
+    """order_index, order_id, id, product_id, variation_id, sku, quantity and the money columns in LINE_ITEM_MONEY."""
+
+    tax_lines: Table
+    """order_index, order_id, rate_id, rate_code, label, compound and the money columns in TAX_LINE_MONEY."""
+
+    coupon_lines: Table
+    """order_index, order_id, code and the money columns in COUPON_LINE_MONEY."""
+
+    def __init__(
+        self,
+        orders: Table,
+        line_items: Table,
+        tax_lines: Table,
+        coupon_lines: Table,
+    ) -> None:
+        self.orders = orders
+        self.line_items = line_items
+        self.tax_lines = tax_lines
+        self.coupon_lines = coupon_lines
+
+    def __len__(self) -> int:
+        return len(self.orders)
+
+    @classmethod
+    def from_orders(
+        cls, orders: t.Iterable[Order], decimals: int = DEFAULT_DECIMALS
+    ) -> "OrderFrame":
+        """
+        Build the tables from orders, e.g. from Woo.iter_orders or an IncrementalSync.
+        The orders are only iterated once.
+
+        :param orders: The orders.
+        :param decimals: Decimal places kept in money columns.
+        :return: The frame.
+        """
+        # Rows are collected as tuples and transposed into columns at the end
+        order_rows = []
+        refund_rows = []
+        item_rows = []
+        tax_rows = []
+        coupon_rows = []
+
+        for index, order in enumerate(orders):
+            order_id = order.id or 0
+            item_count = 0
+            for item in order.line_items:
+                quantity = item.quantity or 0
+                item_count += quantity
+                item_rows.append(
+                    (
+                        index,
+                        order_id,
+                        item.id or 0,
+                        item.product_id or 0,
+                        item.variation_id or 0,
+                        item.sku or None,
+                        quantity,
+                        item.subtotal,
+                        item.subtotal_tax,
+                        item.total,
+                        item.total_tax,
+                    )
+                )
+
+            for tax in order.tax_lines:
+                tax_rows.append(
+                    (
+                        index,
+                        order_id,
+                        tax.rate_id or 0,
+                        tax.rate_code,
+                        tax.label,
+                        bool(tax.compound),
+                        tax.tax_total,
+                        tax.shipping_tax_total,
+                    )
+                )
+
+            for coupon in order.coupon_lines:
+                coupon_rows.append(
+                    (index, order_id, coupon.code, coupon.discount, coupon.discount_tax)
+                )
+
+            for refund in order.refunds:
+                refund_rows.append((index, refund.total))
+
+            order_rows.append(
+                (
+                    order_id,
+                    order.number,
+                    order.status.value if order.status else None,
+                    order.currency,
+                    order.customer_id or 0,
+                    order.billing.country or None if order.billing else None,
+                    order.shipping.country or None if order.shipping else None,
+                    order.payment_method or None,
+                    _gmt(order.date_created_gmt),
+                    _site(order.date_created),
+                    _gmt(order.date_paid_gmt),
+                    _gmt(order.date_completed_gmt),
+                    item_count,
+                    order.total,
+                    order.total_tax,
+                    order.discount_total,
+                    order.discount_tax,
+                    order.shipping_total,
+                    order.shipping_tax,
+                    order.cart_tax,
+                )
+            )
+
+        order_table = _table(
+            _ORDER_COLUMNS,
+            order_rows,
+            decimals,
+            ORDER_MONEY,
+            categorical=(
+                "status",
+                "currency",
+                "billing_country",
+                "shipping_country",
+                "payment_method",
+            ),
+            dates=("date_created", "date_created_site", "date_paid", "date_completed"),
+            strings=("number",),
+        )
+
+        # Refund totals are negative in the order, the column holds the refunded amount
+        refunds = _table(("order_index", "amount"), refund_rows, decimals, ("amount",))
+        refund_total = np.zeros(len(order_rows), dtype=np.int64)
+        np.subtract.at(
+            refund_total, refunds.array("order_index"), refunds.array("amount")
+        )
+
+        return cls(
+            order_table.with_columns(ORDER_MONEY, refund_total=refund_total),
+            _table(
+                _LINE_ITEM_COLUMNS,
+                item_rows,
+                decimals,
+                LINE_ITEM_MONEY,
+                categorical=("sku",),
+            ),
+            _table(
+                _TAX_LINE_COLUMNS,
+                tax_rows,
+                decimals,
+                TAX_LINE_MONEY,
+                categorical=("rate_code", "label"),
+                booleans=("compound",),
+            ),
+            _table(
+                _COUPON_LINE_COLUMNS,
+                coupon_rows,
+                decimals,
+                COUPON_LINE_MONEY,
+                categorical=("code",),
+            ),
+        )
+
+    def join_orders(self, table: Table, *columns: str) -> Table:
+        """
+        Add order columns to a child table, e.g. the status and country of every line item.
+
+        :param table: line_items, tax_lines or coupon_lines, or a filtered version of them.
+        :param columns: Names of the order columns. Columns also in the child table are
+            added with an "order_" prefix.
+        :return: A new table with the columns.
+        """
+        index = table.array("order_index")
+        added: dict[str, Column] = {}
+        money = []
+        for name in columns:
+            target = f"order_{name}" if name in table else name
+            added[target] = self.orders[name][index]
+            if name in self.orders.money:
+                money.append(target)
+        return table.with_columns(money, **added)
+
+
+def parse_money(
+    values: t.Sequence[str | float | None], decimals: int = DEFAULT_DECIMALS
+) -> np.ndarray:
+    """
+    Parse money amounts into integers scaled by 10 ** decimals.
+
+    Decimal strings are parsed digit by digit, without going through float, so every amount
+    that fits into int64 is exact. Amounts with more decimal places are rounded half to even.
+
+    :param values: The amounts, e.g. "29.35". Floats are parsed from their shortest representation.
+        None and "" count as 0.
+    :param decimals: Decimal places kept.
+    :return: int64 array.
+    """
+    padding = "0" * decimals
+    # Amounts repeat a lot (prices, "0.00"), so each distinct one is parsed once
+    parsed: dict[str | float, int] = {}
+    scaled = []
+    for value in values:
+        if not value:
+            scaled.append(0)
+            continue
+
+        amount = parsed.get(value)
+        if amount is None:
+            amount = parsed[value] = _parse_amount(value, decimals, padding)
+        scaled.append(amount)
+
+    return np.array(scaled, dtype=np.int64)
+
+
+def _parse_amount(value: str | float, decimals: int, padding: str) -> int:
+    text = repr(value) if isinstance(value, float) else value
+    whole, _, fraction = text.partition(".")
+    if len(fraction) <= decimals and (fraction.isdecimal() or not fraction):
+        try:
+            # int() takes the sign and surrounding whitespace of the whole part
+            return int(whole + (fraction + padding)[:decimals])
+        except ValueError:
+            pass
+
+    # Exponents, or more decimal places than kept
+    return int(Decimal(text).scaleb(decimals).quantize(Decimal(1), ROUND_HALF_EVEN))
+
+
+def _gmt(value: datetime.datetime | None) -> datetime.datetime | None:
+    if value is not None and value.tzinfo is not None:
+        return value.astimezone(datetime.timezone.utc).replace(tzinfo=None)
+    return value
+
+
+def _site(value: datetime.datetime | None) -> datetime.datetime | None:
+    # Dates in the site's timezone are kept as local time
+    return value.replace(tzinfo=None) if value is not None else None
+
+
+def _table(
+    names: t.Sequence[str],
+    rows: list[tuple[t.Any, ...]],
+    decimals: int,
+    money: t.Sequence[str] = (),
+    categorical: t.Sequence[str] = (),
+    dates: t.Sequence[str] = (),
+    strings: t.Sequence[str] = (),
+    booleans: t.Sequence[str] = (),
+) -> Table:
+    """
+    Convert collected rows to a table. Columns not listed are int64.
+    """
+    transposed = list(zip(*rows)) if rows else [()] * len(names)
+
+    columns: dict[str, Column] = {}
+    for name, values in zip(names, transposed):
+        if name in categorical:
+            columns[name] = Categorical.from_values(values)
+        elif name in dates:
+            columns[name] = np.array(
+                [value if value is not None else "NaT" for value in values],
+                dtype="datetime64[s]",
+            )
+        elif name in strings:
+            columns[name] = np.array(
+                [value if value is not None else "" for value in values], dtype=str
+            )
+        elif name in booleans:
+            columns[name] = np.array(values, dtype=bool)
+        elif name in money:
+            columns[name] = parse_money(values, decimals)
+        else:
+            columns[name] = np.array(values, dtype=np.int64)
+    return Table(columns, money, decimals)
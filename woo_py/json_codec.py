@@ -0,0 +1,89 @@
+"""
+JSON codecs for encoding request bodies and decoding responses of the WooCommerce API.
+"""
+
+import json
+import typing as t
+
+
+class JSONCodec:
+    """
+    Encodes and decodes JSON using the standard library.
+    Subclasses use faster libraries, see get_default_codec for picking the fastest installed one.
+    """
+
+    name: str = "json"
+    """Name of the library used."""
+
+    def dumps(self, data: t.Any) -> bytes:
+        """
+        Encode data as JSON.
+
+        :param data: JSON compatible data.
+        :return: The UTF-8 encoded JSON.
+        """
+        return json.dumps(data, separators=(",", ":"), ensure_ascii=False).encode()
+
+    def loads(self, content: bytes | str) -> t.Any:
+        """
+        Decode JSON.
+
+        :param content: The JSON document.
+        :return: The decoded data.
+        """
+        return json.loads(content)
+
+
+class OrjsonCodec(JSONCodec):
+    """
+    Encodes and decodes JSON using orjson. Requires pip install "woo_py[orjson]".
+    """
+
+    name = "orjson"
+
+    def __init__(self) -> None:
+        import orjson
+
+        self._orjson = orjson
+
+    def dumps(self, data: t.Any) -> bytes:
+        return self._orjson.dumps(data)
+
+    def loads(self, content: bytes | str) -> t.Any:
+        return self._orjson.loads(content)
+
+
+class MsgspecCodec(JSONCodec):
+    """
+    Encodes and decodes JSON using msgspec. Requires pip install "woo_py[msgspec]".
+    """
+
+    name = "msgspec"
+
+    def __init__(self) -> None:
+        import msgspec
+
+        self._encoder = msgspec.json.Encoder()
+        self._decoder = msgspec.json.Decoder()
+
+    def dumps(self, data: t.Any) -> bytes:
+        return self._encoder.encode(data)
+
+    def loads(self, content: bytes | str) -> t.Any:
+        return self._decoder.decode(content)
+
+
+def get_default_codec() -> JSONCodec:
+    """
+    Get the fastest installed JSON codec.
+    Prefers orjson, then msgspec, and falls back to the standard library.
+
+    :return: The codec.
+    """
+    for codec_class in (OrjsonCodec, MsgspecCodec):
+        try:
+            return codec_class()
+        except ImportError:
+            continue
+
+    return JSONCodec()
@@ -0,0 +1,132 @@
+"""
+Lazily validated list responses.
+"""
+
+import typing as t
+
+from pydantic import BaseModel
+
+T = t.TypeVar("T", bound=BaseModel)
+
+
+class LazyList(t.Sequence[T]):
+    """
+    A list of models that keeps the items as decoded JSON, and validates an item
+    into its model only when it is accessed. Validated items are kept, so every item
+    is validated at most once.
+
+    Top-level fields can be read from the raw items without validating them, e.g. to
+    filter a page before processing the remaining items::
+
+        orders = woo.list_orders(per_page=100, lazy=True)
+        for order in orders.filter(lambda raw: raw["status"] == "processing"):
+            ...
+    """
+
+    model: t.Type[T]
+    """The model the items are validated into."""
+
+    def __init__(self, model: t.Type[T], raw: list[dict[str, t.Any]]) -> None:
+        """
+        Initialize the list.
+
+        :param model: The model the items are validated into.
+        :param raw: The items as decoded JSON.
+        """
+        self.model = model
+        self._raw = raw
+        self._models: list[T | None] = [None] * len(raw)
+
+    @classmethod
+    def concat(
+        cls, model: t.Type[T], lists: t.Iterable["LazyList[T]"]
+    ) -> "LazyList[T]":
+        """
+        Join several lazy lists, e.g. the pages of a response, without validating them.
+
+        :param model: The model the items are validated into.
+        :param lists: The lists to join.
+        :return: The joined list.
+        """
+        joined = cls(model, [])
+        for lazy_list in lists:
+            joined._raw.extend(lazy_list._raw)
+            joined._models.extend(lazy_list._models)
+        return joined
+
+    def __len__(self) -> int:
+        return len(self._raw)
+
+    @t.overload
+    def __getitem__(self, index: int) -> T: ...
+
+    @t.overload
+    def __getitem__(self, index: slice) -> "LazyList[T]": ...
+
+    def __getitem__(self, index: int | slice) -> "T | LazyList[T]":
+        if isinstance(index, slice):
+            sliced = LazyList(self.model, self._raw[index])
+            sliced._models = self._models[index]
+            return sliced
+
+        model = self._models[index]
+        if model is None:
+            model = self.model.model_validate(self._raw[index])
+            self._models[index] = model
+        return model
+
+    def raw(self, index: int) -> dict[str, t.Any]:
+        """
+        Get an item as decoded JSON, without validating it.
+        The returned dict must not be modified.
+
+        :param index: Index of the item.
+        :return: The decoded JSON of the item.
+        """
+        return self._raw[index]
+
+    def values(self, field: str) -> list[t.Any]:
+        """
+        Get a top-level field of every item, without validating the items.
+        Values are as sent by the API, e.g. dates are strings.
+
+        :param field: Name of the field in the JSON, e.g. 'id' or 'date_modified_gmt'.
+        :return: The value of the field for each item, None where it is missing.
+        """
+        return [item.get(field) for item in self._raw]
+
+    def filter(self, predicate: t.Callable[[dict[str, t.Any]], bool]) -> "LazyList[T]":
+        """
+        Keep the items whose decoded JSON matches a predicate, without validating them.
+
+        :param predicate: Called with the decoded JSON of each item.
+        :return: A lazy list of the matching items.
+        """
+        indices = [i for i, item in enumerate(self._raw) if predicate(item)]
+
+        filtered = LazyList(self.model, [self._raw[i] for i in indices])
+        filtered._models = [self._models[i] for i in indices]
+        return filtered
+
+    def validate_all(self) -> list[T]:
+        """
+        Validate all items.
+
+        :return: The items as a plain list of models.
+        """
+        return [self[i] for i in range(len(self))]
+
+    def copy(self) -> "LazyList[T]":
+        """
+        Get a copy of the list that shares the raw items, but not the validated models.
+
+        :return: The copy.
+        """
+        return LazyList(self.model, self._raw)
+
+    def __repr__(self) -> str:
+        validated = sum(model is not None for model in self._models)
+        return (
+            f"LazyList[{self.model.__name__}]"
+            f"({len(self)} items, {validated} validated)"
+        )
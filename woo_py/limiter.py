@@ -0,0 +1,234 @@
+"""
+Adaptive concurrency limiting for requests to the WooCommerce API.
+"""
+
+import asyncio
+import threading
+from collections import deque
+
+
+def _wake_waiter(waiter: "asyncio.Future[None]") -> None:
+    if not waiter.done():
+        waiter.set_result(None)
+
+
+class AdaptiveLimiter:
+    """
+    Limits the number of requests in flight, adapting the limit to what the server sustains.
+
+    Uses additive increase / multiplicative decrease (AIMD): while latency is stable, the limit
+    grows by one for every limit's worth of successful requests. On overload responses
+    (e.g. 429 or 503) or timeouts, the limit is cut by backoff_ratio. When latency rises above
+    latency_tolerance times the baseline, the limit is cut by latency_backoff_ratio.
+
+    The limit is cut at most once per window: a burst of overloaded requests that were all
+    in flight together is one congestion signal. Requests that were started before the last cut
+    do not cut the limit again, so acquire returns the epoch to pass to release.
+
+    A single limiter can be shared by several API and AsyncAPI clients, from several threads
+    and event loops at once.
+    """
+
+    min_limit: int
+    """Lowest the limit is reduced to."""
+
+    max_limit: int
+    """Highest the limit is raised to."""
+
+    backoff_ratio: float
+    """Factor applied to the limit on overload responses and timeouts."""
+
+    latency_backoff_ratio: float
+    """Factor applied to the limit when latency rises above the tolerated level."""
+
+    latency_tolerance: float
+    """How many times the baseline latency the smoothed latency may reach before backing off."""
+
+    smoothing: float
+    """Weight of the newest sample in the exponentially smoothed latency."""
+
+    baseline_drift: float
+    """How fast the baseline latency follows the smoothed latency, so it adapts to slower periods."""
+
+    overload_statuses: frozenset[int] = frozenset({429, 503})
+    """Response statuses that signal the server is overloaded."""
+
+    def __init__(
+        self,
+        initial_limit: int = 4,
+        min_limit: int = 1,
+        max_limit: int = 40,
+        backoff_ratio: float = 0.5,
+        latency_backoff_ratio: float = 0.9,
+        latency_tolerance: float = 2.0,
+        smoothing: float = 0.2,
+        baseline_drift: float = 0.01,
+    ) -> None:
+        """
+        Initialize the limiter.
+
+        :param initial_limit: Number of requests allowed in flight at the start.
+        :param min_limit: Lowest the limit is reduced to.
+        :param max_limit: Highest the limit is raised to.
+        :param backoff_ratio: Factor applied to the limit on overload responses and timeouts.
+        :param latency_backoff_ratio: Factor applied to the limit when latency rises.
+        :param latency_tolerance: How many times the baseline latency is tolerated.
+        :param smoothing: Weight of the newest sample in the smoothed latency.
+        :param baseline_drift: How fast the baseline latency follows the smoothed latency.
+        """
+        if not 1 <= min_limit <= initial_limit <= max_limit:
+            raise ValueError(
+                "Limits must satisfy 1 <= min_limit <= initial_limit <= max_limit"
+            )
+
+        self.min_limit = min_limit
+        self.max_limit = max_limit
+        self.backoff_ratio = backoff_ratio
+        self.latency_backoff_ratio = latency_backoff_ratio
+        self.latency_tolerance = latency_tolerance
+        self.smoothing = smoothing
+        self.baseline_drift = baseline_drift
+
+        self._limit = float(initial_limit)
+        self._in_flight = 0
+        self._epoch = 0
+        self._smoothed_latency: float | None = None
+        self._baseline_latency: float | None = None
+
+        self._lock = threading.Lock()
+        self._condition = threading.Condition(self._lock)
+        self._async_waiters: deque["asyncio.Future[None]"] = deque()
+
+    @property
+    def limit(self) -> int:
+        """The current number of requests allowed in flight."""
+        return int(self._limit)
+
+    @property
+    def in_flight(self) -> int:
+        """The number of requests currently in flight."""
+        return self._in_flight
+
+    @property
+    def epoch(self) -> int:
+        """The number of times the limit was cut."""
+        return self._epoch
+
+    def acquire(self) -> int:
+        """
+        Wait for a free slot, blocking the current thread.
+
+        :return: The epoch the slot was acquired in, for release.
+        """
+        with self._condition:
+            while self._in_flight >= self.limit:
+                self._condition.wait()
+            self._in_flight += 1
+            return self._epoch
+
+    async def acquire_async(self) -> int:
+        """
+        Wait for a free slot without blocking the event loop.
+
+        :return: The epoch the slot was acquired in, for release.
+        """
+        while True:
+            with self._lock:
+                if self._in_flight < self.limit:
+                    self._in_flight += 1
+                    return self._epoch
+
+                waiter = asyncio.get_running_loop().create_future()
+                self._async_waiters.append(waiter)
+
+            try:
+                await waiter
+            except asyncio.CancelledError:
+                with self._lock:
+                    if waiter in self._async_waiters:
+                        self._async_waiters.remove(waiter)
+                    # The wake up may have been meant for this waiter, so pass it on
+                    self._wake_waiters()
+                raise
+
+    def release(
+        self,
+        latency: float | None = None,
+        overloaded: bool = False,
+        epoch: int | None = None,
+    ) -> None:
+        """
+        Free a slot and adapt the limit to the outcome of the request.
+
+        :param latency: Duration of the request in seconds, if it got a response.
+        :param overloaded: Whenever the server signalled overload or the request timed out.
+        :param epoch: The epoch returned by acquire. Requests from before the last cut
+            do not cut the limit again. None for the current epoch.
+        """
+        with self._lock:
+            # Only grow the limit when it is actually being used
+            saturated = self._in_flight * 2 >= self.limit
+            self._in_flight -= 1
+            can_cut = epoch is None or epoch >= self._epoch
+
+            if overloaded:
+                if can_cut:
+                    self._cut(self.backoff_ratio)
+            elif latency is not None:
+                self._record_latency(latency, saturated, can_cut)
+
+            self._wake_waiters()
+
+    def _cut(self, ratio: float) -> None:
+        """
+        Cut the limit and start a new epoch. Must be called with the lock held.
+
+        :param ratio: Factor applied to the limit.
+        """
+        self._limit = max(self.min_limit, self._limit * ratio)
+        self._epoch += 1
+
+    def _record_latency(self, latency: float, saturated: bool, can_cut: bool) -> None:
+        """
+        Update the latency estimates and the limit. Must be called with the lock held.
+
+        :param latency: Duration of the request in seconds.
+        :param saturated: Whenever at least half of the slots were in use, so a higher limit could be used.
+        :param can_cut: Whenever the request was started after the last cut.
+        """
+        if self._smoothed_latency is None or self._baseline_latency is None:
+            self._smoothed_latency = latency
+            self._baseline_latency = latency
+        else:
+            self._smoothed_latency += (
+                latency - self._smoothed_latency
+            ) * self.smoothing
+            self._baseline_latency = min(
+                latency,
+                self._baseline_latency
+                + (self._smoothed_latency - self._baseline_latency)
+                * self.baseline_drift,
+            )
+
+        if self._smoothed_latency > self._baseline_latency * self.latency_tolerance:
+            if can_cut:
+                self._cut(self.latency_backoff_ratio)
+        elif saturated:
+            self._limit = min(self.max_limit, self._limit + 1 / self._limit)
+
+    def _wake_waiters(self) -> None:
+        """
+        Wake up as many waiters as there are free slots. Must be called with the lock held.
+        """
+        free_slots = self.limit - self._in_flight
+        if free_slots <= 0:
+            return
+
+        self._condition.notify(free_slots)
+
+        while free_slots > 0 and self._async_waiters:
+            waiter = self._async_waiters.popleft()
+            if waiter.done():
+                continue
+            waiter.get_loop().call_soon_threadsafe(_wake_waiter, waiter)
+            free_slots -= 1
@@ -0,0 +1,352 @@
+"""
+In-process metrics of requests to the WooCommerce API.
+"""
+
+import bisect
+import threading
+import typing as t
+from collections import Counter
+from dataclasses import dataclass, field
+
+LATENCY_BUCKETS: tuple[float, ...] = (
+    0.005,
+    0.01,
+    0.025,
+    0.05,
+    0.1,
+    0.25,
+    0.5,
+    1.0,
+    2.5,
+    5.0,
+    10.0,
+    30.0,
+)
+"""Upper bounds (seconds) of the latency histogram buckets."""
+
+
+def endpoint_label(endpoint: str) -> str:
+    """
+    Get the label of an endpoint, with IDs replaced, so e.g. all orders share one label.
+
+    :param endpoint: The endpoint, e.g. 'orders/123/notes'.
+    :return: The label, e.g. 'orders/{id}/notes'.
+    """
+    return "/".join(
+        "{id}" if part.isdigit() else part for part in endpoint.strip("/").split("/")
+    )
+
+
+class Histogram:
+    """
+    Counts observations in fixed buckets, like a Prometheus histogram.
+    Not thread-safe by itself, MetricsRegistry guards it.
+    """
+
+    buckets: tuple[float, ...]
+    """Upper bounds of the buckets. Observations above the last one go into an overflow bucket."""
+
+    def __init__(self, buckets: tuple[float, ...] = LATENCY_BUCKETS) -> None:
+        self.buckets = buckets
+        self.counts = [0] * (len(buckets) + 1)
+        self.count = 0
+        self.sum = 0.0
+        self.max = 0.0
+
+    def observe(self, value: float) -> None:
+        """
+        Add an observation.
+
+        :param value: The observed value.
+        """
+        self.counts[bisect.bisect_left(self.buckets, value)] += 1
+        self.count += 1
+        self.sum += value
+        self.max = max(self.max, value)
+
+    def quantile(self, q: float) -> float:
+        """
+        Estimate a quantile, interpolating linearly within the bucket it falls into.
+
+        :param q: The quantile, between 0 and 1.
+        :return: The estimated value, 0 without observations.
+        """
+        if self.count == 0:
+            return 0.0
+
+        rank = q * self.count
+        cumulative = 0
+        for index, bucket_count in enumerate(self.counts):
+            if bucket_count and cumulative + bucket_count >= rank:
+                lower = self.buckets[index - 1] if index > 0 else 0.0
+                upper = self.buckets[index] if index < len(self.buckets) else self.max
+                upper = min(upper, self.max)
+                return lower + (upper - lower) * (rank - cumulative) / bucket_count
+            cumulative += bucket_count
+
+        return self.max
+
+
+@dataclass
+class EndpointMetrics:
+    """
+    Metrics of one endpoint and HTTP method.
+    """
+
+    requests: int = 0
+    """Number of responses received, including retried ones."""
+
+    errors: int = 0
+    """Number of attempts that failed without a response, e.g. timeouts."""
+
+    retries: int = 0
+    """Number of attempts that were retried."""
+
+    status_codes: Counter[int] = field(default_factory=Counter)
+    """Number of responses per status code."""
+
+    latency: Histogram = field(default_factory=Histogram)
+    """Seconds until the response was received, per attempt."""
+
+    response_bytes: int = 0
+    """Total size of the response bodies."""
+
+    items_parsed: int = 0
+    """Number of models validated from the responses."""
+
+    validation_seconds: float = 0.0
+    """Total time spent validating responses."""
+
+
+@dataclass
+class EndpointSnapshot:
+    """
+    Metrics of one endpoint and HTTP method at the time of the snapshot.
+    Latencies and validation time are in seconds, latency percentiles are estimated from the histogram.
+    """
+
+    endpoint: str
+    method: str
+    requests: int
+    errors: int
+    retries: int
+    status_codes: dict[int, int]
+    latency_p50: float
+    latency_p95: float
+    latency_p99: float
+    latency_max: float
+    latency_total: float
+    response_bytes: int
+    items_parsed: int
+    validation_seconds: float
+
+
+class MetricsRegistry:
+    """
+    Collects metrics of the requests of one or more API clients, per endpoint and HTTP method.
+
+    Endpoints are grouped with their IDs replaced, e.g. 'orders/{id}'. The registry is thread-safe
+    and can be shared by several API and AsyncAPI clients.
+    """
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self._metrics: dict[tuple[str, str], EndpointMetrics] = {}
+
+    def _get(self, endpoint: str, method: str) -> EndpointMetrics:
+        key = (endpoint_label(endpoint), method.upper())
+        metrics = self._metrics.get(key)
+        if metrics is None:
+            metrics = self._metrics[key] = EndpointMetrics()
+        return metrics
+
+    def record_response(
+        self,
+        endpoint: str,
+        method: str,
+        status_code: int,
+        latency: float,
+        response_bytes: int,
+    ) -> None:
+        """
+        Record a received response.
+
+        :param endpoint: The requested endpoint.
+        :param method: The HTTP method.
+        :param status_code: Status code of the response.
+        :param latency: Seconds until the response was received.
+        :param response_bytes: Size of the response body.
+        """
+        with self._lock:
+            metrics = self._get(endpoint, method)
+            metrics.requests += 1
+            metrics.status_codes[status_code] += 1
+            metrics.latency.observe(latency)
+            metrics.response_bytes += response_bytes
+
+    def record_error(self, endpoint: str, method: str) -> None:
+        """
+        Record an attempt that failed without a response.
+
+        :param endpoint: The requested endpoint.
+        :param method: The HTTP method.
+        """
+        with self._lock:
+            self._get(endpoint, method).errors += 1
+
+    def record_retry(self, endpoint: str, method: str) -> None:
+        """
+        Record that a failed attempt is retried.
+
+        :param endpoint: The requested endpoint.
+        :param method: The HTTP method.
+        """
+        with self._lock:
+            self._get(endpoint, method).retries += 1
+
+    def record_validation(
+        self, endpoint: str, method: str, items: int, seconds: float
+    ) -> None:
+        """
+        Record the validation of a response.
+
+        :param endpoint: The requested endpoint.
+        :param method: The HTTP method.
+        :param items: Number of validated models.
+        :param seconds: Time spent validating.
+        """
+        with self._lock:
+            metrics = self._get(endpoint, method)
+            metrics.items_parsed += items
+            metrics.validation_seconds += seconds
+
+    def reset(self) -> None:
+        """
+        Remove all recorded metrics.
+        """
+        with self._lock:
+            self._metrics.clear()
+
+    def snapshot(self) -> list[EndpointSnapshot]:
+        """
+        Get the current metrics, slowest endpoints first.
+
+        :return: The metrics per endpoint and method, sorted by total latency.
+        """
+        with self._lock:
+            snapshots = [
+                EndpointSnapshot(
+                    endpoint=endpoint,
+                    method=method,
+                    requests=metrics.requests,
+                    errors=metrics.errors,
+                    retries=metrics.retries,
+                    status_codes=dict(metrics.status_codes),
+                    latency_p50=metrics.latency.quantile(0.5),
+                    latency_p95=metrics.latency.quantile(0.95),
+                    latency_p99=metrics.latency.quantile(0.99),
+                    latency_max=metrics.latency.max,
+                    latency_total=metrics.latency.sum,
+                    response_bytes=metrics.response_bytes,
+                    items_parsed=metrics.items_parsed,
+                    validation_seconds=metrics.validation_seconds,
+                )
+                for (endpoint, method), metrics in self._metrics.items()
+            ]
+
+        snapshots.sort(key=lambda snapshot: snapshot.latency_total, reverse=True)
+        return snapshots
+
+    def render_prometheus(self, prefix: str = "woo_py") -> str:
+        """
+        Render the metrics in the Prometheus text exposition format.
+
+        :param prefix: Prefix of the metric names.
+        :return: The metrics as text.
+        """
+        lines: list[str] = []
+
+        def header(name: str, kind: str, help_text: str) -> str:
+            lines.append(f"# HELP {prefix}_{name} {help_text}")
+            lines.append(f"# TYPE {prefix}_{name} {kind}")
+            return f"{prefix}_{name}"
+
+        with self._lock:
+            items = sorted(self._metrics.items())
+
+            name = header(
+                "requests_total", "counter", "Responses received, by status code."
+            )
+            for (endpoint, method), metrics in items:
+                for status_code, count in sorted(metrics.status_codes.items()):
+                    labels = _labels(
+                        endpoint=endpoint, method=method, status=str(status_code)
+                    )
+                    lines.append(f"{name}{labels} {count}")
+
+            name = header(
+                "request_duration_seconds",
+                "histogram",
+                "Seconds until the response was received.",
+            )
+            for (endpoint, method), metrics in items:
+                histogram = metrics.latency
+                cumulative = 0
+                for bound, count in zip((*histogram.buckets, "+Inf"), histogram.counts):
+                    cumulative += count
+                    labels = _labels(endpoint=endpoint, method=method, le=str(bound))
+                    lines.append(f"{name}_bucket{labels} {cumulative}")
+                labels = _labels(endpoint=endpoint, method=method)
+                lines.append(f"{name}_sum{labels} {histogram.sum}")
+                lines.append(f"{name}_count{labels} {histogram.count}")
+
+            counters: list[tuple[str, str, t.Callable[[EndpointMetrics], float]]] = [
+                (
+                    "request_errors_total",
+                    "Attempts that failed without a response.",
+                    lambda metrics: metrics.errors,
+                ),
+                (
+                    "request_retries_total",
+                    "Attempts that were retried.",
+                    lambda metrics: metrics.retries,
+                ),
+                (
+                    "response_bytes_total",
+                    "Size of the response bodies.",
+                    lambda metrics: metrics.response_bytes,
+                ),
+                (
+                    "items_parsed_total",
+                    "Models validated from the responses.",
+                    lambda metrics: metrics.items_parsed,
+                ),
+                (
+                    "validation_seconds_total",
+                    "Time spent validating responses.",
+                    lambda metrics: metrics.validation_seconds,
+                ),
+            ]
+            for counter_name, help_text, value in counters:
+                name = header(counter_name, "counter", help_text)
+                for (endpoint, method), metrics in items:
+                    labels = _labels(endpoint=endpoint, method=method)
+                    lines.append(f"{name}{labels} {value(metrics)}")
+
+        return "\n".join(lines) + "\n"
+
+
+def _labels(**labels: str) -> str:
+    """
+    Format Prometheus labels, escaping the values.
+
+    :param labels: The labels.
+    :return: The labels in braces.
+    """
+    escaped = (
+        value.replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
+        for value in labels.values()
+    )
+    return (
+        "{" + ",".join(f'{key}="{value}"' for key, value in zip(labels, escaped)) + "}"
+    )
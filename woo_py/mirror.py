@@ -0,0 +1,570 @@
+"""
+Local SQLite mirror of the catalog, for answering lookups without requests to the store.
+"""
+
+import datetime
+import os
+import sqlite3
+import threading
+import typing as t
+from concurrent.futures import ThreadPoolExecutor
+
+from loguru import logger
+from pydantic import BaseModel
+
+from woo_py.api import API, GMT_FORMAT
+from woo_py.models.product import Product, ProductType
+from woo_py.models.product_category import ProductCategory
+from woo_py.models.product_tag import ProductTag
+from woo_py.models.product_variation import ProductVariation
+from woo_py.sync import IncrementalSync, SQLiteCheckpointStore
+
+T = t.TypeVar("T", bound=BaseModel)
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS products (
+    id INTEGER PRIMARY KEY,
+    sku TEXT,
+    slug TEXT,
+    parent_id INTEGER,
+    type TEXT,
+    status TEXT,
+    data TEXT NOT NULL
+);
+CREATE INDEX IF NOT EXISTS products_sku ON products (sku);
+CREATE INDEX IF NOT EXISTS products_slug ON products (slug);
+CREATE INDEX IF NOT EXISTS products_parent_id ON products (parent_id);
+
+CREATE TABLE IF NOT EXISTS product_categories (
+    product_id INTEGER NOT NULL,
+    category_id INTEGER NOT NULL,
+    PRIMARY KEY (product_id, category_id)
+);
+CREATE INDEX IF NOT EXISTS product_categories_category_id ON product_categories (category_id);
+
+CREATE TABLE IF NOT EXISTS product_tags (
+    product_id INTEGER NOT NULL,
+    tag_id INTEGER NOT NULL,
+    PRIMARY KEY (product_id, tag_id)
+);
+CREATE INDEX IF NOT EXISTS product_tags_tag_id ON product_tags (tag_id);
+
+CREATE TABLE IF NOT EXISTS variations (
+    id INTEGER PRIMARY KEY,
+    product_id INTEGER NOT NULL,
+    sku TEXT,
+    data TEXT NOT NULL
+);
+CREATE INDEX IF NOT EXISTS variations_sku ON variations (sku);
+CREATE INDEX IF NOT EXISTS variations_product_id ON variations (product_id);
+
+CREATE TABLE IF NOT EXISTS categories (
+    id INTEGER PRIMARY KEY,
+    slug TEXT,
+    parent INTEGER,
+    data TEXT NOT NULL
+);
+CREATE INDEX IF NOT EXISTS categories_slug ON categories (slug);
+CREATE INDEX IF NOT EXISTS categories_parent ON categories (parent);
+
+CREATE TABLE IF NOT EXISTS tags (
+    id INTEGER PRIMARY KEY,
+    slug TEXT,
+    data TEXT NOT NULL
+);
+CREATE INDEX IF NOT EXISTS tags_slug ON tags (slug);
+"""
+
+
+class CatalogMirror:
+    """
+    Keeps products, variations, categories and tags in an SQLite database,
+    indexed by ID, SKU, slug, category and parent, and answers lookups from it.
+
+    refresh updates the mirror incrementally: products changed since the last refresh are
+    fetched using modified_after, together with the variations of the changed variable products,
+    and trashed products are removed. Categories and tags are small, so they are fetched in full.
+    Products deleted permanently, and variations changed without a change of their product,
+    are only updated by a full refresh.
+
+    The lookups return the usual models and never send requests.
+    """
+
+    path: str
+    """Path of the database."""
+
+    api_object: API | None
+    """The API client used for refreshing. None for a read-only mirror."""
+
+    page_concurrency: int
+    """Number of pages of categories and tags, or products for variations, fetched at the same time."""
+
+    def __init__(
+        self,
+        path: str | os.PathLike[str],
+        api_object: API | None = None,
+        page_concurrency: int = 4,
+    ) -> None:
+        """
+        Initialize the mirror, creating the tables if needed.
+
+        :param path: Path of the database. The sync checkpoints are kept in it as well.
+        :param api_object: The API client used for refreshing. None for a read-only mirror.
+        :param page_concurrency: Number of pages of categories and tags, or products for variations,
+        fetched at the same time.
+        """
+        self.path = os.fspath(path)
+        self.api_object = api_object
+        self.page_concurrency = page_concurrency
+
+        self._lock = threading.Lock()
+        self._connection = sqlite3.connect(self.path, check_same_thread=False)
+        with self._lock, self._connection:
+            self._connection.executescript(SCHEMA)
+
+        self._checkpoints = SQLiteCheckpointStore(self.path, table="mirror_checkpoints")
+
+    def close(self) -> None:
+        """
+        Close the database connections.
+        """
+        self._connection.close()
+        self._checkpoints.close()
+
+    # Refreshing
+    def refresh(self, full: bool = False) -> None:
+        """
+        Update the mirror from the store.
+
+        :param full: Whenever to download the whole catalog again instead of only the changes.
+        Removes products that were deleted permanently.
+        """
+        if self.api_object is None:
+            raise ValueError("An API client is required for refreshing the mirror")
+
+        if full:
+            with self._lock, self._connection:
+                for table in (
+                    "products",
+                    "product_categories",
+                    "product_tags",
+                    "variations",
+                    "categories",
+                    "tags",
+                ):
+                    self._connection.execute(f"DELETE FROM {table}")
+                self._connection.execute("DELETE FROM mirror_checkpoints")
+
+        self._refresh_terms()
+        self._remove_trashed()
+
+        sync = IncrementalSync(
+            self.api_object, self._checkpoints, page_concurrency=self.page_concurrency
+        )
+        count = 0
+        # The checkpoint only moves past a page once the next one is requested,
+        # so a failed refresh starts again from the first page that was not stored
+        for page in sync.pages("products"):
+            products = [t.cast(Product, product) for product in page]
+            self.store_products(products)
+            self._refresh_variations(products)
+            count += len(products)
+
+        logger.info("Mirror refreshed, {} changed products", count)
+
+    def _refresh_terms(self) -> None:
+        """
+        Replace all categories and tags.
+        """
+        assert self.api_object is not None
+
+        categories = self.api_object.get_all(
+            "products/categories",
+            ProductCategory,
+            follow_pages=True,
+            page_concurrency=self.page_concurrency,
+            per_page=100,
+        )
+        tags = self.api_object.get_all(
+            "products/tags",
+            ProductTag,
+            follow_pages=True,
+            page_concurrency=self.page_concurrency,
+            per_page=100,
+        )
+
+        with self._lock, self._connection:
+            self._connection.execute("DELETE FROM categories")
+            self._connection.executemany(
+                "INSERT INTO categories (id, slug, parent, data) VALUES (?, ?, ?, ?)",
+                [
+                    (
+                        category.id,
+                        category.slug,
+                        category.parent,
+                        category.model_dump_json(),
+                    )
+                    for category in categories
+                ],
+            )
+            self._connection.execute("DELETE FROM tags")
+            self._connection.executemany(
+                "INSERT INTO tags (id, slug, data) VALUES (?, ?, ?)",
+                [(tag.id, tag.slug, tag.model_dump_json()) for tag in tags],
+            )
+
+    def _remove_trashed(self) -> None:
+        """
+        Remove the products trashed since the last refresh.
+        """
+        assert self.api_object is not None
+
+        checkpoint = self._checkpoints.load("products")
+        if checkpoint is None:
+            return
+
+        trashed = self.api_object.get_all(
+            "products",
+            Product,
+            follow_pages=True,
+            page_concurrency=self.page_concurrency,
+            per_page=100,
+            status="trash",
+            modified_after=(
+                checkpoint.modified_gmt - datetime.timedelta(seconds=1)
+            ).strftime(GMT_FORMAT),
+            dates_are_gmt=True,
+            fields=["id"],
+        )
+        self.remove_products([product.id for product in trashed if product.id])
+
+    def _refresh_variations(self, products: list[Product]) -> None:
+        """
+        Replace the variations of changed products. Only the variable products are requested,
+        the other products keep no variations.
+
+        :param products: The changed products.
+        """
+        assert self.api_object is not None
+        api_object = self.api_object
+
+        variable_ids = [
+            product.id
+            for product in products
+            if product.id is not None and product.type == ProductType.VARIABLE
+        ]
+        other_ids = [
+            (product.id,)
+            for product in products
+            if product.id is not None and product.type != ProductType.VARIABLE
+        ]
+        if other_ids:
+            with self._lock, self._connection:
+                self._connection.executemany(
+                    "DELETE FROM variations WHERE product_id = ?", other_ids
+                )
+
+        def fetch(product_id: int) -> tuple[int, list[ProductVariation]]:
+            variations = api_object.get_all(
+                f"products/{product_id}/variations",
+                ProductVariation,
+                follow_pages=True,
+                per_page=100,
+            )
+            return product_id, variations
+
+        with ThreadPoolExecutor(max_workers=max(self.page_concurrency, 1)) as executor:
+            for product_id, variations in executor.map(fetch, variable_ids):
+                self.store_variations(product_id, variations, replace=True)
+
+    # Storing
+    def store_products(self, products: t.Iterable[Product]) -> None:
+        """
+        Insert or update products in the mirror.
+
+        :param products: The products. Must have their ID set.
+        """
+        products = list(products)
+
+        with self._lock, self._connection:
+            for product in products:
+                self._connection.execute(
+                    "INSERT OR REPLACE INTO products (id, sku, slug, parent_id, type, status, data) "
+                    "VALUES (?, ?, ?, ?, ?, ?, ?)",
+                    (
+                        product.id,
+                        product.sku or None,
+                        product.slug,
+                        product.parent_id,
+                        product.type.value,
+                        product.status.value,
+                        product.model_dump_json(),
+                    ),
+                )
+                self._connection.execute(
+                    "DELETE FROM product_categories WHERE product_id = ?", (product.id,)
+                )
+                self._connection.executemany(
+                    "INSERT OR IGNORE INTO product_categories (product_id, category_id) VALUES (?, ?)",
+                    [(product.id, category.id) for category in product.categories],
+                )
+                self._connection.execute(
+                    "DELETE FROM product_tags WHERE product_id = ?", (product.id,)
+                )
+                self._connection.executemany(
+                    "INSERT OR IGNORE INTO product_tags (product_id, tag_id) VALUES (?, ?)",
+                    [(product.id, tag.id) for tag in product.tags],
+                )
+
+    def store_variations(
+        self,
+        product_id: int,
+        variations: t.Iterable[ProductVariation],
+        replace: bool = False,
+    ) -> None:
+        """
+        Insert or update the variations of a product in the mirror.
+
+        :param product_id: ID of the product.
+        :param variations: The variations. Must have their ID set.
+        :param replace: Whenever to remove the product's other variations.
+        """
+        variations = list(variations)
+
+        with self._lock, self._connection:
+            if replace:
+                self._connection.execute(
+                    "DELETE FROM variations WHERE product_id = ?", (product_id,)
+                )
+            self._connection.executemany(
+                "INSERT OR REPLACE INTO variations (id, product_id, sku, data) VALUES (?, ?, ?, ?)",
+                [
+                    (
+                        variation.id,
+                        product_id,
+                        variation.sku or None,
+                        variation.model_dump_json(),
+                    )
+                    for variation in variations
+                ],
+            )
+
+    def remove_products(self, product_ids: t.Iterable[int]) -> None:
+        """
+        Remove products and their variations from the mirror.
+
+        :param product_ids: IDs of the products.
+        """
+        rows = [(product_id,) for product_id in product_ids]
+
+        with self._lock, self._connection:
+            for table, column in (
+                ("products", "id"),
+                ("product_categories", "product_id"),
+                ("product_tags", "product_id"),
+                ("variations", "product_id"),
+            ):
+                self._connection.executemany(
+                    f"DELETE FROM {table} WHERE {column} = ?", rows
+                )
+
+    # Lookups
+    def _select(
+        self, model: t.Type[T], query: str, params: tuple[t.Any, ...]
+    ) -> list[T]:
+        """
+        Run a query selecting the data column of a table, and validate the rows.
+
+        :param model: The model of the rows.
+        :param query: The query.
+        :param params: Parameters of the query.
+        :return: The models.
+        """
+        with self._lock:
+            rows = self._connection.execute(query, params).fetchall()
+        return [model.model_validate_json(row[0]) for row in rows]
+
+    def _select_one(
+        self, model: t.Type[T], query: str, params: tuple[t.Any, ...]
+    ) -> T | None:
+        items = self._select(model, query, params)
+        if items:
+            return items[0]
+        return None
+
+    def get_product(self, product_id: int) -> Product | None:
+        """
+        Gets a product by its ID.
+        :param product_id: id of the product
+        :return: Product object or None if not in the mirror
+        """
+        return self._select_one(
+            Product, "SELECT data FROM products WHERE id = ?", (product_id,)
+        )
+
+    def get_product_by_sku(self, sku: str) -> Product | None:
+        """
+        Gets a product by its SKU.
+        :param sku: SKU of the product
+        :return: Product object or None if not in the mirror
+        """
+        return self._select_one(
+            Product, "SELECT data FROM products WHERE sku = ?", (sku,)
+        )
+
+    def get_product_by_slug(self, slug: str) -> Product | None:
+        """
+        Gets a product by its slug.
+        :param slug: slug of the product
+        :return: Product object or None if not in the mirror
+        """
+        return self._select_one(
+            Product, "SELECT data FROM products WHERE slug = ?", (slug,)
+        )
+
+    def list_products(
+        self,
+        category: int | None = None,
+        tag: int | None = None,
+        parent: int | None = None,
+        sku: str | None = None,
+        type: str | None = None,
+        status: str | None = None,
+    ) -> list[Product]:
+        """
+        Lists products with optional filtering, ordered by ID.
+        :param category: Limit result set to products assigned a specific category ID.
+        :param tag: Limit result set to products assigned a specific tag ID.
+        :param parent: Limit result set to products with a specific parent ID.
+        :param sku: Limit result set to products with a specific SKU.
+        :param type: Limit result set to products assigned a specific type.
+        :param status: Limit result set to products assigned a specific status.
+        :return: list of Product objects
+        """
+        conditions = []
+        params: list[t.Any] = []
+
+        if category is not None:
+            conditions.append(
+                "id IN (SELECT product_id FROM product_categories WHERE category_id = ?)"
+            )
+            params.append(category)
+        if tag is not None:
+            conditions.append(
+                "id IN (SELECT product_id FROM product_tags WHERE tag_id = ?)"
+            )
+            params.append(tag)
+        for column, value in (
+            ("parent_id", parent),
+            ("sku", sku),
+            ("type", type),
+            ("status", status),
+        ):
+            if value is not None:
+                conditions.append(f"{column} = ?")
+                params.append(value)
+
+        query = "SELECT data FROM products"
+        if conditions:
+            query += " WHERE " + " AND ".join(conditions)
+
+        return self._select(Product, query + " ORDER BY id", tuple(params))
+
+    def get_product_variation(self, variation_id: int) -> ProductVariation | None:
+        """
+        Gets a product variation by its ID.
+        :param variation_id: id of the variation
+        :return: ProductVariation object or None if not in the mirror
+        """
+        return self._select_one(
+            ProductVariation,
+            "SELECT data FROM variations WHERE id = ?",
+            (variation_id,),
+        )
+
+    def get_product_variation_by_sku(self, sku: str) -> ProductVariation | None:
+        """
+        Gets a product variation by its SKU.
+        :param sku: SKU of the variation
+        :return: ProductVariation object or None if not in the mirror
+        """
+        return self._select_one(
+            ProductVariation, "SELECT data FROM variations WHERE sku = ?", (sku,)
+        )
+
+    def list_product_variations(self, product_id: int) -> list[ProductVariation]:
+        """
+        Lists the variations of a product, ordered by ID.
+        :param product_id: id of the product
+        :return: list of ProductVariation objects
+        """
+        return self._select(
+            ProductVariation,
+            "SELECT data FROM variations WHERE product_id = ? ORDER BY id",
+            (product_id,),
+        )
+
+    def get_product_category(self, category_id: int) -> ProductCategory | None:
+        """
+        Gets a product category by its ID.
+        :param category_id: id of the category
+        :return: ProductCategory object or None if not in the mirror
+        """
+        return self._select_one(
+            ProductCategory, "SELECT data FROM categories WHERE id = ?", (category_id,)
+        )
+
+    def get_product_category_by_slug(self, slug: str) -> ProductCategory | None:
+        """
+        Gets a product category by its slug.
+        :param slug: slug of the category
+        :return: ProductCategory object or None if not in the mirror
+        """
+        return self._select_one(
+            ProductCategory, "SELECT data FROM categories WHERE slug = ?", (slug,)
+        )
+
+    def list_product_categories(
+        self, parent: int | None = None
+    ) -> list[ProductCategory]:
+        """
+        Lists product categories, ordered by ID.
+        :param parent: Limit result set to categories assigned a specific parent, 0 for top level categories.
+        :return: list of ProductCategory objects
+        """
+        if parent is None:
+            return self._select(
+                ProductCategory, "SELECT data FROM categories ORDER BY id", ()
+            )
+        return self._select(
+            ProductCategory,
+            "SELECT data FROM categories WHERE parent = ? ORDER BY id",
+            (parent,),
+        )
+
+    def get_product_tag(self, tag_id: int) -> ProductTag | None:
+        """
+        Gets a product tag by its ID.
+        :param tag_id: id of the tag
+        :return: ProductTag object or None if not in the mirror
+        """
+        return self._select_one(
+            ProductTag, "SELECT data FROM tags WHERE id = ?", (tag_id,)
+        )
+
+    def get_product_tag_by_slug(self, slug: str) -> ProductTag | None:
+        """
+        Gets a product tag by its slug.
+        :param slug: slug of the tag
+        :return: ProductTag object or None if not in the mirror
+        """
+        return self._select_one(
+            ProductTag, "SELECT data FROM tags WHERE slug = ?", (slug,)
+        )
+
+    def list_product_tags(self) -> list[ProductTag]:
+        """
+        Lists all product tags, ordered by ID.
+        :return: list of ProductTag objects
+        """
+        return self._select(ProductTag, "SELECT data FROM tags ORDER BY id", ())
@@ -1,17 +1,27 @@
+import importlib
 from enum import Enum
 
 from pydantic import BaseModel, ConfigDict
 import typing
 
 
+class WooModel(BaseModel):
+    """
+    Base of all models. Validators are built on first use instead of at import,
+    so importing the package does not pay for models that are never used.
+    """
+
+    model_config = ConfigDict(defer_build=True)
+
+
 # Common models
-class MetaData(BaseModel):
+class MetaData(WooModel):
     id: int | None  # Meta ID (read-only)
     key: str | None  # Meta key
     value: str | list[str] | dict[str, typing.Any] | None  # Meta value
 
 
-class ShippingAddress(BaseModel):
+class ShippingAddress(WooModel):
     first_name: str | None = None
     last_name: str | None = None
     company: str | None = None
@@ -28,7 +38,7 @@ class BillingAddress(ShippingAddress):
     phone: str | None = None
 
 
-class TaxLine(BaseModel):
+class TaxLine(WooModel):
     id: int | None = None  # Item ID, read-only.
     rate_code: str | None = None  # Tax rate code, read-only.
     rate_id: int | None = None  # Tax rate ID, read-only.
@@ -48,7 +58,7 @@ class TaxStatus(str, Enum):
     NONE = "none"
 
 
-class FeeLine(BaseModel):
+class FeeLine(WooModel):
     model_config = ConfigDict(coerce_numbers_to_str=True)
     id: int | None = None
     name: str | None = None
@@ -60,7 +70,7 @@ class FeeLine(BaseModel):
     meta_data: list[MetaData] = []
 
 
-class ShippingLine(BaseModel):
+class ShippingLine(WooModel):
     model_config = ConfigDict(coerce_numbers_to_str=True)
     id: str | None = None
     method_title: str | None = None
@@ -71,7 +81,7 @@ class ShippingLine(BaseModel):
     meta_data: list[MetaData] = []
 
 
-class LineItem(BaseModel):
+class LineItem(WooModel):
     model_config = ConfigDict(coerce_numbers_to_str=True)
     id: int | None = None
     name: str | None = None
@@ -89,43 +99,145 @@ class LineItem(BaseModel):
     price: str | None = None
 
 
-class Dimensions(BaseModel):
+class Dimensions(WooModel):
     length: str | None = None
     width: str | None = None
     height: str | None = None
 
 
-class DownloadProperties(BaseModel):
+class DownloadProperties(WooModel):
     id: str
     name: str
     file: str
 
 
-# Import all models
-from woo_py.models.coupon import Coupon
-from woo_py.models.customer import Customer
-from woo_py.models.data import Country, Currency
-from woo_py.models.order import Order, OrderStatus
-from woo_py.models.order_note import OrderNote
-from woo_py.models.order_refund import OrderRefund
-from woo_py.models.payment_gateway import PaymentGateway, PaymentGatewaySetting
-from woo_py.models.product import (
-    Product,
-    ProductType,
-    ProductStatus,
-    ProductCategory as ProductCategoryRef,
-    ProductTag as ProductTagRef,
-)
-from woo_py.models.product_attribute import (
-    ProductAttribute,
-    AttributeType,
-    AttributeOrderBy,
-)
-from woo_py.models.product_category import ProductCategory, ProductCategoryImage
-from woo_py.models.product_review import ProductReview, ReviewStatus
-from woo_py.models.product_tag import ProductTag
-from woo_py.models.product_variation import ProductVariation, VariationStatus
-from woo_py.models.report import SalesReport, TopSellersReport
-from woo_py.models.setting import SettingOption
-from woo_py.models.tax_class import TaxClass
-from woo_py.models.webhook import Webhook, WebhookStatus, WebhookTopic
+# Models are imported from their modules on first access, see __getattr__
+_LAZY_MODELS: dict[str, tuple[str, str]] = {
+    "Coupon": ("coupon", "Coupon"),
+    "Customer": ("customer", "Customer"),
+    "Country": ("data", "Country"),
+    "Currency": ("data", "Currency"),
+    "Order": ("order", "Order"),
+    "OrderStatus": ("order", "OrderStatus"),
+    "OrderNote": ("order_note", "OrderNote"),
+    "OrderRefund": ("order_refund", "OrderRefund"),
+    "PaymentGateway": ("payment_gateway", "PaymentGateway"),
+    "PaymentGatewaySetting": ("payment_gateway", "PaymentGatewaySetting"),
+    "Product": ("product", "Product"),
+    "ProductType": ("product", "ProductType"),
+    "ProductStatus": ("product", "ProductStatus"),
+    "ProductCategoryRef": ("product", "ProductCategory"),
+    "ProductTagRef": ("product", "ProductTag"),
+    "ProductAttribute": ("product_attribute", "ProductAttribute"),
+    "AttributeType": ("product_attribute", "AttributeType"),
+    "AttributeOrderBy": ("product_attribute", "AttributeOrderBy"),
+    "ProductCategory": ("product_category", "ProductCategory"),
+    "ProductCategoryImage": ("product_category", "ProductCategoryImage"),
+    "ProductReview": ("product_review", "ProductReview"),
+    "ReviewStatus": ("product_review", "ReviewStatus"),
+    "ProductTag": ("product_tag", "ProductTag"),
+    "ProductVariation": ("product_variation", "ProductVariation"),
+    "VariationStatus": ("product_variation", "VariationStatus"),
+    "SalesReport": ("report", "SalesReport"),
+    "TopSellersReport": ("report", "TopSellersReport"),
+    "SettingOption": ("setting", "SettingOption"),
+    "TaxClass": ("tax_class", "TaxClass"),
+    "TaxRate": ("tax_rate", "TaxRate"),
+    "Webhook": ("webhook", "Webhook"),
+    "WebhookStatus": ("webhook", "WebhookStatus"),
+    "WebhookTopic": ("webhook", "WebhookTopic"),
+}
+
+
+__all__ = [
+    "WooModel",
+    "MetaData",
+    "ShippingAddress",
+    "BillingAddress",
+    "TaxLine",
+    "TaxStatus",
+    "FeeLine",
+    "ShippingLine",
+    "LineItem",
+    "Dimensions",
+    "DownloadProperties",
+    # Imported on first access
+    "Coupon",
+    "Customer",
+    "Country",
+    "Currency",
+    "Order",
+    "OrderStatus",
+    "OrderNote",
+    "OrderRefund",
+    "PaymentGateway",
+    "PaymentGatewaySetting",
+    "Product",
+    "ProductType",
+    "ProductStatus",
+    "ProductCategoryRef",
+    "ProductTagRef",
+    "ProductAttribute",
+    "AttributeType",
+    "AttributeOrderBy",
+    "ProductCategory",
+    "ProductCategoryImage",
+    "ProductReview",
+    "ReviewStatus",
+    "ProductTag",
+    "ProductVariation",
+    "VariationStatus",
+    "SalesReport",
+    "TopSellersReport",
+    "SettingOption",
+    "TaxClass",
+    "TaxRate",
+    "Webhook",
+    "WebhookStatus",
+    "WebhookTopic",
+]
+
+
+def __getattr__(name: str) -> typing.Any:
+    if name not in _LAZY_MODELS:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+    module_name, attribute = _LAZY_MODELS[name]
+    value = getattr(importlib.import_module(f"{__name__}.{module_name}"), attribute)
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> list[str]:
+    return sorted({*globals(), *_LAZY_MODELS})
+
+
+if typing.TYPE_CHECKING:
+    from woo_py.models.coupon import Coupon
+    from woo_py.models.customer import Customer
+    from woo_py.models.data import Country, Currency
+    from woo_py.models.order import Order, OrderStatus
+    from woo_py.models.order_note import OrderNote
+    from woo_py.models.order_refund import OrderRefund
+    from woo_py.models.payment_gateway import PaymentGateway, PaymentGatewaySetting
+    from woo_py.models.product import (
+        Product,
+        ProductType,
+        ProductStatus,
+        ProductCategory as ProductCategoryRef,
+        ProductTag as ProductTagRef,
+    )
+    from woo_py.models.product_attribute import (
+        ProductAttribute,
+        AttributeType,
+        AttributeOrderBy,
+    )
+    from woo_py.models.product_category import ProductCategory, ProductCategoryImage
+    from woo_py.models.product_review import ProductReview, ReviewStatus
+    from woo_py.models.product_tag import ProductTag
+    from woo_py.models.product_variation import ProductVariation, VariationStatus
+    from woo_py.models.report import SalesReport, TopSellersReport
+    from woo_py.models.setting import SettingOption
+    from woo_py.models.tax_class import TaxClass
+    from woo_py.models.tax_rate import TaxRate
+    from woo_py.models.webhook import Webhook, WebhookStatus, WebhookTopic
@@ -1,10 +1,9 @@
-from pydantic import BaseModel
 from datetime import datetime
 from enum import Enum
 
 from pydantic_changedetect import ChangeDetectionMixin
 
-from woo_py.models import MetaData
+from woo_py.models import MetaData, WooModel
 
 
 class DiscountType(str, Enum):
@@ -13,7 +12,7 @@ class DiscountType(str, Enum):
     FIXED_PRODUCT = "fixed_product"
 
 
-class Coupon(ChangeDetectionMixin, BaseModel):
+class Coupon(ChangeDetectionMixin, WooModel):
     id: int | None = None
     code: str
     amount: str | None = None
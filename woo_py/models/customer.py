@@ -1,12 +1,11 @@
-from pydantic import BaseModel
 from datetime import datetime
 
 from pydantic_changedetect import ChangeDetectionMixin
 
-from woo_py.models import MetaData, BillingAddress, ShippingAddress
+from woo_py.models import MetaData, BillingAddress, ShippingAddress, WooModel
 
 
-class Customer(ChangeDetectionMixin, BaseModel):
+class Customer(ChangeDetectionMixin, WooModel):
     id: int | None = None
     date_created: datetime | None = None
     date_created_gmt: datetime | None = None
@@ -1,14 +1,15 @@
-from pydantic import BaseModel
 from typing import Dict, List, Optional
 
+from woo_py.models import WooModel
 
-class Country(BaseModel):
+
+class Country(WooModel):
     code: str
     name: str
     states: List[Dict[str, str | int]] | None = None
 
 
-class Currency(BaseModel):
+class Currency(WooModel):
     code: str
     name: str
     symbol: str
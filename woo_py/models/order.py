@@ -1,10 +1,11 @@
 import datetime
 from enum import Enum
 from typing import List, Union
-from pydantic import BaseModel, ConfigDict
+from pydantic import ConfigDict
 from pydantic_changedetect import ChangeDetectionMixin
 
 from woo_py.models import (
+    WooModel,
     MetaData,
     ShippingLine,
     FeeLine,
@@ -27,7 +28,7 @@ class OrderStatus(str, Enum):
     CHECKOUT_DRAFT = "checkout-draft"
 
 
-class CouponLine(BaseModel):
+class CouponLine(WooModel):
     model_config = ConfigDict(coerce_numbers_to_str=True)
     id: int | None = None
     code: str | None = None
@@ -36,13 +37,13 @@ class CouponLine(BaseModel):
     meta_data: list[MetaData] = []
 
 
-class Refund(BaseModel):
+class Refund(WooModel):
     id: int | None = None
     reason: str | None = None
     total: str | None = None
 
 
-class Order(ChangeDetectionMixin, BaseModel):
+class Order(ChangeDetectionMixin, WooModel):
     model_config = ConfigDict(coerce_numbers_to_str=True)
 
     id: int | None = None
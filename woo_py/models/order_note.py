@@ -1,10 +1,11 @@
 import datetime
 
-from pydantic import BaseModel
 from pydantic_changedetect import ChangeDetectionMixin
 
+from woo_py.models import WooModel
 
-class OrderNote(ChangeDetectionMixin, BaseModel):
+
+class OrderNote(ChangeDetectionMixin, WooModel):
     id: int | None = None
     author: str | None = None
     date_created: datetime.datetime | None = None
@@ -1,14 +1,13 @@
 import datetime
 
-from pydantic import BaseModel
 from typing import List, Optional
 
 from pydantic_changedetect import ChangeDetectionMixin
 
-from woo_py.models import MetaData, LineItem, TaxLine, ShippingLine, FeeLine
+from woo_py.models import MetaData, LineItem, TaxLine, ShippingLine, FeeLine, WooModel
 
 
-class OrderRefund(ChangeDetectionMixin, BaseModel):
+class OrderRefund(ChangeDetectionMixin, WooModel):
     id: int | None = None  # Unique identifier for the resource, read-only.
     date_created: datetime.datetime | None = (
         None  # Date the order refund was created, in the site's timezone, read-only.
@@ -1,6 +1,8 @@
 from enum import Enum
 from typing import Any, Dict, List, Literal, Union
-from pydantic import BaseModel, Field
+from pydantic import Field
+
+from woo_py.models import WooModel
 
 
 class PaymentGatewayType(str, Enum):
@@ -17,7 +19,7 @@ class PaymentGatewayType(str, Enum):
     checkbox = "checkbox"
 
 
-class PaymentGatewaySetting(BaseModel):
+class PaymentGatewaySetting(WooModel):
     id: str
     label: str
     description: str | None = None
@@ -32,7 +34,7 @@ class PaymentGatewaySetting(BaseModel):
     options: Dict[str, str | dict[str, Any]] | None = None
 
 
-class PaymentGateway(BaseModel):
+class PaymentGateway(WooModel):
     id: str
     title: str | None = None  # Make title optional since it can be None in responses
     description: str | None = None
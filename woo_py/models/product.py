@@ -1,15 +1,12 @@
 import datetime
 from typing import Literal
 
-from pydantic import BaseModel
-
 
 import datetime
 from enum import Enum
-from pydantic import BaseModel
 from pydantic_changedetect import ChangeDetectionMixin
 
-from woo_py.models import Dimensions, DownloadProperties, MetaData
+from woo_py.models import Dimensions, DownloadProperties, MetaData, WooModel
 
 
 class ProductType(str, Enum):
@@ -51,19 +48,19 @@ class Backorders(str, Enum):
     YES = "yes"
 
 
-class ProductCategory(BaseModel):
+class ProductCategory(WooModel):
     id: int
     name: str
     slug: str
 
 
-class ProductTag(BaseModel):
+class ProductTag(WooModel):
     id: int
     name: str
     slug: str
 
 
-class ProductImage(BaseModel):
+class ProductImage(WooModel):
     id: int
     date_created: datetime.datetime
     date_created_gmt: datetime.datetime
@@ -74,13 +71,13 @@ class ProductImage(BaseModel):
     alt: str
 
 
-class ProductDefaultAttribute(BaseModel):
+class ProductDefaultAttribute(WooModel):
     id: int
     name: str
     option: str
 
 
-class ProductAttribute(BaseModel):
+class ProductAttribute(WooModel):
     id: int
     name: str
     position: int
@@ -89,7 +86,7 @@ class ProductAttribute(BaseModel):
     options: list[ProductDefaultAttribute | str]
 
 
-class Product(ChangeDetectionMixin, BaseModel):
+class Product(ChangeDetectionMixin, WooModel):
     id: int | None = None
     name: str | None = None
     slug: str | None = None
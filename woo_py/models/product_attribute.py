@@ -1,7 +1,8 @@
 from enum import Enum
-from pydantic import BaseModel
 from pydantic_changedetect import ChangeDetectionMixin
 
+from woo_py.models import WooModel
+
 
 class AttributeOrderBy(str, Enum):
     NAME = "name"
@@ -14,7 +15,7 @@ class AttributeType(str, Enum):
     SELECT = "select"
 
 
-class ProductAttribute(ChangeDetectionMixin, BaseModel):
+class ProductAttribute(ChangeDetectionMixin, WooModel):
     id: int | None = None
     name: str
     slug: str | None = None
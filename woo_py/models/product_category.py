@@ -1,9 +1,8 @@
 import datetime
 from enum import Enum
-from pydantic import BaseModel
 from pydantic_changedetect import ChangeDetectionMixin
 
-from woo_py.models import MetaData
+from woo_py.models import MetaData, WooModel
 
 
 class ProductCategoryDisplay(str, Enum):
@@ -13,7 +12,7 @@ class ProductCategoryDisplay(str, Enum):
     BOTH = "both"
 
 
-class ProductCategoryImage(BaseModel):
+class ProductCategoryImage(WooModel):
     id: int | None = None
     date_created: datetime.datetime | None = None
     date_created_gmt: datetime.datetime | None = None
@@ -24,7 +23,7 @@ class ProductCategoryImage(BaseModel):
     alt: str | None = None
 
 
-class ProductCategory(ChangeDetectionMixin, BaseModel):
+class ProductCategory(ChangeDetectionMixin, WooModel):
     id: int | None = None
     name: str
     slug: str | None = None
@@ -1,8 +1,10 @@
 import datetime
 from enum import Enum
-from pydantic import BaseModel, Field
+from pydantic import Field
 from pydantic_changedetect import ChangeDetectionMixin
 
+from woo_py.models import WooModel
+
 
 class ReviewStatus(str, Enum):
     APPROVED = "approved"
@@ -13,7 +15,7 @@ class ReviewStatus(str, Enum):
     UNTRASH = "untrash"
 
 
-class ProductReview(ChangeDetectionMixin, BaseModel):
+class ProductReview(ChangeDetectionMixin, WooModel):
     id: int | None = None
     date_created: datetime.datetime | None = None
     date_created_gmt: datetime.datetime | None = None
@@ -1,8 +1,9 @@
-from pydantic import BaseModel
 from pydantic_changedetect import ChangeDetectionMixin
 
+from woo_py.models import WooModel
 
-class ProductTag(ChangeDetectionMixin, BaseModel):
+
+class ProductTag(ChangeDetectionMixin, WooModel):
     id: int | None = None
     name: str
     slug: str | None = None
@@ -1,9 +1,8 @@
 import datetime
 from enum import Enum
-from pydantic import BaseModel
 from pydantic_changedetect import ChangeDetectionMixin
 
-from woo_py.models import Dimensions, MetaData, DownloadProperties
+from woo_py.models import Dimensions, MetaData, DownloadProperties, WooModel
 
 
 class VariationTaxStatus(str, Enum):
@@ -31,13 +30,13 @@ class VariationStatus(str, Enum):
     PENDING = "pending"
 
 
-class VariationAttribute(BaseModel):
+class VariationAttribute(WooModel):
     id: int | None = None
     name: str | None = None
     option: str | None = None
 
 
-class VariationImage(BaseModel):
+class VariationImage(WooModel):
     id: int | None = None
     date_created: datetime.datetime | None = None
     date_created_gmt: datetime.datetime | None = None
@@ -48,7 +47,7 @@ class VariationImage(BaseModel):
     alt: str | None = None
 
 
-class ProductVariation(ChangeDetectionMixin, BaseModel):
+class ProductVariation(ChangeDetectionMixin, WooModel):
     id: int | None = None
     date_created: datetime.datetime | None = None
     date_created_gmt: datetime.datetime | None = None
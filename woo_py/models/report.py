@@ -1,9 +1,17 @@
 from datetime import datetime
-from pydantic import BaseModel
 from typing import Any, Dict, List
 
+from pydantic import ConfigDict
+
+from woo_py.models import WooModel
+
+REPORT_STATUSES = ("completed", "processing", "on-hold", "refunded")
+"""Order statuses counted in sales reports, like the reports of WooCommerce."""
+
+
+class SalesReport(WooModel):
+    model_config = ConfigDict(coerce_numbers_to_str=True)
 
-class SalesReport(BaseModel):
     total_sales: str | None = None
     net_sales: str | None = None
     average_sales: str | None = None
@@ -11,12 +19,12 @@ class SalesReport(BaseModel):
     total_items: int | None = None
     total_tax: str | None = None
     total_shipping: str | None = None
-    total_refunds: int | None = None
-    total_discount: int | None = None
+    total_refunds: str | None = None
+    total_discount: str | None = None
     total_customers: int | None = None
 
 
-class TopSellersReport(BaseModel):
+class TopSellersReport(WooModel):
     product_id: int | None = None
     name: str | None = None
     quantity: int | None = None
@@ -1,8 +1,9 @@
-from pydantic import BaseModel
 from typing import Any, Dict, List, Optional
 
+from woo_py.models import WooModel
 
-class SettingOption(BaseModel):
+
+class SettingOption(WooModel):
     id: str
     label: str
     description: str | None = None
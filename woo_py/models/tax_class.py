@@ -1,7 +1,8 @@
-from pydantic import BaseModel
 from pydantic_changedetect import ChangeDetectionMixin
 
+from woo_py.models import WooModel
 
-class TaxClass(ChangeDetectionMixin, BaseModel):
+
+class TaxClass(ChangeDetectionMixin, WooModel):
     slug: str | None = None
     name: str
@@ -1,9 +1,11 @@
 from typing import List
-from pydantic import BaseModel, Field
+from pydantic import Field
 from pydantic_changedetect import ChangeDetectionMixin
 
+from woo_py.models import WooModel
 
-class TaxRate(ChangeDetectionMixin, BaseModel):
+
+class TaxRate(ChangeDetectionMixin, WooModel):
     """
     Model representing a WooCommerce Tax Rate.
     """
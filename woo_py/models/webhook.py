@@ -1,10 +1,11 @@
 import datetime
 
-from pydantic import BaseModel
 from enum import Enum
 
 from pydantic_changedetect import ChangeDetectionMixin
 
+from woo_py.models import WooModel
+
 
 class WebhookStatus(str, Enum):
     ACTIVE = "active"
@@ -30,7 +31,7 @@ class WebhookTopic(str, Enum):
     PRODUCT_DELETED = "product.deleted"
 
 
-class Webhook(ChangeDetectionMixin, BaseModel):
+class Webhook(ChangeDetectionMixin, WooModel):
     id: int | None = None
     name: str | None = None
     status: WebhookStatus
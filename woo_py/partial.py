@@ -0,0 +1,62 @@
+"""
+Partial models for responses limited to a subset of fields with _fields.
+"""
+
+import functools
+import typing as t
+
+from pydantic import BaseModel, Field, create_model
+
+T = t.TypeVar("T", bound=BaseModel)
+
+
+@functools.cache
+def partial_model(model: t.Type[T]) -> t.Type[T]:
+    """
+    Get a variant of a model where every field is optional, for validating responses
+    that only contain some of the fields. Built once per model.
+
+    The partial model subclasses the model, so it can be used wherever the model is expected.
+    Fields that were not returned by the API are None.
+    It is typed as the model itself, so type checkers treat those fields as set.
+
+    :param model: The model.
+    :return: The partial model, named Partial<Model>.
+    """
+    fields: dict[str, t.Any] = {
+        name: (
+            t.Optional[info.annotation],  # type: ignore[name-defined]
+            Field(default=None, alias=info.alias, description=info.description),
+        )
+        for name, info in model.model_fields.items()
+    }
+
+    return create_model(  # type: ignore[call-overload,no-any-return]
+        f"Partial{model.__name__}",
+        __base__=model,
+        __module__=model.__module__,
+        **fields,
+    )
+
+
+def fields_param(model: t.Type[BaseModel], fields: t.Iterable[str]) -> list[str]:
+    """
+    Build the _fields query parameter for a model.
+    Python field names are translated to their names in the API, and _links is always left out.
+
+    :param model: The model of the response.
+    :param fields: The fields to request, e.g. ['id', 'sku', 'stock_quantity'].
+    :return: The field names to send.
+    """
+    names = []
+    for name in fields:
+        info = model.model_fields.get(name)
+        if info is not None and info.alias is not None:
+            name = info.alias
+        if name != "_links" and name not in names:
+            names.append(name)
+
+    if not names:
+        raise ValueError("fields must contain at least one field other than _links")
+
+    return names
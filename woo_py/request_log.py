@@ -0,0 +1,80 @@
+"""
+Logging of requests to the WooCommerce API.
+"""
+
+import random
+from dataclasses import dataclass
+
+import httpx
+from loguru import logger
+
+REDACTED_PARAMS = frozenset({"consumer_secret", "oauth_signature"})
+"""Query parameters that are never logged."""
+
+REDACTED_HEADERS = frozenset({"authorization", "cookie"})
+"""Headers that are never logged."""
+
+
+@dataclass
+class RequestLogger:
+    """
+    Logs a line for every finished request, and the request payload for a sample of them.
+
+    Messages are formatted lazily, only if a loguru handler accepts the level,
+    so with debug logging off, logging a request costs next to nothing.
+    """
+
+    level: str = "DEBUG"
+    """Level of the per-request messages."""
+
+    payload_sample_rate: float = 1.0
+    """Fraction of logged requests that include the request headers and body size, between 0 and 1."""
+
+    def log_response(self, response: httpx.Response, elapsed: float) -> None:
+        """
+        Log a finished request.
+
+        :param response: The response of the request.
+        :param elapsed: Seconds the request took.
+        """
+        logger.opt(lazy=True).log(
+            self.level,
+            "{}",
+            lambda: self.format_response(response, elapsed),
+        )
+
+    def format_response(self, response: httpx.Response, elapsed: float) -> str:
+        """
+        Format the message for a finished request, with secrets removed.
+
+        :param response: The response of the request.
+        :param elapsed: Seconds the request took.
+        :return: The message.
+        """
+        request = response.request
+        message = (
+            f"{request.method} {_redact_url(request.url)} -> {response.status_code} "
+            f"in {elapsed * 1000:.1f} ms"
+        )
+
+        if self.payload_sample_rate > 0 and random.random() < self.payload_sample_rate:
+            headers = {
+                key: "[secure]" if key.lower() in REDACTED_HEADERS else value
+                for key, value in request.headers.items()
+            }
+            message += f", headers: {headers}, body: {len(request.content)} bytes"
+
+        return message
+
+
+def _redact_url(url: httpx.URL) -> httpx.URL:
+    """
+    Remove secrets from the query parameters of a URL.
+
+    :param url: The URL.
+    :return: The URL without secrets.
+    """
+    for param in REDACTED_PARAMS:
+        if param in url.params:
+            url = url.copy_set_param(param, "[secure]")
+    return url
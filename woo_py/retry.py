@@ -0,0 +1,126 @@
+"""
+Retry policies for requests to the WooCommerce API.
+"""
+
+import datetime
+import random
+import typing as t
+from dataclasses import dataclass, field
+from email.utils import parsedate_to_datetime
+
+import httpx
+
+RequestMethod = t.Literal["post", "get", "put", "delete"]
+
+
+def _default_max_retries() -> dict[RequestMethod, int]:
+    # Only reads are retried by default. A PUT or DELETE that timed out may still have been applied,
+    # e.g. with stock changes or emails triggered by hooks, and POST is not idempotent at all.
+    return {"get": 3}
+
+
+def parse_retry_after(value: str | None) -> float | None:
+    """
+    Parse a Retry-After header.
+
+    :param value: The header value, either in seconds or as an HTTP date.
+    :return: The number of seconds to wait, or None if the header is missing or invalid.
+    """
+    if not value:
+        return None
+
+    try:
+        return max(float(value), 0.0)
+    except ValueError:
+        pass
+
+    try:
+        retry_at = parsedate_to_datetime(value)
+    except (TypeError, ValueError):
+        return None
+
+    now = datetime.datetime.now(retry_at.tzinfo or datetime.timezone.utc)
+    return max((retry_at - now).total_seconds(), 0.0)
+
+
+@dataclass
+class RetryPolicy:
+    """
+    Decides whenever a failed request is retried, and how long to wait before retrying.
+    Uses exponential backoff with full jitter, and respects the Retry-After header.
+    """
+
+    max_retries: dict[RequestMethod, int] = field(default_factory=_default_max_retries)
+    """Maximum number of retries per HTTP method. Methods that are missing are not retried."""
+
+    retry_statuses: frozenset[int] = frozenset({429, 500, 502, 503, 504})
+    """Response statuses that are retried."""
+
+    retry_exceptions: tuple[t.Type[Exception], ...] = (
+        httpx.TimeoutException,
+        httpx.ConnectError,
+    )
+    """Transport errors that are retried, e.g. connect and read timeouts."""
+
+    backoff_factor: float = 0.5
+    """Base of the exponential backoff, in seconds. The n-th retry waits up to backoff_factor * 2**n."""
+
+    max_backoff: float = 30.0
+    """Maximum backoff between two attempts, in seconds."""
+
+    jitter: bool = True
+    """Whenever to randomize the backoff, so concurrent clients do not retry in lockstep."""
+
+    respect_retry_after: bool = True
+    """Whenever to wait for the time given in the Retry-After header of the response."""
+
+    max_retry_after: float = 120.0
+    """Longest Retry-After that is waited for. Responses asking for longer are not retried."""
+
+    def backoff(self, attempt: int) -> float:
+        """
+        Get the backoff before a retry.
+
+        :param attempt: Number of the failed attempt, starting at 0.
+        :return: Seconds to wait.
+        """
+        backoff = min(self.max_backoff, self.backoff_factor * 2**attempt)
+        if self.jitter:
+            return random.uniform(0, backoff)
+        return backoff
+
+    def get_delay(
+        self,
+        method: RequestMethod,
+        attempt: int,
+        response: httpx.Response | None = None,
+        error: Exception | None = None,
+    ) -> float | None:
+        """
+        Decide whenever a request is retried.
+
+        :param method: The HTTP method of the request.
+        :param attempt: Number of the failed attempt, starting at 0.
+        :param response: The response, if one was received.
+        :param error: The transport error, if no response was received.
+        :return: Seconds to wait before retrying, or None if the request should not be retried.
+        """
+        if attempt >= self.max_retries.get(method, 0):
+            return None
+
+        if error is not None:
+            if isinstance(error, self.retry_exceptions):
+                return self.backoff(attempt)
+            return None
+
+        if response is None or response.status_code not in self.retry_statuses:
+            return None
+
+        if self.respect_retry_after:
+            retry_after = parse_retry_after(response.headers.get("Retry-After"))
+            if retry_after is not None:
+                if retry_after > self.max_retry_after:
+                    return None
+                return retry_after
+
+        return self.backoff(attempt)
@@ -0,0 +1,298 @@
+"""
+Sales reports computed locally from orders and refunds. Requires pip install "woo_py[numpy]".
+"""
+
+import datetime
+import typing as t
+from decimal import Decimal
+
+import numpy as np
+
+from woo_py.frame import DEFAULT_DECIMALS, OrderFrame, parse_money
+from woo_py.models import Order, OrderRefund, SalesReport
+from woo_py.models.report import REPORT_STATUSES
+
+_MEASURES = (
+    "sales",
+    "shipping",
+    "tax",
+    "discount",
+    "orders",
+    "items",
+    "refunds",
+    "refunded_shipping",
+    "refunded_tax",
+    "refunded_items",
+)
+
+_CENT = Decimal("0.01")
+
+
+class SalesReportEngine:
+    """
+    Computes the numbers of the reports/sales endpoint from orders and refunds held locally,
+    e.g. from an IncrementalSync, for any date range and per day or week.
+
+    Like WooCommerce, orders are counted on the day they were created and refunds on the day
+    they were made, both in the site's timezone, and only orders with a status in statuses are included.
+    Every measure is summed per day once, so a report for any range only adds up the days in it.
+
+    Without refunds, the refund totals listed in the orders are counted on the day of the order,
+    and refunded items, shipping and tax are not known.
+    total_customers is not computed, as it counts customer accounts instead of orders.
+    """
+
+    days: np.ndarray
+    """The days with orders or refunds, sorted, datetime64[D]."""
+
+    def __init__(
+        self,
+        frame: OrderFrame,
+        refunds: t.Mapping[int, t.Iterable[OrderRefund]] | None = None,
+        statuses: t.Iterable[str] = REPORT_STATUSES,
+    ) -> None:
+        """
+        Initialize the engine.
+
+        :param frame: The orders.
+        :param refunds: The refunds, by order ID, e.g. from Woo.list_order_refunds.
+        :param statuses: The order statuses to include.
+        """
+        self.decimals = frame.orders.decimals
+        orders = frame.orders
+        created = orders.array("date_created_site")
+        included = orders.categorical("status").isin(*statuses) & ~np.isnat(created)
+        order_days = created[included].astype("datetime64[D]")
+
+        items = frame.line_items
+        item_orders = items.array("order_index")
+        item_included = included[item_orders]
+        coupons = frame.coupon_lines
+        coupon_orders = coupons.array("order_index")
+        coupon_included = included[coupon_orders]
+
+        # Day and value of every measure, summed per day below
+        events: dict[str, tuple[np.ndarray, np.ndarray]] = {
+            "sales": (order_days, orders.array("total")[included]),
+            "shipping": (order_days, orders.array("shipping_total")[included]),
+            "tax": (
+                order_days,
+                orders.array("cart_tax")[included]
+                + orders.array("shipping_tax")[included],
+            ),
+            "orders": (order_days, np.ones(len(order_days), dtype=np.int64)),
+            "items": (
+                created[item_orders[item_included]].astype("datetime64[D]"),
+                items.array("quantity")[item_included],
+            ),
+            "discount": (
+                created[coupon_orders[coupon_included]].astype("datetime64[D]"),
+                coupons.array("discount")[coupon_included],
+            ),
+        }
+
+        if refunds is None:
+            events["refunds"] = (order_days, orders.array("refund_total")[included])
+        else:
+            order_ids = orders.array("id")[included].tolist()
+            events.update(
+                self._refund_events(
+                    [
+                        refund
+                        for order_id in order_ids
+                        for refund in refunds.get(order_id, ())
+                    ]
+                )
+            )
+
+        self.days = np.unique(np.concatenate([days for days, _ in events.values()]))
+        # Cumulative sums per day, with a leading 0, so a range sums up in constant time
+        self._cumulative: dict[str, np.ndarray] = {}
+        for measure in _MEASURES:
+            daily = np.zeros(len(self.days), dtype=np.int64)
+            if measure in events:
+                days, values = events[measure]
+                np.add.at(daily, np.searchsorted(self.days, days), values)
+            self._cumulative[measure] = np.concatenate(([0], np.cumsum(daily)))
+
+    @classmethod
+    def from_orders(
+        cls,
+        orders: t.Iterable[Order],
+        refunds: t.Mapping[int, t.Iterable[OrderRefund]] | None = None,
+        statuses: t.Iterable[str] = REPORT_STATUSES,
+        decimals: int = DEFAULT_DECIMALS,
+    ) -> "SalesReportEngine":
+        """
+        Build the engine from orders.
+
+        :param orders: The orders.
+        :param refunds: The refunds, by order ID.
+        :param statuses: The order statuses to include.
+        :param decimals: Decimal places kept while summing.
+        :return: The engine.
+        """
+        return cls(OrderFrame.from_orders(orders, decimals), refunds, statuses)
+
+    def _refund_events(
+        self, refunds: list[OrderRefund]
+    ) -> dict[str, tuple[np.ndarray, np.ndarray]]:
+        """
+        Get the day and value of the refund measures.
+
+        :param refunds: The refunds of the included orders.
+        :return: The refund measures.
+        """
+        refunds = [refund for refund in refunds if refund.date_created is not None]
+        days = np.array(
+            [refund.date_created.replace(tzinfo=None) for refund in refunds],  # type: ignore[union-attr]
+            dtype="datetime64[D]",
+        )
+
+        # Amounts in refund lines are negative
+        def line_sum(lines: t.Callable[[OrderRefund], list[t.Any]]) -> np.ndarray:
+            counts = [len(lines(refund)) for refund in refunds]
+            values = parse_money(
+                [value for refund in refunds for value in lines(refund)], self.decimals
+            )
+            return -_sum_runs(values, np.array(counts, dtype=np.int64))
+
+        return {
+            "refunds": (
+                days,
+                parse_money([refund.amount for refund in refunds], self.decimals),
+            ),
+            "refunded_shipping": (
+                days,
+                line_sum(lambda refund: [line.total for line in refund.shipping_lines]),
+            ),
+            "refunded_tax": (
+                days,
+                line_sum(
+                    lambda refund: [line.total_tax for line in refund.line_items]
+                    + [line.total_tax for line in refund.shipping_lines]
+                ),
+            ),
+            "refunded_items": (
+                days,
+                np.array(
+                    [
+                        -sum(line.quantity or 0 for line in refund.line_items)
+                        for refund in refunds
+                    ],
+                    dtype=np.int64,
+                ),
+            ),
+        }
+
+    def _sums(self, starts: np.ndarray, ends: np.ndarray) -> dict[str, np.ndarray]:
+        """
+        Sum every measure over ranges of days.
+
+        :param starts: First day of every range, datetime64[D].
+        :param ends: Day after the last day of every range, datetime64[D].
+        :return: The sums per measure, one entry per range.
+        """
+        first = np.searchsorted(self.days, starts)
+        last = np.searchsorted(self.days, ends)
+        return {
+            measure: cumulative[last] - cumulative[first]
+            for measure, cumulative in self._cumulative.items()
+        }
+
+    def _report(self, sums: dict[str, t.Any], days: int) -> SalesReport:
+        """
+        Build a report from the sums of a range.
+
+        :param sums: The sum of every measure.
+        :param days: Number of days in the range.
+        :return: The report.
+        """
+
+        def money(value: t.Any) -> Decimal:
+            return Decimal(int(value)).scaleb(-self.decimals)
+
+        refunds = money(sums["refunds"])
+        total_sales = money(sums["sales"]) - refunds
+        total_shipping = money(sums["shipping"]) - money(sums["refunded_shipping"])
+        total_tax = money(sums["tax"]) - money(sums["refunded_tax"])
+        net_sales = total_sales - total_shipping - max(total_tax, Decimal(0))
+
+        return SalesReport(
+            total_sales=str(total_sales.quantize(_CENT)),
+            net_sales=str(net_sales.quantize(_CENT)),
+            average_sales=str((net_sales / max(days, 1)).quantize(_CENT)),
+            total_orders=int(sums["orders"]),
+            total_items=int(sums["items"] - sums["refunded_items"]),
+            total_tax=str(total_tax.quantize(_CENT)),
+            total_shipping=str(total_shipping.quantize(_CENT)),
+            total_refunds=str(refunds.quantize(_CENT)),
+            total_discount=str(money(sums["discount"]).quantize(_CENT)),
+        )
+
+    def report(self, date_min: datetime.date, date_max: datetime.date) -> SalesReport:
+        """
+        Compute the report of a date range, like Woo.get_sales_report with date_min and date_max.
+
+        :param date_min: First day of the range, in the site's timezone.
+        :param date_max: Last day of the range, included.
+        :return: The report. average_sales is the average net sales per day.
+        """
+        start = np.datetime64(date_min, "D")
+        end = np.datetime64(date_max, "D") + 1
+        sums = self._sums(np.array([start]), np.array([end]))
+        return self._report(
+            {measure: values[0] for measure, values in sums.items()},
+            int((end - start).astype(int)),
+        )
+
+    def buckets(
+        self,
+        date_min: datetime.date,
+        date_max: datetime.date,
+        interval: t.Literal["day", "week"] = "day",
+    ) -> dict[datetime.date, SalesReport]:
+        """
+        Compute a report per day or week of a date range.
+
+        :param date_min: First day of the range, in the site's timezone.
+        :param date_max: Last day of the range, included.
+        :param interval: Length of the buckets. Weeks start on Monday, the first and last
+            week are cut to the range.
+        :return: The reports by the first day of their bucket, including empty ones.
+        """
+        start = np.datetime64(date_min, "D")
+        end = np.datetime64(date_max, "D") + 1
+        if interval == "day":
+            starts = np.arange(start, end)
+        elif interval == "week":
+            # 1970-01-01 was a Thursday
+            monday = start - (start.astype(np.int64) + 3) % 7
+            starts = np.maximum(np.arange(monday, end, 7), start)
+        else:
+            raise ValueError(f"Unknown interval: {interval}")
+
+        ends = np.append(starts[1:], end)
+        sums = self._sums(starts, ends)
+        lengths = (ends - starts).astype(np.int64)
+
+        return {
+            day: self._report(
+                {measure: values[index] for measure, values in sums.items()},
+                int(lengths[index]),
+            )
+            for index, day in enumerate(starts.tolist())
+        }
+
+
+def _sum_runs(values: np.ndarray, counts: np.ndarray) -> np.ndarray:
+    """
+    Sum consecutive runs of values.
+
+    :param values: The values, run after run.
+    :param counts: Length of every run, may be 0.
+    :return: The sum of every run.
+    """
+    ends = np.cumsum(counts)
+    cumulative = np.concatenate(([0], np.cumsum(values)))
+    return cumulative[ends] - cumulative[ends - counts]
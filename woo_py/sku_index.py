@@ -0,0 +1,146 @@
+"""
+In-memory index of SKUs, for resolving them to products and variations without requests.
+"""
+
+import datetime
+import threading
+import typing as t
+from dataclasses import dataclass
+
+if t.TYPE_CHECKING:
+    from woo_py.models.product import Product
+    from woo_py.models.product_variation import ProductVariation
+
+SKU_FIELDS = ["id", "sku", "parent_id", "type", "date_modified_gmt"]
+"""Fields requested for filling the index."""
+
+
+@dataclass(frozen=True)
+class SkuLocation:
+    """
+    Where a SKU belongs: a product, or a variation of a product.
+    """
+
+    product_id: int
+    """ID of the product, or of the parent product for variations."""
+
+    variation_id: int | None = None
+    """ID of the variation, None for products."""
+
+
+class SkuIndex:
+    """
+    Maps SKUs to products and variations.
+
+    The index is filled and updated by Woo.update_sku_index, and by every remote lookup
+    of Woo.resolve_skus. It is thread-safe.
+    """
+
+    updated_gmt: datetime.datetime | None
+    """The latest modification date (GMT) of the indexed products. None if the index was never built."""
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self._locations: dict[str, SkuLocation] = {}
+        self._skus: dict[SkuLocation, str] = {}
+        self._variations: dict[int, set[SkuLocation]] = {}
+        self.updated_gmt = None
+
+    def __len__(self) -> int:
+        return len(self._locations)
+
+    def __contains__(self, sku: object) -> bool:
+        return sku in self._locations
+
+    def get(self, sku: str) -> SkuLocation | None:
+        """
+        Look up a SKU.
+
+        :param sku: The SKU.
+        :return: Where the SKU belongs, or None if it is not indexed.
+        """
+        return self._locations.get(sku)
+
+    def set(self, sku: str | None, location: SkuLocation) -> None:
+        """
+        Index the SKU of a product or variation, replacing its previous SKU.
+
+        :param sku: The SKU. Empty or None only removes the previous SKU.
+        :param location: The product or variation.
+        """
+        with self._lock:
+            self._set(sku, location)
+
+    def _set(self, sku: str | None, location: SkuLocation) -> None:
+        previous = self._skus.pop(location, None)
+        if previous is not None and self._locations.get(previous) == location:
+            del self._locations[previous]
+
+        if location.variation_id is not None:
+            variations = self._variations.setdefault(location.product_id, set())
+            if sku:
+                variations.add(location)
+            else:
+                variations.discard(location)
+
+        if sku:
+            replaced = self._locations.get(sku)
+            if replaced is not None:
+                self._skus.pop(replaced, None)
+            self._locations[sku] = location
+            self._skus[location] = sku
+
+    def add_products(self, products: "t.Iterable[Product]") -> None:
+        """
+        Index products, and variations returned by SKU searches.
+
+        :param products: Products with at least id, sku and parent_id set.
+        """
+        with self._lock:
+            for product in products:
+                if product.id is None:
+                    continue
+
+                if product.parent_id:
+                    # Searching by SKU returns variations too
+                    self._set(product.sku, SkuLocation(product.parent_id, product.id))
+                    continue
+
+                self._set(product.sku, SkuLocation(product.id))
+
+                modified = product.date_modified_gmt
+                if modified is not None:
+                    modified = modified.replace(tzinfo=None, microsecond=0)
+                    if self.updated_gmt is None or modified > self.updated_gmt:
+                        self.updated_gmt = modified
+
+    def add_variations(
+        self, product_id: int, variations: "t.Iterable[ProductVariation]"
+    ) -> None:
+        """
+        Index the variations of a product, removing its variations that are not in the list.
+
+        :param product_id: ID of the product.
+        :param variations: All variations of the product, with at least id and sku set.
+        """
+        variations = list(variations)
+        current = {variation.id for variation in variations}
+
+        with self._lock:
+            for location in list(self._variations.get(product_id, ())):
+                if location.variation_id not in current:
+                    self._set(None, location)
+
+            for variation in variations:
+                if variation.id is not None:
+                    self._set(variation.sku, SkuLocation(product_id, variation.id))
+
+    def clear(self) -> None:
+        """
+        Remove all SKUs from the index.
+        """
+        with self._lock:
+            self._locations.clear()
+            self._skus.clear()
+            self._variations.clear()
+            self.updated_gmt = None
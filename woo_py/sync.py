@@ -0,0 +1,535 @@
+"""
+Incremental synchronisation of WooCommerce resources, driven by modified_after.
+"""
+
+import abc
+import datetime
+import json
+import os
+import sqlite3
+import threading
+import typing as t
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field
+from pathlib import Path
+
+from loguru import logger
+from pydantic import BaseModel
+
+from woo_py.api import API, GMT_FORMAT
+from woo_py.models import Order
+from woo_py.models.coupon import Coupon
+from woo_py.models.customer import Customer
+from woo_py.models.product import Product
+from woo_py.models.product_variation import ProductVariation
+
+
+@dataclass
+class SyncResource:
+    """
+    A resource that can be synchronised incrementally.
+    """
+
+    endpoint: str
+    """The list endpoint. For variations, contains a {product_id} placeholder."""
+
+    model: t.Type[BaseModel]
+    """The model of the resource."""
+
+    modified_after: bool = True
+    """Whenever the endpoint supports the modified_after filter. If not, all objects are
+    fetched and the changed ones are picked out locally, then passed on sorted."""
+
+    params: dict[str, t.Any] = field(default_factory=dict)
+    """Additional query parameters."""
+
+
+RESOURCES: dict[str, SyncResource] = {
+    "orders": SyncResource("orders", Order, params={"orderby": "modified"}),
+    "products": SyncResource("products", Product, params={"orderby": "modified"}),
+    "variations": SyncResource(
+        "products/{product_id}/variations",
+        ProductVariation,
+        params={"orderby": "modified"},
+    ),
+    "customers": SyncResource("customers", Customer, modified_after=False),
+    "coupons": SyncResource("coupons", Coupon, params={"orderby": "modified"}),
+}
+"""Resources supported by IncrementalSync, by name."""
+
+
+@dataclass
+class Checkpoint:
+    """
+    The high-water mark of a resource: how far it has been synchronised.
+    """
+
+    modified_gmt: datetime.datetime
+    """The latest modification date (GMT) of the synchronised objects."""
+
+    ids: list[int] = field(default_factory=list)
+    """IDs of the synchronised objects modified exactly at modified_gmt.
+    The API compares dates with a precision of one second, so objects modified in the
+    same second as the checkpoint are fetched again, and these are skipped."""
+
+    def to_json(self) -> dict[str, t.Any]:
+        """
+        Convert the checkpoint to JSON compatible data.
+
+        :return: The checkpoint as a dict.
+        """
+        return {
+            "modified_gmt": self.modified_gmt.strftime(GMT_FORMAT),
+            "ids": self.ids,
+        }
+
+    @classmethod
+    def from_json(cls, data: dict[str, t.Any]) -> "Checkpoint":
+        """
+        Load a checkpoint from the data of to_json.
+
+        :param data: The checkpoint as a dict.
+        :return: The checkpoint.
+        """
+        return cls(
+            modified_gmt=datetime.datetime.strptime(data["modified_gmt"], GMT_FORMAT),
+            ids=list(data.get("ids", [])),
+        )
+
+
+class CheckpointStore(abc.ABC):
+    """
+    Durable storage of checkpoints, by resource name.
+    """
+
+    @abc.abstractmethod
+    def load(self, resource: str) -> Checkpoint | None:
+        """
+        Load the checkpoint of a resource.
+
+        :param resource: Name of the resource.
+        :return: The checkpoint, or None if the resource was never synchronised.
+        """
+
+    @abc.abstractmethod
+    def save(self, resource: str, checkpoint: Checkpoint) -> None:
+        """
+        Save the checkpoint of a resource.
+
+        :param resource: Name of the resource.
+        :param checkpoint: The checkpoint.
+        """
+
+
+class FileCheckpointStore(CheckpointStore):
+    """
+    Keeps the checkpoints of all resources in a JSON file.
+    The file is replaced atomically, so a crash never leaves a half written checkpoint.
+    """
+
+    path: Path
+    """Path of the JSON file."""
+
+    def __init__(self, path: str | os.PathLike[str]) -> None:
+        """
+        Initialize the store.
+
+        :param path: Path of the JSON file. Created on the first save.
+        """
+        self.path = Path(path)
+        self._lock = threading.Lock()
+
+    def _read(self) -> dict[str, t.Any]:
+        if not self.path.exists():
+            return {}
+        return json.loads(self.path.read_text())
+
+    def load(self, resource: str) -> Checkpoint | None:
+        with self._lock:
+            data = self._read().get(resource)
+        if data is None:
+            return None
+        return Checkpoint.from_json(data)
+
+    def save(self, resource: str, checkpoint: Checkpoint) -> None:
+        with self._lock:
+            data = self._read()
+            data[resource] = checkpoint.to_json()
+
+            temporary = self.path.with_suffix(self.path.suffix + ".tmp")
+            temporary.write_text(json.dumps(data, indent=2))
+            os.replace(temporary, self.path)
+
+
+class SQLiteCheckpointStore(CheckpointStore):
+    """
+    Keeps the checkpoints of all resources in a table of an SQLite database.
+    """
+
+    path: str
+    """Path of the database."""
+
+    def __init__(
+        self, path: str | os.PathLike[str], table: str = "woo_py_checkpoints"
+    ) -> None:
+        """
+        Initialize the store, creating the table if needed.
+
+        :param path: Path of the database. Can be shared with other data.
+        :param table: Name of the table.
+        """
+        self.path = os.fspath(path)
+        self._table = table
+        self._lock = threading.Lock()
+        self._connection = sqlite3.connect(self.path, check_same_thread=False)
+
+        with self._lock, self._connection:
+            self._connection.execute(
+                f"CREATE TABLE IF NOT EXISTS {self._table} ("
+                "resource TEXT PRIMARY KEY, modified_gmt TEXT NOT NULL, ids TEXT NOT NULL)"
+            )
+
+    def load(self, resource: str) -> Checkpoint | None:
+        with self._lock:
+            row = self._connection.execute(
+                f"SELECT modified_gmt, ids FROM {self._table} WHERE resource = ?",
+                (resource,),
+            ).fetchone()
+        if row is None:
+            return None
+        return Checkpoint.from_json({"modified_gmt": row[0], "ids": json.loads(row[1])})
+
+    def save(self, resource: str, checkpoint: Checkpoint) -> None:
+        data = checkpoint.to_json()
+        with self._lock, self._connection:
+            self._connection.execute(
+                f"INSERT OR REPLACE INTO {self._table} (resource, modified_gmt, ids) "
+                "VALUES (?, ?, ?)",
+                (resource, data["modified_gmt"], json.dumps(data["ids"])),
+            )
+
+    def close(self) -> None:
+        """
+        Close the database connection.
+        """
+        self._connection.close()
+
+
+class IncrementalSync:
+    """
+    Fetches the objects changed since the last run, keeping a checkpoint per resource.
+
+    Every run requests the objects modified after the checkpoint and passes them on in the
+    order they were modified, a page at a time. Each page is requested after the last object
+    of the previous one, rather than by page number. The checkpoint is advanced once a page has
+    been passed on completely, so a failed run is repeated by the next one from the last complete
+    page: objects are delivered at least once.
+    """
+
+    api_object: API
+    """The API client to use."""
+
+    store: CheckpointStore
+    """Where the checkpoints are kept."""
+
+    page_concurrency: int
+    """Number of products whose variations are fetched at the same time."""
+
+    per_page: int
+    """Number of objects per page."""
+
+    initial_modified_after: datetime.datetime | None
+    """Where to start for resources without a checkpoint. None fetches all objects."""
+
+    def __init__(
+        self,
+        api_object: API,
+        store: CheckpointStore,
+        page_concurrency: int = 4,
+        per_page: int = 100,
+        initial_modified_after: datetime.datetime | None = None,
+    ) -> None:
+        """
+        Initialize the sync.
+
+        :param api_object: The API client to use.
+        :param store: Where the checkpoints are kept, e.g. FileCheckpointStore or SQLiteCheckpointStore.
+        :param page_concurrency: Number of products whose variations are fetched at the same time.
+        Pages of a resource are fetched one after another, each starting after the previous one.
+        :param per_page: Number of objects per page, up to 100.
+        :param initial_modified_after: Where to start (GMT) for resources without a checkpoint.
+        None fetches all objects on the first run.
+        """
+        self.api_object = api_object
+        self.store = store
+        self.page_concurrency = page_concurrency
+        self.per_page = per_page
+        self.initial_modified_after = initial_modified_after
+
+    def pages(self, resource: str) -> t.Iterator[list[BaseModel]]:
+        """
+        Iterate over the pages of objects of a resource changed since the last run, oldest change first.
+        The checkpoint is saved when the next page is requested, so it only covers pages that
+        were processed completely; stopping early keeps the checkpoint of the last processed page.
+
+        :param resource: One of 'orders', 'products', 'variations', 'customers' and 'coupons'.
+        :return: An iterator of the pages of changed objects.
+        """
+        spec = RESOURCES[resource]
+        checkpoint = self.store.load(resource)
+
+        count = 0
+        for page, new_checkpoint in self._changed_pages(spec, checkpoint):
+            yield page
+            # Only reached once the caller asks for the page after this one
+            self.store.save(resource, new_checkpoint)
+            count += len(page)
+
+        logger.info("Sync of {}: {} changed objects", resource, count)
+
+    def changes(self, resource: str) -> t.Iterator[BaseModel]:
+        """
+        Iterate over the objects of a resource changed since the last run, oldest change first.
+        The checkpoint is saved after every page, once all its objects have been consumed;
+        stopping early keeps the checkpoint of the last consumed page.
+
+        :param resource: One of 'orders', 'products', 'variations', 'customers' and 'coupons'.
+        :return: An iterator of the changed objects.
+        """
+        for page in self.pages(resource):
+            yield from page
+
+    def run(self, resource: str, callback: t.Callable[[BaseModel], None]) -> int:
+        """
+        Pass the objects of a resource changed since the last run to a callback, oldest change first.
+        If the callback raises, the checkpoint stays at the last page passed on completely.
+
+        :param resource: One of 'orders', 'products', 'variations', 'customers' and 'coupons'.
+        :param callback: Called with every changed object.
+        :return: The number of changed objects.
+        """
+        count = 0
+        for item in self.changes(resource):
+            callback(item)
+            count += 1
+        return count
+
+    def _since(self, checkpoint: Checkpoint | None) -> datetime.datetime | None:
+        """
+        Get the date objects must be modified after.
+
+        :param checkpoint: The checkpoint, None for the first run.
+        :return: The date, or None to fetch all objects.
+        """
+        if checkpoint is not None:
+            return checkpoint.modified_gmt
+        return self.initial_modified_after
+
+    def _params(
+        self, spec: SyncResource, since: datetime.datetime | None
+    ) -> dict[str, t.Any]:
+        """
+        Get the query parameters for the objects modified after a date.
+
+        :param spec: The resource.
+        :param since: The date objects must be modified after, None for all objects.
+        :return: The query parameters.
+        """
+        params: dict[str, t.Any] = {
+            **spec.params,
+            "per_page": self.per_page,
+            "order": "asc",
+        }
+        if since is not None and spec.modified_after:
+            # modified_after is exclusive and precise to the second, so include the checkpoint's second
+            params["modified_after"] = (since - datetime.timedelta(seconds=1)).strftime(
+                GMT_FORMAT
+            )
+            params["dates_are_gmt"] = True
+        return params
+
+    def _changed_pages(
+        self, spec: SyncResource, checkpoint: Checkpoint | None
+    ) -> t.Iterator[tuple[list[BaseModel], Checkpoint]]:
+        """
+        Fetch the objects changed after a checkpoint, a page at a time.
+
+        :param spec: The resource.
+        :param checkpoint: The checkpoint, None for the first run.
+        :return: An iterator of the pages, sorted by modification date,
+            each with the checkpoint after passing it on.
+        """
+        if spec.modified_after and "{product_id}" not in spec.endpoint:
+            yield from self._keyset_pages(spec, checkpoint)
+            return
+
+        # Without a single list ordered by modification date, collect the changed objects first
+        since = self._since(checkpoint)
+        params = self._params(spec, since)
+        if "{product_id}" in spec.endpoint:
+            items: t.Iterable[BaseModel] = self._fetch_variations(spec, params)
+        else:
+            items = self.api_object.iter_all(spec.endpoint, spec.model, **params)
+
+        changed = self._select_changed(items, checkpoint, since)
+        for start in range(0, len(changed), self.per_page):
+            page = changed[start : start + self.per_page]
+            checkpoint = self._advance(checkpoint, page)
+            yield page, checkpoint
+
+    def _keyset_pages(
+        self, spec: SyncResource, checkpoint: Checkpoint | None
+    ) -> t.Iterator[tuple[list[BaseModel], Checkpoint]]:
+        """
+        Fetch the objects changed after a checkpoint using keyset pagination: every page is
+        requested with modified_after set to the latest object passed on, instead of by page number,
+        so objects modified during the run do not shift the pages. The IDs of the checkpoint
+        break ties between objects modified in the same second.
+
+        :param spec: The resource, ordered by modification date.
+        :param checkpoint: The checkpoint, None for the first run.
+        :return: An iterator of the pages, each with the checkpoint after passing it on.
+        """
+        page_number = 1
+        while True:
+            since = self._since(checkpoint)
+            items = self.api_object.get_all(
+                spec.endpoint,
+                spec.model,
+                page=page_number,
+                **self._params(spec, since),
+            )
+
+            changed = self._select_changed(items, checkpoint, since)
+            previous = checkpoint
+            if changed:
+                checkpoint = self._advance(checkpoint, changed)
+                yield changed, checkpoint
+
+            if len(items) < self.per_page:
+                break
+
+            if (
+                previous is not None
+                and checkpoint is not None
+                and checkpoint.modified_gmt == previous.modified_gmt
+            ):
+                # A full page in the checkpoint's second: the same query continues on its next page
+                page_number += 1
+            else:
+                page_number = 1
+
+    def _fetch_variations(
+        self, spec: SyncResource, params: dict[str, t.Any]
+    ) -> list[BaseModel]:
+        """
+        Fetch the changed variations of all variable products.
+
+        :param spec: The variations resource.
+        :param params: Query parameters for each product's variations.
+        :return: The variations.
+        """
+        products = self.api_object.iter_all(
+            "products",
+            Product,
+            per_page=self.per_page,
+            type="variable",
+            fields=["id"],
+        )
+
+        def fetch_product(product: Product) -> list[BaseModel]:
+            endpoint = spec.endpoint.format(product_id=product.id)
+            # Pages of a single product are fetched one after another, products are fetched concurrently
+            return self.api_object.get_all(
+                endpoint, spec.model, follow_pages=True, page_concurrency=1, **params
+            )
+
+        with ThreadPoolExecutor(max_workers=max(self.page_concurrency, 1)) as executor:
+            return [
+                variation
+                for variations in executor.map(fetch_product, products)
+                for variation in variations
+            ]
+
+    @classmethod
+    def _select_changed(
+        cls,
+        items: t.Iterable[BaseModel],
+        checkpoint: Checkpoint | None,
+        since: datetime.datetime | None,
+    ) -> list[BaseModel]:
+        """
+        Pick out the objects changed after a checkpoint.
+
+        :param items: The fetched objects.
+        :param checkpoint: The checkpoint, None for the first run.
+        :param since: The date objects must be modified after.
+        :return: The changed objects, sorted by modification date and ID.
+        """
+        # Pages can shift while they are fetched, so an object may be returned twice
+        unique: dict[int | None, BaseModel] = {}
+        for item in items:
+            unique[getattr(item, "id", None)] = item
+
+        changed = [
+            item for item in unique.values() if cls._is_changed(item, checkpoint, since)
+        ]
+        changed.sort(
+            key=lambda item: (_modified_gmt(item), getattr(item, "id", 0) or 0)
+        )
+        return changed
+
+    @staticmethod
+    def _is_changed(
+        item: BaseModel,
+        checkpoint: Checkpoint | None,
+        since: datetime.datetime | None,
+    ) -> bool:
+        """
+        Check whenever an object was changed after the checkpoint.
+
+        :param item: The object.
+        :param checkpoint: The checkpoint, None for the first run.
+        :param since: The date objects must be modified after.
+        :return: Whenever the object should be passed on.
+        """
+        modified = _modified_gmt(item)
+        if since is None:
+            return True
+        if modified < since:
+            return False
+        if modified == since and checkpoint is not None:
+            # Same-second tie with the checkpoint, skip the objects passed on already
+            return getattr(item, "id", None) not in checkpoint.ids
+        return True
+
+    @staticmethod
+    def _advance(checkpoint: Checkpoint | None, changed: list[BaseModel]) -> Checkpoint:
+        """
+        Get the checkpoint after passing on the changed objects.
+
+        :param checkpoint: The previous checkpoint.
+        :param changed: The changed objects, sorted by modification date. At least one.
+        :return: The new checkpoint.
+        """
+        latest = _modified_gmt(changed[-1])
+        ids = [
+            item.id  # type: ignore[attr-defined]
+            for item in changed
+            if _modified_gmt(item) == latest
+        ]
+        if checkpoint is not None and checkpoint.modified_gmt == latest:
+            ids = checkpoint.ids + ids
+
+        return Checkpoint(modified_gmt=latest, ids=ids)
+
+
+def _modified_gmt(item: BaseModel) -> datetime.datetime:
+    """
+    Get the modification date (GMT) of an object, without timezone and microseconds.
+
+    :param item: The object.
+    :return: The date, or the minimum date if it is missing.
+    """
+    modified = getattr(item, "date_modified_gmt", None) or datetime.datetime.min
+    return modified.replace(tzinfo=None, microsecond=0)
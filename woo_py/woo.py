@@ -1,25 +1,35 @@
+from __future__ import annotations
+
+import datetime
 import typing as t
 from pydantic import BaseModel
 
-from woo_py.models import Order
-from woo_py.models.coupon import Coupon
-from woo_py.models.customer import Customer
-from woo_py.models.product import Product
-from woo_py.models.product_variation import ProductVariation
-from woo_py.models.product_category import ProductCategory
-from woo_py.models.product_tag import ProductTag
-from woo_py.models.product_attribute import ProductAttribute
-from woo_py.models.product_review import ProductReview
-from woo_py.models.payment_gateway import PaymentGateway
-from woo_py.models.report import SalesReport, TopSellersReport
-from woo_py.models.setting import SettingOption
-from woo_py.models.data import Country, Currency
-from woo_py.models.tax_class import TaxClass
-from woo_py.models.tax_rate import TaxRate
-from woo_py.models.webhook import Webhook
-from woo_py.models.order_refund import OrderRefund
-
-from woo_py.api import API, PaginatedResponse
+# Models are only imported when a method first needs them, see woo_py.models
+from woo_py import models
+
+from woo_py.api import API, GMT_FORMAT, BatchResponse, PaginatedResponse
+from woo_py.lazy import LazyList
+from woo_py.sku_index import SKU_FIELDS, SkuIndex, SkuLocation
+
+if t.TYPE_CHECKING:
+    from woo_py.cache import MemoCache
+    from woo_py.models import Order
+    from woo_py.models.coupon import Coupon
+    from woo_py.models.customer import Customer
+    from woo_py.models.product import Product, ProductType
+    from woo_py.models.product_variation import ProductVariation
+    from woo_py.models.product_category import ProductCategory
+    from woo_py.models.product_tag import ProductTag
+    from woo_py.models.product_attribute import ProductAttribute
+    from woo_py.models.product_review import ProductReview
+    from woo_py.models.payment_gateway import PaymentGateway
+    from woo_py.models.report import SalesReport, TopSellersReport
+    from woo_py.models.setting import SettingOption
+    from woo_py.models.data import Country, Currency
+    from woo_py.models.tax_class import TaxClass
+    from woo_py.models.tax_rate import TaxRate
+    from woo_py.models.webhook import Webhook
+    from woo_py.models.order_refund import OrderRefund
 
 ContextType = t.Literal["view", "edit"]
 OrderType = t.Literal["asc", "desc"]
@@ -32,8 +42,54 @@ class Woo:
 
     api_object: API
 
-    def __init__(self, api_object: API) -> None:
+    cache: MemoCache | None
+    """Cache for reference data, e.g. countries, settings and tax rates. None disables it."""
+
+    sku_index: SkuIndex
+    """Index of SKUs used by resolve_skus."""
+
+    def __init__(
+        self,
+        api_object: API,
+        cache: MemoCache | None = None,
+        sku_index: SkuIndex | None = None,
+    ) -> None:
         self.api_object = api_object
+        self.cache = cache
+        self.sku_index = sku_index if sku_index is not None else SkuIndex()
+
+    def _get_cached(self, endpoint: str, key: t.Hashable) -> t.Any | None:
+        """
+        Get a result from the cache, if one is used.
+
+        :param endpoint: The endpoint the result belongs to.
+        :param key: The arguments the result was requested with.
+        :return: The cached result, or None if it is not cached.
+        """
+        if self.cache is None:
+            return None
+
+        return self.cache.get(endpoint, key)
+
+    def _set_cached(self, endpoint: str, key: t.Hashable, value: t.Any) -> None:
+        """
+        Store a result in the cache, if one is used.
+
+        :param endpoint: The endpoint the result belongs to.
+        :param key: The arguments the result was requested with.
+        :param value: The result.
+        """
+        if self.cache is not None:
+            self.cache.set(endpoint, key, value)
+
+    def _invalidate_cached(self, endpoint: str) -> None:
+        """
+        Remove the cached results of an endpoint after it was changed.
+
+        :param endpoint: The endpoint.
+        """
+        if self.cache is not None:
+            self.cache.invalidate(endpoint)
 
     # Coupons
     def create_coupon(self, coupon: Coupon) -> Coupon:
@@ -44,13 +100,17 @@ class Woo:
         """
         return self.api_object.post("coupons", coupon)
 
-    def get_coupon(self, coupon_id: int) -> Coupon | None:
+    def get_coupon(
+        self, coupon_id: int, fields: list[str] | None = None
+    ) -> Coupon | None:
         """
         Gets a coupon by its ID.
         :param coupon_id: id of the coupon
+        :param fields: Only return these fields, e.g. ["id", "code", "amount"]. Other fields of the returned objects are None.
+        The objects are still typed as the full model, so type checkers do not flag those fields as optional.
         :return:
         """
-        return self.api_object.get(f"coupons/{coupon_id}", Coupon)
+        return self.api_object.get(f"coupons/{coupon_id}", models.Coupon, fields=fields)
 
     @t.overload
     def list_coupons(
@@ -70,6 +130,8 @@ class Woo:
         *,
         follow_pages: t.Literal[False] = False,
         return_metadata: t.Literal[True],
+        lazy: t.Literal[False] = False,
+        fields: list[str] | None = None,
     ) -> PaginatedResponse[Coupon]: ...
 
     @t.overload
@@ -90,6 +152,8 @@ class Woo:
         *,
         follow_pages: t.Literal[False] = False,
         return_metadata: t.Literal[False] = False,
+        lazy: t.Literal[False] = False,
+        fields: list[str] | None = None,
     ) -> list[Coupon]: ...
 
     @t.overload
@@ -110,8 +174,32 @@ class Woo:
         *,
         follow_pages: t.Literal[True],
         return_metadata: t.Literal[False] = False,
+        lazy: t.Literal[False] = False,
+        fields: list[str] | None = None,
     ) -> list[Coupon]: ...
 
+    @t.overload
+    def list_coupons(
+        self,
+        context: ContextType = None,
+        page: int = None,
+        per_page: int = None,
+        search: str | None = None,
+        after: str | None = None,
+        before: str | None = None,
+        exclude: list[int] | None = None,
+        include: list[int] | None = None,
+        offset: int = None,
+        order: OrderType = None,
+        orderby: t.Literal["date", "modified", "id", "include", "title", "slug"] = None,
+        code: str | None = None,
+        *,
+        follow_pages: bool = False,
+        return_metadata: t.Literal[False] = False,
+        lazy: t.Literal[True],
+        fields: list[str] | None = None,
+    ) -> LazyList[Coupon]: ...
+
     def list_coupons(
         self,
         context: ContextType = None,
@@ -128,12 +216,17 @@ class Woo:
         code: str | None = None,
         follow_pages: bool = False,
         return_metadata: bool = False,
-    ) -> list[Coupon] | PaginatedResponse[Coupon]:
+        lazy: bool = False,
+        fields: list[str] | None = None,
+    ) -> list[Coupon] | LazyList[Coupon] | PaginatedResponse[Coupon]:
         """
         Lists all coupons.
 
         :param follow_pages: Whether to automatically follow pagination and get all pages. Defaults to False.
         :param return_metadata: If True, returns a PaginatedResponse with metadata instead of just a list. Cannot be used with follow_pages=True.
+        :param lazy: If True, returns a LazyList that validates each item only when it is accessed.
+        :param fields: Only return these fields, e.g. ["id", "code", "amount"]. Other fields of the returned objects are None.
+        The objects are still typed as the full model, so type checkers do not flag those fields as optional.
         :return: A list of Coupon objects or a PaginatedResponse containing the list and pagination metadata.
         """
         if follow_pages and return_metadata:
@@ -158,12 +251,59 @@ class Woo:
 
         return self.api_object.get_all(
             "coupons",
-            Coupon,
+            models.Coupon,
             follow_pages=follow_pages,
             include_metadata=return_metadata,
+            lazy=lazy,
+            fields=fields,
             **params,
         )
 
+    def iter_coupons(
+        self,
+        context: ContextType = None,
+        page: int = None,
+        per_page: int = None,
+        search: str | None = None,
+        after: str | None = None,
+        before: str | None = None,
+        exclude: list[int] | None = None,
+        include: list[int] | None = None,
+        offset: int = None,
+        order: OrderType = None,
+        orderby: t.Literal["date", "modified", "id", "include", "title", "slug"] = None,
+        code: str | None = None,
+        fields: list[str] | None = None,
+    ) -> t.Iterator[Coupon]:
+        """
+        Iterates over all coupons, fetching one page at a time.
+        Accepts the same filters as list_coupons.
+
+        :param fields: Only return these fields, e.g. ["id", "code", "amount"]. Other fields of the returned objects are None.
+        The objects are still typed as the full model, so type checkers do not flag those fields as optional.
+        :return: An iterator of Coupon objects.
+        """
+        params = {
+            "context": context,
+            "page": page,
+            "per_page": per_page,
+            "search": search,
+            "after": after,
+            "before": before,
+            "exclude": exclude,
+            "include": include,
+            "offset": offset,
+            "order": order,
+            "orderby": orderby,
+            "code": code,
+        }
+        # Remove None values
+        params = {k: v for k, v in params.items() if v is not None}
+
+        return self.api_object.iter_all(
+            "coupons", models.Coupon, fields=fields, **params
+        )
+
     def update_coupon(self, coupon_id: int, coupon: Coupon) -> Coupon:
         """
         Updates a coupon by its ID.
@@ -181,6 +321,31 @@ class Woo:
         """
         self.api_object.delete(f"coupons/{coupon_id}")
 
+    def batch_coupons(
+        self,
+        create: list[Coupon] | None = None,
+        update: list[Coupon] | None = None,
+        delete: list[int] | None = None,
+        concurrency: int = 1,
+    ) -> BatchResponse[Coupon]:
+        """
+        Creates, updates and deletes coupons using the batch endpoint.
+        Large inputs are split into requests of up to 100 operations.
+        :param create: Coupon objects to create
+        :param update: Coupon objects to update, must have their id set
+        :param delete: ids of the coupons to delete
+        :param concurrency: number of batch requests sent at the same time
+        :return: BatchResponse with the resulting objects and the errors of failed items
+        """
+        return self.api_object.batch(
+            "coupons/batch",
+            models.Coupon,
+            create=create,
+            update=update,
+            delete=delete,
+            concurrency=concurrency,
+        )
+
     # Webhooks
 
     def create_webhook(self, webhook: Webhook) -> Webhook:
@@ -191,13 +356,19 @@ class Woo:
         """
         return self.api_object.post("webhooks", webhook)
 
-    def get_webhook(self, webhook_id: int) -> Webhook | None:
+    def get_webhook(
+        self, webhook_id: int, fields: list[str] | None = None
+    ) -> Webhook | None:
         """
         Gets a webhook by its ID.
         :param webhook_id: id of the webhook
+        :param fields: Only return these fields, e.g. ["id", "name", "status"]. Other fields of the returned objects are None.
+        The objects are still typed as the full model, so type checkers do not flag those fields as optional.
         :return:
         """
-        return self.api_object.get(f"webhooks/{webhook_id}", Webhook)
+        return self.api_object.get(
+            f"webhooks/{webhook_id}", models.Webhook, fields=fields
+        )
 
     def delete_webhook(self, webhook_id: int, force: bool = False) -> None:
         """
@@ -226,6 +397,8 @@ class Woo:
         *,
         follow_pages: t.Literal[False] = False,
         return_metadata: t.Literal[True],
+        lazy: t.Literal[False] = False,
+        fields: list[str] | None = None,
     ) -> PaginatedResponse[Webhook]: ...
 
     @t.overload
@@ -246,6 +419,8 @@ class Woo:
         *,
         follow_pages: t.Literal[False] = False,
         return_metadata: t.Literal[False] = False,
+        lazy: t.Literal[False] = False,
+        fields: list[str] | None = None,
     ) -> list[Webhook]: ...
 
     @t.overload
@@ -266,8 +441,32 @@ class Woo:
         *,
         follow_pages: t.Literal[True],
         return_metadata: t.Literal[False] = False,
+        lazy: t.Literal[False] = False,
+        fields: list[str] | None = None,
     ) -> list[Webhook]: ...
 
+    @t.overload
+    def list_webhooks(
+        self,
+        context: ContextType = None,
+        page: int = None,
+        per_page: int = None,
+        search: str | None = None,
+        after: str | None = None,
+        before: str | None = None,
+        exclude: list[int] | None = None,
+        include: list[int] | None = None,
+        offset: int | None = None,
+        order: OrderType = None,
+        orderby: t.Literal["date", "id", "title"] = None,
+        status: t.Literal["all", "active", "paused", "disabled", "all"] = None,
+        *,
+        follow_pages: bool = False,
+        return_metadata: t.Literal[False] = False,
+        lazy: t.Literal[True],
+        fields: list[str] | None = None,
+    ) -> LazyList[Webhook]: ...
+
     def list_webhooks(
         self,
         context: ContextType = None,
@@ -284,12 +483,17 @@ class Woo:
         status: t.Literal["all", "active", "paused", "disabled", "all"] = None,
         follow_pages: bool = False,
         return_metadata: bool = False,
-    ) -> list[Webhook] | PaginatedResponse[Webhook]:
+        lazy: bool = False,
+        fields: list[str] | None = None,
+    ) -> list[Webhook] | LazyList[Webhook] | PaginatedResponse[Webhook]:
         """
         Lists all webhooks.
 
         :param follow_pages: Whether to automatically follow pagination and get all pages. Defaults to False.
         :param return_metadata: If True, returns a PaginatedResponse with metadata instead of just a list. Cannot be used with follow_pages=True.
+        :param lazy: If True, returns a LazyList that validates each item only when it is accessed.
+        :param fields: Only return these fields, e.g. ["id", "name", "status"]. Other fields of the returned objects are None.
+        The objects are still typed as the full model, so type checkers do not flag those fields as optional.
         :return: A list of Webhook objects or a PaginatedResponse containing the list and pagination metadata.
         """
         if follow_pages and return_metadata:
@@ -314,12 +518,59 @@ class Woo:
 
         return self.api_object.get_all(
             "webhooks/",
-            Webhook,
+            models.Webhook,
             follow_pages=follow_pages,
             include_metadata=return_metadata,
+            lazy=lazy,
+            fields=fields,
             **params,
         )
 
+    def iter_webhooks(
+        self,
+        context: ContextType = None,
+        page: int = None,
+        per_page: int = None,
+        search: str | None = None,
+        after: str | None = None,
+        before: str | None = None,
+        exclude: list[int] | None = None,
+        include: list[int] | None = None,
+        offset: int | None = None,
+        order: OrderType = None,
+        orderby: t.Literal["date", "id", "title"] = None,
+        status: t.Literal["all", "active", "paused", "disabled", "all"] = None,
+        fields: list[str] | None = None,
+    ) -> t.Iterator[Webhook]:
+        """
+        Iterates over all webhooks, fetching one page at a time.
+        Accepts the same filters as list_webhooks.
+
+        :param fields: Only return these fields, e.g. ["id", "name", "status"]. Other fields of the returned objects are None.
+        The objects are still typed as the full model, so type checkers do not flag those fields as optional.
+        :return: An iterator of Webhook objects.
+        """
+        params = {
+            "context": context,
+            "page": page,
+            "per_page": per_page,
+            "search": search,
+            "after": after,
+            "before": before,
+            "exclude": exclude,
+            "include": include,
+            "offset": offset,
+            "order": order,
+            "orderby": orderby,
+            "status": status,
+        }
+        # Remove None values
+        params = {k: v for k, v in params.items() if v is not None}
+
+        return self.api_object.iter_all(
+            "webhooks/", models.Webhook, fields=fields, **params
+        )
+
     def update_webhook(self, webhook_id: int, webhook: Webhook) -> Webhook:
         """
         Updates a webhook by its ID.
@@ -329,6 +580,31 @@ class Woo:
         """
         return self.api_object.put(f"webhooks/{webhook_id}", webhook)
 
+    def batch_webhooks(
+        self,
+        create: list[Webhook] | None = None,
+        update: list[Webhook] | None = None,
+        delete: list[int] | None = None,
+        concurrency: int = 1,
+    ) -> BatchResponse[Webhook]:
+        """
+        Creates, updates and deletes webhooks using the batch endpoint.
+        Large inputs are split into requests of up to 100 operations.
+        :param create: Webhook objects to create
+        :param update: Webhook objects to update, must have their id set
+        :param delete: ids of the webhooks to delete
+        :param concurrency: number of batch requests sent at the same time
+        :return: BatchResponse with the resulting objects and the errors of failed items
+        """
+        return self.api_object.batch(
+            "webhooks/batch",
+            models.Webhook,
+            create=create,
+            update=update,
+            delete=delete,
+            concurrency=concurrency,
+        )
+
     # Customers
 
     def create_customer(self, customer: Customer) -> BaseModel:
@@ -339,13 +615,19 @@ class Woo:
         """
         return self.api_object.post("customers", customer)
 
-    def get_customer(self, customer_id: int) -> BaseModel | None:
+    def get_customer(
+        self, customer_id: int, fields: list[str] | None = None
+    ) -> BaseModel | None:
         """
         Gets a customer by its ID.
         :param customer_id: id of the customer
+        :param fields: Only return these fields, e.g. ["id", "email"]. Other fields of the returned objects are None.
+        The objects are still typed as the full model, so type checkers do not flag those fields as optional.
         :return:
         """
-        return self.api_object.get(f"customers/{customer_id}", Customer)
+        return self.api_object.get(
+            f"customers/{customer_id}", models.Customer, fields=fields
+        )
 
     @t.overload
     def list_customers(
@@ -373,6 +655,8 @@ class Woo:
         *,
         follow_pages: t.Literal[False] = False,
         return_metadata: t.Literal[True],
+        lazy: t.Literal[False] = False,
+        fields: list[str] | None = None,
     ) -> PaginatedResponse[Customer]: ...
 
     @t.overload
@@ -401,6 +685,8 @@ class Woo:
         *,
         follow_pages: t.Literal[False] = False,
         return_metadata: t.Literal[False] = False,
+        lazy: t.Literal[False] = False,
+        fields: list[str] | None = None,
     ) -> list[Customer]: ...
 
     @t.overload
@@ -429,8 +715,40 @@ class Woo:
         *,
         follow_pages: t.Literal[True],
         return_metadata: t.Literal[False] = False,
+        lazy: t.Literal[False] = False,
+        fields: list[str] | None = None,
     ) -> list[Customer]: ...
 
+    @t.overload
+    def list_customers(
+        self,
+        context: ContextType = None,
+        page: int = None,
+        per_page: int = None,
+        search: str | None = None,
+        exclude: list[int] | None = None,
+        include: list[int] | None = None,
+        offset: int | None = None,
+        order: OrderType = None,
+        orderby: t.Literal["id", "include", "name", "registered_date"] = None,
+        email: str | None = None,
+        role: t.Literal[
+            "all",
+            "administrator",
+            "editor",
+            "author",
+            "contributor",
+            "subscriber",
+            "customer",
+            "shop_manager",
+        ] = None,
+        *,
+        follow_pages: bool = False,
+        return_metadata: t.Literal[False] = False,
+        lazy: t.Literal[True],
+        fields: list[str] | None = None,
+    ) -> LazyList[Customer]: ...
+
     def list_customers(
         self,
         context: ContextType = None,
@@ -455,12 +773,17 @@ class Woo:
         ] = None,
         follow_pages: bool = False,
         return_metadata: bool = False,
-    ) -> list[Customer] | PaginatedResponse[Customer]:
+        lazy: bool = False,
+        fields: list[str] | None = None,
+    ) -> list[Customer] | LazyList[Customer] | PaginatedResponse[Customer]:
         """
         Lists all customers
 
         :param follow_pages: Whether to automatically follow pagination and get all pages. Defaults to False.
         :param return_metadata: If True, returns a PaginatedResponse with metadata instead of just a list. Cannot be used with follow_pages=True.
+        :param lazy: If True, returns a LazyList that validates each item only when it is accessed.
+        :param fields: Only return these fields, e.g. ["id", "email"]. Other fields of the returned objects are None.
+        The objects are still typed as the full model, so type checkers do not flag those fields as optional.
         :return: A list of Customer objects or a PaginatedResponse containing the list and pagination metadata.
         """
         if follow_pages and return_metadata:
@@ -484,12 +807,66 @@ class Woo:
 
         return self.api_object.get_all(
             "customers",
-            Customer,
+            models.Customer,
             follow_pages=follow_pages,
             include_metadata=return_metadata,
+            lazy=lazy,
+            fields=fields,
             **params,
         )
 
+    def iter_customers(
+        self,
+        context: ContextType = None,
+        page: int = None,
+        per_page: int = None,
+        search: str | None = None,
+        exclude: list[int] | None = None,
+        include: list[int] | None = None,
+        offset: int | None = None,
+        order: OrderType = None,
+        orderby: t.Literal["id", "include", "name", "registered_date"] = None,
+        email: str | None = None,
+        role: t.Literal[
+            "all",
+            "administrator",
+            "editor",
+            "author",
+            "contributor",
+            "subscriber",
+            "customer",
+            "shop_manager",
+        ] = None,
+        fields: list[str] | None = None,
+    ) -> t.Iterator[Customer]:
+        """
+        Iterates over all customers, fetching one page at a time.
+        Accepts the same filters as list_customers.
+
+        :param fields: Only return these fields, e.g. ["id", "email"]. Other fields of the returned objects are None.
+        The objects are still typed as the full model, so type checkers do not flag those fields as optional.
+        :return: An iterator of Customer objects.
+        """
+        params = {
+            "context": context,
+            "page": page,
+            "per_page": per_page,
+            "search": search,
+            "exclude": exclude,
+            "include": include,
+            "offset": offset,
+            "order": order,
+            "orderby": orderby,
+            "email": email,
+            "role": role,
+        }
+        # Remove None values
+        params = {k: v for k, v in params.items() if v is not None}
+
+        return self.api_object.iter_all(
+            "customers", models.Customer, fields=fields, **params
+        )
+
     def update_customer(self, customer_id: int, customer: Customer) -> BaseModel:
         """
         Updates a customer by its ID.
@@ -514,6 +891,31 @@ class Woo:
             f"customers/{customer_id}", force=force, reassign=reassign
         )
 
+    def batch_customers(
+        self,
+        create: list[Customer] | None = None,
+        update: list[Customer] | None = None,
+        delete: list[int] | None = None,
+        concurrency: int = 1,
+    ) -> BatchResponse[Customer]:
+        """
+        Creates, updates and deletes customers using the batch endpoint.
+        Large inputs are split into requests of up to 100 operations.
+        :param create: Customer objects to create
+        :param update: Customer objects to update, must have their id set
+        :param delete: ids of the customers to delete
+        :param concurrency: number of batch requests sent at the same time
+        :return: BatchResponse with the resulting objects and the errors of failed items
+        """
+        return self.api_object.batch(
+            "customers/batch",
+            models.Customer,
+            create=create,
+            update=update,
+            delete=delete,
+            concurrency=concurrency,
+        )
+
     # Tax classes
     def create_tax_class(self, tax_class: TaxClass) -> BaseModel:
         """
@@ -521,7 +923,9 @@ class Woo:
         :param tax_class: Tax class object
         :return: the created tax class
         """
-        return self.api_object.post("taxes/classes", tax_class)
+        result = self.api_object.post("taxes/classes", tax_class)
+        self._invalidate_cached("taxes")
+        return result
 
     @t.overload
     def list_tax_classes(
@@ -529,6 +933,8 @@ class Woo:
         *,
         follow_pages: t.Literal[False] = False,
         return_metadata: t.Literal[True],
+        lazy: t.Literal[False] = False,
+        fields: list[str] | None = None,
     ) -> PaginatedResponse[TaxClass]: ...
 
     @t.overload
@@ -537,6 +943,8 @@ class Woo:
         *,
         follow_pages: t.Literal[False] = False,
         return_metadata: t.Literal[False] = False,
+        lazy: t.Literal[False] = False,
+        fields: list[str] | None = None,
     ) -> list[TaxClass]: ...
 
     @t.overload
@@ -545,29 +953,65 @@ class Woo:
         *,
         follow_pages: t.Literal[True],
         return_metadata: t.Literal[False] = False,
+        lazy: t.Literal[False] = False,
+        fields: list[str] | None = None,
     ) -> list[TaxClass]: ...
 
+    @t.overload
+    def list_tax_classes(
+        self,
+        *,
+        follow_pages: bool = False,
+        return_metadata: t.Literal[False] = False,
+        lazy: t.Literal[True],
+        fields: list[str] | None = None,
+    ) -> LazyList[TaxClass]: ...
+
     def list_tax_classes(
         self,
         follow_pages: bool = False,
         return_metadata: bool = False,
-    ) -> list[TaxClass] | PaginatedResponse[TaxClass]:
+        lazy: bool = False,
+        fields: list[str] | None = None,
+    ) -> list[TaxClass] | LazyList[TaxClass] | PaginatedResponse[TaxClass]:
         """
         Lists all tax classes.
 
         :param follow_pages: Whether to automatically follow pagination and get all pages. Defaults to False.
         :param return_metadata: If True, returns a PaginatedResponse with metadata instead of just a list. Cannot be used with follow_pages=True.
+        :param lazy: If True, returns a LazyList that validates each item only when it is accessed.
+        :param fields: Only return these fields, e.g. ["slug", "name"]. Other fields of the returned objects are None.
+        The objects are still typed as the full model, so type checkers do not flag those fields as optional.
         :return: A list of TaxClass objects or a PaginatedResponse containing the list and pagination metadata.
         """
         if follow_pages and return_metadata:
             raise ValueError("Cannot use follow_pages=True with return_metadata=True")
 
-        return self.api_object.get_all(
+        key = ("classes", follow_pages, return_metadata, lazy, tuple(fields or ()))
+        cached = self._get_cached("taxes", key)
+        if cached is not None:
+            return cached
+
+        result = self.api_object.get_all(
             "taxes/classes",
-            TaxClass,
+            models.TaxClass,
             follow_pages=follow_pages,
             include_metadata=return_metadata,
+            lazy=lazy,
+            fields=fields,
         )
+        self._set_cached("taxes", key, result)
+        return result
+
+    def iter_tax_classes(self, fields: list[str] | None = None) -> t.Iterator[TaxClass]:
+        """
+        Iterates over all tax classes, fetching one page at a time.
+
+        :param fields: Only return these fields, e.g. ["slug", "name"]. Other fields of the returned objects are None.
+        The objects are still typed as the full model, so type checkers do not flag those fields as optional.
+        :return: An iterator of TaxClass objects.
+        """
+        return self.api_object.iter_all("taxes/classes", models.TaxClass, fields=fields)
 
     def delete_tax_class(self, slug: str, force: bool) -> None:
         """
@@ -577,6 +1021,7 @@ class Woo:
         :return: None
         """
         self.api_object.delete(f"taxes/classes/{slug}", force=force)
+        self._invalidate_cached("taxes")
 
     # Tax rates
     def create_tax_rate(self, tax_rate: TaxRate) -> TaxRate:
@@ -585,15 +1030,23 @@ class Woo:
         :param tax_rate: TaxRate object
         :return: the created tax rate
         """
-        return self.api_object.post("taxes", tax_rate)
+        result = self.api_object.post("taxes", tax_rate)
+        self._invalidate_cached("taxes")
+        return result
 
-    def get_tax_rate(self, tax_rate_id: int) -> TaxRate | None:
+    def get_tax_rate(
+        self, tax_rate_id: int, fields: list[str] | None = None
+    ) -> TaxRate | None:
         """
         Gets a tax rate by its ID.
         :param tax_rate_id: id of the tax rate
+        :param fields: Only return these fields, e.g. ["id", "country", "rate"]. Other fields of the returned objects are None.
+        The objects are still typed as the full model, so type checkers do not flag those fields as optional.
         :return: TaxRate object or None if not found
         """
-        return self.api_object.get(f"taxes/{tax_rate_id}", TaxRate)
+        return self.api_object.get(
+            f"taxes/{tax_rate_id}", models.TaxRate, fields=fields
+        )
 
     @t.overload
     def list_tax_rates(
@@ -608,6 +1061,8 @@ class Woo:
         *,
         follow_pages: t.Literal[False] = False,
         return_metadata: t.Literal[True],
+        lazy: t.Literal[False] = False,
+        fields: list[str] | None = None,
     ) -> PaginatedResponse[TaxRate]: ...
 
     @t.overload
@@ -623,6 +1078,8 @@ class Woo:
         *,
         follow_pages: t.Literal[False] = False,
         return_metadata: t.Literal[False] = False,
+        lazy: t.Literal[False] = False,
+        fields: list[str] | None = None,
     ) -> list[TaxRate]: ...
 
     @t.overload
@@ -638,8 +1095,27 @@ class Woo:
         *,
         follow_pages: t.Literal[True],
         return_metadata: t.Literal[False] = False,
+        lazy: t.Literal[False] = False,
+        fields: list[str] | None = None,
     ) -> list[TaxRate]: ...
 
+    @t.overload
+    def list_tax_rates(
+        self,
+        context: ContextType = None,
+        page: int = None,
+        per_page: int = None,
+        offset: int | None = None,
+        order: OrderType = None,
+        orderby: t.Literal["id", "order", "priority"] = None,
+        class_: str | None = None,
+        *,
+        follow_pages: bool = False,
+        return_metadata: t.Literal[False] = False,
+        lazy: t.Literal[True],
+        fields: list[str] | None = None,
+    ) -> LazyList[TaxRate]: ...
+
     def list_tax_rates(
         self,
         context: ContextType = None,
@@ -651,7 +1127,9 @@ class Woo:
         class_: str | None = None,
         follow_pages: bool = False,
         return_metadata: bool = False,
-    ) -> list[TaxRate] | PaginatedResponse[TaxRate]:
+        lazy: bool = False,
+        fields: list[str] | None = None,
+    ) -> list[TaxRate] | LazyList[TaxRate] | PaginatedResponse[TaxRate]:
         """
         Lists all tax rates.
 
@@ -664,6 +1142,9 @@ class Woo:
         :param class_: Retrieve only tax rates of this tax class.
         :param follow_pages: Whether to automatically follow pagination and get all pages. Defaults to False.
         :param return_metadata: If True, returns a PaginatedResponse with metadata instead of just a list. Cannot be used with follow_pages=True.
+        :param lazy: If True, returns a LazyList that validates each item only when it is accessed.
+        :param fields: Only return these fields, e.g. ["id", "country", "rate"]. Other fields of the returned objects are None.
+        The objects are still typed as the full model, so type checkers do not flag those fields as optional.
         :return: A list of TaxRate objects or a PaginatedResponse containing the list and pagination metadata.
         """
         if follow_pages and return_metadata:
@@ -682,31 +1163,113 @@ class Woo:
         # Remove None values
         params = {k: v for k, v in params.items() if v is not None}
 
-        return self.api_object.get_all(
+        key = (
+            "rates",
+            follow_pages,
+            return_metadata,
+            lazy,
+            tuple(fields or ()),
+            tuple(sorted(params.items())),
+        )
+        cached = self._get_cached("taxes", key)
+        if cached is not None:
+            return cached
+
+        result = self.api_object.get_all(
             "taxes",
-            TaxRate,
+            models.TaxRate,
             follow_pages=follow_pages,
             include_metadata=return_metadata,
+            lazy=lazy,
+            fields=fields,
             **params,
         )
+        self._set_cached("taxes", key, result)
+        return result
 
-    def update_tax_rate(self, tax_rate_id: int, tax_rate: TaxRate) -> TaxRate:
-        """
-        Updates a tax rate by its ID.
-        :param tax_rate_id: id of the tax rate
-        :param tax_rate: TaxRate object with updates
-        :return: updated TaxRate object
+    def iter_tax_rates(
+        self,
+        context: ContextType = None,
+        page: int = None,
+        per_page: int = None,
+        offset: int | None = None,
+        order: OrderType = None,
+        orderby: t.Literal["id", "order", "priority"] = None,
+        class_: str | None = None,
+        fields: list[str] | None = None,
+    ) -> t.Iterator[TaxRate]:
         """
-        return self.api_object.put(f"taxes/{tax_rate_id}", tax_rate)
+        Iterates over all tax rates, fetching one page at a time.
+        Accepts the same filters as list_tax_rates.
 
-    def delete_tax_rate(self, tax_rate_id: int, force: bool = False) -> None:
+        :param fields: Only return these fields, e.g. ["id", "country", "rate"]. Other fields of the returned objects are None.
+        The objects are still typed as the full model, so type checkers do not flag those fields as optional.
+        :return: An iterator of TaxRate objects.
         """
-        Deletes a tax rate by its ID.
+        params = {
+            "context": context,
+            "page": page,
+            "per_page": per_page,
+            "offset": offset,
+            "order": order,
+            "orderby": orderby,
+            "class": class_,
+        }
+
+        # Remove None values
+        params = {k: v for k, v in params.items() if v is not None}
+
+        return self.api_object.iter_all(
+            "taxes", models.TaxRate, fields=fields, **params
+        )
+
+    def update_tax_rate(self, tax_rate_id: int, tax_rate: TaxRate) -> TaxRate:
+        """
+        Updates a tax rate by its ID.
+        :param tax_rate_id: id of the tax rate
+        :param tax_rate: TaxRate object with updates
+        :return: updated TaxRate object
+        """
+        result = self.api_object.put(f"taxes/{tax_rate_id}", tax_rate)
+        self._invalidate_cached("taxes")
+        return result
+
+    def delete_tax_rate(self, tax_rate_id: int, force: bool = False) -> None:
+        """
+        Deletes a tax rate by its ID.
         :param tax_rate_id: id of the tax rate
         :param force: when True, the tax rate will be permanently deleted
         :return: None
         """
         self.api_object.delete(f"taxes/{tax_rate_id}", force=force)
+        self._invalidate_cached("taxes")
+
+    def batch_tax_rates(
+        self,
+        create: list[TaxRate] | None = None,
+        update: list[TaxRate] | None = None,
+        delete: list[int] | None = None,
+        concurrency: int = 1,
+    ) -> BatchResponse[TaxRate]:
+        """
+        Creates, updates and deletes tax rates using the batch endpoint.
+        Large inputs are split into requests of up to 100 operations.
+        :param create: TaxRate objects to create
+        :param update: TaxRate objects to update, must have their id set
+        :param delete: ids of the tax rates to delete
+        :param concurrency: number of batch requests sent at the same time
+        :return: BatchResponse with the resulting objects and the errors of failed items
+        """
+        result = self.api_object.batch(
+            "taxes/batch",
+            models.TaxRate,
+            create=create,
+            update=update,
+            delete=delete,
+            concurrency=concurrency,
+        )
+        self._invalidate_cached("taxes")
+        return result
 
     # Products
     def create_product(self, product: Product) -> Product:
@@ -717,13 +1280,19 @@ class Woo:
         """
         return self.api_object.post("products", product)
 
-    def get_product(self, product_id: int) -> Product | None:
+    def get_product(
+        self, product_id: int, fields: list[str] | None = None
+    ) -> Product | None:
         """
         Gets a product by its ID.
         :param product_id: id of the product
+        :param fields: Only return these fields, e.g. ["id", "sku", "stock_quantity"]. Other fields of the returned objects are None.
+        The objects are still typed as the full model, so type checkers do not flag those fields as optional.
         :return: Product object or None if not found
         """
-        return self.api_object.get(f"products/{product_id}", Product)
+        return self.api_object.get(
+            f"products/{product_id}", models.Product, fields=fields
+        )
 
     @t.overload
     def list_products(
@@ -750,6 +1319,8 @@ class Woo:
         *,
         follow_pages: t.Literal[False] = False,
         return_metadata: t.Literal[True],
+        lazy: t.Literal[False] = False,
+        fields: list[str] | None = None,
     ) -> PaginatedResponse[Product]: ...
 
     @t.overload
@@ -777,6 +1348,8 @@ class Woo:
         *,
         follow_pages: t.Literal[False] = False,
         return_metadata: t.Literal[False] = False,
+        lazy: t.Literal[False] = False,
+        fields: list[str] | None = None,
     ) -> list[Product]: ...
 
     @t.overload
@@ -804,8 +1377,39 @@ class Woo:
         *,
         follow_pages: t.Literal[True],
         return_metadata: t.Literal[False] = False,
+        lazy: t.Literal[False] = False,
+        fields: list[str] | None = None,
     ) -> list[Product]: ...
 
+    @t.overload
+    def list_products(
+        self,
+        context: ContextType = None,
+        page: int = None,
+        per_page: int = None,
+        search: str | None = None,
+        after: str | None = None,
+        before: str | None = None,
+        exclude: list[int] | None = None,
+        include: list[int] | None = None,
+        offset: int | None = None,
+        order: OrderType = None,
+        orderby: t.Literal[
+            "date", "id", "include", "title", "slug", "price", "popularity", "rating"
+        ] = None,
+        category: str | None = None,
+        tag: str | None = None,
+        status: t.Literal["any", "draft", "pending", "private", "publish"] = None,
+        type: t.Literal["simple", "grouped", "external", "variable"] = None,
+        featured: bool | None = None,
+        sku: str | None = None,
+        *,
+        follow_pages: bool = False,
+        return_metadata: t.Literal[False] = False,
+        lazy: t.Literal[True],
+        fields: list[str] | None = None,
+    ) -> LazyList[Product]: ...
+
     def list_products(
         self,
         context: ContextType = None,
@@ -829,12 +1433,17 @@ class Woo:
         sku: str | None = None,
         follow_pages: bool = False,
         return_metadata: bool = False,
-    ) -> list[Product] | PaginatedResponse[Product]:
+        lazy: bool = False,
+        fields: list[str] | None = None,
+    ) -> list[Product] | LazyList[Product] | PaginatedResponse[Product]:
         """
         Lists all products.
 
         :param follow_pages: Whether to automatically follow pagination and get all pages. Defaults to False.
         :param return_metadata: If True, returns a PaginatedResponse with metadata instead of just a list. Cannot be used with follow_pages=True.
+        :param lazy: If True, returns a LazyList that validates each item only when it is accessed.
+        :param fields: Only return these fields, e.g. ["id", "sku", "stock_quantity"]. Other fields of the returned objects are None.
+        The objects are still typed as the full model, so type checkers do not flag those fields as optional.
         :return: A list of Product objects or a PaginatedResponse containing the list and pagination metadata.
         """
         if follow_pages and return_metadata:
@@ -864,12 +1473,71 @@ class Woo:
 
         return self.api_object.get_all(
             "products",
-            Product,
+            models.Product,
             follow_pages=follow_pages,
             include_metadata=return_metadata,
+            lazy=lazy,
+            fields=fields,
             **params,
         )
 
+    def iter_products(
+        self,
+        context: ContextType = None,
+        page: int = None,
+        per_page: int = None,
+        search: str | None = None,
+        after: str | None = None,
+        before: str | None = None,
+        exclude: list[int] | None = None,
+        include: list[int] | None = None,
+        offset: int | None = None,
+        order: OrderType = None,
+        orderby: t.Literal[
+            "date", "id", "include", "title", "slug", "price", "popularity", "rating"
+        ] = None,
+        category: str | None = None,
+        tag: str | None = None,
+        status: t.Literal["any", "draft", "pending", "private", "publish"] = None,
+        type: t.Literal["simple", "grouped", "external", "variable"] = None,
+        featured: bool | None = None,
+        sku: str | None = None,
+        fields: list[str] | None = None,
+    ) -> t.Iterator[Product]:
+        """
+        Iterates over all products, fetching one page at a time.
+        Accepts the same filters as list_products.
+
+        :param fields: Only return these fields, e.g. ["id", "sku", "stock_quantity"]. Other fields of the returned objects are None.
+        The objects are still typed as the full model, so type checkers do not flag those fields as optional.
+        :return: An iterator of Product objects.
+        """
+        params = {
+            "context": context,
+            "page": page,
+            "per_page": per_page,
+            "search": search,
+            "after": after,
+            "before": before,
+            "exclude": exclude,
+            "include": include,
+            "offset": offset,
+            "order": order,
+            "orderby": orderby,
+            "category": category,
+            "tag": tag,
+            "status": status,
+            "type": type,
+            "featured": featured,
+            "sku": sku,
+        }
+        # Remove None values
+        params = {k: v for k, v in params.items() if v is not None}
+
+        return self.api_object.iter_all(
+            "products", models.Product, fields=fields, **params
+        )
+
     def update_product(self, product_id: int, product: Product) -> Product:
         """
         Updates a product by its ID.
@@ -888,6 +1556,31 @@ class Woo:
         """
         self.api_object.delete(f"products/{product_id}", force=force)
 
+    def batch_products(
+        self,
+        create: list[Product] | None = None,
+        update: list[Product] | None = None,
+        delete: list[int] | None = None,
+        concurrency: int = 1,
+    ) -> BatchResponse[Product]:
+        """
+        Creates, updates and deletes products using the batch endpoint.
+        Large inputs are split into requests of up to 100 operations.
+        :param create: Product objects to create
+        :param update: Product objects to update, must have their id set
+        :param delete: ids of the products to delete
+        :param concurrency: number of batch requests sent at the same time
+        :return: BatchResponse with the resulting objects and the errors of failed items
+        """
+        return self.api_object.batch(
+            "products/batch",
+            models.Product,
+            create=create,
+            update=update,
+            delete=delete,
+            concurrency=concurrency,
+        )
+
     # Product Variations
     def create_product_variation(
         self, product_id: int, variation: ProductVariation
@@ -901,16 +1594,20 @@ class Woo:
         return self.api_object.post(f"products/{product_id}/variations", variation)
 
     def get_product_variation(
-        self, product_id: int, variation_id: int
+        self, product_id: int, variation_id: int, fields: list[str] | None = None
     ) -> ProductVariation | None:
         """
         Gets a product variation by its ID.
         :param product_id: id of the parent product
         :param variation_id: id of the variation
+        :param fields: Only return these fields, e.g. ["id", "sku", "price"]. Other fields of the returned objects are None.
+        The objects are still typed as the full model, so type checkers do not flag those fields as optional.
         :return: ProductVariation object or None if not found
         """
         return self.api_object.get(
-            f"products/{product_id}/variations/{variation_id}", ProductVariation
+            f"products/{product_id}/variations/{variation_id}",
+            models.ProductVariation,
+            fields=fields,
         )
 
     @t.overload
@@ -931,6 +1628,8 @@ class Woo:
         *,
         follow_pages: t.Literal[False] = False,
         return_metadata: t.Literal[True],
+        lazy: t.Literal[False] = False,
+        fields: list[str] | None = None,
     ) -> PaginatedResponse[ProductVariation]: ...
 
     @t.overload
@@ -951,6 +1650,8 @@ class Woo:
         *,
         follow_pages: t.Literal[False] = False,
         return_metadata: t.Literal[False] = False,
+        lazy: t.Literal[False] = False,
+        fields: list[str] | None = None,
     ) -> list[ProductVariation]: ...
 
     @t.overload
@@ -971,8 +1672,32 @@ class Woo:
         *,
         follow_pages: t.Literal[True],
         return_metadata: t.Literal[False] = False,
+        lazy: t.Literal[False] = False,
+        fields: list[str] | None = None,
     ) -> list[ProductVariation]: ...
 
+    @t.overload
+    def list_product_variations(
+        self,
+        product_id: int,
+        context: ContextType = None,
+        page: int = None,
+        per_page: int = None,
+        search: str | None = None,
+        after: str | None = None,
+        before: str | None = None,
+        exclude: list[int] | None = None,
+        include: list[int] | None = None,
+        offset: int | None = None,
+        order: OrderType = None,
+        orderby: t.Literal["date", "id", "include", "title", "slug"] = None,
+        *,
+        follow_pages: bool = False,
+        return_metadata: t.Literal[False] = False,
+        lazy: t.Literal[True],
+        fields: list[str] | None = None,
+    ) -> LazyList[ProductVariation]: ...
+
     def list_product_variations(
         self,
         product_id: int,
@@ -989,13 +1714,22 @@ class Woo:
         orderby: t.Literal["date", "id", "include", "title", "slug"] = None,
         follow_pages: bool = False,
         return_metadata: bool = False,
-    ) -> list[ProductVariation] | PaginatedResponse[ProductVariation]:
+        lazy: bool = False,
+        fields: list[str] | None = None,
+    ) -> (
+        list[ProductVariation]
+        | LazyList[ProductVariation]
+        | PaginatedResponse[ProductVariation]
+    ):
         """
         Lists all variations for a product.
 
         :param product_id: id of the parent product
         :param follow_pages: Whether to automatically follow pagination and get all pages. Defaults to False.
         :param return_metadata: If True, returns a PaginatedResponse with metadata instead of just a list. Cannot be used with follow_pages=True.
+        :param lazy: If True, returns a LazyList that validates each item only when it is accessed.
+        :param fields: Only return these fields, e.g. ["id", "sku", "price"]. Other fields of the returned objects are None.
+        The objects are still typed as the full model, so type checkers do not flag those fields as optional.
         :return: A list of ProductVariation objects or a PaginatedResponse containing the list and pagination metadata.
         """
         if follow_pages and return_metadata:
@@ -1019,9 +1753,59 @@ class Woo:
 
         return self.api_object.get_all(
             f"products/{product_id}/variations",
-            ProductVariation,
+            models.ProductVariation,
             follow_pages=follow_pages,
             include_metadata=return_metadata,
+            lazy=lazy,
+            fields=fields,
+            **params,
+        )
+
+    def iter_product_variations(
+        self,
+        product_id: int,
+        context: ContextType = None,
+        page: int = None,
+        per_page: int = None,
+        search: str | None = None,
+        after: str | None = None,
+        before: str | None = None,
+        exclude: list[int] | None = None,
+        include: list[int] | None = None,
+        offset: int | None = None,
+        order: OrderType = None,
+        orderby: t.Literal["date", "id", "include", "title", "slug"] = None,
+        fields: list[str] | None = None,
+    ) -> t.Iterator[ProductVariation]:
+        """
+        Iterates over all product variations, fetching one page at a time.
+        Accepts the same filters as list_product_variations.
+
+        :param product_id: id of the parent product
+        :param fields: Only return these fields, e.g. ["id", "sku", "price"]. Other fields of the returned objects are None.
+        The objects are still typed as the full model, so type checkers do not flag those fields as optional.
+        :return: An iterator of ProductVariation objects.
+        """
+        params = {
+            "context": context,
+            "page": page,
+            "per_page": per_page,
+            "search": search,
+            "after": after,
+            "before": before,
+            "exclude": exclude,
+            "include": include,
+            "offset": offset,
+            "order": order,
+            "orderby": orderby,
+        }
+        # Remove None values
+        params = {k: v for k, v in params.items() if v is not None}
+
+        return self.api_object.iter_all(
+            f"products/{product_id}/variations",
+            models.ProductVariation,
+            fields=fields,
             **params,
         )
 
@@ -1053,6 +1837,102 @@ class Woo:
             f"products/{product_id}/variations/{variation_id}", force=force
         )
 
+    def batch_product_variations(
+        self,
+        product_id: int,
+        create: list[ProductVariation] | None = None,
+        update: list[ProductVariation] | None = None,
+        delete: list[int] | None = None,
+        concurrency: int = 1,
+    ) -> BatchResponse[ProductVariation]:
+        """
+        Creates, updates and deletes variations of a product using the batch endpoint.
+        Large inputs are split into requests of up to 100 operations.
+        :param product_id: id of the parent product
+        :param create: ProductVariation objects to create
+        :param update: ProductVariation objects to update, must have their id set
+        :param delete: ids of the variations to delete
+        :param concurrency: number of batch requests sent at the same time
+        :return: BatchResponse with the resulting objects and the errors of failed items
+        """
+        return self.api_object.batch(
+            f"products/{product_id}/variations/batch",
+            models.ProductVariation,
+            create=create,
+            update=update,
+            delete=delete,
+            concurrency=concurrency,
+        )
+
+    # SKU resolution
+    def update_sku_index(self, full: bool = False) -> int:
+        """
+        Updates the SKU index with the products modified since it was last updated.
+        The variations of the modified variable products are indexed again, requesting
+        the variations of up to page_concurrency products at a time.
+        Only IDs and SKUs are requested.
+        :param full: Whenever to rebuild the index from a scan of the whole catalog.
+        The index is always built in full the first time.
+        :return: number of scanned products
+        """
+        params: dict[str, t.Any] = {"per_page": 100}
+        if full:
+            self.sku_index.clear()
+        elif self.sku_index.updated_gmt is not None:
+            # modified_after is exclusive and precise to the second, so include the last second
+            modified_after = self.sku_index.updated_gmt - datetime.timedelta(seconds=1)
+            params["modified_after"] = modified_after.strftime(GMT_FORMAT)
+            params["dates_are_gmt"] = True
+
+        # Products are streamed a page at a time, only the IDs of variable products are kept
+        scanned = 0
+        variable_ids: list[int] = []
+        for product in self.api_object.iter_all(
+            "products", models.Product, fields=SKU_FIELDS, **params
+        ):
+            self.sku_index.add_products([product])
+            scanned += 1
+            if product.id is not None and product.type == models.ProductType.VARIABLE:
+                variable_ids.append(product.id)
+
+        # The variations of several products are requested concurrently
+        variations = self.api_object.get_each(
+            [f"products/{product_id}/variations" for product_id in variable_ids],
+            models.ProductVariation,
+            per_page=100,
+            fields=["id", "sku"],
+        )
+        for product_id, product_variations in zip(variable_ids, variations):
+            self.sku_index.add_variations(product_id, product_variations)
+
+        return scanned
+
+    def resolve_skus(self, skus: t.Iterable[str]) -> dict[str, SkuLocation]:
+        """
+        Resolves SKUs to products and variations.
+        SKUs are looked up in the SKU index first. The missing ones are searched for
+        100 at a time, which finds variations as well, and added to the index.
+        :param skus: SKUs to resolve
+        :return: dict of SKU to SkuLocation. SKUs that do not exist in the store are left out.
+        """
+        unique = [sku for sku in dict.fromkeys(skus) if sku]
+        missing = [sku for sku in unique if sku not in self.sku_index]
+
+        for start in range(0, len(missing), 100):
+            self.sku_index.add_products(
+                self.api_object.get_all(
+                    "products",
+                    models.Product,
+                    follow_pages=True,
+                    per_page=100,
+                    sku=",".join(missing[start : start + 100]),
+                    fields=["id", "sku", "parent_id"],
+                )
+            )
+
+        resolved = {sku: self.sku_index.get(sku) for sku in unique}
+        return {sku: location for sku, location in resolved.items() if location}
+
     # Product Categories
     def create_product_category(self, category: ProductCategory) -> ProductCategory:
         """
@@ -1062,14 +1942,18 @@ class Woo:
         """
         return self.api_object.post("products/categories", category)
 
-    def get_product_category(self, category_id: int) -> ProductCategory | None:
+    def get_product_category(
+        self, category_id: int, fields: list[str] | None = None
+    ) -> ProductCategory | None:
         """
         Gets a product category by its ID.
         :param category_id: id of the category
+        :param fields: Only return these fields, e.g. ["id", "name", "parent"]. Other fields of the returned objects are None.
+        The objects are still typed as the full model, so type checkers do not flag those fields as optional.
         :return: ProductCategory object or None if not found
         """
         return self.api_object.get(
-            f"products/categories/{category_id}", ProductCategory
+            f"products/categories/{category_id}", models.ProductCategory, fields=fields
         )
 
     @t.overload
@@ -1092,6 +1976,8 @@ class Woo:
         *,
         follow_pages: t.Literal[False] = False,
         return_metadata: t.Literal[True],
+        lazy: t.Literal[False] = False,
+        fields: list[str] | None = None,
     ) -> PaginatedResponse[ProductCategory]: ...
 
     @t.overload
@@ -1114,6 +2000,8 @@ class Woo:
         *,
         follow_pages: t.Literal[False] = False,
         return_metadata: t.Literal[False] = False,
+        lazy: t.Literal[False] = False,
+        fields: list[str] | None = None,
     ) -> list[ProductCategory]: ...
 
     @t.overload
@@ -1136,8 +2024,34 @@ class Woo:
         *,
         follow_pages: t.Literal[True],
         return_metadata: t.Literal[False] = False,
+        lazy: t.Literal[False] = False,
+        fields: list[str] | None = None,
     ) -> list[ProductCategory]: ...
 
+    @t.overload
+    def list_product_categories(
+        self,
+        context: ContextType = None,
+        page: int = None,
+        per_page: int = None,
+        search: str | None = None,
+        exclude: list[int] | None = None,
+        include: list[int] | None = None,
+        order: OrderType = None,
+        orderby: t.Literal[
+            "id", "include", "name", "slug", "term_group", "description", "count"
+        ] = None,
+        hide_empty: bool = None,
+        parent: int | None = None,
+        product: int | None = None,
+        slug: str | None = None,
+        *,
+        follow_pages: bool = False,
+        return_metadata: t.Literal[False] = False,
+        lazy: t.Literal[True],
+        fields: list[str] | None = None,
+    ) -> LazyList[ProductCategory]: ...
+
     def list_product_categories(
         self,
         context: ContextType = None,
@@ -1156,12 +2070,21 @@ class Woo:
         slug: str | None = None,
         follow_pages: bool = False,
         return_metadata: bool = False,
-    ) -> list[ProductCategory] | PaginatedResponse[ProductCategory]:
+        lazy: bool = False,
+        fields: list[str] | None = None,
+    ) -> (
+        list[ProductCategory]
+        | LazyList[ProductCategory]
+        | PaginatedResponse[ProductCategory]
+    ):
         """
         Lists all product categories.
 
         :param follow_pages: Whether to automatically follow pagination and get all pages. Defaults to False.
         :param return_metadata: If True, returns a PaginatedResponse with metadata instead of just a list. Cannot be used with follow_pages=True.
+        :param lazy: If True, returns a LazyList that validates each item only when it is accessed.
+        :param fields: Only return these fields, e.g. ["id", "name", "parent"]. Other fields of the returned objects are None.
+        The objects are still typed as the full model, so type checkers do not flag those fields as optional.
         :return: A list of ProductCategory objects or a PaginatedResponse containing the list and pagination metadata.
         """
         if follow_pages and return_metadata:
@@ -1186,12 +2109,61 @@ class Woo:
 
         return self.api_object.get_all(
             "products/categories",
-            ProductCategory,
+            models.ProductCategory,
             follow_pages=follow_pages,
             include_metadata=return_metadata,
+            lazy=lazy,
+            fields=fields,
             **params,
         )
 
+    def iter_product_categories(
+        self,
+        context: ContextType = None,
+        page: int = None,
+        per_page: int = None,
+        search: str | None = None,
+        exclude: list[int] | None = None,
+        include: list[int] | None = None,
+        order: OrderType = None,
+        orderby: t.Literal[
+            "id", "include", "name", "slug", "term_group", "description", "count"
+        ] = None,
+        hide_empty: bool = None,
+        parent: int | None = None,
+        product: int | None = None,
+        slug: str | None = None,
+        fields: list[str] | None = None,
+    ) -> t.Iterator[ProductCategory]:
+        """
+        Iterates over all product categories, fetching one page at a time.
+        Accepts the same filters as list_product_categories.
+
+        :param fields: Only return these fields, e.g. ["id", "name", "parent"]. Other fields of the returned objects are None.
+        The objects are still typed as the full model, so type checkers do not flag those fields as optional.
+        :return: An iterator of ProductCategory objects.
+        """
+        params = {
+            "context": context,
+            "page": page,
+            "per_page": per_page,
+            "search": search,
+            "exclude": exclude,
+            "include": include,
+            "order": order,
+            "orderby": orderby,
+            "hide_empty": hide_empty,
+            "parent": parent,
+            "product": product,
+            "slug": slug,
+        }
+        # Remove None values
+        params = {k: v for k, v in params.items() if v is not None}
+
+        return self.api_object.iter_all(
+            "products/categories", models.ProductCategory, fields=fields, **params
+        )
+
     def update_product_category(
         self, category_id: int, category: ProductCategory
     ) -> ProductCategory:
@@ -1212,6 +2184,31 @@ class Woo:
         """
         self.api_object.delete(f"products/categories/{category_id}", force=force)
 
+    def batch_product_categories(
+        self,
+        create: list[ProductCategory] | None = None,
+        update: list[ProductCategory] | None = None,
+        delete: list[int] | None = None,
+        concurrency: int = 1,
+    ) -> BatchResponse[ProductCategory]:
+        """
+        Creates, updates and deletes product categories using the batch endpoint.
+        Large inputs are split into requests of up to 100 operations.
+        :param create: ProductCategory objects to create
+        :param update: ProductCategory objects to update, must have their id set
+        :param delete: ids of the product categories to delete
+        :param concurrency: number of batch requests sent at the same time
+        :return: BatchResponse with the resulting objects and the errors of failed items
+        """
+        return self.api_object.batch(
+            "products/categories/batch",
+            models.ProductCategory,
+            create=create,
+            update=update,
+            delete=delete,
+            concurrency=concurrency,
+        )
+
     # Product Tags
     def create_product_tag(self, tag: ProductTag) -> ProductTag:
         """
@@ -1221,13 +2218,19 @@ class Woo:
         """
         return self.api_object.post("products/tags", tag)
 
-    def get_product_tag(self, tag_id: int) -> ProductTag | None:
+    def get_product_tag(
+        self, tag_id: int, fields: list[str] | None = None
+    ) -> ProductTag | None:
         """
         Gets a product tag by its ID.
         :param tag_id: id of the tag
+        :param fields: Only return these fields, e.g. ["id", "name", "count"]. Other fields of the returned objects are None.
+        The objects are still typed as the full model, so type checkers do not flag those fields as optional.
         :return: ProductTag object or None if not found
         """
-        return self.api_object.get(f"products/tags/{tag_id}", ProductTag)
+        return self.api_object.get(
+            f"products/tags/{tag_id}", models.ProductTag, fields=fields
+        )
 
     @t.overload
     def list_product_tags(
@@ -1249,6 +2252,8 @@ class Woo:
         *,
         follow_pages: t.Literal[False] = False,
         return_metadata: t.Literal[True],
+        lazy: t.Literal[False] = False,
+        fields: list[str] | None = None,
     ) -> PaginatedResponse[ProductTag]: ...
 
     @t.overload
@@ -1271,6 +2276,8 @@ class Woo:
         *,
         follow_pages: t.Literal[False] = False,
         return_metadata: t.Literal[False] = False,
+        lazy: t.Literal[False] = False,
+        fields: list[str] | None = None,
     ) -> list[ProductTag]: ...
 
     @t.overload
@@ -1293,8 +2300,34 @@ class Woo:
         *,
         follow_pages: t.Literal[True],
         return_metadata: t.Literal[False] = False,
+        lazy: t.Literal[False] = False,
+        fields: list[str] | None = None,
     ) -> list[ProductTag]: ...
 
+    @t.overload
+    def list_product_tags(
+        self,
+        context: ContextType = None,
+        page: int = None,
+        per_page: int = None,
+        search: str | None = None,
+        exclude: list[int] | None = None,
+        include: list[int] | None = None,
+        offset: int | None = None,
+        order: OrderType = None,
+        orderby: t.Literal[
+            "id", "include", "name", "slug", "term_group", "description", "count"
+        ] = None,
+        hide_empty: bool = None,
+        product: int | None = None,
+        slug: str | None = None,
+        *,
+        follow_pages: bool = False,
+        return_metadata: t.Literal[False] = False,
+        lazy: t.Literal[True],
+        fields: list[str] | None = None,
+    ) -> LazyList[ProductTag]: ...
+
     def list_product_tags(
         self,
         context: ContextType = None,
@@ -1313,12 +2346,17 @@ class Woo:
         slug: str | None = None,
         follow_pages: bool = False,
         return_metadata: bool = False,
-    ) -> list[ProductTag] | PaginatedResponse[ProductTag]:
+        lazy: bool = False,
+        fields: list[str] | None = None,
+    ) -> list[ProductTag] | LazyList[ProductTag] | PaginatedResponse[ProductTag]:
         """
         Lists all product tags.
 
         :param follow_pages: Whether to automatically follow pagination and get all pages. Defaults to False.
         :param return_metadata: If True, returns a PaginatedResponse with metadata instead of just a list. Cannot be used with follow_pages=True.
+        :param lazy: If True, returns a LazyList that validates each item only when it is accessed.
+        :param fields: Only return these fields, e.g. ["id", "name", "count"]. Other fields of the returned objects are None.
+        The objects are still typed as the full model, so type checkers do not flag those fields as optional.
         :return: A list of ProductTag objects or a PaginatedResponse containing the list and pagination metadata.
         """
         if follow_pages and return_metadata:
@@ -1343,12 +2381,61 @@ class Woo:
 
         return self.api_object.get_all(
             "products/tags",
-            ProductTag,
+            models.ProductTag,
             follow_pages=follow_pages,
             include_metadata=return_metadata,
+            lazy=lazy,
+            fields=fields,
             **params,
         )
 
+    def iter_product_tags(
+        self,
+        context: ContextType = None,
+        page: int = None,
+        per_page: int = None,
+        search: str | None = None,
+        exclude: list[int] | None = None,
+        include: list[int] | None = None,
+        offset: int | None = None,
+        order: OrderType = None,
+        orderby: t.Literal[
+            "id", "include", "name", "slug", "term_group", "description", "count"
+        ] = None,
+        hide_empty: bool = None,
+        product: int | None = None,
+        slug: str | None = None,
+        fields: list[str] | None = None,
+    ) -> t.Iterator[ProductTag]:
+        """
+        Iterates over all product tags, fetching one page at a time.
+        Accepts the same filters as list_product_tags.
+
+        :param fields: Only return these fields, e.g. ["id", "name", "count"]. Other fields of the returned objects are None.
+        The objects are still typed as the full model, so type checkers do not flag those fields as optional.
+        :return: An iterator of ProductTag objects.
+        """
+        params = {
+            "context": context,
+            "page": page,
+            "per_page": per_page,
+            "search": search,
+            "exclude": exclude,
+            "include": include,
+            "offset": offset,
+            "order": order,
+            "orderby": orderby,
+            "hide_empty": hide_empty,
+            "product": product,
+            "slug": slug,
+        }
+        # Remove None values
+        params = {k: v for k, v in params.items() if v is not None}
+
+        return self.api_object.iter_all(
+            "products/tags", models.ProductTag, fields=fields, **params
+        )
+
     def update_product_tag(self, tag_id: int, tag: ProductTag) -> ProductTag:
         """
         Updates a product tag by its ID.
@@ -1367,6 +2454,31 @@ class Woo:
         """
         self.api_object.delete(f"products/tags/{tag_id}", force=force)
 
+    def batch_product_tags(
+        self,
+        create: list[ProductTag] | None = None,
+        update: list[ProductTag] | None = None,
+        delete: list[int] | None = None,
+        concurrency: int = 1,
+    ) -> BatchResponse[ProductTag]:
+        """
+        Creates, updates and deletes product tags using the batch endpoint.
+        Large inputs are split into requests of up to 100 operations.
+        :param create: ProductTag objects to create
+        :param update: ProductTag objects to update, must have their id set
+        :param delete: ids of the product tags to delete
+        :param concurrency: number of batch requests sent at the same time
+        :return: BatchResponse with the resulting objects and the errors of failed items
+        """
+        return self.api_object.batch(
+            "products/tags/batch",
+            models.ProductTag,
+            create=create,
+            update=update,
+            delete=delete,
+            concurrency=concurrency,
+        )
+
     # Product Attributes
     def create_product_attribute(self, attribute: ProductAttribute) -> ProductAttribute:
         """
@@ -1376,14 +2488,20 @@ class Woo:
         """
         return self.api_object.post("products/attributes", attribute)
 
-    def get_product_attribute(self, attribute_id: int) -> ProductAttribute | None:
+    def get_product_attribute(
+        self, attribute_id: int, fields: list[str] | None = None
+    ) -> ProductAttribute | None:
         """
         Gets a product attribute by its ID.
         :param attribute_id: id of the attribute
+        :param fields: Only return these fields, e.g. ["id", "name", "slug"]. Other fields of the returned objects are None.
+        The objects are still typed as the full model, so type checkers do not flag those fields as optional.
         :return: ProductAttribute object or None if not found
         """
         return self.api_object.get(
-            f"products/attributes/{attribute_id}", ProductAttribute
+            f"products/attributes/{attribute_id}",
+            models.ProductAttribute,
+            fields=fields,
         )
 
     @t.overload
@@ -1397,6 +2515,8 @@ class Woo:
         *,
         follow_pages: t.Literal[False] = False,
         return_metadata: t.Literal[True],
+        lazy: t.Literal[False] = False,
+        fields: list[str] | None = None,
     ) -> PaginatedResponse[ProductAttribute]: ...
 
     @t.overload
@@ -1410,6 +2530,8 @@ class Woo:
         *,
         follow_pages: t.Literal[False] = False,
         return_metadata: t.Literal[False] = False,
+        lazy: t.Literal[False] = False,
+        fields: list[str] | None = None,
     ) -> list[ProductAttribute]: ...
 
     @t.overload
@@ -1423,28 +2545,91 @@ class Woo:
         *,
         follow_pages: t.Literal[True],
         return_metadata: t.Literal[False] = False,
+        lazy: t.Literal[False] = False,
+        fields: list[str] | None = None,
     ) -> list[ProductAttribute]: ...
 
-    def list_product_attributes(
+    @t.overload
+    def list_product_attributes(
+        self,
+        context: ContextType = None,
+        page: int = None,
+        per_page: int = None,
+        order: OrderType = None,
+        orderby: t.Literal["id", "name", "slug", "type", "order_by"] = None,
+        *,
+        follow_pages: bool = False,
+        return_metadata: t.Literal[False] = False,
+        lazy: t.Literal[True],
+        fields: list[str] | None = None,
+    ) -> LazyList[ProductAttribute]: ...
+
+    def list_product_attributes(
+        self,
+        context: ContextType = None,
+        page: int = None,
+        per_page: int = None,
+        order: OrderType = None,
+        orderby: t.Literal["id", "name", "slug", "type", "order_by"] = None,
+        follow_pages: bool = False,
+        return_metadata: bool = False,
+        lazy: bool = False,
+        fields: list[str] | None = None,
+    ) -> (
+        list[ProductAttribute]
+        | LazyList[ProductAttribute]
+        | PaginatedResponse[ProductAttribute]
+    ):
+        """
+        Lists all product attributes.
+
+        :param follow_pages: Whether to automatically follow pagination and get all pages. Defaults to False.
+        :param return_metadata: If True, returns a PaginatedResponse with metadata instead of just a list. Cannot be used with follow_pages=True.
+        :param lazy: If True, returns a LazyList that validates each item only when it is accessed.
+        :param fields: Only return these fields, e.g. ["id", "name", "slug"]. Other fields of the returned objects are None.
+        The objects are still typed as the full model, so type checkers do not flag those fields as optional.
+        :return: A list of ProductAttribute objects or a PaginatedResponse containing the list and pagination metadata.
+        """
+        if follow_pages and return_metadata:
+            raise ValueError("Cannot use follow_pages=True with return_metadata=True")
+
+        params = {
+            "context": context,
+            "page": page,
+            "per_page": per_page,
+            "order": order,
+            "orderby": orderby,
+        }
+        # Remove None values
+        params = {k: v for k, v in params.items() if v is not None}
+
+        return self.api_object.get_all(
+            "products/attributes",
+            models.ProductAttribute,
+            follow_pages=follow_pages,
+            include_metadata=return_metadata,
+            lazy=lazy,
+            fields=fields,
+            **params,
+        )
+
+    def iter_product_attributes(
         self,
         context: ContextType = None,
         page: int = None,
         per_page: int = None,
         order: OrderType = None,
         orderby: t.Literal["id", "name", "slug", "type", "order_by"] = None,
-        follow_pages: bool = False,
-        return_metadata: bool = False,
-    ) -> list[ProductAttribute] | PaginatedResponse[ProductAttribute]:
+        fields: list[str] | None = None,
+    ) -> t.Iterator[ProductAttribute]:
         """
-        Lists all product attributes.
+        Iterates over all product attributes, fetching one page at a time.
+        Accepts the same filters as list_product_attributes.
 
-        :param follow_pages: Whether to automatically follow pagination and get all pages. Defaults to False.
-        :param return_metadata: If True, returns a PaginatedResponse with metadata instead of just a list. Cannot be used with follow_pages=True.
-        :return: A list of ProductAttribute objects or a PaginatedResponse containing the list and pagination metadata.
+        :param fields: Only return these fields, e.g. ["id", "name", "slug"]. Other fields of the returned objects are None.
+        The objects are still typed as the full model, so type checkers do not flag those fields as optional.
+        :return: An iterator of ProductAttribute objects.
         """
-        if follow_pages and return_metadata:
-            raise ValueError("Cannot use follow_pages=True with return_metadata=True")
-
         params = {
             "context": context,
             "page": page,
@@ -1455,12 +2640,8 @@ class Woo:
         # Remove None values
         params = {k: v for k, v in params.items() if v is not None}
 
-        return self.api_object.get_all(
-            "products/attributes",
-            ProductAttribute,
-            follow_pages=follow_pages,
-            include_metadata=return_metadata,
-            **params,
+        return self.api_object.iter_all(
+            "products/attributes", models.ProductAttribute, fields=fields, **params
         )
 
     def update_product_attribute(
@@ -1483,6 +2664,31 @@ class Woo:
         """
         self.api_object.delete(f"products/attributes/{attribute_id}", force=force)
 
+    def batch_product_attributes(
+        self,
+        create: list[ProductAttribute] | None = None,
+        update: list[ProductAttribute] | None = None,
+        delete: list[int] | None = None,
+        concurrency: int = 1,
+    ) -> BatchResponse[ProductAttribute]:
+        """
+        Creates, updates and deletes product attributes using the batch endpoint.
+        Large inputs are split into requests of up to 100 operations.
+        :param create: ProductAttribute objects to create
+        :param update: ProductAttribute objects to update, must have their id set
+        :param delete: ids of the product attributes to delete
+        :param concurrency: number of batch requests sent at the same time
+        :return: BatchResponse with the resulting objects and the errors of failed items
+        """
+        return self.api_object.batch(
+            "products/attributes/batch",
+            models.ProductAttribute,
+            create=create,
+            update=update,
+            delete=delete,
+            concurrency=concurrency,
+        )
+
     # Product Reviews
     def create_product_review(self, review: ProductReview) -> ProductReview:
         """
@@ -1492,13 +2698,19 @@ class Woo:
         """
         return self.api_object.post("products/reviews", review)
 
-    def get_product_review(self, review_id: int) -> ProductReview | None:
+    def get_product_review(
+        self, review_id: int, fields: list[str] | None = None
+    ) -> ProductReview | None:
         """
         Gets a product review by its ID.
         :param review_id: id of the review
+        :param fields: Only return these fields, e.g. ["id", "product_id", "rating"]. Other fields of the returned objects are None.
+        The objects are still typed as the full model, so type checkers do not flag those fields as optional.
         :return: ProductReview object or None if not found
         """
-        return self.api_object.get(f"products/reviews/{review_id}", ProductReview)
+        return self.api_object.get(
+            f"products/reviews/{review_id}", models.ProductReview, fields=fields
+        )
 
     @t.overload
     def list_product_reviews(
@@ -1525,6 +2737,8 @@ class Woo:
         *,
         follow_pages: t.Literal[False] = False,
         return_metadata: t.Literal[True],
+        lazy: t.Literal[False] = False,
+        fields: list[str] | None = None,
     ) -> PaginatedResponse[ProductReview]: ...
 
     @t.overload
@@ -1552,6 +2766,8 @@ class Woo:
         *,
         follow_pages: t.Literal[False] = False,
         return_metadata: t.Literal[False] = False,
+        lazy: t.Literal[False] = False,
+        fields: list[str] | None = None,
     ) -> list[ProductReview]: ...
 
     @t.overload
@@ -1579,8 +2795,39 @@ class Woo:
         *,
         follow_pages: t.Literal[True],
         return_metadata: t.Literal[False] = False,
+        lazy: t.Literal[False] = False,
+        fields: list[str] | None = None,
     ) -> list[ProductReview]: ...
 
+    @t.overload
+    def list_product_reviews(
+        self,
+        context: ContextType = None,
+        page: int = None,
+        per_page: int = None,
+        search: str | None = None,
+        after: str | None = None,
+        before: str | None = None,
+        exclude: list[int] | None = None,
+        include: list[int] | None = None,
+        offset: int | None = None,
+        order: OrderType = None,
+        orderby: t.Literal[
+            "date", "date_gmt", "id", "include", "product", "rating"
+        ] = None,
+        reviewer: str | None = None,
+        reviewer_email: str | None = None,
+        product: int | None = None,
+        status: t.Literal[
+            "approved", "hold", "spam", "unspam", "trash", "untrash"
+        ] = None,
+        *,
+        follow_pages: bool = False,
+        return_metadata: t.Literal[False] = False,
+        lazy: t.Literal[True],
+        fields: list[str] | None = None,
+    ) -> LazyList[ProductReview]: ...
+
     def list_product_reviews(
         self,
         context: ContextType = None,
@@ -1604,12 +2851,19 @@ class Woo:
         ] = None,
         follow_pages: bool = False,
         return_metadata: bool = False,
-    ) -> list[ProductReview] | PaginatedResponse[ProductReview]:
+        lazy: bool = False,
+        fields: list[str] | None = None,
+    ) -> (
+        list[ProductReview] | LazyList[ProductReview] | PaginatedResponse[ProductReview]
+    ):
         """
         Lists all product reviews.
 
         :param follow_pages: Whether to automatically follow pagination and get all pages. Defaults to False.
         :param return_metadata: If True, returns a PaginatedResponse with metadata instead of just a list. Cannot be used with follow_pages=True.
+        :param lazy: If True, returns a LazyList that validates each item only when it is accessed.
+        :param fields: Only return these fields, e.g. ["id", "product_id", "rating"]. Other fields of the returned objects are None.
+        The objects are still typed as the full model, so type checkers do not flag those fields as optional.
         :return: A list of ProductReview objects or a PaginatedResponse containing the list and pagination metadata.
         """
         if follow_pages and return_metadata:
@@ -1637,12 +2891,69 @@ class Woo:
 
         return self.api_object.get_all(
             "products/reviews",
-            ProductReview,
+            models.ProductReview,
             follow_pages=follow_pages,
             include_metadata=return_metadata,
+            lazy=lazy,
+            fields=fields,
             **params,
         )
 
+    def iter_product_reviews(
+        self,
+        context: ContextType = None,
+        page: int = None,
+        per_page: int = None,
+        search: str | None = None,
+        after: str | None = None,
+        before: str | None = None,
+        exclude: list[int] | None = None,
+        include: list[int] | None = None,
+        offset: int | None = None,
+        order: OrderType = None,
+        orderby: t.Literal[
+            "date", "date_gmt", "id", "include", "product", "rating"
+        ] = None,
+        reviewer: str | None = None,
+        reviewer_email: str | None = None,
+        product: int | None = None,
+        status: t.Literal[
+            "approved", "hold", "spam", "unspam", "trash", "untrash"
+        ] = None,
+        fields: list[str] | None = None,
+    ) -> t.Iterator[ProductReview]:
+        """
+        Iterates over all product reviews, fetching one page at a time.
+        Accepts the same filters as list_product_reviews.
+
+        :param fields: Only return these fields, e.g. ["id", "product_id", "rating"]. Other fields of the returned objects are None.
+        The objects are still typed as the full model, so type checkers do not flag those fields as optional.
+        :return: An iterator of ProductReview objects.
+        """
+        params = {
+            "context": context,
+            "page": page,
+            "per_page": per_page,
+            "search": search,
+            "after": after,
+            "before": before,
+            "exclude": exclude,
+            "include": include,
+            "offset": offset,
+            "order": order,
+            "orderby": orderby,
+            "reviewer": reviewer,
+            "reviewer_email": reviewer_email,
+            "product": product,
+            "status": status,
+        }
+        # Remove None values
+        params = {k: v for k, v in params.items() if v is not None}
+
+        return self.api_object.iter_all(
+            "products/reviews", models.ProductReview, fields=fields, **params
+        )
+
     def update_product_review(
         self, review_id: int, review: ProductReview
     ) -> ProductReview:
@@ -1663,6 +2974,31 @@ class Woo:
         """
         self.api_object.delete(f"products/reviews/{review_id}", force=force)
 
+    def batch_product_reviews(
+        self,
+        create: list[ProductReview] | None = None,
+        update: list[ProductReview] | None = None,
+        delete: list[int] | None = None,
+        concurrency: int = 1,
+    ) -> BatchResponse[ProductReview]:
+        """
+        Creates, updates and deletes product reviews using the batch endpoint.
+        Large inputs are split into requests of up to 100 operations.
+        :param create: ProductReview objects to create
+        :param update: ProductReview objects to update, must have their id set
+        :param delete: ids of the product reviews to delete
+        :param concurrency: number of batch requests sent at the same time
+        :return: BatchResponse with the resulting objects and the errors of failed items
+        """
+        return self.api_object.batch(
+            "products/reviews/batch",
+            models.ProductReview,
+            create=create,
+            update=update,
+            delete=delete,
+            concurrency=concurrency,
+        )
+
     # Payment Gateways
     @t.overload
     def list_payment_gateways(
@@ -1670,6 +3006,8 @@ class Woo:
         *,
         follow_pages: t.Literal[False] = False,
         return_metadata: t.Literal[True],
+        lazy: t.Literal[False] = False,
+        fields: list[str] | None = None,
     ) -> PaginatedResponse[PaymentGateway]: ...
 
     @t.overload
@@ -1678,6 +3016,8 @@ class Woo:
         *,
         follow_pages: t.Literal[False] = False,
         return_metadata: t.Literal[False] = False,
+        lazy: t.Literal[False] = False,
+        fields: list[str] | None = None,
     ) -> list[PaymentGateway]: ...
 
     @t.overload
@@ -1686,37 +3026,87 @@ class Woo:
         *,
         follow_pages: t.Literal[True],
         return_metadata: t.Literal[False] = False,
+        lazy: t.Literal[False] = False,
+        fields: list[str] | None = None,
     ) -> list[PaymentGateway]: ...
 
+    @t.overload
+    def list_payment_gateways(
+        self,
+        *,
+        follow_pages: bool = False,
+        return_metadata: t.Literal[False] = False,
+        lazy: t.Literal[True],
+        fields: list[str] | None = None,
+    ) -> LazyList[PaymentGateway]: ...
+
     def list_payment_gateways(
         self,
         follow_pages: bool = False,
         return_metadata: bool = False,
-    ) -> list[PaymentGateway] | PaginatedResponse[PaymentGateway]:
+        lazy: bool = False,
+        fields: list[str] | None = None,
+    ) -> (
+        list[PaymentGateway]
+        | LazyList[PaymentGateway]
+        | PaginatedResponse[PaymentGateway]
+    ):
         """
         Lists all payment gateways.
 
         :param follow_pages: Whether to automatically follow pagination and get all pages. Defaults to False.
         :param return_metadata: If True, returns a PaginatedResponse with metadata instead of just a list. Cannot be used with follow_pages=True.
+        :param lazy: If True, returns a LazyList that validates each item only when it is accessed.
+        :param fields: Only return these fields, e.g. ["id", "enabled"]. Other fields of the returned objects are None.
+        The objects are still typed as the full model, so type checkers do not flag those fields as optional.
         :return: A list of PaymentGateway objects or a PaginatedResponse containing the list and pagination metadata.
         """
         if follow_pages and return_metadata:
             raise ValueError("Cannot use follow_pages=True with return_metadata=True")
 
-        return self.api_object.get_all(
+        key = (follow_pages, return_metadata, lazy, tuple(fields or ()))
+        cached = self._get_cached("payment_gateways", key)
+        if cached is not None:
+            return cached
+
+        result = self.api_object.get_all(
             "payment_gateways",
-            PaymentGateway,
+            models.PaymentGateway,
             follow_pages=follow_pages,
             include_metadata=return_metadata,
+            lazy=lazy,
+            fields=fields,
+        )
+        self._set_cached("payment_gateways", key, result)
+        return result
+
+    def iter_payment_gateways(
+        self, fields: list[str] | None = None
+    ) -> t.Iterator[PaymentGateway]:
+        """
+        Iterates over all payment gateways, fetching one page at a time.
+
+        :param fields: Only return these fields, e.g. ["id", "enabled"]. Other fields of the returned objects are None.
+        The objects are still typed as the full model, so type checkers do not flag those fields as optional.
+        :return: An iterator of PaymentGateway objects.
+        """
+        return self.api_object.iter_all(
+            "payment_gateways", models.PaymentGateway, fields=fields
         )
 
-    def get_payment_gateway(self, gateway_id: str) -> PaymentGateway | None:
+    def get_payment_gateway(
+        self, gateway_id: str, fields: list[str] | None = None
+    ) -> PaymentGateway | None:
         """
         Gets a payment gateway by its ID.
         :param gateway_id: id of the payment gateway
+        :param fields: Only return these fields, e.g. ["id", "enabled"]. Other fields of the returned objects are None.
+        The objects are still typed as the full model, so type checkers do not flag those fields as optional.
         :return: PaymentGateway object or None if not found
         """
-        return self.api_object.get(f"payment_gateways/{gateway_id}", PaymentGateway)
+        return self.api_object.get(
+            f"payment_gateways/{gateway_id}", models.PaymentGateway, fields=fields
+        )
 
     def update_payment_gateway(
         self, gateway_id: str, gateway: PaymentGateway
@@ -1727,7 +3117,9 @@ class Woo:
         :param gateway: PaymentGateway object with updates
         :return: updated PaymentGateway object
         """
-        return self.api_object.put(f"payment_gateways/{gateway_id}", gateway)
+        result = self.api_object.put(f"payment_gateways/{gateway_id}", gateway)
+        self._invalidate_cached("payment_gateways")
+        return result
 
     # Data endpoints
     def get_countries(self, follow_pages: bool = False) -> list[Country]:
@@ -1736,9 +3128,16 @@ class Woo:
         :param follow_pages: Whether to automatically follow pagination and get all pages. Defaults to False.
         :return: list of Country objects
         """
-        return self.api_object.get_all(
-            "data/countries", Country, follow_pages=follow_pages
+        key = ("countries", follow_pages)
+        cached = self._get_cached("data", key)
+        if cached is not None:
+            return cached
+
+        result = self.api_object.get_all(
+            "data/countries", models.Country, follow_pages=follow_pages
         )
+        self._set_cached("data", key, result)
+        return result
 
     def get_country(self, country_code: str) -> Country | None:
         """
@@ -1746,7 +3145,7 @@ class Woo:
         :param country_code: two-character country code
         :return: Country object or None if not found
         """
-        return self.api_object.get(f"data/countries/{country_code}", Country)
+        return self.api_object.get(f"data/countries/{country_code}", models.Country)
 
     def get_currencies(self, follow_pages: bool = False) -> list[Currency]:
         """
@@ -1754,9 +3153,16 @@ class Woo:
         :param follow_pages: Whether to automatically follow pagination and get all pages. Defaults to False.
         :return: list of Currency objects
         """
-        return self.api_object.get_all(
-            "data/currencies", Currency, follow_pages=follow_pages
+        key = ("currencies", follow_pages)
+        cached = self._get_cached("data", key)
+        if cached is not None:
+            return cached
+
+        result = self.api_object.get_all(
+            "data/currencies", models.Currency, follow_pages=follow_pages
         )
+        self._set_cached("data", key, result)
+        return result
 
     def get_currency(self, currency_code: str) -> Currency | None:
         """
@@ -1764,7 +3170,7 @@ class Woo:
         :param currency_code: three-character currency code
         :return: Currency object or None if not found
         """
-        return self.api_object.get(f"data/currencies/{currency_code}", Currency)
+        return self.api_object.get(f"data/currencies/{currency_code}", models.Currency)
 
     # Reports
     def get_sales_report(
@@ -1786,7 +3192,9 @@ class Woo:
         if date_max:
             params["date_max"] = date_max
 
-        sales_report = self.api_object.get_all("reports/sales", SalesReport, **params)
+        sales_report = self.api_object.get_all(
+            "reports/sales", models.SalesReport, **params
+        )
 
         if sales_report:
             return sales_report[0]
@@ -1812,7 +3220,7 @@ class Woo:
             params["date_max"] = date_max
 
         return self.api_object.get_all(
-            "reports/top_sellers", TopSellersReport, **params
+            "reports/top_sellers", models.TopSellersReport, **params
         )
 
     # Settings
@@ -1822,11 +3230,17 @@ class Woo:
         :param group: The settings group to get
         :return: list of SettingOption objects
         """
+        cached = self._get_cached("settings", group)
+        if cached is not None:
+            return cached
+
         endpoint = "settings"
         if group:
             endpoint = f"settings/{group}"
 
-        return self.api_object.get_all(endpoint, SettingOption)
+        result = self.api_object.get_all(endpoint, models.SettingOption)
+        self._set_cached("settings", group, result)
+        return result
 
     def get_setting(self, group: str, id: str) -> SettingOption | None:
         """
@@ -1835,7 +3249,7 @@ class Woo:
         :param id: The setting ID
         :return: SettingOption object or None if not found
         """
-        return self.api_object.get(f"settings/{group}/{id}", SettingOption)
+        return self.api_object.get(f"settings/{group}/{id}", models.SettingOption)
 
     def update_setting(
         self, group: str, id: str, setting: SettingOption
@@ -1847,7 +3261,9 @@ class Woo:
         :param setting: SettingOption object with updates
         :return: updated SettingOption object
         """
-        return self.api_object.put(f"settings/{group}/{id}", setting)
+        result = self.api_object.put(f"settings/{group}/{id}", setting)
+        self._invalidate_cached("settings")
+        return result
 
     # Order Refunds
     def create_order_refund(self, order_id: int, refund: OrderRefund) -> OrderRefund:
@@ -1859,15 +3275,19 @@ class Woo:
         """
         return self.api_object.post(f"orders/{order_id}/refunds", refund)
 
-    def get_order_refund(self, order_id: int, refund_id: int) -> OrderRefund | None:
+    def get_order_refund(
+        self, order_id: int, refund_id: int, fields: list[str] | None = None
+    ) -> OrderRefund | None:
         """
         Retrieves a refund for a given order by its refund ID.
         :param order_id: id of the order
         :param refund_id: id of the refund
+        :param fields: Only return these fields, e.g. ["id", "amount", "date_created"]. Other fields of the returned objects are None.
+        The objects are still typed as the full model, so type checkers do not flag those fields as optional.
         :return: OrderRefund object or None if not found
         """
         return self.api_object.get(
-            f"orders/{order_id}/refunds/{refund_id}", OrderRefund
+            f"orders/{order_id}/refunds/{refund_id}", models.OrderRefund, fields=fields
         )
 
     @t.overload
@@ -1889,6 +3309,8 @@ class Woo:
         *,
         follow_pages: t.Literal[False] = False,
         return_metadata: t.Literal[True],
+        lazy: t.Literal[False] = False,
+        fields: list[str] | None = None,
     ) -> PaginatedResponse[OrderRefund]: ...
 
     @t.overload
@@ -1910,6 +3332,8 @@ class Woo:
         *,
         follow_pages: t.Literal[False] = False,
         return_metadata: t.Literal[False] = False,
+        lazy: t.Literal[False] = False,
+        fields: list[str] | None = None,
     ) -> list[OrderRefund]: ...
 
     @t.overload
@@ -1931,8 +3355,33 @@ class Woo:
         *,
         follow_pages: t.Literal[True],
         return_metadata: t.Literal[False] = False,
+        lazy: t.Literal[False] = False,
+        fields: list[str] | None = None,
     ) -> list[OrderRefund]: ...
 
+    @t.overload
+    def list_order_refunds(
+        self,
+        order_id: int,
+        context: str = None,
+        page: int = None,
+        per_page: int = None,
+        search: str = None,
+        after: str = None,
+        before: str = None,
+        exclude: list[int] = None,
+        include: list[int] = None,
+        offset: int = None,
+        order: str = None,
+        orderby: str = None,
+        dp: int = None,
+        *,
+        follow_pages: bool = False,
+        return_metadata: t.Literal[False] = False,
+        lazy: t.Literal[True],
+        fields: list[str] | None = None,
+    ) -> LazyList[OrderRefund]: ...
+
     def list_order_refunds(
         self,
         order_id: int,
@@ -1950,7 +3399,9 @@ class Woo:
         dp: int = None,
         follow_pages: bool = False,
         return_metadata: bool = False,
-    ) -> list[OrderRefund] | PaginatedResponse[OrderRefund]:
+        lazy: bool = False,
+        fields: list[str] | None = None,
+    ) -> list[OrderRefund] | LazyList[OrderRefund] | PaginatedResponse[OrderRefund]:
         """
         Lists all refunds for a given order.
 
@@ -1969,6 +3420,9 @@ class Woo:
         :param dp: number of decimal points to use for each resource
         :param follow_pages: Whether to automatically follow pagination and get all pages. Defaults to False.
         :param return_metadata: If True, returns a PaginatedResponse with metadata instead of just a list. Cannot be used with follow_pages=True.
+        :param lazy: If True, returns a LazyList that validates each item only when it is accessed.
+        :param fields: Only return these fields, e.g. ["id", "amount", "date_created"]. Other fields of the returned objects are None.
+        The objects are still typed as the full model, so type checkers do not flag those fields as optional.
         :return: A list of OrderRefund objects or a PaginatedResponse containing the list and pagination metadata.
         """
         if follow_pages and return_metadata:
@@ -1993,12 +3447,61 @@ class Woo:
 
         return self.api_object.get_all(
             f"orders/{order_id}/refunds",
-            OrderRefund,
+            models.OrderRefund,
             follow_pages=follow_pages,
             include_metadata=return_metadata,
+            lazy=lazy,
+            fields=fields,
             **params,
         )
 
+    def iter_order_refunds(
+        self,
+        order_id: int,
+        context: str = None,
+        page: int = None,
+        per_page: int = None,
+        search: str = None,
+        after: str = None,
+        before: str = None,
+        exclude: list[int] = None,
+        include: list[int] = None,
+        offset: int = None,
+        order: str = None,
+        orderby: str = None,
+        dp: int = None,
+        fields: list[str] | None = None,
+    ) -> t.Iterator[OrderRefund]:
+        """
+        Iterates over all order refunds, fetching one page at a time.
+        Accepts the same filters as list_order_refunds.
+
+        :param order_id: id of the order
+        :param fields: Only return these fields, e.g. ["id", "amount", "date_created"]. Other fields of the returned objects are None.
+        The objects are still typed as the full model, so type checkers do not flag those fields as optional.
+        :return: An iterator of OrderRefund objects.
+        """
+        params: dict[str, t.Any] = {
+            "context": context,
+            "page": page,
+            "per_page": per_page,
+            "search": search,
+            "after": after,
+            "before": before,
+            "exclude": exclude,
+            "include": include,
+            "offset": offset,
+            "order": order,
+            "orderby": orderby,
+            "dp": dp,
+        }
+        # Remove None values
+        params = {k: v for k, v in params.items() if v is not None}
+
+        return self.api_object.iter_all(
+            f"orders/{order_id}/refunds", models.OrderRefund, fields=fields, **params
+        )
+
     def delete_order_refund(
         self, order_id: int, refund_id: int, force: bool = None
     ) -> None:
@@ -2019,13 +3522,15 @@ class Woo:
         """
         return self.api_object.post("orders", order)
 
-    def get_order(self, order_id: int) -> Order | None:
+    def get_order(self, order_id: int, fields: list[str] | None = None) -> Order | None:
         """
         Retrieves an order by its ID.
         :param order_id: The ID of the order.
+        :param fields: Only return these fields, e.g. ["id", "status", "total"]. Other fields of the returned objects are None.
+        The objects are still typed as the full model, so type checkers do not flag those fields as optional.
         :return: The Order object if found, otherwise None.
         """
-        return self.api_object.get(f"orders/{order_id}", Order)
+        return self.api_object.get(f"orders/{order_id}", models.Order, fields=fields)
 
     @t.overload
     def list_orders(
@@ -2055,6 +3560,8 @@ class Woo:
         *,
         follow_pages: t.Literal[False] = False,
         return_metadata: t.Literal[True],
+        lazy: t.Literal[False] = False,
+        fields: list[str] | None = None,
     ) -> PaginatedResponse[Order]: ...
 
     @t.overload
@@ -2085,6 +3592,8 @@ class Woo:
         *,
         follow_pages: t.Literal[False] = False,
         return_metadata: t.Literal[False] = False,
+        lazy: t.Literal[False] = False,
+        fields: list[str] | None = None,
     ) -> list[Order]: ...
 
     @t.overload
@@ -2115,8 +3624,42 @@ class Woo:
         *,
         follow_pages: t.Literal[True],
         return_metadata: t.Literal[False] = False,
+        lazy: t.Literal[False] = False,
+        fields: list[str] | None = None,
     ) -> list[Order]: ...
 
+    @t.overload
+    def list_orders(
+        self,
+        context: ContextType | None = None,
+        page: int | None = None,
+        per_page: int | None = None,
+        search: str | None = None,
+        after: str | None = None,
+        before: str | None = None,
+        modified_after: str | None = None,
+        modified_before: str | None = None,
+        dates_are_gmt: bool | None = None,
+        exclude: list[int] | None = None,
+        include: list[int] | None = None,
+        offset: int | None = None,
+        order: OrderType | None = None,
+        orderby: (
+            t.Literal["date", "modified", "id", "include", "title", "slug"] | None
+        ) = None,
+        parent: list[int] | None = None,
+        parent_exclude: list[int] | None = None,
+        status: list[str] | None = None,
+        customer: int | None = None,
+        product: int | None = None,
+        dp: int | None = None,
+        *,
+        follow_pages: bool = False,
+        return_metadata: t.Literal[False] = False,
+        lazy: t.Literal[True],
+        fields: list[str] | None = None,
+    ) -> LazyList[Order]: ...
+
     def list_orders(
         self,
         context: ContextType | None = None,
@@ -2143,7 +3686,9 @@ class Woo:
         dp: int | None = None,
         follow_pages: bool = False,
         return_metadata: bool = False,
-    ) -> list[Order] | PaginatedResponse[Order]:
+        lazy: bool = False,
+        fields: list[str] | None = None,
+    ) -> list[Order] | LazyList[Order] | PaginatedResponse[Order]:
         """
         Lists orders with optional filtering.
         Available parameters include:
@@ -2165,6 +3710,9 @@ class Woo:
           - dp: Number of decimal points to include.
           - follow_pages: Whether to automatically follow pagination and get all pages. Defaults to False.
           - return_metadata: If True, returns a PaginatedResponse with metadata instead of just a list. Cannot be used with follow_pages=True.
+          - lazy: If True, returns a LazyList that validates each item only when it is accessed.
+          - fields: Only return these fields, e.g. ["id", "status", "total"]. Other fields of the returned objects are None.
+            The objects are still typed as the full model, so type checkers do not flag those fields as optional.
         :return: A list of Order objects or a PaginatedResponse containing the list and pagination metadata.
         """
         if follow_pages and return_metadata:
@@ -2197,12 +3745,75 @@ class Woo:
 
         return self.api_object.get_all(
             "orders",
-            Order,
+            models.Order,
             follow_pages=follow_pages,
             include_metadata=return_metadata,
+            lazy=lazy,
+            fields=fields,
             **params,
         )
 
+    def iter_orders(
+        self,
+        context: ContextType | None = None,
+        page: int | None = None,
+        per_page: int | None = None,
+        search: str | None = None,
+        after: str | None = None,
+        before: str | None = None,
+        modified_after: str | None = None,
+        modified_before: str | None = None,
+        dates_are_gmt: bool | None = None,
+        exclude: list[int] | None = None,
+        include: list[int] | None = None,
+        offset: int | None = None,
+        order: OrderType | None = None,
+        orderby: (
+            t.Literal["date", "modified", "id", "include", "title", "slug"] | None
+        ) = None,
+        parent: list[int] | None = None,
+        parent_exclude: list[int] | None = None,
+        status: list[str] | None = None,
+        customer: int | None = None,
+        product: int | None = None,
+        dp: int | None = None,
+        fields: list[str] | None = None,
+    ) -> t.Iterator[Order]:
+        """
+        Iterates over all orders, fetching one page at a time.
+        Accepts the same filters as list_orders.
+
+        :param fields: Only return these fields, e.g. ["id", "status", "total"]. Other fields of the returned objects are None.
+        The objects are still typed as the full model, so type checkers do not flag those fields as optional.
+        :return: An iterator of Order objects.
+        """
+        params = {
+            "context": context,
+            "page": page,
+            "per_page": per_page,
+            "search": search,
+            "after": after,
+            "before": before,
+            "modified_after": modified_after,
+            "modified_before": modified_before,
+            "dates_are_gmt": dates_are_gmt,
+            "exclude": exclude,
+            "include": include,
+            "offset": offset,
+            "order": order,
+            "orderby": orderby,
+            "parent": parent,
+            "parent_exclude": parent_exclude,
+            "status": status,
+            "customer": customer,
+            "product": product,
+            "dp": dp,
+        }
+        # Remove any parameters that are None.
+        params = {k: v for k, v in params.items() if v is not None}
+
+        return self.api_object.iter_all("orders", models.Order, fields=fields, **params)
+
     def update_order(self, order_id: int, order: Order) -> Order:
         """
         Updates an order by its ID.
@@ -2220,3 +3831,28 @@ class Woo:
         :return: None.
         """
         self.api_object.delete(f"orders/{order_id}", force=force)
+
+    def batch_orders(
+        self,
+        create: list[Order] | None = None,
+        update: list[Order] | None = None,
+        delete: list[int] | None = None,
+        concurrency: int = 1,
+    ) -> BatchResponse[Order]:
+        """
+        Creates, updates and deletes orders using the batch endpoint.
+        Large inputs are split into requests of up to 100 operations.
+        :param create: Order objects to create
+        :param update: Order objects to update, must have their id set
+        :param delete: ids of the orders to delete
+        :param concurrency: number of batch requests sent at the same time
+        :return: BatchResponse with the resulting objects and the errors of failed items
+        """
+        return self.api_object.batch(
+            "orders/batch",
+            models.Order,
+            create=create,
+            update=update,
+            delete=delete,
+            concurrency=concurrency,
+        )